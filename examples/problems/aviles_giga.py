@@ -1,13 +1,11 @@
 # coding=utf-8
-import scipy.fftpack as spfft
-import scipy.optimize as scop
 import numpy as np
 
-from pypint.plugins.multigrid.i_transient_multigrid_problem import IInitialValueProblem
-from pypint.utilities import assert_is_callable, assert_is_instance
+from examples.problems.spectral_problem import SpectralProblem
+from pypint.utilities import assert_is_instance
 
 
-class AvilesGiga(IInitialValueProblem):
+class AvilesGiga(SpectralProblem):
     """A nonlinear partial differential equation in two spacial dimensions for
         which describes a homogeneous dipole model
 
@@ -17,11 +15,15 @@ class AvilesGiga(IInitialValueProblem):
         E(u) = \\int_{\\Omega} \\frac{\\epsilon}{2} (\\grad^2 u)^2 + \frac{1}{4\\epsilon}(1 - |\\grad i|^2)^2 dx
 
     smoothness factor:math:`\\epsilon`.
+
+    The implicit part :math:`-\\epsilon \\Delta^2 u` has the symbol :math:`-\\epsilon k^4`, thus the implicit systems of
+    the semi-implicit SDC cores are solved directly in Fourier space (see :py:class:`.SpectralProblem`).
     """
     def __init__(self, *args, **kwargs):
         self._n = kwargs.get('n')
         self._m = 2*self._n + 1
         kwargs.update({"dim": (self._m, self._m, 1)})
+        kwargs.setdefault('real_field', not isinstance(kwargs.get('epsilon', 1.0), complex))
 
         super(AvilesGiga, self).__init__(*args, **kwargs)
 
@@ -43,35 +45,32 @@ class AvilesGiga(IInitialValueProblem):
 
         if isinstance(self.epsilon, complex):
             self.numeric_type = np.complex
-        self._u = np.zeros((self._m, self._m), dtype=np.complex128)
-        # place to work on
-        self._u_x = self._u.copy()
-        self._u_y = self._u.copy()
-        self._u_f = self._u.copy()
-        self._u_angle = self._u.copy()
-        self._u_edens = self._u.copy()
-        self._B = self._u.copy()
+        # place to work on, real unless epsilon is complex
+        self._u = self.spectral.buffer('u')
+        self._u_x = self.spectral.buffer('u_x')
+        self._u_y = self.spectral.buffer('u_y')
+        self._u_angle = self.spectral.buffer('u_angle')
+        self._u_edens = self.spectral.buffer('u_edens')
+        self._B = self.spectral.buffer('B')
+        self._flux = self.spectral.buffer('flux')
         # arrays to work in fourier space
-        self._k_od = np.hstack((np.arange(self._n+1, dtype=np.int64),
-                               np.arange(self._n, dtype=np.int64)-self._n))
-        self._k_y = self._k_od
-        self._k_x = self._k_od.reshape(self._m, 1)
-        for i in range(self._m-1):
-            self._k_y = np.vstack((self._k_y, self._k_od))
-            self._k_x = np.hstack((self._k_x, self._k_od.reshape(self._m, 1)))
-
-        self._k_2 = self._k_x**2 + self._k_y**2
+        self._u_f = self.spectral.buffer('u_f', spectral=True)
+        self._k_x, self._k_y = self.spectral.wavenumbers
+        self._ik_x, self._ik_y = self.spectral.derivative_factors
+
+        self._k_2 = self.spectral.squared_wavenumbers
         self._k_4 = self._k_2**2
 
+        self.implicit_symbol = -self._epsilon * self._k_4
 
-        if kwargs.get('delta_times_for_time_levels') is not None and self._mg_level is not None:
+        if kwargs.get('delta_times_for_time_levels') is not None:
             assert_is_instance(kwargs['delta_times_for_time_levels'], (list, np.ndarray),
                                descriptor="Delta Times for Time Levels", checking_obj=self)
-            for time_level in kwargs['delta_times_for_time_levels']:
-                assert_is_instance(kwargs['delta_times_for_time_levels'][time_level], (list, np.ndarray),
+            for time_level, delta_times in enumerate(kwargs['delta_times_for_time_levels']):
+                assert_is_instance(delta_times, (list, np.ndarray),
                                    descriptor="Delta Times for Time Level %d" % time_level, checking_obj=self)
-                for delta_time in kwargs['delta_times_for_time_levels'][time_level]:
-                    self.initialize_direct_space_solver(time_level, delta_time, kwargs['mg_level'])
+                for delta_time in delta_times:
+                    self.spectral_solve(np.zeros(self.dim_for_time_solver), delta_time)
 
     @property
     def epsilon(self):
@@ -80,16 +79,7 @@ class AvilesGiga(IInitialValueProblem):
     @epsilon.setter
     def epsilon(self, value):
         self._epsilon = value
-
-    def fft(self, u):
-        """Wrapper around some fft
-        """
-        return spfft.fft2(u)
-
-    def ifft(self, u):
-        """Wrapper around some ifft
-        """
-        return spfft.ifft2(u)
+        self.implicit_symbol = -self._epsilon * self._k_4
 
     def energy_linear(self):
         pass
@@ -98,46 +88,49 @@ class AvilesGiga(IInitialValueProblem):
         pass
 
     def compute_grad(self):
-        self._u_x[:] = np.real(self.ifft(np.complex(0, 1) * self._k_x * self._u_f))
-        self._u_y[:] = np.real(self.ifft(np.complex(0, 1) * self._k_y * self._u_f))
-        self._B = self._u_x**2 + self._u_y**2 - 1
+        self.spectral.derivative(self._u_f, 0, out=self._u_x)
+        self.spectral.derivative(self._u_f, 1, out=self._u_y)
+        np.multiply(self._u_x, self._u_x, out=self._B)
+        np.multiply(self._u_y, self._u_y, out=self._flux)
+        self._B += self._flux
+        self._B -= 1
 
     def compute_non_linear(self):
-        return np.real(self.ifft(np.complex(0, 1) * self._k_x * (self.fft(self._B*self._u_x)) +
-                                 np.complex(0, 1) * self._k_y * (self.fft(self._B*self._u_y))))
+        np.multiply(self._B, self._u_x, out=self._flux)
+        _div = self.fft(self._flux)
+        _div *= self._ik_x
+        np.multiply(self._B, self._u_y, out=self._flux)
+        _flux_y = self.fft(self._flux)
+        _flux_y *= self._ik_y
+        _div += _flux_y
+        return self.ifft(_div)
 
     def compute_linear(self):
-        return np.real(self.ifft(self._k_4 * self.fft(self._u)))
+        _u_f = self._u_f * self._k_4
+        return self.ifft(_u_f)
 
     def evaluate_wrt_time(self, time, phi_of_time, **kwargs):
         """Computing the right hand side with respect to time
         """
         super(AvilesGiga, self).evaluate_wrt_time(time, phi_of_time, **kwargs)
         self._u.reshape(phi_of_time.shape)[:] = phi_of_time
-        self._u_f = self.fft(self._u)
-        self.compute_grad()
+        self._u_f[:] = self.fft(self._u)
         if kwargs.get('partial') is not None:
             if isinstance(kwargs['partial'], str) and kwargs['partial'] == 'impl':
                 return (- self.epsilon * self.compute_linear()).reshape(phi_of_time.shape)
             elif kwargs['partial'] == 'expl':
+                self.compute_grad()
                 return (self.compute_non_linear() / self.epsilon).reshape(phi_of_time.shape)
         else:
+            self.compute_grad()
             return (self.compute_non_linear() / self.epsilon - self.epsilon * self.compute_linear()).reshape(phi_of_time.shape)
 
-    def implicit_solve(self, next_x, func, method="unused", **kwargs):
-        """A solver for the implicit equations.
-        """
-        assert_is_instance(next_x, np.ndarray, descriptor="Initial Guess", checking_obj=self)
-        assert_is_callable(func, descriptor="Function of RHS for Implicit Solver", checking_obj=self)
-        sol = scop.newton_krylov(func, next_x.reshape(-1))
-        assert_is_instance(sol, np.ndarray, descriptor="Solution", checking_obj=self)
-        return sol.reshape(self.dim_for_time_solver)
-
     def angle(self, u):
         """ returns angles of the vector (u_x, u_y)
 
         """
         self._u.reshape(u.shape)[:] = u
+        self._u_f[:] = self.fft(self._u)
         self.compute_grad()
         return np.angle(np.complex(0, 1) * self._u_x + self._u_y)
 
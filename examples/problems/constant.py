@@ -34,6 +34,9 @@ class Constant(IInitialValueProblem, HasExactSolutionMixin):
     shift : :py:class:`float`
         Initial value :math:`IV`, which is the shift along the :math:`y` axis.
     """
+
+    thread_safe = True
+
     def __init__(self, constant=-1.0, shift=1.0, *args, **kwargs):
         super(Constant, self).__init__(*args, **kwargs)
         HasExactSolutionMixin.__init__(self, *args, **kwargs)
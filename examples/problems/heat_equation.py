@@ -3,16 +3,30 @@
 .. moduleauthor:: Torbjörn Klatt <t.kaltt@fz-juelich.de>
 .. moduleauthor:: Dieter Moser <d.moser@fz-juelich.de>
 """
+import threading
+
 import numpy as np
+import scipy.sparse.linalg as spla
 
+from pypint.plugins.multigrid.factorization_cache import FactorizationCache
 from pypint.plugins.multigrid.i_transient_multigrid_problem import ITransientMultigridProblem
 from pypint.plugins.multigrid.i_multigrid_level import IMultigridLevel
 from pypint.plugins.multigrid.stencil import Stencil
+from pypint.problems.has_linear_part_mixin import HasLinearPartMixin
 from pypint.utilities import assert_named_argument, assert_is_key, assert_is_instance
 from pypint.utilities.logging import LOG, this_got_called
 
 
-class HeatEquation(ITransientMultigridProblem):
+def _view_into(view, base, other):
+    """View of ``other`` at the position of ``view`` within ``base``
+
+    ``other`` must have the memory layout of ``base``, e.g. be a copy of it.
+    """
+    _offset = view.__array_interface__['data'][0] - base.__array_interface__['data'][0]
+    return np.ndarray(view.shape, dtype=other.dtype, buffer=other, offset=_offset, strides=view.strides)
+
+
+class HeatEquation(ITransientMultigridProblem, HasLinearPartMixin):
     """A parabolic partial differential equation in two spacial dimensions
 
     Also known as the 2D-Heat-Equation:
@@ -22,9 +36,16 @@ class HeatEquation(ITransientMultigridProblem):
         \\frac{\\partial u(x,y,t)}{\\partial t} = \\alpha \\laplace u(x,y,t)
 
     with the thermal diffusivity :math:`\\alpha`.
+
+    The multigrid level only provides the boundary values and is not written to, thus evaluations and implicit solves
+    may run in several threads at once.
     """
+
+    thread_safe = True
+
     def __init__(self, *args, **kwargs):
         super(HeatEquation, self).__init__(*args, **kwargs)
+        HasLinearPartMixin.__init__(self, *args, **kwargs)
 
         # HasExactSolutionMixin.__init__(self, *args, **kwargs)
 
@@ -42,7 +63,15 @@ class HeatEquation(ITransientMultigridProblem):
 
         self._mg_stencil = kwargs.get('mg_stencil')
         self._mg_level = kwargs.get('mg_level')
-        self._direct_solvers = {}
+        # direct space solvers by time level, level shape and operator for each delta time
+        self._direct_solvers = kwargs.get('direct_solver_cache', FactorizationCache(name='direct solvers'))
+        assert_is_instance(self._direct_solvers, FactorizationCache, descriptor="Direct Solver Cache",
+                           checking_obj=self)
+        # contributions of the boundary values by level, stencil and time
+        self._boundary_terms_cache = FactorizationCache(name='boundary terms')
+        self._add_metered(self._direct_solvers, self._boundary_terms_cache)
+        # padded copy of the level for each thread evaluating the stencil
+        self._padded_buffers = threading.local()
 
         if kwargs.get('delta_times_for_time_levels') is not None and self._mg_level is not None:
             assert_is_instance(kwargs['delta_times_for_time_levels'], (list, np.ndarray),
@@ -64,51 +93,151 @@ class HeatEquation(ITransientMultigridProblem):
     def evaluate_wrt_time(self, time, phi_of_time, **kwargs):
         # this_got_called(self, time=time, phi_of_time=phi_of_time, **kwargs)
         # LOG.debug(" using Stencil: %s" % self._mg_stencil.arr)
+        self._count_rhs_evaluation(kwargs.get('partial'))
         if kwargs.get('partial'):
             if kwargs['partial'] == "impl":
-                self._mg_level.mid[:] = phi_of_time.reshape(-1)
-                _padded_phi = self._mg_level.evaluable_view(self._mg_stencil)
-                _out = self._mg_stencil.eval_convolve(_padded_phi)
-                # LOG.debug(" --> %s" % _out.reshape(phi_of_time.shape))
-                return _out.reshape(phi_of_time.shape)
+                return self._apply_mg_stencil(phi_of_time)
             else:
                 # LOG.debug(" --> zeros")
                 return np.zeros(phi_of_time.shape)
         else:
-            self._mg_level.mid[:] = phi_of_time.reshape(-1)
-            _padded_phi = self._mg_level.evaluable_view(self._mg_stencil)
-            _out = self._mg_stencil.eval_convolve(_padded_phi)
-            # LOG.debug(" --> %s" % _out.reshape(phi_of_time.shape))
-            return _out.reshape(phi_of_time.shape)
+            return self._apply_mg_stencil(phi_of_time)
+
+    def _apply_mg_stencil(self, phi_of_time):
+        # the level provides the boundary values around phi
+        _level = self._mg_level
+        _padded = self._padded_buffer(_level)
+        _view_into(_level.mid, _level.arr, _padded)[:] = phi_of_time.reshape(_level.mid.shape)
+        _out = np.empty(phi_of_time.shape, dtype=_padded.dtype)
+        self._mg_stencil.eval_into(_view_into(_level.evaluable_view(self._mg_stencil), _level.arr, _padded),
+                                   _out.reshape(_level.mid.shape))
+        # LOG.debug(" --> %s" % _out)
+        return _out
+
+    def _padded_buffer(self, level):
+        """Copy of the level's padded array for the calling thread, allocated once for each level
+
+        Only the inner points are written to, thus the boundary values are the ones of the level.
+        """
+        if getattr(self._padded_buffers, 'level', None) is not level:
+            self._padded_buffers.arr = level.arr.copy()
+            self._padded_buffers.level = level
+        return self._padded_buffers.arr
+
+    def _boundary_terms(self, level, stencil, time=None):
+        """Contributions of the level's boundary values to the stencil at the inner points
+
+        Subtracting them from a right hand side is what :py:meth:`.Stencil.modify_rhs` does on the level itself.
+        They are computed once for each level, stencil and ``time``; the latter only matters for time-dependent
+        :py:class:`.BoundaryCondition`.
+        """
+        def _evaluate():
+            _arr = level.arr.copy()
+            if time is not None and getattr(level, 'ghost_cells', None) is not None:
+                level.ghost_cells.pad(_arr, time)
+            _view_into(level.mid, level.arr, _arr)[:] = 0.0
+            _terms = np.empty(level.mid.shape, dtype=level.arr.dtype)
+            stencil.eval_into(_view_into(level.evaluable_view(stencil), level.arr, _arr), _terms)
+            return level, stencil, _terms
+
+        # the entry references the level and the stencil, thus their ids are not reused while cached
+        return self._boundary_terms_cache.get((id(level), id(stencil), time), None, _evaluate)[2]
+
+    def linear_operator(self):
+        """Sparse matrix of the right hand side's stencil on the inner points of the level
+
+        Inhomogeneous boundary values are not part of it, thus exponential integrators treat them as the nonlinear
+        part.
+        """
+        assert_is_instance(self._mg_level, IMultigridLevel, descriptor="Multigrid Level", checking_obj=self)
+        return self._mg_stencil.to_sparse_matrix(self._mg_level.mid.shape, "csr")
 
     def mg_stencil(self, delta_time, delta_space):
-        _stencil = np.array(
-            [
-                -1.0 * delta_time * self.thermal_diffusivity / (delta_space**2),
-                ((2.0 * delta_time * self.thermal_diffusivity) / (delta_space**2)) + 1.0,
-                -1.0 * delta_time * self.thermal_diffusivity / (delta_space**2)
-            ]
-        )
+        """Stencil of :math:`I - \\Delta t \\alpha \\Delta_h`
+
+        The three point stencil in 1D, otherwise the five and seven point stencils with ``delta_space`` holding the
+        grid widths in :math:`(x, y, z)` order as the 2D and 3D multigrid levels do.
+        """
+        if len(self.spacial_dim) == 1:
+            _stencil = np.array(
+                [
+                    -1.0 * delta_time * self.thermal_diffusivity / (delta_space**2),
+                    ((2.0 * delta_time * self.thermal_diffusivity) / (delta_space**2)) + 1.0,
+                    -1.0 * delta_time * self.thermal_diffusivity / (delta_space**2)
+                ]
+            )
+        else:
+            _dim = len(self.spacial_dim)
+            _delta_space = np.asarray(delta_space).reshape(-1)
+            _center = (1,) * _dim
+            _stencil = np.zeros((3,) * _dim)
+            _stencil[_center] = 1.0
+            for axis in range(_dim):
+                _coupling = delta_time * self.thermal_diffusivity / (_delta_space[_dim - 1 - axis]**2)
+                for neighbour in (0, 2):
+                    _stencil[_center[:axis] + (neighbour,) + _center[axis + 1:]] = -_coupling
+                _stencil[_center] += 2.0 * _coupling
         return _stencil
 
     def initialize_direct_space_solver(self, time_level, delta_time, mg_level=None):
+        """Sets up the direct space solver for a time level and delta time
+
+        The solvers are kept in a :py:class:`.FactorizationCache`, which may be shared among problems by passing it
+        as ``direct_solver_cache`` to the constructor.
+        Problems share a solver only if their operators are the same, i.e. the same grid widths, thermal diffusivity
+        and stencil of :py:meth:`.mg_stencil`.
+        The sparse LU factorization is only computed for the ``direct`` implicit solve method; the other methods set
+        up their own solvers in :py:meth:`.mg_solve`.
+
+        Returns
+        -------
+        solver set : :py:class:`dict`
+            with the ``mg_level``, ``stencil``, ``lu``, ``solver`` and ``stencil_fnc``;
+            ``lu`` and ``solver`` are ``None`` unless the method is ``direct``
+        """
         if mg_level is None:
             mg_level = self._mg_level
         assert_is_instance(mg_level, IMultigridLevel, descriptor="Multigrid Level", checking_obj=self)
-        _stencil = Stencil(self.mg_stencil(delta_time, mg_level.h))
-        # LOG.debug("Stencil for dt=%f, h=%f: %s" % (delta_time, mg_level.h, _stencil.arr))
-        time_level = str(time_level)
-        delta_time = str(delta_time)
-        if self._direct_solvers.get(time_level) is None:
-            # LOG.debug("Initializing Solvers for Time Level '%s'" % time_level)
-            self._direct_solvers[time_level] = {}
-        # LOG.debug("  Initializing Solver for Time Level '%s' and Delta Node '%s'" % (time_level, delta_time))
-        # LOG.debug("    shape: %s" % (mg_level.mid.shape))
-        self._direct_solvers[time_level][delta_time] = {
-            'mg_level': mg_level,
-            'stencil': _stencil,
-            'solver': _stencil.generate_direct_solver(mg_level.mid.shape)
-        }
+
+        def _factorize():
+            _solver_set = {
+                'mg_level': mg_level,
+                'stencil': Stencil(self.mg_stencil(delta_time, mg_level.h)),
+                'lu': None,
+                'solver': None,
+                'stencil_fnc': lambda level: self.mg_stencil(delta_time, level.h)
+            }
+            # LOG.debug("Stencil for dt=%f, h=%f: %s" % (delta_time, mg_level.h, _solver_set['stencil'].arr))
+            if self._implicit_solve_method == 'direct':
+                self._factorize_lu(_solver_set)
+            return _solver_set
+
+        return self._direct_solvers.get((str(time_level), mg_level.mid.shape) + self._operator_identity(mg_level),
+                                        delta_time, _factorize)
+
+    def _operator_identity(self, mg_level):
+        """Hashable identity of the operator on the level, independent of the time step width
+
+        The stencil for a unit time step width along with the grid widths and the thermal diffusivity.
+        """
+        return (np.asarray(mg_level.h, dtype=float).tobytes(), self.thermal_diffusivity,
+                np.ascontiguousarray(self.mg_stencil(1.0, mg_level.h)).tobytes())
+
+    def _factorize_lu(self, solver_set):
+        _lu = spla.splu(solver_set['stencil'].to_sparse_matrix(solver_set['mg_level'].mid.shape, "csc"))
+        self.metrics.increment('sparse_factorizations', kind='lu')
+        solver_set['lu'] = _lu
+        solver_set['solver'] = _lu.solve
+
+    @property
+    def direct_solvers(self):
+        """Read-only accessor for the cache of direct space solvers
+
+        Returns
+        -------
+        direct solvers : :py:class:`.FactorizationCache`
+        """
+        return self._direct_solvers
 
     def implicit_solve(self, next_x, func, method="direct", **kwargs):
         """Space-Solver for the Heat Equation
@@ -126,6 +255,9 @@ class HeatEquation(ITransientMultigridProblem):
             time level in MLSDC-notation (i.e. 0 is base level of MLSDC)
         delta_time : :py:class:`float`
             distance from the previous to currently calculated time node
+        time : :py:class:`float`
+            *(optional)*
+            time of time-dependent :py:class:`.BoundaryCondition`
         """
         # this_got_called(self, next_x=next_x, func=func, **kwargs)
         assert_named_argument('expl_term', kwargs, types=np.ndarray, descriptor="RHS for Space Solver",
@@ -133,33 +265,30 @@ class HeatEquation(ITransientMultigridProblem):
         # assert_named_argument('time_level', kwargs, types=int, descriptor="Time Level", checking_obj=self)
         if kwargs.get('time_level') is None:
             kwargs['time_level'] = 0
-        time_level = str(kwargs['time_level'])
         assert_named_argument('delta_time', kwargs, types=float, descriptor="Delta Time Node", checking_obj=self)
-        delta_time = str(kwargs['delta_time'])
-        # assert_is_key(time_level, self._direct_solvers, key_desc="Time Level", dict_desc="Direct Solvers",
-        #               checking_obj=self)
-        # assert_is_key(delta_time, self._direct_solvers[time_level],
-        #               key_desc="Delta Time '%s'" % delta_time,
-        #               dict_desc="Direct Solvers for Time Level '%s'" % 'time_level', checking_obj=self)
-        if time_level not in self._direct_solvers or delta_time not in self._direct_solvers[time_level]:
-            self.initialize_direct_space_solver(kwargs['time_level'], kwargs['delta_time'])
-        _this_set = self._direct_solvers[time_level][delta_time]
-        _this_set['mg_level'].rhs = kwargs['expl_term']
-        # LOG.debug("initial RHS: %s" % _this_set['mg_level'].rhs)
-        _this_set['stencil'].modify_rhs(_this_set['mg_level'])
-        # LOG.debug("modified RHS: %s" % _this_set['mg_level'].rhs)
+        _this_set = self.initialize_direct_space_solver(kwargs['time_level'], kwargs['delta_time'])
+        if self._implicit_solve_method == 'direct' and _this_set['lu'] is None:
+            # the method was changed after the solver set was cached
+            self._factorize_lu(_this_set)
+        # the boundary values are the problem's own, as the solver set may be shared with another problem
+        _level = self._mg_level
+        _rhs = kwargs['expl_term'].reshape(_level.mid.shape) \
+            - self._boundary_terms(_level, _this_set['stencil'], kwargs.get('time'))
+        # LOG.debug("modified RHS: %s" % _rhs)
         # LOG.debug("Stencil: %s" % _this_set['stencil'].arr)
 
         _sol = self.mg_solve(next_x,
-                             rhs=_this_set['mg_level'].rhs,
+                             rhs=_rhs,
                              method=self._implicit_solve_method,
                              solver=_this_set['solver'],
-                             stencil_fnc=lambda level: self.mg_stencil(kwargs['delta_time'], level.h))
+                             stencil=_this_set['stencil'],
+                             stencil_fnc=_this_set['stencil_fnc'],
+                             time_level=kwargs['time_level'],
+                             delta_time=kwargs['delta_time'])
 
         # LOG.debug("Implicit Solve => %s" % _sol)
-        _this_set['mg_level'].mid[:] = _sol.reshape(-1)
         # _padded_sol = _this_set['mg_level'].evaluable_view(_this_set['stencil'])
-        _sp_matrix = _this_set['stencil'].to_sparse_matrix(self.spacial_dim)
+        # _sp_matrix = _this_set['stencil'].to_sparse_matrix(self.spacial_dim)
         # LOG.debug("Check with Sparse Matrix %s:" % _sp_matrix.todense())
         # LOG.debug("  ==> %s" % _sp_matrix.dot(_sol.reshape(-1)).reshape(_sol.shape))
         return _sol
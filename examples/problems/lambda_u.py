@@ -4,7 +4,7 @@
 """
 import numpy as np
 
-from pypint.problems import IInitialValueProblem, HasExactSolutionMixin, HasDirectImplicitMixin
+from pypint.problems import IInitialValueProblem, HasExactSolutionMixin, HasDirectImplicitMixin, HasLinearPartMixin
 from pypint.utilities import assert_condition, assert_is_instance, class_name, assert_named_argument
 from pypint.solvers.cores.implicit_sdc_core import ImplicitSdcCore
 from pypint.solvers.cores.implicit_mlsdc_core import ImplicitMlSdcCore
@@ -12,7 +12,7 @@ from pypint.solvers.cores.semi_implicit_mlsdc_core import SemiImplicitMlSdcCore
 from pypint.utilities.logging import LOG
 
 
-class LambdaU(IInitialValueProblem, HasExactSolutionMixin, HasDirectImplicitMixin):
+class LambdaU(IInitialValueProblem, HasExactSolutionMixin, HasDirectImplicitMixin, HasLinearPartMixin):
 # class LambdaU(IInitialValueProblem, HasExactSolutionMixin):
     """:math:`u'(t, \\phi_t) = \\lambda u(t, \\phi_t)`
 
@@ -37,10 +37,14 @@ class LambdaU(IInitialValueProblem, HasExactSolutionMixin, HasDirectImplicitMixi
         *(optional)*
         Coefficient :math:`\\lambda`
     """
+
+    thread_safe = True
+
     def __init__(self, *args, **kwargs):
         super(LambdaU, self).__init__(*args, **kwargs)
         HasExactSolutionMixin.__init__(self, *args, **kwargs)
         HasDirectImplicitMixin.__init__(self, *args, **kwargs)
+        HasLinearPartMixin.__init__(self, *args, **kwargs)
         if self.time_start is None:
             self.time_start = 0.0
         if self.time_end is None:
@@ -123,6 +127,11 @@ class LambdaU(IInitialValueProblem, HasExactSolutionMixin, HasDirectImplicitMixi
             #           % (_new, _phis[2],  _dn, complex(0, self.lmbda.imag), _phis[2], _phis[0], self.lmbda.real, _phis[1], _int, _fas, self.lmbda.real, _dn))
             return _new
 
+    def linear_symbol(self):
+        """The right hand side is linear with the single eigenvalue :math:`\\lambda`
+        """
+        return self._linear_symbol
+
     @property
     def lmbda(self):
         return self._lmbda
@@ -130,6 +139,7 @@ class LambdaU(IInitialValueProblem, HasExactSolutionMixin, HasDirectImplicitMixi
     @lmbda.setter
     def lmbda(self, lmbda):
         self._lmbda = lmbda
+        self._linear_symbol = np.asarray(lmbda)
 
     def print_lines_for_log(self):
         _lines = super(LambdaU, self).print_lines_for_log()
@@ -0,0 +1,186 @@
+# coding=utf-8
+"""
+.. moduleauthor:: Torbjörn Klatt <t.klatt@fz-juelich.de>
+"""
+import scipy.optimize as scop
+import numpy as np
+
+from examples.problems.spectral_toolkit import SpectralToolkit
+from pypint.problems.i_initial_value_problem import IInitialValueProblem
+from pypint.problems.has_linear_part_mixin import HasLinearPartMixin
+from pypint.plugins.multigrid.factorization_cache import FactorizationCache
+from pypint.utilities import assert_condition, assert_is_callable, assert_is_instance
+
+
+class SpectralProblem(IInitialValueProblem, HasLinearPartMixin):
+    """Initial value problem on a periodic grid with an implicit part diagonal in Fourier space
+
+    The implicit part of the right hand side is
+
+    .. math::
+
+        f_I(u) = \\mathcal{F}^{-1} \\left( \\sigma \\mathcal{F}(u) \\right)
+
+    with the symbol :math:`\\sigma` given by :py:attr:`.implicit_symbol`, e.g. :math:`-\\epsilon k^4` for a
+    bi-Laplacian.
+    The implicit systems :math:`u - \\Delta\\tau f_I(u) = b` of the semi-implicit SDC cores are thus solved directly by
+
+    .. math::
+
+        \\hat{u} = \\frac{\\hat{b}}{1 - \\Delta\\tau \\sigma}
+
+    with one forward and one backward FFT of the problem's :py:class:`.SpectralToolkit`.
+    For real fields, i.e. unless ``real_field=False`` is given, these are real-to-complex transforms and the symbol is
+    given on the non-negative wave numbers of the last axis only.
+    The denominators are computed once for each :math:`\\Delta\\tau` and kept in a :py:class:`.FactorizationCache`.
+
+    Implicit systems containing the explicit part as well, e.g. of the implicit Euler predictor, are solved with
+    :py:func:`scipy.optimize.newton_krylov`.
+
+    For exponential integrators the implicit part is the linear part with the eigenvalues :math:`\\sigma` in Fourier
+    space (see :py:class:`.HasLinearPartMixin`).
+    """
+    def __init__(self, *args, **kwargs):
+        super(SpectralProblem, self).__init__(*args, **kwargs)
+        HasLinearPartMixin.__init__(self, *args, **kwargs)
+        self._spectral = SpectralToolkit(self.spacial_dim, real=kwargs.get('real_field', True),
+                                         workers=kwargs.get('fft_workers'))
+        self._implicit_symbol = None
+        self._denominators = FactorizationCache(max_entries=kwargs.get('max_cached_denominators', 32),
+                                                name='denominators')
+        self._add_metered(self._denominators)
+
+    @property
+    def implicit_symbol(self):
+        """Eigenvalues :math:`\\sigma` of the implicit part in Fourier space
+
+        Parameters
+        ----------
+        implicit_symbol : :py:class:`numpy.ndarray`
+            of shape :py:attr:`.SpectralToolkit.spectral_shape` in the order of :py:meth:`.fft`
+
+        Raises
+        ------
+        ValueError
+            if the symbol does not match the transformed fields
+        """
+        return self._implicit_symbol
+
+    @implicit_symbol.setter
+    def implicit_symbol(self, implicit_symbol):
+        assert_is_instance(implicit_symbol, np.ndarray, descriptor="Implicit Symbol", checking_obj=self)
+        assert_condition(implicit_symbol.shape == self._spectral.spectral_shape, ValueError,
+                         message="Implicit symbol must match the transformed fields: %s != %s"
+                                 % (implicit_symbol.shape, self._spectral.spectral_shape),
+                         checking_obj=self)
+        self._implicit_symbol = implicit_symbol
+        self._denominators.clear()
+
+    @property
+    def denominators(self):
+        """Read-only accessor for the cache of the denominators :math:`1 - \\Delta\\tau \\sigma`
+
+        Returns
+        -------
+        denominators : :py:class:`.FactorizationCache`
+        """
+        return self._denominators
+
+    @property
+    def spectral(self):
+        """Read-only accessor for the transforms, wave numbers and work buffers
+
+        Returns
+        -------
+        spectral : :py:class:`.SpectralToolkit`
+        """
+        return self._spectral
+
+    def fft(self, u, overwrite=False):
+        """Transforms a field (see :py:meth:`.SpectralToolkit.forward`)
+        """
+        return self._spectral.forward(u, overwrite=overwrite)
+
+    def ifft(self, u_hat, out=None):
+        """Transforms back into a field, destroying ``u_hat`` (see :py:meth:`.SpectralToolkit.backward`)
+        """
+        return self._spectral.backward(u_hat, out=out)
+
+    def linear_symbol(self):
+        return self._implicit_symbol
+
+    def to_linear_eigenbasis(self, values):
+        return self.fft(values)
+
+    def from_linear_eigenbasis(self, coefficients):
+        return self.ifft(coefficients)
+
+    def implicit_solve(self, next_x, func, method="spectral", **kwargs):
+        """Solver for the implicit equations
+
+        Parameters
+        ----------
+        next_x : :py:class:`numpy.ndarray`
+            initial guess
+        func : :py:class:`callable`
+            residual of the implicit equation
+        method : :py:class:`str`
+            *(optional)*
+            ``spectral`` (default) for the direct solve in Fourier space if possible, anything else for
+            :py:func:`scipy.optimize.newton_krylov`
+        expl_term : :py:class:`numpy.ndarray`
+            right hand side :math:`b` of the implicit equation
+        delta_time : :py:class:`float`
+            factor :math:`\\Delta\\tau` of the implicit part
+        partial : :py:class:`str`
+            only for ``impl`` the implicit equation contains the implicit part of the right hand side alone and is
+            solved directly
+
+        Returns
+        -------
+        next_x : :py:class:`numpy.ndarray`
+        """
+        assert_is_instance(next_x, np.ndarray, descriptor="Initial Guess", checking_obj=self)
+        assert_is_callable(func, descriptor="Function of RHS for Implicit Solver", checking_obj=self)
+        if method == "spectral" and self._implicit_symbol is not None and kwargs.get('partial') == 'impl' \
+                and kwargs.get('expl_term') is not None and kwargs.get('delta_time') is not None:
+            return self.spectral_solve(kwargs['expl_term'], kwargs['delta_time'])
+        sol = scop.newton_krylov(func, next_x.reshape(-1),
+                                 callback=lambda x, f: self.metrics.increment('newton_iterations'))
+        assert_is_instance(sol, np.ndarray, descriptor="Solution", checking_obj=self)
+        return sol.reshape(self.dim_for_time_solver)
+
+    def spectral_solve(self, rhs, delta_time):
+        """Solves :math:`u - \\Delta\\tau f_I(u) = b` in Fourier space
+
+        Parameters
+        ----------
+        rhs : :py:class:`numpy.ndarray`
+            right hand side :math:`b`
+        delta_time : :py:class:`float`
+            factor :math:`\\Delta\\tau` of the implicit part
+
+        Returns
+        -------
+        solution : :py:class:`numpy.ndarray`
+            of shape :py:attr:`.IProblem.dim_for_time_solver`
+        """
+        _denominator = self._denominators.get('implicit', float(delta_time),
+                                              lambda: 1.0 - float(delta_time) * self._implicit_symbol)
+        _rhs = np.asarray(rhs).reshape(self._spectral.shape)
+        if self._spectral.real and np.iscomplexobj(_rhs):
+            # the real transforms require solving for the real and imaginary parts separately
+            _sol = self._divide(_rhs.real, _denominator) + 1j * self._divide(_rhs.imag, _denominator)
+        else:
+            _sol = self._divide(_rhs, _denominator)
+        if not self._spectral.real and np.isrealobj(_rhs) and np.isrealobj(self._implicit_symbol):
+            _sol = _sol.real
+        return _sol.reshape(self.dim_for_time_solver)
+
+    def _divide(self, rhs, denominator):
+        _rhs_hat = self.fft(rhs)
+        _rhs_hat /= denominator
+        return self.ifft(_rhs_hat)
+
+
+__all__ = ['SpectralProblem']
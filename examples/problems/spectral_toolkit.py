@@ -0,0 +1,239 @@
+# coding=utf-8
+"""
+.. moduleauthor:: Torbjörn Klatt <t.klatt@fz-juelich.de>
+"""
+import numpy as np
+
+try:
+    import scipy.fft as fft
+except ImportError:
+    # requires scipy 1.4 or later
+    fft = None
+
+from pypint.utilities import assert_condition
+
+
+class SpectralToolkit(object):
+    """Transforms, wave numbers and work buffers for pseudo-spectral problems on periodic grids
+
+    Real fields are transformed with :py:func:`scipy.fft.rfftn`, i.e. only the non-negative wave numbers of the last
+    axis are stored and the spectrum takes about half the memory and time of a complex transform.
+    Complex fields use the full transforms.
+
+    The wave numbers are generated with :py:func:`numpy.meshgrid` as sparse, broadcastable arrays, one for each axis,
+    ordered as the transforms' output.
+    Derivatives multiply by :math:`i k` with the Nyquist wave number of even axes set to zero, thus real fields stay
+    real.
+
+    Work buffers are allocated once by name (see :py:meth:`.buffer`), so that repeated evaluations of a right hand
+    side reuse the same memory.
+
+    Examples
+    --------
+    >>> toolkit = SpectralToolkit((4, 6))
+    >>> toolkit.spectral_shape
+    (4, 4)
+    >>> u = np.sin(2 * np.pi * np.arange(6) / 6) * np.ones((4, 1))
+    >>> bool(np.allclose(toolkit.backward(toolkit.forward(u)), u))
+    True
+    """
+    def __init__(self, shape, real=True, workers=None):
+        """
+        Parameters
+        ----------
+        shape : :py:class:`tuple`
+            shape of the grid
+        real : :py:class:`bool`
+            *(optional)*
+            whether the fields are real; defaults to ``True``
+        workers : :py:class:`int`
+            *(optional)*
+            number of threads of the transforms (see :py:mod:`scipy.fft`); defaults to one
+
+        Raises
+        ------
+        RuntimeError
+            if :py:mod:`scipy.fft` is not available
+        """
+        assert_condition(fft is not None, RuntimeError,
+                         message="The spectral toolkit requires scipy.fft (scipy 1.4 or later).", checking_obj=self)
+        self._shape = tuple(int(n) for n in shape)
+        self._real = bool(real)
+        self._workers = workers
+        if self._real:
+            self._spectral_shape = self._shape[:-1] + (self._shape[-1] // 2 + 1,)
+        else:
+            self._spectral_shape = self._shape
+
+        _axes = [fft.fftfreq(n, 1.0 / n) for n in self._shape]
+        if self._real:
+            _axes[-1] = fft.rfftfreq(self._shape[-1], 1.0 / self._shape[-1])
+        self._wavenumbers = np.meshgrid(*_axes, indexing='ij', sparse=True)
+        self._derivative_factors = []
+        for _axis, _k in enumerate(self._wavenumbers):
+            _factor = 1j * _k
+            if self._shape[_axis] % 2 == 0:
+                _factor[_k == -(self._shape[_axis] // 2)] = 0.0
+                _factor[_k == self._shape[_axis] // 2] = 0.0
+            self._derivative_factors.append(_factor)
+        self._squared_wavenumbers = None
+        self._buffers = {}
+
+    @property
+    def shape(self):
+        """Shape of the grid
+        """
+        return self._shape
+
+    @property
+    def spectral_shape(self):
+        """Shape of the transformed fields
+        """
+        return self._spectral_shape
+
+    @property
+    def real(self):
+        """Whether the fields are real
+        """
+        return self._real
+
+    @property
+    def field_dtype(self):
+        return np.dtype(float) if self._real else np.dtype(complex)
+
+    @property
+    def wavenumbers(self):
+        """Wave numbers along each axis as broadcastable arrays
+
+        Returns
+        -------
+        wavenumbers : :py:class:`list` of :py:class:`numpy.ndarray`
+        """
+        return self._wavenumbers
+
+    @property
+    def derivative_factors(self):
+        """Factors :math:`i k` of the first derivatives along each axis as broadcastable arrays
+
+        Returns
+        -------
+        factors : :py:class:`list` of :py:class:`numpy.ndarray`
+        """
+        return self._derivative_factors
+
+    @property
+    def squared_wavenumbers(self):
+        """:math:`|k|^2` of the transformed fields, computed on first access
+
+        Returns
+        -------
+        squared wavenumbers : :py:class:`numpy.ndarray`
+            of shape :py:attr:`.spectral_shape`
+        """
+        if self._squared_wavenumbers is None:
+            self._squared_wavenumbers = np.zeros(self._spectral_shape)
+            for _k in self._wavenumbers:
+                self._squared_wavenumbers += _k ** 2
+        return self._squared_wavenumbers
+
+    def buffer(self, name, spectral=False):
+        """Work buffer of the given name, allocated on first request
+
+        Parameters
+        ----------
+        name : :py:class:`str`
+        spectral : :py:class:`bool`
+            *(optional)*
+            whether the buffer holds a transformed field; defaults to ``False``
+
+        Returns
+        -------
+        buffer : :py:class:`numpy.ndarray`
+            of shape :py:attr:`.spectral_shape` and complex or of shape :py:attr:`.shape` and
+            :py:attr:`.field_dtype`; its values are undefined
+        """
+        if (name, spectral) not in self._buffers:
+            if spectral:
+                self._buffers[(name, spectral)] = np.zeros(self._spectral_shape, dtype=complex)
+            else:
+                self._buffers[(name, spectral)] = np.zeros(self._shape, dtype=self.field_dtype)
+        return self._buffers[(name, spectral)]
+
+    @property
+    def nbytes(self):
+        """Memory of all work buffers in bytes
+        """
+        return sum(_buffer.nbytes for _buffer in self._buffers.values())
+
+    def forward(self, u, overwrite=False):
+        """Transforms a field
+
+        Parameters
+        ----------
+        u : :py:class:`numpy.ndarray`
+            with as many values as grid points
+        overwrite : :py:class:`bool`
+            *(optional)*
+            whether ``u`` may be destroyed; defaults to ``False``
+
+        Returns
+        -------
+        u_hat : :py:class:`numpy.ndarray`
+            of shape :py:attr:`.spectral_shape`
+        """
+        _u = u.reshape(self._shape)
+        if self._real:
+            return fft.rfftn(_u, workers=self._workers, overwrite_x=overwrite)
+        return fft.fftn(_u, workers=self._workers, overwrite_x=overwrite)
+
+    def backward(self, u_hat, out=None, overwrite=True):
+        """Transforms back into a field
+
+        Parameters
+        ----------
+        u_hat : :py:class:`numpy.ndarray`
+            of shape :py:attr:`.spectral_shape`
+        out : :py:class:`numpy.ndarray`
+            *(optional)*
+            to store the field in
+        overwrite : :py:class:`bool`
+            *(optional)*
+            whether ``u_hat`` may be destroyed; defaults to ``True``
+
+        Returns
+        -------
+        u : :py:class:`numpy.ndarray`
+            of shape :py:attr:`.shape` or ``out``
+        """
+        if self._real:
+            _u = fft.irfftn(u_hat, s=self._shape, workers=self._workers, overwrite_x=overwrite)
+        else:
+            _u = fft.ifftn(u_hat, workers=self._workers, overwrite_x=overwrite)
+        if out is None:
+            return _u
+        out.reshape(self._shape)[:] = _u
+        return out
+
+    def derivative(self, u_hat, axis, out=None):
+        """First derivative of a transformed field along an axis
+
+        Parameters
+        ----------
+        u_hat : :py:class:`numpy.ndarray`
+            of shape :py:attr:`.spectral_shape`; left unchanged
+        axis : :py:class:`int`
+        out : :py:class:`numpy.ndarray`
+            *(optional)*
+            to store the derivative in
+
+        Returns
+        -------
+        derivative : :py:class:`numpy.ndarray`
+            of shape :py:attr:`.shape` or ``out``
+        """
+        _work = self.buffer('derivative', spectral=True)
+        np.multiply(u_hat, self._derivative_factors[axis], out=_work)
+        return self.backward(_work, out=out)
+
+
+__all__ = ['SpectralToolkit']
@@ -5,10 +5,11 @@
 from copy import deepcopy
 
 from pypint.communicators import Message
+from pypint.plugins.metrics.metrics_registry import HasMetricsMixin
 from pypint.utilities import assert_is_instance, assert_condition
 
 
-class ICommunicationProvider(object):
+class ICommunicationProvider(HasMetricsMixin):
     """Interface for communication providers
 
     Notes
@@ -27,6 +28,7 @@ class ICommunicationProvider(object):
         ValueError
             if ``buffer`` is not a :py:class:`.Message`
         """
+        HasMetricsMixin.__init__(self, *args, **kwargs)
         self._buffer = {}
 
         if 'buffer' in kwargs:
@@ -91,6 +93,7 @@ class ICommunicationProvider(object):
 
         if 'value' in kwargs:
             self._buffer[tag].value = deepcopy(kwargs['value'])
+            self.metrics.increment('communicated_bytes', getattr(kwargs['value'], 'nbytes', 0))
 
         if 'time_point' in kwargs:
             assert_is_instance(kwargs['time_point'], float, descriptor="Time Point", checking_obj=self)
@@ -6,6 +6,7 @@
 from copy import deepcopy
 
 import numpy as np
+from scipy.linalg import lu
 
 from pypint.integrators.integrator_base import IntegratorBase
 from pypint.integrators.node_providers.gauss_lobatto_nodes import GaussLobattoNodes
@@ -21,6 +22,7 @@ class SdcIntegrator(IntegratorBase):
         super(SdcIntegrator, self).__init__()
         self._smat = np.zeros(0)
         self._qmat = np.zeros(0)
+        self._q_deltas = {}
 
     def init(self, nodes_type=GaussLobattoNodes, num_nodes=3, weights_function=PolynomialWeightFunction, interval=None):
         """Initialize SDC Integrator
@@ -125,6 +127,91 @@ class SdcIntegrator(IntegratorBase):
             # LOG.debug("  weights: %s" % self._qmat[_target_index])
             return np.tensordot(self._qmat[_target_index], data, axes=([0], [0]))
 
+    def q_delta(self, kind='implicit-euler'):
+        """Approximation :math:`Q_\\Delta` of the :math:`Q`-matrix used as the preconditioner of SDC sweeps
+
+        Like the :math:`Q`-matrix, :math:`Q_\\Delta` is given with respect to the current interval and its first row
+        and column correspond to the first node, which is not computed by a sweep.
+        All built-in approximations are precomputed once per node set.
+
+        Parameters
+        ----------
+        kind : :py:class:`str` or :py:class:`numpy.ndarray`
+            *(optional)*
+            type of the approximation; one of
+
+            ``implicit-euler`` *(default)*
+                the node-to-node implicit Euler of the classic SDC sweep
+            ``explicit-euler``
+                the node-to-node explicit Euler
+            ``lu``
+                the *LU-trick*, i.e. the transposed :math:`U`-factor of the LU-decomposition of :math:`Q^T`
+            ``trapezoidal``
+                the node-to-node trapezoidal rule
+            ``diag``
+                the diagonal of the :math:`Q`-matrix
+            ``min-sr``
+                the *MIN-SR-NS* diagonal coefficients :math:`\\tau_m / M`, which minimize the spectral radius of the
+                non-stiff iteration matrix
+
+            A user-supplied lower-triangular matrix of the same shape as the :math:`Q`-matrix is returned as is.
+
+        Returns
+        -------
+        q_delta : :py:class:`numpy.ndarray`
+
+        Raises
+        ------
+        ValueError
+
+            * if ``kind`` is not a known approximation
+            * if a given matrix is not lower-triangular or of wrong shape
+        """
+        if isinstance(kind, np.ndarray):
+            assert_condition(kind.shape == self._qmat.shape,
+                             ValueError, message="Q_Delta must be of shape {}: NOT {}"
+                                                 .format(self._qmat.shape, kind.shape),
+                             checking_obj=self)
+            assert_condition(np.allclose(np.triu(kind, 1), 0.0),
+                             ValueError, message="Q_Delta must be lower-triangular.",
+                             checking_obj=self)
+            return kind
+        assert_condition(kind in self._q_deltas,
+                         ValueError, message="Unknown Q_Delta: {}".format(kind),
+                         checking_obj=self)
+        return self._q_deltas[kind]
+
+    def diagonal_q_delta(self, kind='diag'):
+        """Coefficients of a diagonal approximation :math:`Q_\\Delta` of the :math:`Q`-matrix
+
+        With a diagonal :math:`Q_\\Delta` the update of one node within an SDC sweep does not depend on the other
+        nodes of the same sweep.
+        Thus, all nodes of a sweep can be computed concurrently.
+
+        Parameters
+        ----------
+        kind : :py:class:`str` or :py:class:`numpy.ndarray`
+            *(optional)*
+            type of the diagonal approximation (see :py:meth:`.q_delta`);
+            *(defaults to ``diag``)*
+
+        Returns
+        -------
+        q_delta : :py:class:`numpy.ndarray`
+            coefficients for the nodes :math:`\\tau_1, \\dots, \\tau_n` (i.e. without the first node) with respect to
+            the current interval
+
+        Raises
+        ------
+        ValueError
+            if ``kind`` is not a diagonal approximation
+        """
+        _q_delta = self.q_delta(kind)[1:, 1:]
+        assert_condition(np.allclose(np.tril(_q_delta, -1), 0.0),
+                         ValueError, message="Q_Delta is not diagonal: {}".format(kind),
+                         checking_obj=self)
+        return np.diag(_q_delta).copy()
+
     def transform_interval(self, interval):
         """Transforms nodes onto new interval
 
@@ -174,6 +261,29 @@ class SdcIntegrator(IntegratorBase):
         for i in range(0, self._smat.shape[0]):
             self._qmat[i + 1] = self._qmat[i] + self._smat[i]
 
+        # approximations of Q used as preconditioners of the sweeps
+        _num_nodes = self.nodes.size
+        _deltas = np.diff(self.nodes)
+        _implicit_euler = np.zeros((_num_nodes, _num_nodes), dtype=float)
+        _explicit_euler = np.zeros((_num_nodes, _num_nodes), dtype=float)
+        for i in range(1, _num_nodes):
+            _implicit_euler[i, 1:i + 1] = _deltas[0:i]
+            _explicit_euler[i, 0:i] = _deltas[0:i]
+        _lu = np.zeros((_num_nodes, _num_nodes), dtype=float)
+        _lu[1:, 1:] = lu(self._qmat[1:, 1:].T)[2].T
+        _diag = np.zeros((_num_nodes, _num_nodes), dtype=float)
+        _diag[1:, 1:] = np.diag(np.diag(self._qmat)[1:])
+        _min_sr = np.zeros((_num_nodes, _num_nodes), dtype=float)
+        _min_sr[1:, 1:] = np.diag((self.nodes[1:] - self.nodes[0]) / (_num_nodes - 1))
+        self._q_deltas = {
+            'implicit-euler': _implicit_euler,
+            'explicit-euler': _explicit_euler,
+            'lu': _lu,
+            'trapezoidal': 0.5 * (_implicit_euler + _explicit_euler),
+            'diag': _diag,
+            'min-sr': _min_sr
+        }
+
     def __str__(self):
         return "SdcIntegrator<0x%x>(nodes=%s, weights=%s)" % (id(self), self.nodes_type, self.weights_function)
 
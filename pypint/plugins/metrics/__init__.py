@@ -0,0 +1,5 @@
+# coding=utf-8
+"""Counters of Work Units for PyPinT
+
+.. moduleauthor:: Torbjörn Klatt <t.klatt@fz-juelich.de>
+"""
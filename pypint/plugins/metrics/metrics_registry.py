@@ -0,0 +1,298 @@
+# coding=utf-8
+"""
+
+.. moduleauthor:: Torbjörn Klatt <t.klatt@fz-juelich.de>
+"""
+import json as json
+from collections import OrderedDict
+from threading import Lock
+
+
+class _Labels(object):
+    """Context adding labels to all counts of a registry
+    """
+    __slots__ = ('_registry', '_labels', '_previous')
+
+    def __init__(self, registry, labels):
+        self._registry = registry
+        self._labels = labels
+        self._previous = None
+
+    def __enter__(self):
+        self._previous = self._registry._context
+        _context = dict(self._previous)
+        _context.update(self._labels)
+        self._registry._context = _context
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._registry._context = self._previous
+        return False
+
+
+class _NullLabels(object):
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
+_NULL_LABELS = _NullLabels()
+
+
+class MetricsRegistry(object):
+    """Registry of counters of work units, e.g. right hand side evaluations or multigrid cycles
+
+    Each counter is identified by its name and a set of labels, e.g. ``partial`` and ``level`` of the right hand side
+    evaluations.
+    Labels given by :py:meth:`.labels` are added to all counts within its context; this way a solver attributes the
+    counts of its core and problem to the current level.
+    A disabled registry ignores all counts.
+    Counts may be added from several threads, e.g. by problems evaluated in the node-parallel sweeps, while the labels
+    apply to all threads.
+
+    The counters are exported as JSON (:py:meth:`.to_json`) or in the text format of Prometheus
+    (:py:meth:`.to_prometheus`).
+
+    The counters used by PyPinT are
+
+        ``rhs_evaluations``
+            by ``partial`` (``full``, ``expl`` or ``impl``) and ``level``
+        ``implicit_solves``
+            by ``level``
+        ``newton_iterations``
+            of the nonlinear solvers of the problems' implicit systems
+        ``linear_solver_iterations``
+            by ``method`` of the Krylov solvers of :py:meth:`.MultigridProblemMixin.mg_solve`
+        ``mg_cycles``
+            by ``cycle``
+        ``sparse_factorizations``
+            by ``kind``
+        ``cache_hits`` and ``cache_misses``
+            by ``cache`` (see :py:class:`.FactorizationCache`)
+        ``communicated_bytes``
+            of the values copied into the buffers of the communicators
+        ``iterations``
+            by ``interval``
+
+    Examples
+    --------
+    >>> metrics = MetricsRegistry()
+    >>> metrics.increment('rhs_evaluations', partial='expl')
+    >>> with metrics.labels(level=1):
+    ...     metrics.increment('rhs_evaluations', 2, partial='expl')
+    >>> metrics.total('rhs_evaluations'), metrics.value('rhs_evaluations', partial='expl', level=1)
+    (3, 2)
+    >>> print(metrics.to_prometheus())
+    # TYPE pypint_rhs_evaluations_total counter
+    pypint_rhs_evaluations_total{partial="expl"} 1
+    pypint_rhs_evaluations_total{level="1",partial="expl"} 2
+    """
+    def __init__(self, enabled=True):
+        """
+        Parameters
+        ----------
+        enabled : :py:class:`bool`
+            *(optional)*
+            defaults to ``True``
+        """
+        self._enabled = bool(enabled)
+        self._context = {}
+        # (name, sorted label items) -> value, in order of the first count
+        self._counters = OrderedDict()
+        self._lock = Lock()
+
+    def increment(self, name, value=1, **labels):
+        """Adds to a counter
+
+        Parameters
+        ----------
+        name : :py:class:`str`
+        value : :py:class:`int` or :py:class:`float`
+            *(optional)*
+            defaults to ``1``
+        labels : :py:class:`dict`
+            in addition to the ones of the current :py:meth:`.labels` context, which they take precedence over
+        """
+        if not self._enabled:
+            return
+        if self._context:
+            _labels = dict(self._context)
+            _labels.update(labels)
+        else:
+            _labels = labels
+        _key = (name, tuple(sorted((_label, str(_value)) for _label, _value in _labels.items())))
+        with self._lock:
+            self._counters[_key] = self._counters.get(_key, 0) + value
+
+    def labels(self, **labels):
+        """Context adding the given labels to all counts within
+
+        Parameters
+        ----------
+        labels : :py:class:`dict`
+
+        Returns
+        -------
+        context : context manager
+        """
+        if not self._enabled:
+            return _NULL_LABELS
+        return _Labels(self, labels)
+
+    @property
+    def enabled(self):
+        """Whether counts are recorded
+
+        Parameters
+        ----------
+        enabled : :py:class:`bool`
+        """
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, enabled):
+        self._enabled = bool(enabled)
+
+    def value(self, name, **labels):
+        """Value of the counter with exactly the given labels
+
+        Returns
+        -------
+        value : :py:class:`int` or :py:class:`float`
+            ``0`` if nothing was counted
+        """
+        return self._counters.get((name, tuple(sorted((_label, str(_value)) for _label, _value in labels.items()))),
+                                  0)
+
+    def total(self, name, **labels):
+        """Sum of all counters of the given name having (at least) the given labels
+
+        Returns
+        -------
+        total : :py:class:`int` or :py:class:`float`
+        """
+        _labels = set((_label, str(_value)) for _label, _value in labels.items())
+        return sum(_value for (_name, _items), _value in self._counters.items()
+                   if _name == name and _labels.issubset(_items))
+
+    def items(self):
+        """All counters in order of their first count
+
+        Returns
+        -------
+        items : :py:class:`list` of :py:class:`tuple`
+            of the name, the labels as :py:class:`dict` and the value
+        """
+        return [(_name, dict(_items), _value) for (_name, _items), _value in self._counters.items()]
+
+    def reset(self):
+        """Drops all counters
+        """
+        self._counters.clear()
+
+    def to_dict(self):
+        """Counters by name
+
+        Returns
+        -------
+        counters : :py:class:`dict`
+            of lists of dictionaries with the ``labels`` and ``value`` of each counter
+        """
+        _dict = OrderedDict()
+        for _name, _labels, _value in self.items():
+            _dict.setdefault(_name, []).append({'labels': _labels, 'value': _value})
+        return _dict
+
+    def to_json(self, **kwargs):
+        """Counters as JSON (see :py:meth:`.to_dict`)
+
+        Parameters
+        ----------
+        kwargs : :py:class:`dict`
+            passed on to :py:func:`json.dumps`
+
+        Returns
+        -------
+        json : :py:class:`str`
+        """
+        return json.dumps(self.to_dict(), **kwargs)
+
+    def to_prometheus(self, prefix="pypint_"):
+        """Counters in the text exposition format of Prometheus
+
+        Parameters
+        ----------
+        prefix : :py:class:`str`
+            *(optional)*
+            of the metric names; defaults to ``pypint_``
+
+        Returns
+        -------
+        text : :py:class:`str`
+        """
+        _lines = []
+        for _name, _counters in self.to_dict().items():
+            _metric = "%s%s_total" % (prefix, _name)
+            _lines.append("# TYPE %s counter" % _metric)
+            for _counter in _counters:
+                _labels = ",".join('%s="%s"' % (_label, _escape_label_value(_value))
+                                   for _label, _value in sorted(_counter['labels'].items()))
+                _lines.append("%s%s %s" % (_metric, "{%s}" % _labels if _labels else "", _counter['value']))
+        return "\n".join(_lines)
+
+
+def _escape_label_value(value):
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+DISABLED_METRICS = MetricsRegistry(enabled=False)
+"""Shared disabled registry used by default
+"""
+
+
+class HasMetricsMixin(object):
+    """Provides the :py:class:`.MetricsRegistry` counted work is reported to
+
+    Solvers hand their registry on to their cores, problems and communicators.
+    Objects registered with :py:meth:`._add_metered`, e.g. caches, get the registry as well.
+    """
+    def __init__(self, *args, **kwargs):
+        self._metrics = DISABLED_METRICS
+
+    @property
+    def metrics(self):
+        """Accessor for the metrics registry
+
+        Parameters
+        ----------
+        metrics : :py:class:`.MetricsRegistry`
+            handed on to all registered objects
+
+        Returns
+        -------
+        metrics : :py:class:`.MetricsRegistry`
+            :py:data:`.DISABLED_METRICS` by default
+        """
+        return getattr(self, '_metrics', DISABLED_METRICS)
+
+    @metrics.setter
+    def metrics(self, metrics):
+        self._metrics = metrics
+        for _metered in getattr(self, '_metered', ()):
+            _metered.metrics = metrics
+
+    def _add_metered(self, *metered):
+        """Registers objects with a ``metrics`` attribute to get the registry of this one
+        """
+        if getattr(self, '_metered', None) is None:
+            self._metered = []
+        for _metered in metered:
+            self._metered.append(_metered)
+            _metered.metrics = self.metrics
+
+
+__all__ = ['MetricsRegistry', 'HasMetricsMixin', 'DISABLED_METRICS']
@@ -1,5 +1,7 @@
 # coding=utf-8
 
+import itertools as it
+
 import numpy as np
 from pypint.plugins.multigrid.interpolation import InterpolationByStencilForLevelsClassical
 from pypint.plugins.multigrid.restriction import RestrictionByStencilForLevelsClassical
@@ -21,7 +23,7 @@ MG_LEVEL_PRESETS = {}
 """Useful presets for the level setup used by MGCore
 """
 
-corner_array = np.ones((2., 2.)) * 0.25
+corner_array = np.ones((2, 2)) * 0.25
 border_arr_h = np.asarray([[0.5, 0.5]])
 border_arr_v = np.asarray([[0.5], [0.5]])
 
@@ -54,6 +56,24 @@ MG_RESTRICTION_PRESETS["Standard-1D"] = {
     "rst_opts": [Stencil(np.asarray([0.25, 0.5, 0.25]))]
 }
 
+# trilinear interpolation: coarse points are copied, the others are averaged over the neighbouring coarse points
+ipl_stencil_list_3d = []
+for position in it.product((0, 1), repeat=3):
+    _arr = np.ones([1 if p == 1 else 2 for p in position]) * 0.5 ** (3 - sum(position))
+    ipl_stencil_list_3d.append((Stencil(_arr), position))
+
+MG_INTERPOLATION_PRESETS["Standard-3D"] = {
+    "ipl_class": InterpolationByStencilForLevelsClassical,
+    "ipl_opts": [ipl_stencil_list_3d]
+}
+
+full_weighting_1d = np.asarray([0.25, 0.5, 0.25])
+
+MG_RESTRICTION_PRESETS["Standard-3D"] = {
+    "rst_class": RestrictionByStencilForLevelsClassical,
+    "rst_opts": [Stencil(np.einsum('i,j,k->ijk', full_weighting_1d, full_weighting_1d, full_weighting_1d))]
+}
+
 MG_LEVEL_PRESETS["Standard-1D"] = {
     "dim": 1,
     "shape_coarse": 32,
@@ -68,6 +88,13 @@ MG_LEVEL_PRESETS["Standard-2D"] = {
     "max_borders":  np.ones((2, 2)) * 2
 }
 
+MG_LEVEL_PRESETS["Standard-3D"] = {
+    "dim": 3,
+    "shape_coarse": (8, 8, 8),
+    "num_levels": 3,
+    "max_borders": np.ones((3, 2), dtype=int) * 2
+}
+
 MG_SMOOTHER_PRESETS["Jacobi"] = {
     "smoothing_type": "jacobi",
     "n_pre": 3,
@@ -87,4 +114,34 @@ MG_SMOOTHER_PRESETS["ILU"] = {
     }
 }
 
+MG_SMOOTHER_PRESETS["RedBlackGaussSeidel"] = {
+    "smoothing_type": "red_black_gauss_seidel",
+    "n_pre": 2,
+    "n_post": 2,
+    "smooth_opts": {
+        "omega": 1.0
+    }
+}
+
+MG_SMOOTHER_PRESETS["Chebyshev"] = {
+    "smoothing_type": "chebyshev",
+    "n_pre": 1,
+    "n_post": 1,
+    "smooth_opts": {
+        "degree": 3,
+        "lower_fraction": 0.3
+    }
+}
+
+# the sliced smoothers split large levels into blocks relaxed by "n_workers" threads
+MG_SMOOTHER_PRESETS["DampedJacobi"] = {
+    "smoothing_type": "damped_jacobi",
+    "n_pre": 2,
+    "n_post": 2,
+    "smooth_opts": {
+        "omega": 2.0 / 3.0,
+        "n_workers": 1
+    }
+}
+
 __all__ = ['MG_SMOOTHER_PRESETS', 'MG_LEVEL_PRESETS', 'MG_RESTRICTION_PRESETS', 'MG_INTERPOLATION_PRESETS']
@@ -0,0 +1,178 @@
+# coding=utf-8
+"""Dirichlet boundary conditions and the values of the ghost cells they define
+
+.. moduleauthor:: Torbjörn Klatt <t.klatt@fz-juelich.de>
+"""
+import numpy as np
+
+from pypint.utilities import assert_condition, assert_is_callable
+
+
+class BoundaryCondition(object):
+    """Dirichlet boundary values given by a function of the coordinates and, optionally, of the time
+
+    A static boundary condition is called as ``function(x)`` and its values are computed only once for each level.
+    A time-dependent one is called as ``function(x, time)`` whenever the ghost cells are padded for another time.
+    In both cases ``x`` holds the coordinates of all ghost cells of one part of the boundary at once.
+
+    Plain callables given as boundary functions of a :py:class:`.MultigridProblemMixin` are treated as static boundary
+    conditions (see :py:func:`.as_boundary_condition`).
+
+    Examples
+    --------
+    >>> bc = BoundaryCondition(lambda x, t: x * t, time_dependent=True)
+    >>> float(bc(2.0, time=3.0))
+    6.0
+    """
+
+    def __init__(self, function=None, time_dependent=False):
+        """
+        Parameters
+        ----------
+        function : :py:class:`callable`
+            *(optional)*
+            defaults to zero
+        time_dependent : :py:class:`bool`
+            *(optional)*
+            whether ``function`` takes the time as second argument; defaults to ``False``
+        """
+        if function is None:
+            function = lambda x: 0.0
+            time_dependent = False
+        assert_is_callable(function, descriptor="Boundary Function", checking_obj=self)
+        self._function = function
+        self._time_dependent = bool(time_dependent)
+
+    @property
+    def function(self):
+        return self._function
+
+    @property
+    def time_dependent(self):
+        """Whether the boundary values change with the time
+        """
+        return self._time_dependent
+
+    @property
+    def static(self):
+        return not self._time_dependent
+
+    def __call__(self, x, time=None):
+        """Boundary values at the given coordinates
+
+        Parameters
+        ----------
+        x : :py:class:`numpy.ndarray` or :py:class:`list` of :py:class:`numpy.ndarray`
+            coordinates
+        time : :py:class:`float`
+            *(optional)*
+            required for time-dependent boundary conditions
+
+        Raises
+        ------
+        ValueError
+            if no time is given for a time-dependent boundary condition
+        """
+        if self._time_dependent:
+            assert_condition(time is not None, ValueError,
+                             message="Time-dependent boundary condition requires the time", checking_obj=self)
+            return self._function(x, time)
+        return self._function(x)
+
+    def __str__(self):
+        return "%s(%s, time_dependent=%s)" % (self.__class__.__name__, self._function, self._time_dependent)
+
+
+def as_boundary_condition(function):
+    """Wraps a boundary function as static :py:class:`.BoundaryCondition` unless it is one already
+
+    Parameters
+    ----------
+    function : :py:class:`None`, :py:class:`callable` or :py:class:`.BoundaryCondition`
+        ``None`` for zero
+
+    Returns
+    -------
+    boundary_condition : :py:class:`.BoundaryCondition`
+    """
+    if isinstance(function, BoundaryCondition):
+        return function
+    return BoundaryCondition(function)
+
+
+class DirichletGhostCells(object):
+    """Values of the ghost cells of a level with Dirichlet boundaries
+
+    Each region of ghost cells is a part of the padded array given by its slices together with the boundary
+    conditions it belongs to and the coordinates of its points.
+    The values of a region belonging to several boundaries, e.g. a corner, are the mean of their boundary conditions.
+
+    The values of static boundary conditions are computed on construction, so that padding is just copying the
+    stored values into the slices of the padded array.
+    Time-dependent boundary conditions are evaluated on all points of a region at once, only if the time changed
+    since the last padding.
+    """
+
+    def __init__(self, regions, arr):
+        """
+        Parameters
+        ----------
+        regions : :py:class:`list` of :py:class:`tuple`
+            ``(slices, boundary_conditions, coordinates)`` for each region of ghost cells, with ``slices`` selecting
+            its points of the padded array and ``coordinates`` passed to the boundary conditions
+        arr : :py:class:`numpy.ndarray`
+            padded array
+        """
+        self._regions = []
+        self._time = None
+        for _slices, _conditions, _coordinates in regions:
+            _conditions = [as_boundary_condition(_bc) for _bc in _conditions]
+            _static = np.zeros(arr[_slices].shape, dtype=arr.dtype)
+            for _bc in _conditions:
+                if _bc.static:
+                    _static += _bc(_coordinates)
+            _static /= len(_conditions)
+            _dynamic = [_bc for _bc in _conditions if _bc.time_dependent]
+            # values of the region, the static part of them and the time-dependent conditions with their coordinates
+            if _dynamic:
+                self._regions.append([_slices, _static.copy(), _static, _dynamic, _coordinates, len(_conditions)])
+            else:
+                self._regions.append([_slices, _static, _static, _dynamic, None, len(_conditions)])
+        self._time_dependent = any(len(_region[3]) > 0 for _region in self._regions)
+
+    @property
+    def time_dependent(self):
+        """Whether any of the boundary conditions is time-dependent
+        """
+        return self._time_dependent
+
+    def pad(self, arr, time=None):
+        """Writes the values of the ghost cells into the padded array
+
+        Parameters
+        ----------
+        arr : :py:class:`numpy.ndarray`
+            padded array
+        time : :py:class:`float`
+            *(optional)*
+            time for time-dependent boundary conditions; defaults to the one of the last padding
+
+        Raises
+        ------
+        ValueError
+            if there are time-dependent boundary conditions but no time was given yet
+        """
+        if time is not None and time != self._time and self._time_dependent:
+            for _slices, _values, _static, _dynamic, _coordinates, _n in self._regions:
+                if _dynamic:
+                    _values[:] = _static
+                    for _bc in _dynamic:
+                        _values += np.asarray(_bc(_coordinates, time)) / _n
+            self._time = time
+        assert_condition(self._time is not None or not self._time_dependent, ValueError,
+                         message="Time-dependent boundary conditions require the time", checking_obj=self)
+        for _region in self._regions:
+            arr[_region[0]] = _region[1]
+
+
+__all__ = ['BoundaryCondition', 'as_boundary_condition', 'DirichletGhostCells']
@@ -0,0 +1,216 @@
+# coding=utf-8
+"""Bounded cache of factorizations of space operators
+
+.. moduleauthor:: Torbjörn Klatt <t.klatt@fz-juelich.de>
+"""
+from collections import OrderedDict
+from threading import RLock
+
+import numpy as np
+
+from pypint.plugins.metrics.metrics_registry import HasMetricsMixin
+from pypint.utilities import assert_condition, assert_is_callable
+
+
+def estimate_nbytes(value):
+    """Estimates the memory held by a cached value
+
+    Counts :py:class:`numpy.ndarray` and sparse matrices, the :math:`L` and :math:`U` factors of
+    :py:class:`scipy.sparse.linalg.SuperLU` objects and recurses into dicts, lists and tuples.
+    Anything else is not counted.
+
+    Parameters
+    ----------
+    value : :py:class:`object`
+
+    Returns
+    -------
+    nbytes : :py:class:`int`
+    """
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, dict):
+        return sum(estimate_nbytes(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return sum(estimate_nbytes(v) for v in value)
+    if hasattr(value, 'L') and hasattr(value, 'U'):
+        return estimate_nbytes(value.L) + estimate_nbytes(value.U) \
+            + estimate_nbytes(getattr(value, 'perm_r', None)) + estimate_nbytes(getattr(value, 'perm_c', None))
+    if hasattr(value, 'data') and hasattr(value, 'nnz'):
+        return sum(estimate_nbytes(getattr(value, attr, None)) for attr in ('data', 'indices', 'indptr', 'offsets'))
+    return 0
+
+
+class FactorizationCache(HasMetricsMixin):
+    """Least recently used cache of factorizations keyed by a key and a time step width
+
+    Entries are looked up by a hashable key, e.g. the time level and the grid shape, and a time step width
+    :math:`\\Delta\\tau`.
+    Time step widths within the given tolerance of a cached one are considered equal, so that nearly equal widths
+    share one factorization.
+
+    Once there are more than ``max_entries`` entries or the estimated memory of all entries exceeds ``max_bytes``,
+    the least recently used entries are evicted.
+
+    Hits and misses are counted by the cache's :py:attr:`.metrics` as well, labelled with the cache's ``name``.
+
+    Lookups from several threads are serialized, thus a missing value is created only once.
+    The cached values themselves are shared among the threads.
+
+    Examples
+    --------
+    >>> cache = FactorizationCache(max_entries=2)
+    >>> cache.get('level', 0.1, lambda: 'LU(0.1)')
+    'LU(0.1)'
+    >>> cache.get('level', 0.1 + 1e-16, lambda: 'another LU')
+    'LU(0.1)'
+    >>> cache.hits, cache.misses
+    (1, 1)
+    """
+
+    def __init__(self, max_entries=32, max_bytes=None, rtol=1e-10, atol=0.0, sizeof=estimate_nbytes,
+                 name='factorizations'):
+        """
+        Parameters
+        ----------
+        max_entries : :py:class:`int`
+            *(optional)*
+            maximum number of entries; defaults to ``32``
+        max_bytes : :py:class:`int`
+            *(optional)*
+            maximum estimated memory of all entries; unbounded by default
+        rtol : :py:class:`float`
+            *(optional)*
+            relative tolerance for matching time step widths; defaults to ``1e-10``
+        atol : :py:class:`float`
+            *(optional)*
+            absolute tolerance for matching time step widths; defaults to ``0.0``
+        sizeof : :py:func:`callable`
+            *(optional)*
+            estimate of the memory of a value in bytes; defaults to :py:func:`.estimate_nbytes`
+        name : :py:class:`str`
+            *(optional)*
+            label of the counted hits and misses; defaults to ``factorizations``
+
+        Raises
+        ------
+        ValueError
+            if ``max_entries`` is not positive, ``max_bytes`` is negative or a tolerance is negative
+        """
+        super(FactorizationCache, self).__init__()
+        # (key, delta_time) -> (value, nbytes), least recently used first
+        self._entries = OrderedDict()
+        assert_condition(max_entries > 0, ValueError,
+                         message="Maximum number of entries must be positive: NOT %s" % max_entries, checking_obj=self)
+        assert_condition(max_bytes is None or max_bytes >= 0, ValueError,
+                         message="Maximum memory must not be negative: NOT %s" % max_bytes, checking_obj=self)
+        assert_condition(rtol >= 0.0 and atol >= 0.0, ValueError,
+                         message="Tolerances must not be negative", checking_obj=self)
+        assert_is_callable(sizeof, descriptor="Size Estimation", checking_obj=self)
+        self._name = name
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._rtol = rtol
+        self._atol = atol
+        self._sizeof = sizeof
+        self._nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = RLock()
+
+    def get(self, key, delta_time, factory):
+        """Returns the cached value for the key and time step width, creating it on a miss
+
+        Parameters
+        ----------
+        key : hashable
+        delta_time : :py:class:`float` or :py:class:`None`
+            time step width; ``None`` only matches ``None``
+        factory : :py:func:`callable`
+            called without arguments to create the value on a miss
+
+        Returns
+        -------
+        value
+        """
+        with self._lock:
+            _entry_key = self._find(key, delta_time)
+            if _entry_key is not None:
+                self.hits += 1
+                self.metrics.increment('cache_hits', cache=self._name)
+                self._entries.move_to_end(_entry_key)
+                return self._entries[_entry_key][0]
+
+            self.misses += 1
+            self.metrics.increment('cache_misses', cache=self._name)
+            assert_is_callable(factory, descriptor="Factory", checking_obj=self)
+            _value = factory()
+            _nbytes = self._sizeof(_value)
+            self._entries[(key, delta_time)] = (_value, _nbytes)
+            self._nbytes += _nbytes
+            self._evict()
+            return _value
+
+    def clear(self):
+        """Drops all entries and resets the counters
+        """
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    @property
+    def nbytes(self):
+        """Estimated memory of all entries in bytes
+
+        Returns
+        -------
+        nbytes : :py:class:`int`
+        """
+        return self._nbytes
+
+    @property
+    def hit_rate(self):
+        """Fraction of lookups which were hits
+
+        Returns
+        -------
+        hit_rate : :py:class:`float`
+            ``0.0`` if there were no lookups yet
+        """
+        _lookups = self.hits + self.misses
+        return self.hits / _lookups if _lookups > 0 else 0.0
+
+    def _matches(self, delta_time, cached):
+        if delta_time is None or cached is None:
+            return delta_time is cached
+        return abs(delta_time - cached) <= self._atol + self._rtol * abs(cached)
+
+    def _find(self, key, delta_time):
+        if (key, delta_time) in self._entries:
+            return key, delta_time
+        for _key, _delta_time in reversed(self._entries):
+            if _key == key and self._matches(delta_time, _delta_time):
+                return _key, _delta_time
+        return None
+
+    def _evict(self):
+        # the latest entry is kept in any case
+        while len(self._entries) > 1 and (len(self._entries) > self._max_entries or
+                                          (self._max_bytes is not None and self._nbytes > self._max_bytes)):
+            _value, _nbytes = self._entries.popitem(last=False)[1]
+            self._nbytes -= _nbytes
+            self.evictions += 1
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __str__(self):
+        return "%s(entries=%d, nbytes=%d, hits=%d, misses=%d, evictions=%d)" \
+               % (self.__class__.__name__, len(self), self._nbytes, self.hits, self.misses, self.evictions)
+
+
+__all__ = ['FactorizationCache', 'estimate_nbytes']
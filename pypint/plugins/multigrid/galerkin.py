@@ -0,0 +1,105 @@
+# coding=utf-8
+"""Sparse transfer matrices and Galerkin coarse operators
+
+.. moduleauthor:: Torbjörn Klatt <t.klatt@fz-juelich.de>
+"""
+from functools import reduce
+
+import numpy as np
+import scipy.sparse as sprs
+
+from pypint.plugins.multigrid.stencil import Stencil
+from pypint.utilities import assert_condition
+
+
+def linear_interpolation_matrix(coarse_shape, dtype=float):
+    """Sparse matrix of the (bi-)linear interpolation from a coarse grid to the next finer one
+
+    The fine grid has :math:`2n+1` points along each axis with :math:`n` points of the coarse grid, the values on
+    the boundaries are zero.
+    This is the interpolation of the ``Standard-1D`` and ``Standard-2D`` presets.
+
+    Parameters
+    ----------
+    coarse_shape : :py:class:`tuple`
+        shape of the coarse grid
+    dtype : :py:class:`numpy.dtype`
+        *(optional)*
+
+    Returns
+    -------
+    interpolation : :py:class:`scipy.sparse.csr_matrix`
+        of shape :math:`(N_{fine}, N_{coarse})` with respect to the flattened grids
+    """
+    _matrices = []
+    for n in coarse_shape:
+        n = int(n)
+        _coarse = np.arange(n)
+        _rows = np.hstack((2 * _coarse, 2 * _coarse + 1, 2 * _coarse + 2))
+        _cols = np.hstack((_coarse, _coarse, _coarse))
+        _data = np.hstack((np.full(n, 0.5), np.ones(n), np.full(n, 0.5))).astype(dtype)
+        _matrices.append(sprs.csr_matrix((_data, (_rows, _cols)), shape=(2 * n + 1, n)))
+    return reduce(lambda a, b: sprs.kron(a, b, format="csr"), _matrices)
+
+
+def full_weighting_matrix(coarse_shape, dtype=float):
+    """Sparse matrix of the full weighting restriction onto the given coarse grid
+
+    The transposed of :py:func:`.linear_interpolation_matrix` scaled by :math:`2^{-d}`, i.e. the restriction of the
+    ``Standard-1D`` and ``Standard-2D`` presets.
+
+    Returns
+    -------
+    restriction : :py:class:`scipy.sparse.csr_matrix`
+        of shape :math:`(N_{coarse}, N_{fine})`
+    """
+    return (linear_interpolation_matrix(coarse_shape, dtype).T * 0.5 ** len(coarse_shape)).tocsr()
+
+
+def galerkin_product(restriction, matrix, interpolation):
+    """Galerkin coarse operator :math:`R A P`
+
+    Returns
+    -------
+    coarse matrix : :py:class:`scipy.sparse.csr_matrix`
+    """
+    return (restriction.dot(matrix.tocsr())).dot(interpolation).tocsr()
+
+
+def stencil_from_matrix(matrix, shape):
+    """Extracts the stencil of a matrix from the row of the grid's center point
+
+    For an operator with constant coefficients, this gives back the stencil the matrix was assembled from, e.g. with
+    :py:meth:`.Stencil.to_sparse_matrix`.
+
+    Parameters
+    ----------
+    matrix : :py:class:`scipy.sparse.spmatrix`
+        operator on the flattened grid
+    shape : :py:class:`tuple`
+        shape of the grid
+
+    Returns
+    -------
+    stencil : :py:class:`.Stencil`
+        centered stencil
+
+    Raises
+    ------
+    ValueError
+        if the matrix does not match the grid
+    """
+    shape = tuple(int(n) for n in shape)
+    assert_condition(matrix.shape == (np.prod(shape), np.prod(shape)), ValueError,
+                     "Matrix of shape %s does not match grid of shape %s" % (matrix.shape, shape))
+    _center = tuple(n // 2 for n in shape)
+    _row = matrix.tocsr()[int(np.ravel_multi_index(_center, shape))]
+    _offsets = np.asarray(np.unravel_index(_row.indices, shape)).T - np.asarray(_center)
+    _radius = np.max(np.abs(_offsets), axis=0) if _offsets.size > 0 else np.zeros(len(shape), dtype=int)
+    _arr = np.zeros(tuple(2 * r + 1 for r in _radius), dtype=matrix.dtype)
+    for _offset, _value in zip(_offsets, _row.data):
+        _arr[tuple(_offset + _radius)] += _value
+    return Stencil(_arr)
+
+
+__all__ = ['linear_interpolation_matrix', 'full_weighting_matrix', 'galerkin_product', 'stencil_from_matrix']
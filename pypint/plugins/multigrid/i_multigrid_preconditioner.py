@@ -0,0 +1,70 @@
+# coding=utf-8
+"""Interface for multigrid methods used as preconditioners of Krylov solvers
+
+.. moduleauthor:: Torbjörn Klatt <t.klatt@fz-juelich.de>
+"""
+import numpy as np
+import scipy.sparse.linalg as spla
+
+
+class IMultigridPreconditioner(object):
+    """Approximates the inverse of a linear operator by a fixed number of multigrid cycles
+
+    Applying it has to be a linear operation on the right hand side, i.e. the cycles start from a zero initial guess
+    and their smoothers must not depend on the values.
+    For conjugate gradients the cycles must be symmetric as well, e.g. with the same number of damped Jacobi pre- and
+    post-smoothing steps.
+    """
+
+    def __init__(self, shape, dtype=float, *args, **kwargs):
+        """
+        Parameters
+        ----------
+        shape : :py:class:`tuple`
+            shape :math:`(N, N)` of the approximated operator on the flattened grid
+        dtype : :py:class:`numpy.dtype`
+            *(optional)*
+        """
+        self._shape = tuple(int(n) for n in shape)
+        self._dtype = np.dtype(dtype)
+
+    def apply(self, rhs):
+        """Approximately solves the linear system for the given right hand side
+
+        Parameters
+        ----------
+        rhs : :py:class:`numpy.ndarray`
+            of :math:`N` values
+
+        Returns
+        -------
+        approximation : :py:class:`numpy.ndarray`
+            of the shape of ``rhs``
+        """
+        raise NotImplementedError("Must be implemented and overridden by subclasses.")
+
+    @property
+    def shape(self):
+        """Shape of the approximated operator
+
+        Returns
+        -------
+        shape : :py:class:`tuple`
+        """
+        return self._shape
+
+    @property
+    def dtype(self):
+        return self._dtype
+
+    def as_linear_operator(self):
+        """Wraps :py:meth:`.apply` to be passed as ``M`` to the solvers of :py:mod:`scipy.sparse.linalg`
+
+        Returns
+        -------
+        operator : :py:class:`scipy.sparse.linalg.LinearOperator`
+        """
+        return spla.LinearOperator(self.shape, matvec=lambda rhs: self.apply(rhs.reshape(-1)), dtype=self.dtype)
+
+
+__all__ = ['IMultigridPreconditioner']
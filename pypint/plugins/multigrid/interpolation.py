@@ -7,6 +7,7 @@ from pypint.plugins.multigrid.stencil import Stencil
 from pypint.utilities import assert_is_callable, assert_is_instance, assert_condition
 from pypint.plugins.multigrid.i_multigrid_level import IMultigridLevel
 import itertools as it
+from operator import iadd
 
 class InterpolationByStencilForLevelsClassical(IInterpolation):
     """1D class for Interpolation which binds two levels
@@ -47,7 +48,7 @@ class InterpolationByStencilForLevelsClassical(IInterpolation):
 
         for i in range(level_in.mid.ndim):
 
-            self.iip.append((level_out.mid.shape[i]-1)/(level_in.mid.shape[i]) - 1)
+            self.iip.append((level_out.mid.shape[i]-1)//(level_in.mid.shape[i]) - 1)
 
             n = level_out.mid.shape[i]
             m = level_in.mid.shape[i]
@@ -69,32 +70,62 @@ class InterpolationByStencilForLevelsClassical(IInterpolation):
         for st, pos in stencil_list:
             sl_out = []
             for i in range(st.dim):
-                sl_out.append(slice(pos[i], None, self.iip[i]+1))
+                sl_out.append(slice(pos[i], None, int(self.iip[i])+1))
             # print("Initial Position:", pos)
             # print("Slice", sl_out)
             self.slices_out.append(tuple(sl_out.copy()))
 
-
-
+        # the fine points at the position of a stencil get the stencil applied to the coarse values, i.e. the
+        # "full" convolution; each stencil entry adds a shifted part of the coarse values to part of the fine points
+        coarse_shape = level_in.interpolate_out_mid.shape
+        self.entries = []
+        self._scratch = []
+        for (st, pos), sl_out in zip(stencil_list, self.slices_out):
+            target_shape = level_out.interpolate_in[sl_out].shape
+            stencil_entries = []
+            for index in zip(*np.nonzero(st.arr)):
+                coarse = []
+                target = []
+                for k, n_st, m, n_t in zip(index, st.arr.shape, coarse_shape, target_shape):
+                    shift = n_st - 1 - k
+                    t_start, t_stop = max(0, shift), min(n_t, m + shift)
+                    coarse.append(slice(t_start - shift, t_stop - shift))
+                    target.append(slice(t_start, t_stop))
+                stencil_entries.append((st.arr[index], tuple(coarse), tuple(target)))
+            self.entries.append(stencil_entries)
+            self._scratch.append(np.empty(target_shape,
+                                          dtype=np.result_type(st.arr, level_in.interpolate_out_mid)))
+        # adding up works in place on the fine level, otherwise the values are computed into buffers first
+        self._in_place = pre_assign is None or pre_assign is iadd
+        self._buffers = [None if self._in_place else np.empty_like(scratch) for scratch in self._scratch]
+
+    def _accumulate(self, i, out):
+        array_in = self.level_in.interpolate_out_mid
+        for value, coarse, target in self.entries[i]:
+            if value == 1.0:
+                out[target] += array_in[coarse]
+            else:
+                np.multiply(array_in[coarse], value, out=self._scratch[i][target])
+                out[target] += self._scratch[i][target]
+        return out
 
     def eval(self):
-        """ for each stencil at a certain position the convolution is computed
+        """ for each stencil at a certain position the stencil is applied to the coarse values
 
+        Only the fine points at the stencil's position are computed, which are added to or assigned to the fine
+        level in place.
         """
         for i in range(len(self.stencil_list)):
-            # print("\nPosition: ", self.stencil_list[i][1])
-            # print("Out_shape: ", self.level_out.interpolate_in[self.slices_out[i]].shape)
-            # siggy = sig.convolve(self.level_in.interpolate_out_mid, self.stencil_list[i][0].reversed_arr, "full")
-            # print("In_shape:", siggy.shape)
-            # print(siggy)
-            # print("reversed arr_shape:", self.stencil_list[i][0].reversed_arr.shape)
-            # print(self.stencil_list[i][0].reversed_arr)
-            # the option "full" means that the array is padded with zeros
-
-            self.level_out.interpolate_in[self.slices_out[i]] = \
-                self.pre_assign(
-                    self.level_out.interpolate_in[self.slices_out[i]],
-                    sig.convolve(self.level_in.interpolate_out_mid, self.stencil_list[i][0].reversed_arr, "full"))
+            if self._in_place:
+                out = self.level_out.interpolate_in[self.slices_out[i]]
+                if self.pre_assign is not iadd:
+                    out[...] = 0.0
+                self._accumulate(i, out)
+            else:
+                self._buffers[i][...] = 0.0
+                self.level_out.interpolate_in[self.slices_out[i]] = \
+                    self.pre_assign(self.level_out.interpolate_in[self.slices_out[i]],
+                                    self._accumulate(i, self._buffers[i]))
 
 class InterpolationByStencilForLevels(IInterpolation):
     """1D class for Interpolation which binds two levels
@@ -166,7 +197,6 @@ class InterpolationByStencilForLevels(IInterpolation):
         """
         for i in range(len(self.stencil_list)):
             # sigs = sig.convolve(self.evaluable_views[i], self.stencil_list[i][0].arr, 'valid')
-            print(i, self.level_out.interpolate_in[self.slices_out[i]].shape, self.evaluable_views[i].shape, self.stencil_list[i][0].arr[::-1].shape)
             # print("slice_out :\n", self.slices_out[i])
             # print("Stencil_arr: \n", self.stencil_list[i][0].arr)
             # print("eval_view: \n", self.evaluable_views[i])
@@ -7,6 +7,8 @@ import scipy.signal as sig
 from pypint.utilities import assert_is_callable, assert_is_instance, assert_condition
 # from pypint.plugins.multigrid.multigrid_problem_mixin import problem_is_multigrid_problem
 from pypint.plugins.multigrid.stencil import Stencil
+from pypint.plugins.multigrid.boundary_condition import as_boundary_condition, DirichletGhostCells
+from pypint.plugins.multigrid.memory_arena import zeros
 from pypint.plugins.multigrid.i_multigrid_level import IMultigridLevel
 from pypint.utilities.logging import LOG
 
@@ -52,12 +54,15 @@ class MultigridLevel1D(IMultigridLevel):
     --------
 
     """
-    def __init__(self, shape, mg_problem=None, max_borders=None, dtype=float, role="ML"):
+    def __init__(self, shape, mg_problem=None, max_borders=None, dtype=float, role="ML", arena=None):
         """
         Summary
         -------
         takes the physical MultiGridProblem and initialises with help of
         max_borders, and n_points an appropriate array
+
+        The padded array, the residual and the right hand side are taken from ``arena`` if given
+        (see :py:meth:`.buffer_shapes`).
         """
         # the level should know its geometrical information, because it differs from level to level
         self.space_tensor = None
@@ -70,7 +75,7 @@ class MultigridLevel1D(IMultigridLevel):
                 forward_shape = shape
             else:
                 raise ValueError("Please provide an ndarray with the size of 2")
-            self.arr = np.zeros(forward_shape, dtype=dtype)
+            self.arr = zeros(forward_shape, dtype, arena)
             # if problem_is_multigrid_problem(mg_problem, checking_obj=self) and len(mg_problem.spacial_dim) == 1:
             if len(mg_problem.spacial_dim) == 1:
                 self._mg_problem = mg_problem
@@ -85,7 +90,7 @@ class MultigridLevel1D(IMultigridLevel):
                 max_borders = shape.borders
                 forward_shape = forward_shape + max_borders[0] + max_borders[1]
 
-            self.arr = np.zeros(forward_shape, dtype=dtype)
+            self.arr = zeros(forward_shape, dtype, arena)
 
             self.arr[max_borders[0]:-max_borders[1]] = shape.mid
 
@@ -107,7 +112,7 @@ class MultigridLevel1D(IMultigridLevel):
             else:
                 raise ValueError("Please provide an ndarray with the size of 2")
 
-            self.arr = np.zeros(forward_shape, dtype=dtype)
+            self.arr = zeros(forward_shape, dtype, arena)
             self.arr[max_borders[0]:-max_borders[1]] = shape
 
             # if problem_is_multigrid_problem(mg_problem, checking_obj=self) and mg_problem.dim == 1:
@@ -126,22 +131,23 @@ class MultigridLevel1D(IMultigridLevel):
         self.left = self.arr.__array__()[:self.borders[0]]
         self.right = self.arr.__array__()[-self.borders[1]:]
         self.mid = self.arr.__array__()[self.borders[0]:-self.borders[1]]
-        self._rhs = np.copy(self.mid)
+        self._rhs = zeros(self.mid.shape, dtype, arena)
+        self._rhs[:] = self.mid
 
         # the first border points coincides with the geometrical border
         # that is why self.mid.size+1 is used instead of self.mid.size - 1
         self.h = (self._mg_problem.geometry[0][1]
                   - self._mg_problem.geometry[0][0]) / (self.mid.size + 1)
-        start = self._mg_problem.geometry[0][0] - self.h * (max_borders[0] - 1)
-        stop = self._mg_problem.geometry[0][1] + self.h * (max_borders[1] - 1)
-        self.space_tensor = np.linspace(start, stop, self.arr.size)
+        # the coordinates are generated on access
+        self._space_range = (self._mg_problem.geometry[0][0] - self.h * (max_borders[0] - 1),
+                             self._mg_problem.geometry[0][1] + self.h * (max_borders[1] - 1))
         self._mid_points = self.mid.size
         self.dim = 1
 
         # set the interpolation and restriction ports according to the level which is used
         self.role = role
         # some place to store the residuum
-        self.res = np.zeros(self.arr.shape)
+        self.res = zeros(self.arr.shape, dtype, arena)
         # some views on the residuum
         self.res_left = self.res.__array__()[:self.borders[0]]
         self.res_right = self.res.__array__()[-self.borders[1]:]
@@ -184,9 +190,51 @@ class MultigridLevel1D(IMultigridLevel):
         else:
             raise ValueError("MultiLevel has no role "+self.role)
 
+        self.fl = as_boundary_condition(self.fl)
+        self.fr = as_boundary_condition(self.fr)
+        # the values of the Dirichlet ghost cells are computed once
+        self.ghost_cells = None
+        if self._mg_problem.boundaries[0] == 'dirichlet':
+            _left = slice(None, self.borders[0])
+            _right = slice(self.arr.size - self.borders[1], None)
+            _space_tensor = self.space_tensor
+            self.ghost_cells = DirichletGhostCells([(_left, [self.fl], _space_tensor[_left]),
+                                                    (_right, [self.fr], _space_tensor[_right])], self.arr)
+
         # in order to know if the rhs was modified
         self.modified_rhs = False
 
+    @staticmethod
+    def buffer_shapes(shape, max_borders):
+        """Shapes of the padded array, the residual and the right hand side of a level
+
+        Parameters
+        ----------
+        shape : :py:class:`int`
+            number of inner points
+        max_borders : :py:class:`numpy.ndarray`
+
+        Returns
+        -------
+        shapes : :py:class:`list` of :py:class:`tuple`
+        """
+        _padded = (int(shape + max_borders[0] + max_borders[1]),)
+        return [_padded, _padded, (int(shape),)]
+
+    @property
+    def space_tensor(self):
+        """Coordinates of all points of the padded array
+
+        Generated on each access unless set explicitly.
+        """
+        if self._space_tensor is not None:
+            return self._space_tensor
+        return np.linspace(self._space_range[0], self._space_range[1], self.arr.size)
+
+    @space_tensor.setter
+    def space_tensor(self, value):
+        self._space_tensor = value
+
     def adjust_references(self):
         self.left = self.arr.__array__()[:self.borders[0]]
         self.right = self.arr.__array__()[-self.borders[1]:]
@@ -224,12 +272,21 @@ class MultigridLevel1D(IMultigridLevel):
                          "Array to embed has the wrong size")
         self[self.borders[0]:-self.borders[1]] = ue
 
-    def pad(self):
+    def pad(self, time=None):
         """
         Summary
         -------
         Uses the informations in Multigridproblems in order to
         pad the array.
+
+        Dirichlet values are copied from :py:attr:`.ghost_cells`, thus the boundary functions are only called again
+        for time-dependent :py:class:`.BoundaryCondition` and another ``time``.
+
+        Parameters
+        ----------
+        time : :py:class:`float`
+            *(optional)*
+            time for time-dependent boundary conditions; defaults to the one of the last padding
         """
         if self._mg_problem.boundaries[0] == 'periodic':
             #  left side
@@ -237,15 +294,7 @@ class MultigridLevel1D(IMultigridLevel):
             #  right side
             self.right[:] = self.mid[:self.borders[1]]
         elif self._mg_problem.boundaries[0] == 'dirichlet':
-
-                # left from border
-            l_f_b = self.space_tensor[0:self.borders[0]]
-            # right_from_border
-            r_f_b = self.space_tensor[-self.borders[1]:]
-            #  left side
-            self.left[:] = self.fl(l_f_b)
-            #  right side
-            self.right[:] = self.fr(r_f_b)
+            self.ghost_cells.pad(self.arr, time)
 
     def _evaluable_view(self, stencil, arr, offset=0):
         """gives the right view of the array
@@ -278,10 +327,11 @@ class MultigridLevel1D(IMultigridLevel):
 
     def compute_residual(self, stencil):
         if self.modified_rhs is False:
-            self.res_mid[:] = - self.rhs + stencil.eval_convolve(self.evaluable_view(stencil))
+            stencil.eval_into(self.evaluable_view(stencil), self.res_mid)
         else:
             # self.res_mid[:] = self.rhs - stencil.eval_convolve(self.mid, "full")[stencil.b[0][0]:-stencil.b[0][1]]
-            self.res_mid[:] = - self.rhs + stencil.eval_convolve(self.mid, "same")
+            stencil.eval_into(self.mid, self.res_mid, "same")
+        np.subtract(self.rhs, self.res_mid, out=self.res_mid)
 
     def border_function_generator(self, stencil):
         """Generates a function which returns true if the index of the
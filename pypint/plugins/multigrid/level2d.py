@@ -7,6 +7,8 @@ from pypint.utilities import assert_is_callable, assert_is_instance, \
 # from pypint.plugins.multigrid.multigrid_problem import MultigridProblem
 # from pypint.plugins.multigrid.stencil import Stencil
 from pypint.plugins.multigrid.i_multigrid_level import IMultigridLevel
+from pypint.plugins.multigrid.boundary_condition import as_boundary_condition, DirichletGhostCells
+from pypint.plugins.multigrid.memory_arena import zeros
 
 
 class MultigridLevel2D(IMultigridLevel):
@@ -48,12 +50,15 @@ class MultigridLevel2D(IMultigridLevel):
     --------
 
     """
-    def __init__(self, shape, mg_problem=None, max_borders=np.ones((2, 2)), dtype=float, role="ML"):
+    def __init__(self, shape, mg_problem=None, max_borders=np.ones((2, 2)), dtype=float, role="ML", arena=None):
         """
         Summary
         -------
         takes the physical MultiGridProblem and initialises with help of
         max_borders, and n_points an appropriate array
+
+        The padded array, the residual and the right hand side are taken from ``arena`` if given
+        (see :py:meth:`.buffer_shapes`).
         """
         # the level should know its geometrical information, because it differs from level to level
         self.space_tensor = None
@@ -66,7 +71,7 @@ class MultigridLevel2D(IMultigridLevel):
 
         forward_shape = (shape[0] + max_borders[0][1]+max_borders[0][0],
                          shape[1] + max_borders[1][1]+max_borders[1][0])
-        self.arr = np.zeros(forward_shape, dtype=dtype)
+        self.arr = zeros(forward_shape, dtype, arena)
         self.borders = max_borders
         self.dim = 2
         self._mg_problem = mg_problem
@@ -127,33 +132,19 @@ class MultigridLevel2D(IMultigridLevel):
             # print("front :\n", self.l_spaces[i][0])
             # print("mid :\n", self.l_spaces[i][1])
             # print("end :\n", self.l_spaces[i][2])
-        # using this linear spaces we define space tensors for different parts
-        self.mid_tensor = np.meshgrid(self.l_spaces[0][1], self.l_spaces[1][1])
-
-        self.north_tensor = np.meshgrid(self.l_spaces[0][1], self.l_spaces[1][0])
-        self.south_tensor = np.meshgrid(self.l_spaces[0][1], self.l_spaces[1][2])
-
-        self.east_tensor = np.meshgrid(self.l_spaces[0][2], self.l_spaces[1][1])
-        self.west_tensor = np.meshgrid(self.l_spaces[0][0], self.l_spaces[1][1])
-
-        self.ne_tensor = np.meshgrid(self.l_spaces[0][2], self.l_spaces[1][0])
-        self.nw_tensor = np.meshgrid(self.l_spaces[0][0], self.l_spaces[1][0])
-        self.se_tensor = np.meshgrid(self.l_spaces[0][2], self.l_spaces[1][2])
-        self.sw_tensor = np.meshgrid(self.l_spaces[0][0], self.l_spaces[1][2])
+        # using this linear spaces the space tensors for the different parts are generated on access
 
         # space for the rhs
         # self._rhs = np.copy(self.mid)
-        self._rhs = np.zeros(self.mid.shape, dtype=dtype)
-        lspc = []
+        self._rhs = zeros(self.mid.shape, dtype, arena)
+        self._space_ranges = []
         for i in range(self.dim):
-            start = self._mg_problem.geometry[i][0] - self.h[i] * (max_borders[i][0] - 1)
-            stop = self._mg_problem.geometry[i][1] + self.h[i] * (max_borders[i][1] - 1)
-            lspc.append(np.linspace(start, stop, self.arr.shape[i]))
-        self.space_tensor = np.asarray(np.meshgrid(*lspc))
+            self._space_ranges.append((self._mg_problem.geometry[i][0] - self.h[i] * (max_borders[i][0] - 1),
+                                       self._mg_problem.geometry[i][1] + self.h[i] * (max_borders[i][1] - 1)))
         # set the interpolation and restriction ports according to the level which is used
         self.role = role
         # some place to store the residuum
-        self.res = np.zeros(self.arr.shape)
+        self.res = zeros(self.arr.shape, dtype, arena)
         self.res_mid = self.res.__array__()[self.sl_mid_y, self.sl_mid_x]
 
         if role is "FL":
@@ -193,10 +184,107 @@ class MultigridLevel2D(IMultigridLevel):
             self.f_north = lambda x: 0.
             self.f_south = lambda x: 0.
 
+        self.f_west = as_boundary_condition(self.f_west)
+        self.f_east = as_boundary_condition(self.f_east)
+        self.f_north = as_boundary_condition(self.f_north)
+        self.f_south = as_boundary_condition(self.f_south)
+        # the values of the Dirichlet ghost cells are computed once, the corners are the mean of both sides
+        self.ghost_cells = None
+        if self.mg_problem.boundaries[0] == 'dirichlet' and self.mg_problem.boundaries[1] == 'dirichlet':
+            self.ghost_cells = DirichletGhostCells(
+                [((self.sl_front_y, self.sl_mid_x), [self.f_north], self.north_tensor),
+                 ((self.sl_mid_y, self.sl_end_x), [self.f_east], self.east_tensor),
+                 ((self.sl_end_y, self.sl_mid_x), [self.f_south], self.south_tensor),
+                 ((self.sl_mid_y, self.sl_front_x), [self.f_west], self.west_tensor),
+                 ((self.sl_front_y, self.sl_end_x), [self.f_north, self.f_east], self.ne_tensor),
+                 ((self.sl_front_y, self.sl_front_x), [self.f_north, self.f_west], self.nw_tensor),
+                 ((self.sl_end_y, self.sl_end_x), [self.f_south, self.f_east], self.se_tensor),
+                 ((self.sl_end_y, self.sl_front_x), [self.f_south, self.f_west], self.sw_tensor)],
+                self.arr)
+
         # in order to know if the rhs was modified
         self.modified_rhs = False
         self.mid_slice = (self.sl_mid_x, self.sl_mid_y)
 
+    @staticmethod
+    def buffer_shapes(shape, max_borders):
+        """Shapes of the padded array, the residual and the right hand side of a level
+
+        Parameters
+        ----------
+        shape : :py:class:`tuple`
+            number of inner points along each axis
+        max_borders : :py:class:`numpy.ndarray`
+
+        Returns
+        -------
+        shapes : :py:class:`list` of :py:class:`tuple`
+        """
+        _padded = (int(shape[0] + max_borders[0][0] + max_borders[0][1]),
+                   int(shape[1] + max_borders[1][0] + max_borders[1][1]))
+        return [_padded, _padded, (int(shape[0]), int(shape[1]))]
+
+    @property
+    def space_tensor(self):
+        """Coordinates of all points of the padded array
+
+        Generated on each access unless set explicitly.
+        """
+        if self._space_tensor is not None:
+            return self._space_tensor
+        return np.asarray(np.meshgrid(*[np.linspace(start, stop, n)
+                                        for (start, stop), n in zip(self._space_ranges, self.arr.shape)]))
+
+    @space_tensor.setter
+    def space_tensor(self, value):
+        self._space_tensor = value
+
+    def part_tensor(self, x_part, y_part):
+        """Coordinates of a part of the padded array
+
+        Parameters
+        ----------
+        x_part, y_part : :py:class:`int`
+            ``0`` for the front, ``1`` for the middle and ``2`` for the end along the respective axis
+        """
+        return np.meshgrid(self.l_spaces[0][x_part], self.l_spaces[1][y_part])
+
+    @property
+    def mid_tensor(self):
+        return self.part_tensor(1, 1)
+
+    @property
+    def north_tensor(self):
+        return self.part_tensor(1, 0)
+
+    @property
+    def south_tensor(self):
+        return self.part_tensor(1, 2)
+
+    @property
+    def east_tensor(self):
+        return self.part_tensor(2, 1)
+
+    @property
+    def west_tensor(self):
+        return self.part_tensor(0, 1)
+
+    @property
+    def ne_tensor(self):
+        return self.part_tensor(2, 0)
+
+    @property
+    def nw_tensor(self):
+        return self.part_tensor(0, 0)
+
+    @property
+    def se_tensor(self):
+        return self.part_tensor(2, 2)
+
+    @property
+    def sw_tensor(self):
+        return self.part_tensor(0, 2)
+
     def adjust_references(self):
         #define the parts
         self.mid = self.arr.__array__()[self.sl_mid_y, self.sl_mid_x]
@@ -246,26 +334,27 @@ class MultigridLevel2D(IMultigridLevel):
                          "Array to embed has the wrong size")
         self.mid = ue
 
-    def pad(self):
+    def pad(self, time=None):
         """
         Summary
         -------
         Uses the information in Multigridproblems in order to
         pad the array.
+
+        Dirichlet values are copied from :py:attr:`.ghost_cells`, thus the boundary functions are only called again
+        for time-dependent :py:class:`.BoundaryCondition` and another ``time``.
+
+        Parameters
+        ----------
+        time : :py:class:`float`
+            *(optional)*
+            time for time-dependent boundary conditions; defaults to the one of the last padding
         """
 
         # just dirichlet conditions
 
         if self.mg_problem.boundaries[0] is 'dirichlet' and self.mg_problem.boundaries[1] is 'dirichlet':
-
-            self.north[:] = self.f_north(self.north_tensor)
-            self.east[:] = self.f_east(self.east_tensor)
-            self.south[:] = self.f_south(self.south_tensor)
-            self.west[:] = self.f_west(self.west_tensor)
-            self.ne[:] = self.f_north(self.ne_tensor) * 0.5 + self.f_east(self.ne_tensor) * 0.5
-            self.nw[:] = self.f_north(self.nw_tensor) * 0.5 + self.f_west(self.nw_tensor) * 0.5
-            self.se[:] = self.f_south(self.se_tensor) * 0.5 + self.f_east(self.se_tensor) * 0.5
-            self.sw[:] = self.f_south(self.sw_tensor) * 0.5 + self.f_west(self.sw_tensor) * 0.5
+            self.ghost_cells.pad(self.arr, time)
         elif self.mg_problem.boundaries[0] is 'periodic' and self.mg_problem.boundaries[1] is 'periodic':
             self.east[:] = self.mid[:, self.sl_front_x]
             self.west[:] = self.mid[:, self.sl_end_x]
@@ -308,10 +397,11 @@ class MultigridLevel2D(IMultigridLevel):
 
     def compute_residual(self, stencil):
         if self.modified_rhs is False:
-            self.res_mid[:] = self.rhs - stencil.eval_convolve(self.evaluable_view(stencil))
+            stencil.eval_into(self.evaluable_view(stencil), self.res_mid)
         else:
             # not sure if this works
-            self.res_mid[:] = self.rhs - stencil.eval_convolve(self.mid, "same")
+            stencil.eval_into(self.mid, self.res_mid, "same")
+        np.subtract(self.rhs, self.res_mid, out=self.res_mid)
 
     def border_function_generator(self, stencil):
         """Generates a function which returns true if the index of the
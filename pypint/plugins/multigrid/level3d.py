@@ -0,0 +1,311 @@
+# coding=utf-8
+"""
+
+.. moduleauthor:: Torbjörn Klatt <t.klatt@fz-juelich.de>
+"""
+import itertools as it
+
+import numpy as np
+
+from pypint.utilities import assert_is_instance, assert_condition
+from pypint.plugins.multigrid.i_multigrid_level import IMultigridLevel
+from pypint.plugins.multigrid.boundary_condition import as_boundary_condition, DirichletGhostCells
+from pypint.plugins.multigrid.memory_arena import zeros
+
+
+class MultigridLevel3D(IMultigridLevel):
+    """
+    Summary
+    -------
+    Padded numpy array for three dimensional grids, analog to :py:class:`.MultigridLevel2D`.
+    Every calculation is applied to the non-padded version, the boundaries are used whenever a stencil is applied.
+
+    As for the 2D level and :py:attr:`.Stencil.b`, the arrays are indexed :math:`(z, y, x)`, i.e. the borders, the
+    boundary functions and the geometry are given in :math:`(x, y, z)` order and ``max_borders[k]`` belongs to the
+    array axis :math:`2 - k`.
+
+    The ghost cells consist of six faces, twelve edges and eight corners.
+    Their Dirichlet values are computed once (see :py:class:`.DirichletGhostCells`), so that padding only copies them.
+    Dirichlet values on edges and corners are the mean of the adjacent faces' boundary functions.
+
+    The ports for interpolation and restriction are the same as for the 1D and 2D levels.
+    """
+    def __init__(self, shape, mg_problem=None, max_borders=np.ones((3, 2), dtype=int), dtype=float, role="ML",
+                 arena=None):
+        """
+        Parameters
+        ----------
+        shape : :py:class:`tuple`
+            number of inner points along each array axis
+        mg_problem : :py:class:`.MultigridProblemMixin`
+        max_borders : :py:class:`numpy.ndarray`
+            *(optional)*
+            of shape :math:`(3, 2)` with the number of ghost cells in front and at the end for :math:`x, y, z`
+        dtype : :py:class:`numpy.dtype`
+            *(optional)*
+        role : :py:class:`str`
+            *(optional)*
+            one of ``FL``, ``ML`` (default) or ``CL``
+        arena : :py:class:`.MemoryArena`
+            *(optional)*
+            to take the padded array, the residual and the right hand side from (see :py:meth:`.buffer_shapes`)
+        """
+        assert_is_instance(shape, tuple, "shape has to be a tuple")
+        assert_condition(len(shape) == 3, ValueError, "shape has to be of length 3")
+        assert_condition(len(mg_problem.spacial_dim) == 3, ValueError, "mg_problem has the wrong dimension")
+        assert_is_instance(max_borders, np.ndarray, "max borders has to be a numpy array")
+        assert_condition(max_borders.shape == (3, 2), ValueError, "max borders has the wrong shape")
+        assert_condition(role in ("FL", "ML", "CL"), ValueError, "MultiLevel has no role " + str(role))
+
+        self.dim = 3
+        self.borders = np.asarray(max_borders, dtype=int)
+        self._mg_problem = mg_problem
+        self.role = role
+        # borders along each array axis
+        self._axis_borders = [self.borders[self.dim - 1 - axis] for axis in range(self.dim)]
+
+        forward_shape = tuple(int(n) + b[0] + b[1] for n, b in zip(shape, self._axis_borders))
+        self.arr = zeros(forward_shape, dtype, arena)
+        self.res = zeros(forward_shape, dtype, arena)
+        self._rhs = zeros(tuple(int(n) for n in shape), dtype, arena)
+
+        # slices of the front ghost cells, the inner points and the end ghost cells along each axis
+        self.axis_slices = [(slice(None, b[0]), slice(b[0], n - b[1]), slice(n - b[1], None))
+                            for n, b in zip(forward_shape, self._axis_borders)]
+        self.mid_slice = tuple(slices[1] for slices in self.axis_slices)
+        self.adjust_references()
+
+        # grid widths and coordinates of all points along x, y and z, the tensors are generated on access
+        self.h = np.zeros(self.dim)
+        self.l_spaces = []
+        for k in range(self.dim):
+            axis = self.dim - 1 - k
+            self.h[k] = (self.mg_problem.geometry[k][1] - self.mg_problem.geometry[k][0]) / (self.mid.shape[axis] + 1)
+            self.l_spaces.append(self.mg_problem.geometry[k][0]
+                                 + self.h[k] * (np.arange(forward_shape[axis]) - self.borders[k][0] + 1))
+
+        # slices of the ghost regions by their position (0: front, 1: inner, 2: end) along each axis
+        self.ghost_regions = {}
+        for position in it.product(range(3), repeat=self.dim):
+            if position != (1,) * self.dim:
+                _slices = tuple(self.axis_slices[axis][p] for axis, p in enumerate(position))
+                if self.arr[_slices].size > 0:
+                    self.ghost_regions[position] = _slices
+
+        # boundary functions for the front and end of x, y and z
+        self.boundary_functions = [(as_boundary_condition(None), as_boundary_condition(None))] * self.dim
+        if role == "FL":
+            for k, functions in enumerate(self._mg_problem.boundary_functions):
+                if functions is not None:
+                    self.boundary_functions[k] = tuple(as_boundary_condition(f) for f in functions)
+
+        # the values of the Dirichlet ghost cells are computed once
+        _types = self.boundary_types()
+        for bc in _types:
+            if bc not in ('dirichlet', 'periodic'):
+                raise NotImplementedError("Only Dirichlet and periodic boundary conditions are implemented")
+        _regions = []
+        for position, _slices in self.ghost_regions.items():
+            _conditions = [self.boundary_functions[self.dim - 1 - axis][p // 2] for axis, p in enumerate(position)
+                           if p != 1 and _types[axis] == 'dirichlet']
+            if len(_conditions) > 0:
+                _regions.append((_slices, _conditions, self._tensor(_slices)))
+        self.ghost_cells = DirichletGhostCells(_regions, self.arr)
+        self._periodic_axes = [axis for axis, bc in enumerate(_types) if bc == 'periodic']
+
+        self._set_ports()
+
+        # in order to know if the rhs was modified
+        self.modified_rhs = False
+
+    @staticmethod
+    def buffer_shapes(shape, max_borders):
+        """Shapes of the padded array, the residual and the right hand side of a level
+
+        Parameters
+        ----------
+        shape : :py:class:`tuple`
+            number of inner points along each array axis
+        max_borders : :py:class:`numpy.ndarray`
+            of shape :math:`(3, 2)` for :math:`x, y, z`
+
+        Returns
+        -------
+        shapes : :py:class:`list` of :py:class:`tuple`
+        """
+        _padded = tuple(int(n + max_borders[2 - axis][0] + max_borders[2 - axis][1]) for axis, n in enumerate(shape))
+        return [_padded, _padded, tuple(int(n) for n in shape)]
+
+    @property
+    def space_tensor(self):
+        """Coordinates :math:`[x, y, z]` of all points of the padded array, generated on each access
+        """
+        return np.asarray(self._tensor(tuple(slice(None) for n in self.arr.shape)))
+
+    @property
+    def mid_tensor(self):
+        """Coordinates :math:`[x, y, z]` of the inner points, generated on each access
+        """
+        return self._tensor(self.mid_slice)
+
+    def _tensor(self, slices):
+        """Coordinates :math:`[x, y, z]` of the points of the padded array selected by the slices
+        """
+        _axes = [self.l_spaces[self.dim - 1 - axis][slices[axis]] for axis in range(self.dim)]
+        return list(reversed(np.meshgrid(*_axes, indexing='ij')))
+
+    def _set_ports(self):
+        if self.role == "FL":
+            # here we define the ports for the finest level
+            self.interpolate_out = None
+            self.interpolate_in = self.mid
+            self.restrict_in = None
+            self.restrict_out = self.res
+            self.restriction_out_mid = self.res_mid
+        elif self.role == "ML":
+            # here we define the ports for the mid level
+            self.interpolate_out = self.arr
+            self.interpolate_out_mid = self.mid
+            self.interpolate_in = self.mid
+            self.restrict_in = self.rhs
+            self.restrict_out = self.res
+            self.restriction_out_mid = self.res_mid
+        else:
+            # here we define the ports for the coarsest level
+            self.interpolate_out = self.arr
+            self.interpolate_out_mid = self.mid
+            self.interpolate_in = None
+            self.restrict_in = self.rhs
+            self.restrict_out = None
+
+    def adjust_references(self):
+        self.mid = self.arr.__array__()[self.mid_slice]
+        self.res_mid = self.res.__array__()[self.mid_slice]
+
+    @property
+    def mg_problem(self):
+        """
+        return MultiGridProblem
+        """
+        return self._mg_problem
+
+    @property
+    def rhs(self):
+        return self._rhs
+
+    @rhs.setter
+    def rhs(self, value):
+        self.modified_rhs = False
+        self._rhs[:] = value
+
+    def embed(self, ue):
+        """
+        Summary
+        _______
+        checks if u fits then embeds it
+
+        Parameters
+        ----------
+        ue : ndarray
+            numpy array to embed
+        """
+        assert_condition(ue.shape == self.mid.shape, ValueError,
+                         "Array to embed has the wrong size")
+        self.mid[:] = ue
+
+    def boundary_types(self):
+        """Boundary condition of each array axis
+
+        Returns
+        -------
+        boundaries : :py:class:`list` of :py:class:`str`
+        """
+        _boundaries = self.mg_problem.boundaries
+        if len(_boundaries) == self.dim:
+            _per_coordinate = list(_boundaries)
+        else:
+            _per_coordinate = []
+            for k in range(self.dim):
+                assert_condition(_boundaries[2 * k] == _boundaries[2 * k + 1], NotImplementedError,
+                                 "Different boundary conditions on both sides of an axis are not supported")
+                _per_coordinate.append(_boundaries[2 * k])
+        return list(reversed(_per_coordinate))
+
+    def pad(self, time=None):
+        """
+        Summary
+        -------
+        Uses the information in Multigridproblems in order to pad the array.
+
+        First the ghost cells outside along Dirichlet axes are copied from :py:attr:`.ghost_cells`, then the periodic
+        axes are wrapped one after another over the whole extent of the others, which fills their edges and corners as
+        well.
+
+        Parameters
+        ----------
+        time : :py:class:`float`
+            *(optional)*
+            time for time-dependent boundary conditions; defaults to the one of the last padding
+        """
+        self.ghost_cells.pad(self.arr, time)
+
+        for axis in self._periodic_axes:
+            front, mid, end = self.axis_slices[axis]
+            _target = [slice(None)] * self.dim
+            _source = [slice(None)] * self.dim
+            _target[axis] = front
+            _source[axis] = slice(mid.stop - (front.stop or 0), mid.stop)
+            self.arr[tuple(_target)] = self.arr[tuple(_source)]
+            _target[axis] = end
+            _source[axis] = slice(mid.start, mid.start + self.arr.shape[axis] - end.start)
+            self.arr[tuple(_target)] = self.arr[tuple(_source)]
+
+    def _evaluable_view(self, stencil, arr):
+        """gives the right view of the array
+
+        """
+        if (stencil.b == self.borders).all():
+            return arr
+        slices = []
+        for axis in range(self.dim):
+            lvl_b = self._axis_borders[axis]
+            st_b = stencil.b[self.dim - 1 - axis]
+            slices.append(slice(lvl_b[0] - st_b[0], arr.shape[axis] - (lvl_b[1] - st_b[1])))
+        return arr[tuple(slices)]
+
+    def evaluable_view(self, stencil):
+        """gives the right view of the array
+
+        """
+        return self._evaluable_view(stencil, self.arr)
+
+    def evaluable_interpolation_view(self, stencil):
+        return self._evaluable_view(stencil, self.interpolate_out)
+
+    def evaluable_restriction_view(self, stencil):
+        return self._evaluable_view(stencil, self.restrict_out)
+
+    def compute_residual(self, stencil):
+        if self.modified_rhs is False:
+            stencil.eval_into(self.evaluable_view(stencil), self.res_mid)
+        else:
+            stencil.eval_into(self.mid, self.res_mid, "same")
+        np.subtract(self.rhs, self.res_mid, out=self.res_mid)
+
+    def border_function_generator(self, stencil):
+        """Generates a function which returns true if the index of the
+           evaluable view is on the border, attention just works if evaluable view was generated!
+
+        """
+
+        def is_on_border(indice):
+            for axis in range(self.dim):
+                st_b = stencil.b[self.dim - 1 - axis]
+                if indice[axis] < st_b[0] or indice[axis] >= self.mid.shape[axis] + st_b[0]:
+                    return True
+            return False
+
+        return is_on_border
+
+
+__all__ = ['MultigridLevel3D']
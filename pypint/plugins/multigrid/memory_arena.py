@@ -0,0 +1,146 @@
+# coding=utf-8
+"""Contiguous memory for the arrays of a multigrid hierarchy
+
+.. moduleauthor:: Torbjörn Klatt <t.klatt@fz-juelich.de>
+"""
+import numpy as np
+
+from pypint.utilities import assert_condition
+
+
+class MemoryArena(object):
+    """One contiguous buffer out of which the arrays of the levels are carved
+
+    The arena is sized up front for all arrays (see :py:meth:`.required_size`), thus the values, residuals and right
+    hand sides of all levels lie next to each other in memory instead of being scattered over many allocations.
+    Each array starts at a multiple of :py:attr:`.alignment` bytes, i.e. at the beginning of a cache line.
+
+    After :py:meth:`.reset` the same memory is handed out again, e.g. to another hierarchy with the same grids.
+    Arrays handed out before still refer to that memory.
+
+    Examples
+    --------
+    >>> arena = MemoryArena(MemoryArena.required_size([(3, 4), (5,)]))
+    >>> arena.allocate((3, 4)).shape
+    (3, 4)
+    >>> arena.used == MemoryArena.required_size([(3, 4)])
+    True
+    """
+
+    alignment = 64
+
+    def __init__(self, size, dtype=float):
+        """
+        Parameters
+        ----------
+        size : :py:class:`int`
+            number of elements
+        dtype : :py:class:`numpy.dtype`
+            *(optional)*
+        """
+        self._dtype = np.dtype(dtype)
+        self._size = int(size)
+        _raw = np.zeros(self._size * self._dtype.itemsize + MemoryArena.alignment, dtype=np.uint8)
+        _start = (-_raw.ctypes.data) % MemoryArena.alignment
+        self._buffer = _raw[_start:_start + self._size * self._dtype.itemsize].view(self._dtype)
+        self._offset = 0
+
+    @staticmethod
+    def required_size(shapes, dtype=float):
+        """Number of elements of an arena holding arrays of the given shapes
+
+        Parameters
+        ----------
+        shapes : :py:class:`list` of :py:class:`tuple`
+        dtype : :py:class:`numpy.dtype`
+            *(optional)*
+
+        Returns
+        -------
+        size : :py:class:`int`
+        """
+        return sum(MemoryArena._aligned(int(np.prod(shape)), np.dtype(dtype)) for shape in shapes)
+
+    @property
+    def dtype(self):
+        return self._dtype
+
+    @property
+    def size(self):
+        """Number of elements of the arena
+        """
+        return self._size
+
+    @property
+    def used(self):
+        """Number of elements handed out since the last reset, including the alignment
+        """
+        return self._offset
+
+    @property
+    def nbytes(self):
+        return self._buffer.nbytes
+
+    def allocate(self, shape):
+        """Hands out the next zeroed array of the given shape
+
+        Parameters
+        ----------
+        shape : :py:class:`int` or :py:class:`tuple`
+
+        Returns
+        -------
+        array : :py:class:`numpy.ndarray`
+            C-contiguous view of the arena
+
+        Raises
+        ------
+        MemoryError
+            if the arena is too small
+        """
+        _shape = (int(shape),) if np.isscalar(shape) else tuple(int(n) for n in shape)
+        _n = int(np.prod(_shape))
+        _stop = self._offset + MemoryArena._aligned(_n, self._dtype)
+        assert_condition(_stop <= self._size, MemoryError,
+                         message="Arena of %d elements too small for another %s array" % (self._size, _shape),
+                         checking_obj=self)
+        _array = self._buffer[self._offset:self._offset + _n].reshape(_shape)
+        _array[...] = 0
+        self._offset = _stop
+        return _array
+
+    def reset(self):
+        """Hands out the memory from the beginning again
+        """
+        self._offset = 0
+
+    @staticmethod
+    def _aligned(n, dtype):
+        _per_line = max(1, MemoryArena.alignment // dtype.itemsize)
+        return -(-n // _per_line) * _per_line
+
+
+def zeros(shape, dtype=float, arena=None):
+    """Zeroed array taken from the arena if one is given
+
+    Parameters
+    ----------
+    shape : :py:class:`int` or :py:class:`tuple`
+    dtype : :py:class:`numpy.dtype`
+        *(optional)*
+        has to match the one of ``arena``
+    arena : :py:class:`.MemoryArena`
+        *(optional)*
+
+    Returns
+    -------
+    array : :py:class:`numpy.ndarray`
+    """
+    if arena is None:
+        return np.zeros(shape, dtype=dtype)
+    assert_condition(arena.dtype == np.dtype(dtype), ValueError,
+                     message="Arena of %s cannot hold %s" % (arena.dtype, np.dtype(dtype)), checking_obj=arena)
+    return arena.allocate(shape)
+
+
+__all__ = ['MemoryArena', 'zeros']
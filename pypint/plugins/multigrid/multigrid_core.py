@@ -1,7 +1,5 @@
 # coding=utf-8
 import numpy as np
-import sys
-print(sys.path)
 # try:
 # from pypint.plugins.multigrid.multigrid_problem_mixin import problem_is_multigrid_problem
 # except ImportError:
@@ -10,9 +8,16 @@ print(sys.path)
 # from pypint.plugins.multigrid.multigrid_solution import MultiGridSolution
 from pypint.plugins.multigrid.level import MultigridLevel1D
 from pypint.plugins.multigrid.level2d import MultigridLevel2D
+from pypint.plugins.multigrid.level3d import MultigridLevel3D
+from pypint.plugins.multigrid.memory_arena import MemoryArena
 from pypint.plugins.multigrid.multigrid_smoother import SplitSmoother,ILUSmoother, DirectSolverSmoother, WeightedJacobiSmoother
+from pypint.plugins.multigrid.multigrid_smoother import RedBlackGaussSeidelSmoother, ChebyshevJacobiSmoother, \
+    DampedJacobiSmoother
 from pypint.utilities import assert_is_callable, assert_is_instance, assert_condition
+from pypint.utilities.logging import LOG
 from pypint.plugins.multigrid.stencil import Stencil
+from pypint.plugins.multigrid.galerkin import linear_interpolation_matrix, full_weighting_matrix, galerkin_product, \
+    stencil_from_matrix
 # from pypint.plugins.multigrid.interpolation import InterpolationByStencilListIn1D, InterpolationByStencilForLevels, InterpolationByStencilForLevelsClassical
 # from pypint.plugins.multigrid.restriction import RestrictionStencilPure, RestrictionByStencilForLevels, RestrictionByStencilForLevelsClassical
 from operator import iadd,add
@@ -145,6 +150,42 @@ class ResidualErrorControl(MultiGridControl):
         """
         return np.sum(np.abs(prev_arr - act_arr))
 
+    def reset(self):
+        """Forgets the residuals of previous solves
+        """
+        self.residuals = {}
+
+    def reached(self, lvl_ind, residual, n_cycles):
+        """Checks whether cycling on a level can stop
+
+        The first residual given for a level after :py:meth:`.reset` is taken as its initial residual.
+        Cycling stops as soon as the residual is reduced by the level's tolerance relative to the initial residual or
+        the level's maximum number of cycles is reached.
+
+        Parameters
+        ----------
+        lvl_ind : :py:class:`int`
+            index of the level as used for the tolerance and maximum iteration dicts
+        residual : :py:class:`float`
+            norm of the current residual on the level
+        n_cycles : :py:class:`int`
+            number of cycles done so far
+
+        Returns
+        -------
+        reached : :py:class:`bool`
+        """
+        if not hasattr(self, 'residuals'):
+            self.reset()
+        self.residuals.setdefault(lvl_ind, []).append(residual)
+        if self.mid.get(lvl_ind) is not None and n_cycles >= self.mid[lvl_ind]:
+            self.history.append("Maximum number of cycles reached on level " + str(lvl_ind))
+            return True
+        if self.rtd.get(lvl_ind) is not None and residual <= self.rtd[lvl_ind] * self.residuals[lvl_ind][0]:
+            self.history.append("Residual reduced by " + str(self.rtd[lvl_ind]) + " on level " + str(lvl_ind))
+            return True
+        return False
+
 
 
 class MultiGridCore(object):
@@ -163,12 +204,13 @@ class MultiGridCore(object):
     -------
     The main ingredients of MultiGrid are merged in this class,
     the most important function is the run command
+
+    The arrays of all levels are carved out of one :py:class:`.MemoryArena`, which is sized up front;
+    the one of another hierarchy with the same grids can be reused by passing it as ``arena``.
     """
 
     def __init__(self, mg_prob, stencil_form, *args, **kwargs):
 
-        for keys in kwargs.keys():
-            print(keys)
         # assert_condition(problem_is_multigrid_problem(mg_prob), ValueError, message="Not a multigrid Problem")
         assert_is_callable(stencil_form, "StencilForm has to be a function")
         self.mg_problem = mg_prob
@@ -182,17 +224,37 @@ class MultiGridCore(object):
         self.n_post = kwargs.get("n_post", 3)
         self.num_levels = kwargs.get("num_levels", 3)
 
+        _level_classes = {1: MultigridLevel1D, 2: MultigridLevel2D, 3: MultigridLevel3D}
+        if kwargs.get("dim") not in _level_classes:
+            raise ValueError("Only 1D, 2D and 3D levels are supported: NOT %s" % kwargs.get("dim"))
+        level_class = _level_classes[kwargs["dim"]]
+
+        # shapes from the coarsest to the finest level
+        shapes = [kwargs["shape_coarse"] if kwargs["dim"] == 1 else tuple(kwargs["shape_coarse"])]
+        for i in range(kwargs["num_levels"]-1):
+            if kwargs["dim"] == 1:
+                shapes.append(shapes[-1]*2+1)
+            else:
+                shapes.append(tuple(n*2+1 for n in shapes[-1]))
+
+        # all level arrays are carved out of one arena, which may be reused from another hierarchy
+        _buffer_shapes = []
+        for shape in shapes:
+            _buffer_shapes.extend(level_class.buffer_shapes(shape, kwargs["max_borders"]))
+        _required_size = MemoryArena.required_size(_buffer_shapes)
+        self.arena = kwargs.get("arena")
+        if self.arena is None:
+            self.arena = MemoryArena(_required_size)
+        else:
+            assert_condition(self.arena.size >= _required_size, ValueError,
+                             "Arena of %d elements too small for %d" % (self.arena.size, _required_size))
+            self.arena.reset()
+
         # append course level
-        shape = kwargs["shape_coarse"]
-        if kwargs.get("dim") == 1:
-            self.levels.append(MultigridLevel1D(shape, self.mg_problem,
-                                                max_borders=kwargs["max_borders"], role="CL"))
-        elif kwargs.get("dim") == 2:
-            self.levels.append(MultigridLevel2D(shape, self.mg_problem,
-                                                max_borders=kwargs["max_borders"], role="CL"))
+        self.levels.append(level_class(shapes[0], self.mg_problem,
+                                       max_borders=kwargs["max_borders"], role="CL", arena=self.arena))
         #append course stencil
         self.stencils.append(Stencil(*stencil_form(self.levels[-1])))
-        self.smoothers.append(DirectSolverSmoother(self.stencils[-1], self.levels[-1]))
 
 
         for i in range(kwargs["num_levels"]-1):
@@ -201,28 +263,10 @@ class MultiGridCore(object):
                 role = "FL"
             else:
                 role = "ML"
-            if kwargs.get("dim") == 1:
-                shape = shape*2+1
-                self.levels.append(MultigridLevel1D(shape, self.mg_problem,
-                                                    max_borders=kwargs["max_borders"], role=role))
-            elif kwargs.get("dim") == 2:
-                shape = (shape[0]*2+1, shape[1]*2+1)
-                self.levels.append(MultigridLevel2D(shape, self.mg_problem,
-                                                    max_borders=kwargs["max_borders"], role=role))
+            self.levels.append(level_class(shapes[i+1], self.mg_problem,
+                                           max_borders=kwargs["max_borders"], role=role, arena=self.arena))
 
             self.stencils.append(Stencil(*stencil_form(self.levels[-1])))
-            # append smoother
-            if kwargs["smoothing_type"] is "jacobi":
-                omega = kwargs["smooth_opts"]["omega"]
-                # l_plus = np.asarray([0, -2.0/omega, 0])
-                # l_minus = np.asarray([1.0, -2.0*(1.0 - 1.0/omega), 1.0])
-                l_plus = self.stencils[-1].l_plus_jacobi(omega)
-                l_minus = self.stencils[-1].l_minus_jacobi(omega)
-                self.smoothers.append(SplitSmoother(l_plus, l_minus, self.levels[-1]))
-            elif kwargs["smoothing_type"] is "ilu":
-                self.smoothers.append(ILUSmoother(self.stencils[-1], self.levels[-1], **kwargs["smooth_opts"]))
-            else:
-                raise ValueError("Wrong smoothing type")
             # append interpolation
 
             self.ipl_ops.append(kwargs["ipl_class"](self.levels[-2], self.levels[-1],
@@ -230,11 +274,60 @@ class MultiGridCore(object):
             self.rst_ops.append(kwargs["rst_class"](self.levels[-1], self.levels[-2],
                                                     *kwargs.get("rst_opts")))
 
+        self.coarse_operator = kwargs.get("coarse_operator", "rediscretize")
+        if self.coarse_operator == "galerkin":
+            # replace the coarse stencils by the ones of R A P, assuming the standard interpolation and restriction
+            for i in range(self.num_levels - 2, -1, -1):
+                coarse_shape = self.levels[i].mid.shape
+                fine_matrix = self.stencils[i + 1].to_sparse_matrix(self.levels[i + 1].mid.shape, "csr")
+                self.stencils[i] = stencil_from_matrix(galerkin_product(full_weighting_matrix(coarse_shape),
+                                                                        fine_matrix,
+                                                                        linear_interpolation_matrix(coarse_shape)),
+                                                       coarse_shape)
+        elif self.coarse_operator != "rediscretize":
+            raise ValueError("Unknown coarse operator: '%s'" % self.coarse_operator)
+
+        # direct solver on the coarsest level
+        self.smoothers.append(DirectSolverSmoother(self.stencils[0], self.levels[0]))
+        for stencil, level in zip(self.stencils[1:], self.levels[1:]):
+            self.smoothers.append(self._make_smoother(stencil, level, **kwargs))
+
+    @staticmethod
+    def _make_smoother(stencil, level, **kwargs):
+        if kwargs["smoothing_type"] is "jacobi":
+            omega = kwargs["smooth_opts"]["omega"]
+            # l_plus = np.asarray([0, -2.0/omega, 0])
+            # l_minus = np.asarray([1.0, -2.0*(1.0 - 1.0/omega), 1.0])
+            l_plus = stencil.l_plus_jacobi(omega)
+            l_minus = stencil.l_minus_jacobi(omega)
+            return SplitSmoother(l_plus, l_minus, level)
+        elif kwargs["smoothing_type"] is "ilu":
+            return ILUSmoother(stencil, level, **kwargs["smooth_opts"])
+        elif kwargs["smoothing_type"] == "red_black_gauss_seidel":
+            return RedBlackGaussSeidelSmoother(stencil, level, **kwargs["smooth_opts"])
+        elif kwargs["smoothing_type"] == "chebyshev":
+            return ChebyshevJacobiSmoother(stencil, level, **kwargs["smooth_opts"])
+        elif kwargs["smoothing_type"] == "damped_jacobi":
+            return DampedJacobiSmoother(stencil, level, **kwargs["smooth_opts"])
+        else:
+            raise ValueError("Wrong smoothing type")
+
+    def reset_coarse_levels(self):
+        """Clears values, right hand sides and residuals of all but the finest level
+
+        Required before reusing this core for another solve, as the coarser levels still hold the corrections of the
+        previous one.
+        """
+        for level in self.levels[:-1]:
+            level.arr[:] = 0.0
+            level.rhs = 0.0
+            level.res[:] = 0.0
+
     def set_initial_value(self, lvl_ind, data):
         self.levels[lvl_ind].mid[:] = data
 
-    def pad(self, lvl_ind):
-        self.levels[lvl_ind].pad()
+    def pad(self, lvl_ind, time=None):
+        self.levels[lvl_ind].pad(time)
 
     def modify_rhs(self, ind):
         self.stencils[ind].modify_rhs(self.levels[ind])
@@ -243,8 +336,77 @@ class MultiGridCore(object):
         self.mg_problem.fill_rhs(self.levels[ind])
 
     def run(self, controlflow):
-        print(controlflow)
-        print("Starting calculation . . .")
+        LOG.debug("Starting calculation of %s . . ." % controlflow)
+
+    def solve(self, control, cycle_type="v"):
+        """Cycles on the finest level until the given control is satisfied
+
+        Parameters
+        ----------
+        control : :py:class:`.ResidualErrorControl`
+            checked with level index ``-1`` after each cycle
+        cycle_type : :py:class:`str`
+            one of ``v``, ``w``, ``f`` or ``fmg``;
+            for ``fmg`` a full multigrid cycle is done first followed by V-cycles if required
+
+        Returns
+        -------
+        n_cycles : :py:class:`int`
+            number of cycles done
+        """
+        cycles = {"v": self.v_cycle, "w": self.w_cycle, "f": self.f_cycle, "fmg": self.v_cycle}
+        if cycle_type not in cycles:
+            raise ValueError("Unknown cycle type: '%s'" % cycle_type)
+        control.reset()
+        n_cycles = 0
+        while not control.reached(-1, self.residual_norm(-1), n_cycles):
+            if cycle_type == "fmg" and n_cycles == 0:
+                self.fmg_cycle()
+            else:
+                cycles[cycle_type]()
+            n_cycles += 1
+        return n_cycles
+
+    def residual_norm(self, lvl_ind):
+        """Computes the residual of a level and returns its supremum norm
+        """
+        self.levels[lvl_ind].compute_residual(self.stencils[lvl_ind])
+        return np.max(np.abs(self.levels[lvl_ind].res_mid))
+
+    def _coarsest_index(self, max_depth):
+        if max_depth is None:
+            return 0
+        return max(0, self.num_levels - 1 - max_depth)
+
+    def _solve_on(self, lvl_ind):
+        # directly on the coarsest level, otherwise as good as the smoother allows
+        if lvl_ind == 0:
+            self.smoothers[0].relax()
+        else:
+            self.smoothers[lvl_ind].relax(self.n_pre + self.n_post)
+
+    def _cycle(self, lvl_ind, gamma, coarsest=0):
+        """Recursive multigrid cycle on level ``lvl_ind`` (``0`` is the coarsest)
+
+        ``gamma`` is the number of recursive cycles on the next coarser level, i.e. 1 for a V-cycle and 2 for a
+        W-cycle, or ``"f"`` for an F-cycle (an F-cycle followed by a V-cycle on the next coarser level).
+        """
+        if lvl_ind == coarsest:
+            self._solve_on(lvl_ind)
+            return
+        self.smoothers[lvl_ind].relax(self.n_pre)
+        # restrict the defect f - A u, the coarse correction starts from zero
+        self.levels[lvl_ind].compute_residual(self.stencils[lvl_ind])
+        self.rst_ops[lvl_ind - 1].restrict()
+        self.levels[lvl_ind - 1].arr[:] = 0.0
+        if gamma == "f":
+            self._cycle(lvl_ind - 1, "f", coarsest)
+            self._cycle(lvl_ind - 1, 1, coarsest)
+        else:
+            for i in range(gamma):
+                self._cycle(lvl_ind - 1, gamma, coarsest)
+        self.ipl_ops[lvl_ind - 1].eval()
+        self.smoothers[lvl_ind].relax(self.n_post)
 
     def v_cycle_verbose(self):
         # start with top_level down the v_cycle
@@ -289,30 +451,63 @@ class MultiGridCore(object):
             print("Level %d after smoothing" % (i+1))
             self.levels[i+1].print_all()
 
-    def v_cycle(self):
-        # start with top_level down the v_cycle
+    def v_cycle(self, max_depth=None):
+        """One V-cycle on the finest level
 
-        for i in range(1, self.num_levels):
-            self.smoothers[-i].relax(self.n_pre)
-            self.levels[-i].compute_residual(self.stencils[-i])
-            self.rst_ops[-i].restrict()
+        Parameters
+        ----------
+        max_depth : :py:class:`int`
+            *(optional)*
+            number of coarser levels to descend; defaults to all
+        """
+        self._cycle(self.num_levels - 1, 1, self._coarsest_index(max_depth))
 
-        # compute direct solution on coarsest level
+    def w_cycle(self, max_depth=None):
+        """One W-cycle on the finest level
 
-        self.smoothers[0].relax()
+        Parameters
+        ----------
+        max_depth : :py:class:`int`
+            *(optional)*
+            number of coarser levels to descend; defaults to all
+        """
+        self._cycle(self.num_levels - 1, 2, self._coarsest_index(max_depth))
 
+    def f_cycle(self, max_depth=None):
+        """One F-cycle on the finest level
 
-        # up the v cycle
-        for i in range(self.num_levels-1):
-            self.ipl_ops[i].eval()
-            self.smoothers[i+1].relax(self.n_post)
+        Parameters
+        ----------
+        max_depth : :py:class:`int`
+            *(optional)*
+            number of coarser levels to descend; defaults to all
+        """
+        self._cycle(self.num_levels - 1, "f", self._coarsest_index(max_depth))
 
+    def fmg_cycle(self, max_depth=None):
+        """Full multigrid cycle
 
-    def w_cycle(self, max_depth):
-        pass
+        The right hand side of the finest level is restricted to all coarser levels, the problem is solved on the
+        coarsest one and the solution is interpolated level by level as the initial guess for a V-cycle on the next
+        finer level.
+        The initial guess on the finest level is discarded.
 
-    def fmg_cycle(self, max_depth):
-        pass
+        Parameters
+        ----------
+        max_depth : :py:class:`int`
+            *(optional)*
+            number of coarser levels to start from; defaults to all
+        """
+        coarsest = self._coarsest_index(max_depth)
+        for lvl_ind in range(self.num_levels - 1, coarsest, -1):
+            self.levels[lvl_ind].res_mid[:] = self.levels[lvl_ind].rhs
+            self.rst_ops[lvl_ind - 1].restrict()
+        self.levels[coarsest].arr[:] = 0.0
+        self._solve_on(coarsest)
+        for lvl_ind in range(coarsest + 1, self.num_levels):
+            self.levels[lvl_ind].mid[:] = 0.0
+            self.ipl_ops[lvl_ind - 1].eval()
+            self._cycle(lvl_ind, 1, coarsest)
 
 if __name__ == '__main__':
     laplace_array = np.asarray([1.0, -2.0, 1.0])
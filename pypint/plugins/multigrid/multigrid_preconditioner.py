@@ -0,0 +1,61 @@
+# coding=utf-8
+"""Geometric multigrid cycles as preconditioner
+
+.. moduleauthor:: Torbjörn Klatt <t.klatt@fz-juelich.de>
+"""
+from pypint.plugins.multigrid.i_multigrid_preconditioner import IMultigridPreconditioner
+from pypint.utilities import assert_condition
+
+
+class MultiGridPreconditioner(IMultigridPreconditioner):
+    """Applies cycles of a :py:class:`.MultiGridCore` starting from zero
+
+    The approximated operator is the stencil of the finest level on its grid with zero values outside, i.e. the
+    sparse matrix of :py:meth:`.Stencil.to_sparse_matrix`.
+    Inhomogeneous boundary values have to be moved into the right hand side of the Krylov solver beforehand, e.g. with
+    :py:meth:`.Stencil.modify_rhs`.
+
+    The core is reused on each application and thus must not be used for anything else in the meantime.
+    """
+
+    def __init__(self, mg_core, cycle_type="v", n_cycles=1):
+        """
+        Parameters
+        ----------
+        mg_core : :py:class:`.MultiGridCore`
+        cycle_type : :py:class:`str`
+            *(optional)*
+            one of ``v`` (default), ``w`` or ``f``
+        n_cycles : :py:class:`int`
+            *(optional)*
+            number of cycles per application; defaults to ``1``
+
+        Raises
+        ------
+        ValueError
+            if ``cycle_type`` is unknown or ``n_cycles`` is not positive
+        """
+        _cycles = {"v": mg_core.v_cycle, "w": mg_core.w_cycle, "f": mg_core.f_cycle}
+        assert_condition(cycle_type in _cycles, ValueError,
+                         message="Unknown cycle type: '%s'" % cycle_type, checking_obj=self)
+        assert_condition(n_cycles > 0, ValueError,
+                         message="Number of cycles must be positive: NOT %s" % n_cycles, checking_obj=self)
+        self._finest = mg_core.levels[-1]
+        super(MultiGridPreconditioner, self).__init__((self._finest.mid.size, self._finest.mid.size),
+                                                      dtype=self._finest.mid.dtype)
+        self.mg_core = mg_core
+        self.cycle_type = cycle_type
+        self.n_cycles = n_cycles
+        self._cycle = _cycles[cycle_type]
+
+    def apply(self, rhs):
+        self._finest.arr[:] = 0.0
+        self._finest.rhs = rhs.reshape(self._finest.rhs.shape)
+        # the ghost cells are zero, so there is nothing to move into the right hand side
+        self._finest.modified_rhs = True
+        for _ in range(self.n_cycles):
+            self._cycle()
+        return self._finest.mid.reshape(rhs.shape).copy()
+
+
+__all__ = ['MultiGridPreconditioner']
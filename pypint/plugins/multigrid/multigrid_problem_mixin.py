@@ -5,12 +5,19 @@
 .. moduleauthor:: Torbjörn Klatt <t.klatt@fz-juelich.de>
 """
 from collections import OrderedDict
+from contextlib import contextmanager
+from os import cpu_count
+from queue import LifoQueue
 
 import numpy as np
 
 from pypint.problems.i_problem import IProblem
 from pypint.plugins.multigrid.stencil import Stencil
-from pypint.plugins.multigrid.multigrid_core import MultiGridCore
+from pypint.plugins.multigrid.multigrid_core import MultiGridCore, ResidualErrorControl
+from pypint.plugins.multigrid.smoothed_aggregation import SmoothedAggregationSolver
+from pypint.plugins.multigrid.multigrid_preconditioner import MultiGridPreconditioner
+from pypint.plugins.multigrid.spectral_solver import SpectralSpaceSolver
+from pypint.plugins.multigrid.factorization_cache import FactorizationCache
 from pypint.plugins.multigrid import MG_INTERPOLATION_PRESETS, MG_RESTRICTION_PRESETS, MG_SMOOTHER_PRESETS, MG_LEVEL_PRESETS
 
 # from pypint.plugins.multigrid.i_multigrid_level import IMultigridLevel
@@ -18,11 +25,12 @@ from pypint.plugins.multigrid import MG_INTERPOLATION_PRESETS, MG_RESTRICTION_PR
 # except ImportError:
 #     MultiGridCore = None
 from pypint.plugins.multigrid.multigrid_smoother import DirectSolverSmoother
+from pypint.plugins.timers.profiler import HasProfilerMixin, profiled
 from pypint.utilities import assert_is_callable, assert_is_instance, assert_condition, assert_named_argument
 from pypint.utilities.logging import LOG
 
 
-class MultigridProblemMixin(object):
+class MultigridProblemMixin(HasProfilerMixin):
     """Provides functionality of a problem to have multigrid as its space solver
 
     Contains every aspect of the Problem that has to be solved, like the stencil from which on may derive :math:`A_h`
@@ -31,6 +39,8 @@ class MultigridProblemMixin(object):
 
     valid_boundary_conditions = ['periodic', 'dirichlet']
 
+    valid_krylov_methods = ['cg', 'gmres', 'bicgstab']
+
     def __init__(self, *args, **kwargs):
         """
         Parameters
@@ -42,12 +52,20 @@ class MultigridProblemMixin(object):
             defaults to ``periodic`` for each dimension
         boundary_functions : :py:class:`None` or :py:class:`list` of :py:class:`callable`
             *(optional)*
-            functions defined on the boundaries of the geometry
+            functions defined on the boundaries of the geometry;
+            plain functions are static, time-dependent ones have to be given as :py:class:`.BoundaryCondition`
         geometry : :py:class:`None` or :py:class:`numpy.ndarray`
             *(optional)*
             specifying the dimension and extend of the geometry
+        mg_max_threads : :py:class:`int`
+            *(optional)*
+            maximum number of threads solving with ``mg`` or a Krylov method preconditioned by it at once, each on
+            hierarchies of its own;
+            further threads wait for one of them to finish; defaults to the default number of workers of a
+            :py:class:`concurrent.futures.ThreadPoolExecutor`, i.e. four more than the number of CPUs up to ``32``
         """
         assert_is_instance(self, IProblem, message="This Mixin is only valid for IProblems.", checking_obj=self)
+        HasProfilerMixin.__init__(self, *args, **kwargs)
 
         assert_named_argument('rhs_function_wrt_space', kwargs, descriptor="RHS for space solver", checking_obj=self)
         assert_is_callable(kwargs['rhs_function_wrt_space'], descriptor="RHS for space solver", checking_obj=self)
@@ -109,6 +127,22 @@ class MultigridProblemMixin(object):
 
         self._implicit_solve_method = kwargs.get('implicit_solve_method', 'direct')
         self._mg_core = None
+        # assembled multigrid hierarchies, their preconditioners and the memory of their levels by time level, grid
+        # shape, coarse operator and slot for each delta time
+        self._mg_cores = FactorizationCache(sizeof=lambda entry: entry['arena'].nbytes, name='mg hierarchies')
+        # slots of the threads currently solving, the most recently released one is handed out first
+        _max_threads = kwargs.get('mg_max_threads', min(32, (cpu_count() or 1) + 4))
+        assert_condition(_max_threads > 0, ValueError,
+                         message="Maximum number of threads must be positive: NOT %s" % _max_threads, checking_obj=self)
+        self._mg_slots = LifoQueue(maxsize=_max_threads)
+        for _slot in reversed(range(0, _max_threads)):
+            self._mg_slots.put(_slot)
+        # algebraic multigrid hierarchies by operator for each delta time
+        self._amg_solvers = FactorizationCache(name='amg solvers')
+        # spectral solvers by stencil for each delta time
+        self._spectral_solvers = FactorizationCache(sizeof=lambda entry: entry[1].symbol.nbytes,
+                                                    name='spectral solvers')
+        self._add_metered(self._mg_cores, self._amg_solvers, self._spectral_solvers)
 
         # the Space tensor which is actually used
         self._act_space_tensor = None
@@ -170,22 +204,123 @@ class MultigridProblemMixin(object):
     def set_rhs_space_operator(self, delta_time, operator='default'):
         self._rhs_space_operators[delta_time] = operator
 
+    @profiled("mg solve")
     def mg_solve(self, next_x, method='direct', **kwargs):
         """Runs the multigrid solver
 
         This is where all the magic happens on each call of the space solver from the iterative time solver, i.e. on
         every iteration for each time-level in each sweep on each step.
 
+        For ``mg``, the multigrid hierarchy (levels, stencils, smoothers, level transitions) is assembled only once for
+        each combination of ``time_level``, shape of ``next_x``, ``mg_coarse_operator``, ``stencil_fnc`` and
+        ``delta_time`` and reused on subsequent calls; only the initial guess and right hand side are refreshed.
+        Another ``stencil_fnc`` object, e.g. for another operator, gets a hierarchy of its own, thus the same one must
+        be passed on each call to reuse a hierarchy and it must give the same stencils on each of these calls.
+        The hierarchies are kept in a :py:class:`.FactorizationCache`, which evicts the least recently used ones
+        along with the memory of their levels (see :py:class:`.MemoryArena`).
+        Threads solving at once use hierarchies of their own, taken from a pool of ``mg_max_threads`` slots, while
+        the solvers of ``amg`` and ``fft`` are shared by all threads.
+
         Parameters
         ----------
         method : :py:class:`str`
             defaults to ``direct``
 
             ``mg``
-                for full multigrid cycles; additional keyword arguments passed to the multigrid solver can be given;
+                for multigrid cycles until the residual is sufficiently reduced;
+                additional keyword arguments passed to the multigrid solver can be given;
                 additional arguments required:
 
-                    ``mg_level``
+                    ``stencil_fnc``
+
+                    ``rhs``
+
+                optional arguments:
+
+                    ``time_level`` and ``delta_time``
+                        identifying the hierarchy along with the shape of ``next_x``, ``mg_coarse_operator`` and
+                        ``stencil_fnc``
+
+                    ``time``
+                        for time-dependent :py:class:`.BoundaryCondition`
+
+                    ``mg_cycle``
+                        one of ``v``, ``w``, ``f`` or ``fmg`` (see :py:meth:`.MultiGridCore.solve`);
+                        defaults to ``fmg``
+
+                    ``mg_tolerance``
+                        reduction of the residual relative to the one of the initial guess at which cycling stops;
+                        defaults to ``1e-6``
+
+                    ``mg_max_cycles``
+                        maximum number of cycles; defaults to ``20``
+
+                    ``mg_coarse_operator``
+                        ``rediscretize`` (default) to apply ``stencil_fnc`` on each level or ``galerkin`` for
+                        :math:`R A P` (see :py:class:`.MultiGridCore`)
+
+            ``amg``
+                for V-cycles of a :py:class:`.SmoothedAggregationSolver`;
+                the hierarchy is set up once for each operator and ``delta_time``;
+                additional arguments required:
+
+                    ``rhs``
+
+                    ``stencil`` or ``matrix``
+                        the operator as :py:class:`.Stencil` on the problem's grid or as sparse matrix, e.g. with
+                        variable coefficients; ``matrix`` takes precedence
+
+                optional arguments:
+
+                    ``delta_time``
+
+                    ``mg_tolerance`` and ``mg_max_cycles``
+                        as for ``mg``
+
+            ``cg``, ``gmres`` or ``bicgstab``
+                for the Krylov solver of :py:mod:`scipy.sparse.linalg` preconditioned by one multigrid cycle
+                starting from zero (see :py:class:`.IMultigridPreconditioner`);
+                the number of iterations does not grow with the number of grid points;
+                additional arguments required:
+
+                    ``stencil``
+                        the operator as :py:class:`.Stencil` on the grid of ``next_x``
+
+                    ``rhs``
+
+                optional arguments:
+
+                    ``mg_preconditioner``
+                        ``mg`` (default) for a V-cycle of the hierarchy assembled as for ``mg``, which requires
+                        ``stencil_fnc`` as well, or ``amg`` for a V-cycle of a :py:class:`.SmoothedAggregationSolver`
+
+                    ``time_level``, ``delta_time``, ``time`` and ``mg_coarse_operator``
+                        as for ``mg``
+
+                    ``mg_tolerance``
+                        reduction of the residual relative to the one of the right hand side; defaults to ``1e-6``
+
+                    ``mg_max_cycles``
+                        maximum number of iterations; defaults to ``20``
+
+            ``fft``
+                for a :py:class:`.SpectralSpaceSolver` with a discrete Fourier or sine transform along each axis
+                for ``periodic`` or ``dirichlet`` boundaries, respectively;
+                only for stencils with constant coefficients;
+                the eigenvalues are computed once for each stencil and ``delta_time``;
+                additional arguments required:
+
+                    ``stencil``
+                        on the problem's grid
+
+                    ``rhs``
+
+                optional arguments:
+
+                    ``delta_time``
+
+                    ``fft_workers``
+                        number of threads of the transforms
 
             ``direct``
                 for using the a predefined multigrid smoother as a direct solver via :py:class:`.DirectSolverSmoother`;
@@ -195,40 +330,98 @@ class MultigridProblemMixin(object):
 
                     ``stencil``
 
+                optional arguments:
+
+                    ``solver``
+                        solving for a given right hand side instead, e.g. of a cached LU factorization; applied to
+                        ``rhs`` if given, otherwise to ``next_x``
+
         Raises
         ------
         ValueError
-            if given ``method`` is not one of ``mg`` or ``direct``
+            if given ``method`` is not one of ``mg``, ``amg``, ``cg``, ``gmres``, ``bicgstab``, ``fft`` or ``direct``
+            or ``mg_preconditioner`` is unknown
 
         Returns
         -------
         solution
         """
         if method == 'mg':
-            assert_named_argument('stencil_fnc', kwargs, descriptor="Stencil Generation Function",
-                                  checking_obj=self)
-            assert_is_callable(kwargs['stencil_fnc'], descriptor="Stencil Generation Function", checking_obj=self)
-            # LOG.debug("Using Multigrid as implicit space solver.")
-
-            mg_core_options = {}
-            mg_core_options.update(MG_SMOOTHER_PRESETS["Jacobi"])
-            mg_core_options.update(MG_LEVEL_PRESETS["Standard-1D"])
-            mg_core_options.update(MG_RESTRICTION_PRESETS["Standard-1D"])
-            mg_core_options.update(MG_INTERPOLATION_PRESETS["Standard-1D"])
-            mg_core_options["shape_coarse"] = 4
-            mg_core_options["n_pre"] = 1
-            mg_core_options["n_post"] = 1
-            self.mg_core = MultiGridCore(self, lambda h: (kwargs['stencil_fnc'](h), np.array([1])), **mg_core_options)
-            self.mg_core.levels[-1].mid[:] = next_x.reshape(self.mg_core.levels[-1].mid.shape)
-            self.mg_core.levels[-1].rhs = kwargs['rhs'].reshape(self.mg_core.levels[-1].rhs.shape)
-            self.mg_core.pad(-1)
-            self.mg_core.modify_rhs(-1)
-
-            self.mg_core.v_cycle()
-            self.mg_core.v_cycle()
+            with self._mg_slot() as _slot:
+                # the hierarchy of this slot, as another thread may replace the last used one in the meantime
+                _mg_core = self._get_mg_core(next_x, _slot, **kwargs)
+                self.mg_core = _mg_core
+                _mg_core.levels[-1].mid[:] = next_x.reshape(_mg_core.levels[-1].mid.shape)
+                _mg_core.levels[-1].rhs = kwargs['rhs'].reshape(_mg_core.levels[-1].rhs.shape)
+                _mg_core.pad(-1, kwargs.get('time'))
+                _mg_core.modify_rhs(-1)
+
+                _control = ResidualErrorControl({-1: kwargs.get('mg_tolerance', 1e-6)},
+                                                {-1: kwargs.get('mg_max_cycles', 20)})
+                _cycles = _mg_core.solve(_control, cycle_type=kwargs.get('mg_cycle', 'fmg'))
+                self.metrics.increment('mg_cycles', _cycles, cycle=kwargs.get('mg_cycle', 'fmg'))
+
+                # LOG.debug("input: %s --> %s" % (next_x.shape, self._mg_core.levels[-1].mid.shape))
+                # copy, as the level is overwritten by the next solve with the same hierarchy
+                return _mg_core.levels[-1].mid.reshape(next_x.shape).copy()
+
+        elif method in MultigridProblemMixin.valid_krylov_methods:
+            assert_named_argument('stencil', kwargs, types=Stencil, descriptor="MG Stencil", checking_obj=self)
+            _stencil = kwargs['stencil']
+            _preconditioner_type = kwargs.get('mg_preconditioner', 'mg')
+            if _preconditioner_type == 'mg':
+                # the hierarchy of the slot is used by the preconditioner until the Krylov solver is done
+                with self._mg_slot() as _slot:
+                    _entry = self._get_mg_entry(next_x, _slot, **kwargs)
+                    _mg_core = _entry['core']
+                    self.mg_core = _mg_core
+                    _mg_core.reset_coarse_levels()
+                    _level = _mg_core.levels[-1]
+                    # move the boundary values into the right hand side
+                    _level.arr[:] = 0.0
+                    _level.rhs = kwargs['rhs'].reshape(_level.rhs.shape)
+                    _mg_core.pad(-1, kwargs.get('time'))
+                    _mg_core.modify_rhs(-1)
+                    _rhs = _level.rhs.reshape(-1).copy()
+                    if _entry['preconditioner'] is None:
+                        _entry['preconditioner'] = MultiGridPreconditioner(_mg_core)
+                    return self._krylov_solve(method, next_x, _stencil, _rhs, _entry['preconditioner'],
+                                              kwargs.get('mg_tolerance', 1e-6), kwargs.get('mg_max_cycles', 20))
+            elif _preconditioner_type == 'amg':
+                _preconditioner = self._amg_solvers.get(id(_stencil), kwargs.get('delta_time'),
+                                                        lambda: (_stencil, self._setup_amg(
+                                                            _stencil.to_sparse_matrix(self.spacial_dim, "csr"))))[1]
+                return self._krylov_solve(method, next_x, _stencil, kwargs['rhs'].reshape(-1), _preconditioner,
+                                          kwargs.get('mg_tolerance', 1e-6), kwargs.get('mg_max_cycles', 20))
+            else:
+                raise ValueError("Unknown preconditioner: '%s'" % _preconditioner_type)
 
-            # LOG.debug("input: %s --> %s" % (next_x.shape, self._mg_core.levels[-1].mid.shape))
-            return self.mg_core.levels[-1].mid.reshape(next_x.shape)
+        elif method == 'amg':
+            if kwargs.get('matrix') is None:
+                assert_named_argument('stencil', kwargs, types=Stencil, descriptor="MG Stencil", checking_obj=self)
+                _operator = kwargs['stencil']
+                _setup = lambda: self._setup_amg(_operator.to_sparse_matrix(self.spacial_dim, "csr"))
+            else:
+                _operator = kwargs['matrix']
+                _setup = lambda: self._setup_amg(_operator)
+            # the entry references the operator, thus its id is not reused while cached
+            _amg = self._amg_solvers.get(id(_operator), kwargs.get('delta_time'), lambda: (_operator, _setup()))[1]
+            _sol = _amg.solve(kwargs['rhs'], initial_guess=next_x,
+                              tolerance=kwargs.get('mg_tolerance', 1e-6),
+                              max_cycles=kwargs.get('mg_max_cycles', 20)).reshape(next_x.shape)
+            self.metrics.increment('mg_cycles', _amg.cycles, cycle='amg')
+            return _sol
+
+        elif method == 'fft':
+            assert_named_argument('stencil', kwargs, types=Stencil, descriptor="MG Stencil", checking_obj=self)
+            _stencil = kwargs['stencil']
+            _boundaries = self._boundaries_per_axis()
+            # the entry references the stencil, thus its id is not reused while cached
+            _solver = self._spectral_solvers.get((id(_stencil), tuple(_boundaries)), kwargs.get('delta_time'),
+                                                 lambda: (_stencil,
+                                                          SpectralSpaceSolver(_stencil, self.spacial_dim, _boundaries,
+                                                                              workers=kwargs.get('fft_workers'))))[1]
+            return _solver.solve(kwargs['rhs']).reshape(next_x.shape)
 
         elif method == 'direct':
             if kwargs.get('solver') is None:
@@ -236,13 +429,116 @@ class MultigridProblemMixin(object):
                 #                       checking_obj=self)
                 assert_named_argument('stencil', kwargs, types=Stencil, descriptor="MG Stencil", checking_obj=self)
                 solver_function = DirectSolverSmoother(kwargs['stencil'], kwargs['mg_level']).relax
+                self.metrics.increment('sparse_factorizations', kind='lu')
             else:
                 solver_function = kwargs['solver']
+                if kwargs.get('rhs') is not None:
+                    # the solver inverts the operator, thus it is applied to the right hand side
+                    return solver_function(kwargs['rhs'].reshape(-1)).reshape(next_x.shape)
             # LOG.debug("next_x.shape: {:s}".format(next_x.shape))
             return solver_function(next_x)
         else:
             raise ValueError("Unknown method: '%s'" % method)
 
+    def _krylov_solve(self, method, next_x, stencil, flat_rhs, preconditioner, tolerance, max_iterations):
+        """Runs the Krylov solver ``method`` for the stencil's operator with the given preconditioner
+        """
+        _sol, _info = stencil.iterative_solver_list(method, flat_rhs, grid=self.spacial_dim,
+                                                    x0=next_x.reshape(-1), M=preconditioner,
+                                                    tol=tolerance, maxiter=max_iterations,
+                                                    callback=lambda *args: self.metrics.increment(
+                                                        'linear_solver_iterations', method=method))
+        if _info > 0:
+            LOG.warning("%s did not converge within %d iterations." % (method, _info))
+        return _sol.reshape(next_x.shape)
+
+    def _setup_amg(self, matrix):
+        # the coarsest level of the hierarchy is factorized
+        self.metrics.increment('sparse_factorizations', kind='amg')
+        return SmoothedAggregationSolver(matrix)
+
+    def _boundaries_per_axis(self):
+        """Boundary condition of each axis, which has to be the same on both of its sides
+        """
+        if len(self.boundaries) == len(self.spacial_dim):
+            return list(self.boundaries)
+        _boundaries = []
+        for _axis in range(len(self.spacial_dim)):
+            _left, _right = self.boundaries[2 * _axis], self.boundaries[2 * _axis + 1]
+            assert_condition(_left == _right, ValueError,
+                             message="Boundaries of axis %d differ: %s != %s" % (_axis, _left, _right),
+                             checking_obj=self)
+            _boundaries.append(_left)
+        return _boundaries
+
+    @contextmanager
+    def _mg_slot(self):
+        """Holds one of the slots of the hierarchies while solving, waiting for one to be released if none is free
+        """
+        _slot = self._mg_slots.get()
+        try:
+            yield _slot
+        finally:
+            self._mg_slots.put(_slot)
+
+    def _get_mg_core(self, next_x, slot, **kwargs):
+        """Returns the multigrid hierarchy of the slot for the grid of ``next_x``, assembling it on first use
+        """
+        _mg_core = self._get_mg_entry(next_x, slot, **kwargs)['core']
+        _mg_core.reset_coarse_levels()
+        return _mg_core
+
+    def _get_mg_entry(self, next_x, slot, **kwargs):
+        """Returns the cache entry of the slot's multigrid hierarchy and its preconditioner for the grid of ``next_x``
+        """
+        assert_named_argument('stencil_fnc', kwargs, descriptor="Stencil Generation Function", checking_obj=self)
+        assert_is_callable(kwargs['stencil_fnc'], descriptor="Stencil Generation Function", checking_obj=self)
+        # LOG.debug("Using Multigrid as implicit space solver.")
+
+        _coarse_operator = kwargs.get('mg_coarse_operator', 'rediscretize')
+        _stencil_fnc = kwargs['stencil_fnc']
+
+        def _assemble():
+            _grid = tuple(self.spacial_dim) if len(self.spacial_dim) > 1 else (next_x.size,)
+            _preset = "Standard-%dD" % len(_grid)
+            mg_core_options = {}
+            mg_core_options.update(MG_SMOOTHER_PRESETS["Jacobi"])
+            # undamped Jacobi does not smooth the high frequencies once the spatial operator dominates
+            mg_core_options["smooth_opts"] = {"omega": 2.0 / 3.0}
+            mg_core_options.update(MG_LEVEL_PRESETS[_preset])
+            mg_core_options.update(MG_RESTRICTION_PRESETS[_preset])
+            mg_core_options.update(MG_INTERPOLATION_PRESETS[_preset])
+            # all axes are coarsened together, thus the axis allowing the fewest levels limits the hierarchy
+            _num_levels = min(self._mg_hierarchy_size(n)[0] for n in _grid)
+            _shape_coarse = tuple((n + 1) // 2 ** (_num_levels - 1) - 1 for n in _grid)
+            mg_core_options["num_levels"] = _num_levels
+            mg_core_options["shape_coarse"] = _shape_coarse[0] if len(_grid) == 1 else _shape_coarse
+            mg_core_options["n_pre"] = 1
+            mg_core_options["n_post"] = 1
+            mg_core_options["coarse_operator"] = _coarse_operator
+            _center = np.ones(len(_grid), dtype=int)
+            _mg_core = MultiGridCore(self, lambda h: (_stencil_fnc(h), _center), **mg_core_options)
+            return {'core': _mg_core, 'preconditioner': None, 'arena': _mg_core.arena, 'stencil_fnc': _stencil_fnc}
+
+        # the levels hold the values of a solve, thus threads solving at once must not share hierarchies;
+        # the entry references the stencil function, thus its id is not reused while cached
+        return self._mg_cores.get((str(kwargs.get('time_level')), next_x.shape, _coarse_operator, id(_stencil_fnc),
+                                   slot),
+                                  kwargs.get('delta_time'), _assemble)
+
+    @staticmethod
+    def _mg_hierarchy_size(n_points, min_coarse=3):
+        """Number of levels and points of the coarsest level for standard coarsening of ``n_points`` points
+
+        The grid is coarsened from :math:`2n+1` to :math:`n` points as long as there are at least ``min_coarse``
+        points left, e.g. ``19`` points give three levels down to ``4`` points.
+        """
+        _num_levels = 1
+        while n_points % 2 == 1 and (n_points - 1) // 2 >= min_coarse:
+            n_points = (n_points - 1) // 2
+            _num_levels += 1
+        return _num_levels, n_points
+
     def construct_space_tensor(self, number_of_points_list, stencil=None):
         """Constructs the Spacetensor which is important for the evaluation in the case of Dirichlet boundary conditions
 
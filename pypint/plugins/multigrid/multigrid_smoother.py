@@ -1,5 +1,6 @@
 # coding=utf-8
 
+from concurrent.futures import Executor, ThreadPoolExecutor
 import numpy as np
 from pypint.multi_level_providers.multi_level_provider import MultiLevelProvider
 from pypint.utilities import assert_is_instance, assert_condition
@@ -7,7 +8,9 @@ from pypint.plugins.multigrid.stencil import Stencil
 from pypint.plugins.multigrid.i_multigrid_level import IMultigridLevel
 import scipy.signal as sig
 import scipy.sparse as sprs
+from logbook import DEBUG
 from pypint.plugins.multigrid.i_multigrid_smoother import IMultigridSmoother
+from pypint.utilities.logging import LOG, is_logging
 
 class ILUSmoother(IMultigridSmoother):
     """ makes a incomplete LU smoother solver
@@ -98,7 +101,6 @@ class SplitSmoother(IMultigridSmoother):
         elif level.role is "FL": # a little hacky
             self.convolve_control = "same"
             self.evaluable_view = level.mid
-            print("is all the same")
 
         super().__init__(l_plus.ndim, *args, **kwargs)
 
@@ -141,12 +143,10 @@ class WeightedJacobiSmoother(IMultigridSmoother):
             U = sprs.triu(-A, 1)
             I = sprs.eye(level.mid.size, level.mid.size, 0, np.float64, "lil")
             self.D = self.center_value
-            print("Matrices of the weighted Jacobian class: ")
-            print("A :\n", A.todense())
-            print("L :\n", L.todense())
-            print("U :\n", U.todense())
-            print("I :\n", I.todense())
-            print("D :\n", self.D)
+            if is_logging(DEBUG):
+                # densifying the matrices is far more expensive than the setup itself
+                LOG.debug("Matrices of the weighted Jacobian class:\nA :\n%s\nL :\n%s\nU :\n%s\nI :\n%s\nD :\n%s"
+                          % (A.todense(), L.todense(), U.todense(), I.todense(), self.D))
 
             self.R_w = (1.0-omega) * I + omega * (L + U) / self.D
             self.R_w = self.R_w.tocsc()
@@ -222,3 +222,317 @@ class WeightedJacobiSmoother(IMultigridSmoother):
             - self.stencil.eval_convolve(self.lvl_view) \
                 * self.omega / self.center_value
 
+
+
+class SlicedStencilSmoother(IMultigridSmoother):
+    """Base class for smoothers applying the stencil via shifted slices of the padded level array
+
+    The off-center entries of the stencil are applied by adding up shifted views of the padded array of the level,
+    thus no matrix and no factorization is needed.
+    If the right hand side of the level is modified, i.e. the boundary values are already part of it, the ghost cells
+    are zeroed before relaxing; for periodic boundaries they are refreshed before each update.
+
+    1D, 2D and 3D levels are supported.
+
+    With more than one worker the points are split into blocks of rows, i.e. along the first array axis, which are
+    updated concurrently by threads; NumPy releases the GIL within the slice operations.
+    The blocks share the padded array of the level, thus the halo of each block are the rows of its neighbours, which
+    are only read while the blocks are updated and exchanged by waiting for all blocks before the next update.
+    The results do not depend on the number of workers.
+    Blocks have at least ``min_block_size`` points, so small levels are still relaxed by a single thread.
+    """
+
+    def __init__(self, stencil, level, n_workers=1, executor=None, min_block_size=2 ** 15, **kwargs):
+        """
+        Parameters
+        ----------
+        stencil : :py:class:`.Stencil`
+        level : :py:class:`.IMultigridLevel`
+        n_workers : :py:class:`int`
+            *(optional)*
+            maximum number of blocks updated concurrently; defaults to ``1``
+        executor : :py:class:`concurrent.futures.Executor`
+            *(optional)*
+            executor the blocks are dispatched to; defaults to a thread pool with ``n_workers`` threads shared by all
+            smoothers
+        min_block_size : :py:class:`int`
+            *(optional)*
+            minimum number of points of a block
+        """
+        assert_is_instance(stencil, Stencil, "A Stencil object is needed")
+        assert_is_instance(level, IMultigridLevel, "Level should be level instance")
+        assert_condition(level.dim in (1, 2, 3), ValueError, "Only 1D, 2D and 3D levels are supported")
+        assert_condition(n_workers > 0, ValueError, "Number of workers has to be positive")
+        if executor is not None:
+            assert_is_instance(executor, Executor, "Executor has to be a concurrent.futures.Executor")
+        elif n_workers > 1:
+            executor = _thread_pool(n_workers)
+        self.n_workers = n_workers
+        self.min_block_size = min_block_size
+        self._executor = executor
+        self.level = level
+        self.stencil = stencil
+        self.center_value = stencil.arr[tuple(stencil.center)]
+
+        # borders of the padded array per axis, the 2D and 3D levels store them in (x, y, z) order
+        if level.dim == 1:
+            self._lower = (level.borders[0],)
+            self._upper = (level.borders[1],)
+        else:
+            self._lower = tuple(level.borders[level.dim - 1 - axis][0] for axis in range(level.dim))
+            self._upper = tuple(level.borders[level.dim - 1 - axis][1] for axis in range(level.dim))
+
+        self.neighbours = []
+        for index in zip(*np.nonzero(stencil.arr)):
+            offset = tuple(int(i - c) for i, c in zip(index, stencil.center))
+            if any(offset):
+                assert_condition(all(-l <= o <= u for o, l, u in zip(offset, self._lower, self._upper)),
+                                 ValueError, "Borders of the level are too small for the stencil")
+                self.neighbours.append((offset, stencil.arr[index]))
+
+        self._periodic = level.mg_problem.boundaries[0] == 'periodic'
+        super().__init__(level.dim, **kwargs)
+
+    def _slices(self, start, step=1, offset=None, rows=None):
+        """Slices of the padded array for the points of the mid region starting at ``start`` shifted by ``offset``
+
+        ``rows`` restricts them to the rows ``rows[0]`` up to ``rows[1]`` of these points.
+        """
+        if offset is None:
+            offset = (0,) * self.level.dim
+        slices = [slice(l + s + o, n - u + o, step)
+                  for s, o, l, u, n in zip(start, offset, self._lower, self._upper, self.level.arr.shape)]
+        if rows is not None:
+            slices[0] = slice(slices[0].start + rows[0] * step, slices[0].start + rows[1] * step, step)
+        return tuple(slices)
+
+    def _row_blocks(self, shape):
+        """Rows of the blocks for points of the given shape
+        """
+        n_blocks = max(1, min(self.n_workers, shape[0], int(np.prod(shape)) // self.min_block_size))
+        bounds = np.linspace(0, shape[0], n_blocks + 1).astype(int)
+        return [(int(first), int(last)) for first, last in zip(bounds[:-1], bounds[1:])]
+
+    def _run_blocks(self, function, tasks):
+        """Calls ``function`` with the arguments of each task and waits for all of them
+        """
+        if self._executor is None or len(tasks) == 1:
+            for task in tasks:
+                function(*task)
+        else:
+            for future in [self._executor.submit(function, *task) for task in tasks]:
+                future.result()
+
+    def _prepare_ghosts(self):
+        if self.level.modified_rhs:
+            for axis, (l, u) in enumerate(zip(self._lower, self._upper)):
+                index = [slice(None)] * self.level.dim
+                index[axis] = slice(None, l)
+                self.level.arr[tuple(index)] = 0.0
+                index[axis] = slice(self.level.arr.shape[axis] - u, None)
+                self.level.arr[tuple(index)] = 0.0
+        elif self._periodic:
+            self.level.pad()
+
+    def _neighbour_sum(self, out, scratch, start, step=1, rows=None):
+        """Subtracts the off-center part of the stencil applied to the points starting at ``start`` from ``out``
+        """
+        for offset, value in self.neighbours:
+            np.multiply(self.level.arr[self._slices(start, step, offset, rows)], value, out=scratch)
+            out -= scratch
+
+
+class DampedJacobiSmoother(SlicedStencilSmoother):
+    """Damped Jacobi smoother
+
+    Each sweep computes :math:`u \\leftarrow (1 - \\omega) u + \\omega D^{-1} (f - (A - D) u)` for all points at once.
+    """
+
+    def __init__(self, stencil, level, omega=2.0 / 3.0, **kwargs):
+        """
+        Parameters
+        ----------
+        stencil : :py:class:`.Stencil`
+        level : :py:class:`.IMultigridLevel`
+        omega : :py:class:`float`
+            *(optional)*
+            damping factor; defaults to ``2/3``
+        """
+        super().__init__(stencil, level, **kwargs)
+        self.omega = omega
+        self._start = (0,) * level.dim
+        self._blocks = self._row_blocks(level.mid.shape)
+        self._update = np.empty(level.mid.shape, dtype=level.arr.dtype)
+        self._scratch = np.empty(level.mid.shape, dtype=level.arr.dtype)
+
+    def _jacobi_block(self, first, last):
+        update = self._update[first:last]
+        update[:] = self.level.rhs[first:last]
+        self._neighbour_sum(update, self._scratch[first:last], self._start, 1, (first, last))
+        update *= self.omega / self.center_value
+
+    def _assign_block(self, first, last):
+        points = self.level.mid[first:last]
+        points *= 1.0 - self.omega
+        points += self._update[first:last]
+
+    def relax(self, n=1):
+        """Does n damped Jacobi sweeps in place
+        """
+        self._prepare_ghosts()
+        for i in range(n):
+            if self._periodic and not self.level.modified_rhs:
+                self.level.pad()
+            # all blocks have to read the old values of their halos before any block is updated
+            self._run_blocks(self._jacobi_block, self._blocks)
+            self._run_blocks(self._assign_block, self._blocks)
+
+
+class RedBlackGaussSeidelSmoother(SlicedStencilSmoother):
+    """Red-black Gauss-Seidel smoother
+
+    The points are colored like a checkerboard and all points of one color are updated at once.
+    This is an exact Gauss-Seidel sweep, if the stencil only couples points of different colors, i.e. for the
+    three point stencil in 1D and the five point stencil in 2D.
+    """
+
+    def __init__(self, stencil, level, omega=1.0, **kwargs):
+        """
+        Parameters
+        ----------
+        stencil : :py:class:`.Stencil`
+        level : :py:class:`.IMultigridLevel`
+        omega : :py:class:`float`
+            *(optional)*
+            over-relaxation factor; defaults to ``1.0``
+        """
+        super().__init__(stencil, level, **kwargs)
+        assert_condition(all(sum(offset) % 2 == 1 for offset, value in self.neighbours), ValueError,
+                         "Stencil couples points of the same color")
+        self.omega = omega
+        # sub-lattices of the red and black points, e.g. (0, 0) and (1, 1) are red in 2D
+        starts = [tuple(int(b) for b in np.binary_repr(i, level.dim)) for i in range(2 ** level.dim)]
+        self._colors = [[s for s in starts if sum(s) % 2 == color] for color in (0, 1)]
+        self._buffers = {}
+        for start in starts:
+            shape = level.arr[self._slices(start, 2)].shape
+            self._buffers[start] = (np.empty(shape, dtype=level.arr.dtype), np.empty(shape, dtype=level.arr.dtype))
+        # the points of one color only depend on the other color, thus all their blocks are independent
+        self._tasks = [[(start, first, last) for start in color for first, last in self._row_blocks(
+            self._buffers[start][0].shape)] for color in self._colors]
+
+    def _relax_block(self, start, first, last):
+        update, scratch = self._buffers[start]
+        update, scratch = update[first:last], scratch[first:last]
+        update[:] = self.level.rhs[tuple(slice(s, None, 2) for s in start)][first:last]
+        self._neighbour_sum(update, scratch, start, 2, (first, last))
+        points = self.level.arr[self._slices(start, 2, rows=(first, last))]
+        if self.omega != 1.0:
+            points *= 1.0 - self.omega
+            points += update * (self.omega / self.center_value)
+        else:
+            np.divide(update, self.center_value, out=points)
+
+    def relax(self, n=1):
+        """Does n red-black sweeps in place
+        """
+        self._prepare_ghosts()
+        for i in range(n):
+            for tasks in self._tasks:
+                if self._periodic and not self.level.modified_rhs:
+                    self.level.pad()
+                self._run_blocks(self._relax_block, tasks)
+
+
+class ChebyshevJacobiSmoother(SlicedStencilSmoother):
+    """Chebyshev accelerated Jacobi smoother
+
+    Applies the Chebyshev polynomial of the given degree of the Jacobi iteration matrix, which damps the eigenvalues
+    of :math:`D^{-1}A` within :math:`[\\lambda_{min}, \\lambda_{max}]`.
+    By default :math:`\\lambda_{max}` is Gershgorin's bound and :math:`\\lambda_{min}` a fraction of it, so that
+    the upper part of the spectrum, i.e. the high frequencies, is damped.
+    """
+
+    def __init__(self, stencil, level, degree=3, lower_fraction=0.3, max_eigenvalue=None, **kwargs):
+        """
+        Parameters
+        ----------
+        stencil : :py:class:`.Stencil`
+        level : :py:class:`.IMultigridLevel`
+        degree : :py:class:`int`
+            *(optional)*
+            degree of the polynomial, i.e. number of Jacobi steps per relaxation; defaults to ``3``
+        lower_fraction : :py:class:`float`
+            *(optional)*
+            :math:`\\lambda_{min}` relative to :math:`\\lambda_{max}`; defaults to ``0.3``
+        max_eigenvalue : :py:class:`float`
+            *(optional)*
+            :math:`\\lambda_{max}`; defaults to Gershgorin's bound
+        """
+        super().__init__(stencil, level, **kwargs)
+        assert_condition(degree > 0, ValueError, "Degree has to be positive")
+        assert_condition(0.0 < lower_fraction < 1.0, ValueError, "Lower fraction has to be within (0, 1)")
+        if max_eigenvalue is None:
+            max_eigenvalue = 1.0 + sum(abs(value) for offset, value in self.neighbours) / abs(self.center_value)
+        self.degree = degree
+        self.max_eigenvalue = max_eigenvalue
+        self.min_eigenvalue = lower_fraction * max_eigenvalue
+        self._start = (0,) * level.dim
+        self._blocks = self._row_blocks(level.mid.shape)
+        self._residual = np.empty(level.mid.shape, dtype=level.arr.dtype)
+        self._direction = np.empty(level.mid.shape, dtype=level.arr.dtype)
+        self._scratch = np.empty(level.mid.shape, dtype=level.arr.dtype)
+
+    def _jacobi_residual(self, first, last):
+        # D^{-1} (f - A u)
+        residual = self._residual[first:last]
+        np.multiply(self.level.mid[first:last], self.center_value, out=residual)
+        np.subtract(self.level.rhs[first:last], residual, out=residual)
+        self._neighbour_sum(residual, self._scratch[first:last], self._start, 1, (first, last))
+        residual /= self.center_value
+
+    def _first_direction_block(self, first, last, theta):
+        self._jacobi_residual(first, last)
+        np.divide(self._residual[first:last], theta, out=self._direction[first:last])
+
+    def _direction_block(self, first, last, old_factor, residual_factor):
+        self._jacobi_residual(first, last)
+        direction = self._direction[first:last]
+        direction *= old_factor
+        direction += self._residual[first:last] * residual_factor
+
+    def _update_block(self, first, last):
+        self.level.mid[first:last] += self._direction[first:last]
+
+    def relax(self, n=1):
+        """Applies the Chebyshev polynomial n times in place
+        """
+        theta = 0.5 * (self.max_eigenvalue + self.min_eigenvalue)
+        delta = 0.5 * (self.max_eigenvalue - self.min_eigenvalue)
+        sigma = theta / delta
+        self._prepare_ghosts()
+        for i in range(n):
+            rho = 1.0 / sigma
+            self._run_blocks(self._first_direction_block, [(first, last, theta) for first, last in self._blocks])
+            for k in range(self.degree):
+                # all blocks have to read the old values of their halos before any block is updated
+                self._run_blocks(self._update_block, self._blocks)
+                if k == self.degree - 1:
+                    break
+                if self._periodic and not self.level.modified_rhs:
+                    self.level.pad()
+                rho_next = 1.0 / (2.0 * sigma - rho)
+                self._run_blocks(self._direction_block, [(first, last, rho_next * rho, 2.0 * rho_next / delta)
+                                                         for first, last in self._blocks])
+                rho = rho_next
+
+
+_thread_pools = {}
+
+
+def _thread_pool(n_workers):
+    """Thread pool with the given number of threads shared by all smoothers
+    """
+    if n_workers not in _thread_pools:
+        _thread_pools[n_workers] = ThreadPoolExecutor(max_workers=n_workers)
+    return _thread_pools[n_workers]
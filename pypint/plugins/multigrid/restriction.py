@@ -5,6 +5,7 @@ import scipy.signal as sig
 # import scipy.sparse.linalg as spla
 # import functools as ft
 from pypint.utilities import assert_is_callable, assert_is_instance, assert_condition
+from pypint.utilities.logging import LOG
 from pypint.plugins.multigrid.i_multigrid_level import IMultigridLevel
 from pypint.plugins.multigrid.stencil import Stencil
 from pypint.plugins.multigrid.i_restriction import IRestriction
@@ -37,10 +38,9 @@ class RestrictionByStencilForLevelsClassical(IRestriction):
         # check if the number of points per level matches
         self.dip = []
         for i in range(rst_stencil.dim):
-            self.dip.append((level_in.mid.shape[i]-1)/(level_out.mid.shape[i]) - 1)
-            print("in.shape[", i, "]: ", level_in.mid.shape[i])
-            print("out.shape[", i, "]: ", level_out.mid.shape[i])
-            print("dip[", i, "]: ", self.dip[-1])
+            self.dip.append((level_in.mid.shape[i]-1)//(level_out.mid.shape[i]) - 1)
+            LOG.debug("in.shape[%d]: %d, out.shape[%d]: %d, dip[%d]: %s"
+                      % (i, level_in.mid.shape[i], i, level_out.mid.shape[i], i, self.dip[-1]))
             if (self.dip[-1] % 1) != 0:
                 raise ValueError("The Level do not match in direction " + str(i))
 
@@ -53,16 +53,41 @@ class RestrictionByStencilForLevelsClassical(IRestriction):
 
         self.reversed_stencil = rst_stencil.arr[self.reverse_slice]
 
+        # the coarse point j is the stencil applied at the fine point step * j, so each stencil entry contributes the
+        # fine points with the stride of the coarsening shifted by the entry's position
+        self.steps = [int(d) + 1 for d in self.dip]
+        coarse_shape = level_out.restrict_in.shape
+        self.entries = []
+        for index in zip(*np.nonzero(rst_stencil.arr)):
+            self.entries.append((rst_stencil.arr[index],
+                                 tuple(slice(k, k + step * (m - 1) + 1, step)
+                                       for k, step, m in zip(index, self.steps, coarse_shape))))
+        # assigning writes directly into the right hand side of the coarse level
+        self._in_place = pre_assign is None
+        dtype = np.result_type(rst_stencil.arr, level_out.restrict_in)
+        self._scratch = np.empty(coarse_shape, dtype=dtype)
+        self._buffer = None if self._in_place else np.empty(coarse_shape, dtype=dtype)
+
+    def _apply(self, array_in, out):
+        value, fine = self.entries[0]
+        np.multiply(array_in[fine], value, out=out)
+        for value, fine in self.entries[1:]:
+            np.multiply(array_in[fine], value, out=self._scratch)
+            out += self._scratch
+        return out
 
     def restrict(self):
-        """Uses an unefficient algorithm in order to compute the restriction,
-           because the convolution is computed on each node of the fine grid instead on every second or third
+        """Computes the restriction only on the coarse points
+
+        Instead of convolving on each node of the fine grid and taking every second or third value, each nonzero
+        stencil entry adds the strided fine values to the coarse values.
         """
-        
-        self.level_out.restrict_in[:] = self.pre_assign(self.level_out.restrict_in[:],
-                                                       sig.convolve(self.level_in.restriction_out_mid,
-                                                                    self.reversed_stencil,
-                                                                    "valid")[self.slices])
+        if self._in_place:
+            self._apply(self.level_in.restriction_out_mid, self.level_out.restrict_in)
+        else:
+            self.level_out.restrict_in[:] = self.pre_assign(self.level_out.restrict_in[:],
+                                                           self._apply(self.level_in.restriction_out_mid,
+                                                                       self._buffer))
 
 class RestrictionByStencilForLevels(IRestriction):
     """Restriction Stencil class which binds two level to each other, takes a
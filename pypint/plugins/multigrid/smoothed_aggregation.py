@@ -0,0 +1,246 @@
+# coding=utf-8
+"""Algebraic multigrid by smoothed aggregation
+
+.. moduleauthor:: Torbjörn Klatt <t.klatt@fz-juelich.de>
+"""
+import numpy as np
+import scipy.sparse as sprs
+import scipy.sparse.linalg as spla
+
+from pypint.plugins.multigrid.galerkin import galerkin_product
+from pypint.plugins.multigrid.i_multigrid_preconditioner import IMultigridPreconditioner
+from pypint.utilities import assert_condition
+
+
+class SmoothedAggregationSolver(IMultigridPreconditioner):
+    """Algebraic multigrid solver with smoothed aggregation coarsening
+
+    The hierarchy is set up from the matrix alone:
+
+        1. strongly connected unknowns with :math:`|a_{ij}| \\geq \\theta \\sqrt{|a_{ii} a_{jj}|}` are grouped into
+           aggregates
+        2. the tentative interpolation maps each aggregate onto a single coarse unknown, representing constants
+        3. it is smoothed by a damped Jacobi step, :math:`P = (I - \\frac{4}{3 \\rho} D^{-1} A) T`
+        4. the coarse matrix is the Galerkin product :math:`P^H A P`
+
+    until the coarse matrix has at most ``max_coarse`` rows, which is then solved directly.
+    Damped Jacobi is used as smoother.
+    As preconditioner, a single V-cycle starting from zero is applied.
+
+    As this does not rely on a grid, it also works for variable coefficients and anisotropic operators, where
+    geometric coarsening stalls.
+    """
+
+    def __init__(self, matrix, max_levels=10, max_coarse=50, theta=0.08, n_pre=1, n_post=1):
+        """
+        Parameters
+        ----------
+        matrix : :py:class:`scipy.sparse.spmatrix`
+            square system matrix
+        max_levels : :py:class:`int`
+            *(optional)*
+            maximum number of levels; defaults to ``10``
+        max_coarse : :py:class:`int`
+            *(optional)*
+            maximum number of unknowns on the coarsest level; defaults to ``50``
+        theta : :py:class:`float`
+            *(optional)*
+            strength of connection threshold; defaults to ``0.08``
+        n_pre : :py:class:`int`
+            *(optional)*
+            number of pre-smoothing steps; defaults to ``1``
+        n_post : :py:class:`int`
+            *(optional)*
+            number of post-smoothing steps; defaults to ``1``
+
+        Raises
+        ------
+        ValueError
+            if the matrix is not square
+        """
+        assert_condition(matrix.shape[0] == matrix.shape[1], ValueError,
+                         message="Matrix must be square: NOT %s" % (matrix.shape,), checking_obj=self)
+        super(SmoothedAggregationSolver, self).__init__(matrix.shape, dtype=matrix.dtype)
+        self.theta = theta
+        self.n_pre = n_pre
+        self.n_post = n_post
+        self.levels = []
+
+        _matrix = sprs.csr_matrix(matrix)
+        while True:
+            _level = {'A': _matrix}
+            self.levels.append(_level)
+            if _matrix.shape[0] <= max_coarse or len(self.levels) == max_levels:
+                break
+            _diag = _matrix.diagonal()
+            _level['D_inv'] = 1.0 / _diag
+            _level['omega'] = 4.0 / (3.0 * self._spectral_radius(_matrix, _level['D_inv']))
+            _aggregates = self._aggregate(self._strength(_matrix, _diag))
+            if _aggregates.max() + 1 >= _matrix.shape[0]:
+                # no coarsening possible anymore
+                del _level['D_inv'], _level['omega']
+                break
+            _tentative = self._tentative_interpolation(_aggregates, _matrix.dtype)
+            _level['P'] = (_tentative - _level['omega'] * sprs.diags(_level['D_inv']).dot(_matrix.dot(_tentative)))\
+                .tocsr()
+            _level['R'] = _level['P'].conj().T.tocsr()
+            _matrix = galerkin_product(_level['R'], _matrix, _level['P'])
+
+        self._coarse_solver = spla.splu(sprs.csc_matrix(self.levels[-1]['A'])).solve
+
+    @property
+    def num_levels(self):
+        """Number of levels of the hierarchy
+
+        Returns
+        -------
+        num_levels : :py:class:`int`
+        """
+        return len(self.levels)
+
+    @property
+    def operator_complexity(self):
+        """Number of nonzeros of all matrices relative to the one of the finest matrix
+
+        Returns
+        -------
+        complexity : :py:class:`float`
+        """
+        return sum(_level['A'].nnz for _level in self.levels) / self.levels[0]['A'].nnz
+
+    def solve(self, rhs, initial_guess=None, tolerance=1e-8, max_cycles=50):
+        """Runs V-cycles until the residual is reduced by ``tolerance`` relative to the one of the initial guess
+
+        Parameters
+        ----------
+        rhs : :py:class:`numpy.ndarray`
+        initial_guess : :py:class:`numpy.ndarray`
+            *(optional)*
+            defaults to zero
+        tolerance : :py:class:`float`
+            *(optional)*
+        max_cycles : :py:class:`int`
+            *(optional)*
+
+        Returns
+        -------
+        solution : :py:class:`numpy.ndarray`
+            of the shape of ``rhs``
+        """
+        _b = rhs.reshape(-1)
+        _dtype = np.result_type(_b, self.levels[0]['A'].dtype)
+        if initial_guess is None:
+            _x = np.zeros(_b.shape, dtype=_dtype)
+        else:
+            _x = np.array(initial_guess, dtype=_dtype).reshape(-1)
+        _initial = np.linalg.norm(_b - self.levels[0]['A'].dot(_x))
+        # counted locally, as the hierarchy may be used by several threads at once
+        _cycles = 0
+        while _cycles < max_cycles and np.linalg.norm(_b - self.levels[0]['A'].dot(_x)) > tolerance * _initial:
+            _x = self.v_cycle(_x, _b)
+            _cycles += 1
+        self.cycles = _cycles
+        return _x.reshape(rhs.shape)
+
+    def apply(self, rhs):
+        _b = rhs.reshape(-1)
+        return self.v_cycle(np.zeros(_b.shape, dtype=np.result_type(_b, self.levels[0]['A'].dtype)), _b)\
+            .reshape(rhs.shape)
+
+    def v_cycle(self, x, rhs, level=0):
+        """One V-cycle starting on the given level
+
+        Parameters
+        ----------
+        x : :py:class:`numpy.ndarray`
+            flat initial guess
+        rhs : :py:class:`numpy.ndarray`
+            flat right hand side
+        level : :py:class:`int`
+            *(optional)*
+            index of the level with ``0`` the finest one
+
+        Returns
+        -------
+        x : :py:class:`numpy.ndarray`
+        """
+        _level = self.levels[level]
+        if level == len(self.levels) - 1:
+            return self._coarse_solver(rhs)
+        x = self._jacobi(_level, x, rhs, self.n_pre)
+        _coarse_rhs = _level['R'].dot(rhs - _level['A'].dot(x))
+        _correction = self.v_cycle(np.zeros(_coarse_rhs.shape, dtype=_coarse_rhs.dtype), _coarse_rhs, level + 1)
+        x = x + _level['P'].dot(_correction)
+        return self._jacobi(_level, x, rhs, self.n_post)
+
+    @staticmethod
+    def _jacobi(level, x, rhs, n):
+        for _ in range(n):
+            x = x + level['omega'] * level['D_inv'] * (rhs - level['A'].dot(x))
+        return x
+
+    @staticmethod
+    def _spectral_radius(matrix, d_inv, iterations=15):
+        # power iteration on D^{-1} A, slightly overestimated to be safe
+        _x = np.random.RandomState(0).rand(matrix.shape[0])
+        _rho = 1.0
+        for _ in range(iterations):
+            _y = d_inv * matrix.dot(_x)
+            _rho = np.linalg.norm(_y) / np.linalg.norm(_x)
+            _x = _y / np.linalg.norm(_y)
+        return 1.1 * _rho
+
+    def _strength(self, matrix, diag):
+        # symmetric strength of connection, without the diagonal
+        _coo = matrix.tocoo()
+        _scale = np.sqrt(np.abs(diag))
+        _strong = (np.abs(_coo.data) >= self.theta * _scale[_coo.row] * _scale[_coo.col]) & (_coo.row != _coo.col)
+        return sprs.csr_matrix((np.ones(np.count_nonzero(_strong)), (_coo.row[_strong], _coo.col[_strong])),
+                               shape=matrix.shape)
+
+    @staticmethod
+    def _aggregate(strength):
+        """Standard aggregation
+
+        Returns
+        -------
+        aggregates : :py:class:`numpy.ndarray`
+            index of the aggregate of each unknown
+        """
+        _n = strength.shape[0]
+        _aggregates = np.full(_n, -1, dtype=int)
+        _indptr, _indices = strength.indptr, strength.indices
+        _count = 0
+        # 1. unknowns with an unaggregated neighbourhood form new aggregates with their neighbours
+        for i in range(_n):
+            _neighbours = _indices[_indptr[i]:_indptr[i + 1]]
+            if _aggregates[i] == -1 and np.all(_aggregates[_neighbours] == -1):
+                _aggregates[i] = _count
+                _aggregates[_neighbours] = _count
+                _count += 1
+        # 2. remaining unknowns join an aggregate of one of their neighbours
+        _first_pass = _aggregates.copy()
+        for i in np.nonzero(_first_pass == -1)[0]:
+            _neighbours = _indices[_indptr[i]:_indptr[i + 1]]
+            _joined = _first_pass[_neighbours][_first_pass[_neighbours] != -1]
+            if _joined.size > 0:
+                _aggregates[i] = _joined[0]
+        # 3. the rest forms aggregates with their unaggregated neighbours, isolated unknowns on their own
+        for i in np.nonzero(_aggregates == -1)[0]:
+            if _aggregates[i] == -1:
+                _neighbours = _indices[_indptr[i]:_indptr[i + 1]]
+                _aggregates[i] = _count
+                _aggregates[_neighbours[_aggregates[_neighbours] == -1]] = _count
+                _count += 1
+        return _aggregates
+
+    @staticmethod
+    def _tentative_interpolation(aggregates, dtype):
+        # piecewise constant on the aggregates with normalized columns
+        _sizes = np.bincount(aggregates)
+        _data = (1.0 / np.sqrt(_sizes[aggregates])).astype(dtype)
+        return sprs.csr_matrix((_data, (np.arange(aggregates.size), aggregates)),
+                               shape=(aggregates.size, _sizes.size))
+
+
+__all__ = ['SmoothedAggregationSolver']
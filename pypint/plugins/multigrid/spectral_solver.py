@@ -0,0 +1,215 @@
+# coding=utf-8
+"""Fast solvers for constant coefficient stencils diagonalized by discrete Fourier, sine or cosine transforms
+
+.. moduleauthor:: Torbjörn Klatt <t.klatt@fz-juelich.de>
+"""
+import numpy as np
+
+try:
+    import scipy.fft as fft
+except ImportError:
+    # requires scipy 1.4 or later
+    fft = None
+
+from pypint.plugins.multigrid.stencil import Stencil
+from pypint.utilities import assert_condition, assert_is_instance
+
+
+class SpectralSpaceSolver(object):
+    """Solves :math:`S u = b` for a constant coefficient stencil :math:`S` in :math:`\\mathcal{O}(N \\log N)`
+
+    Along each axis the stencil is diagonalized by a transform depending on the boundary condition:
+
+        ``periodic``
+            discrete Fourier transform; any stencil
+
+        ``dirichlet``
+            discrete sine transform of type I, i.e. zero values outside the grid as for
+            :py:meth:`.Stencil.to_sparse_matrix`; inhomogeneous boundary values have to be moved into the right hand
+            side beforehand, e.g. with :py:meth:`.Stencil.modify_rhs`
+
+        ``neumann``
+            discrete cosine transform of type II, i.e. the values outside the grid mirror the ones at the boundary
+            (cell centered grid)
+
+    For ``dirichlet`` and ``neumann`` the stencil must reach only the direct neighbours along that axis and must be
+    symmetric with respect to it.
+
+    The eigenvalues of the stencil (its symbol) are computed once on construction, thus a solve costs only a forward
+    and a backward transform.
+    No factorization is required.
+
+    Examples
+    --------
+    >>> solver = SpectralSpaceSolver(Stencil(np.array([-1.0, 3.0, -1.0])), (8,), 'dirichlet')
+    >>> rhs = np.arange(8.0)
+    >>> bool(np.allclose(Stencil(np.array([-1.0, 3.0, -1.0])).to_sparse_matrix((8,)).dot(solver.solve(rhs)), rhs))
+    True
+    """
+
+    valid_boundaries = ['periodic', 'dirichlet', 'neumann']
+
+    def __init__(self, stencil, shape, boundaries='periodic', workers=None):
+        """
+        Parameters
+        ----------
+        stencil : :py:class:`.Stencil`
+        shape : :py:class:`tuple`
+            shape of the grid
+        boundaries : :py:class:`str` or :py:class:`list` of :py:class:`str`
+            *(optional)*
+            one of :py:attr:`.valid_boundaries` for all or for each axis; defaults to ``periodic``
+        workers : :py:class:`int`
+            *(optional)*
+            number of threads of the transforms (see :py:mod:`scipy.fft`); defaults to one
+
+        Raises
+        ------
+        RuntimeError
+            if :py:mod:`scipy.fft` is not available
+        ValueError
+            * if the grid does not match the stencil
+            * if a boundary condition is unknown or the stencil does not fit it
+            * if the stencil is singular on the grid
+        """
+        assert_condition(fft is not None, RuntimeError,
+                         message="The spectral solver requires scipy.fft (scipy 1.4 or later).", checking_obj=self)
+        assert_is_instance(stencil, Stencil, descriptor="Stencil", checking_obj=self)
+        self._shape = tuple(int(n) for n in shape)
+        assert_condition(len(self._shape) == stencil.dim, ValueError,
+                         message="Grid of shape %s does not match %dD stencil" % (self._shape, stencil.dim),
+                         checking_obj=self)
+        if isinstance(boundaries, str):
+            boundaries = [boundaries] * stencil.dim
+        assert_condition(len(boundaries) == stencil.dim, ValueError,
+                         message="One boundary condition for each axis required: NOT %s" % (boundaries,),
+                         checking_obj=self)
+        for _bc in boundaries:
+            assert_condition(_bc in SpectralSpaceSolver.valid_boundaries, ValueError,
+                             message="Unknown boundary condition: '%s'" % _bc, checking_obj=self)
+        self._boundaries = list(boundaries)
+        self._workers = workers
+
+        _indices = np.transpose(np.nonzero(stencil.arr))
+        _offsets = _indices - np.asarray(stencil.center).reshape(-1)
+        _values = stencil.arr[tuple(_indices.T)]
+        self._check_symmetry(stencil, _offsets)
+
+        # real to complex transform if the solution is real anyway
+        self._real = all(_bc == 'periodic' for _bc in self._boundaries) and np.isrealobj(stencil.arr)
+        self._symbol = self._compute_symbol(_offsets, _values)
+        assert_condition(np.all(np.abs(self._symbol) > np.finfo(float).eps * np.max(np.abs(self._symbol))),
+                         ValueError, message="Stencil is singular on the grid", checking_obj=self)
+        self._real_symbol = np.isrealobj(stencil.arr) and np.allclose(self._symbol.imag, 0.0)
+        # the real to complex transform only gives the non-negative wave numbers along the last axis
+        self._half_symbol = self._symbol[..., :self._shape[-1] // 2 + 1] if self._real else None
+
+    @property
+    def shape(self):
+        """Shape of the grid
+        """
+        return self._shape
+
+    @property
+    def boundaries(self):
+        """Boundary condition for each axis
+        """
+        return self._boundaries
+
+    @property
+    def symbol(self):
+        """Eigenvalues of the stencil in the transformed space
+
+        Returns
+        -------
+        symbol : :py:class:`numpy.ndarray`
+        """
+        return self._symbol
+
+    def solve(self, rhs):
+        """Solves for the given right hand side
+
+        Parameters
+        ----------
+        rhs : :py:class:`numpy.ndarray`
+            with as many values as grid points
+
+        Returns
+        -------
+        solution : :py:class:`numpy.ndarray`
+            of the shape of ``rhs``
+        """
+        _b = rhs.reshape(self._shape)
+        if self._real and np.isrealobj(_b):
+            _sol = fft.irfftn(fft.rfftn(_b, workers=self._workers) / self._half_symbol, s=self._shape,
+                              workers=self._workers)
+        else:
+            _sol = self._backward(self._forward(_b) / self._symbol)
+            if self._real_symbol and np.isrealobj(_b):
+                _sol = _sol.real
+        return _sol.reshape(rhs.shape)
+
+    def __call__(self, rhs):
+        return self.solve(rhs)
+
+    def _forward(self, values):
+        for _axis, _bc in enumerate(self._boundaries):
+            if _bc == 'periodic':
+                values = fft.fft(values, axis=_axis, workers=self._workers)
+            elif _bc == 'dirichlet':
+                values = fft.dst(values, type=1, axis=_axis, norm='ortho', workers=self._workers)
+            else:
+                values = fft.dct(values, type=2, axis=_axis, norm='ortho', workers=self._workers)
+        return values
+
+    def _backward(self, values):
+        for _axis, _bc in enumerate(self._boundaries):
+            if _bc == 'periodic':
+                values = fft.ifft(values, axis=_axis, workers=self._workers)
+            elif _bc == 'dirichlet':
+                values = fft.idst(values, type=1, axis=_axis, norm='ortho', workers=self._workers)
+            else:
+                values = fft.idct(values, type=2, axis=_axis, norm='ortho', workers=self._workers)
+        return values
+
+    def _check_symmetry(self, stencil, offsets):
+        for _axis, _bc in enumerate(self._boundaries):
+            if _bc == 'periodic':
+                continue
+            assert_condition(np.all(np.abs(offsets[:, _axis]) <= 1), ValueError,
+                             message="Stencil must only reach the direct neighbours along axis %d for %s boundaries"
+                                     % (_axis, _bc),
+                             checking_obj=self)
+            _center = np.asarray(stencil.center).reshape(-1)
+            _mirrored = stencil.arr[tuple(slice(c - 1, c + 2) if a == _axis else slice(None)
+                                          for a, c in enumerate(_center))]
+            assert_condition(stencil.arr.shape[_axis] < 3 or np.allclose(_mirrored, np.flip(_mirrored, _axis)),
+                             ValueError,
+                             message="Stencil must be symmetric along axis %d for %s boundaries" % (_axis, _bc),
+                             checking_obj=self)
+
+    def _eigenvalue_factors(self, axis, n, offsets):
+        """Eigenvalues of the shift by each offset along an axis for each wave number
+        """
+        _bc = self._boundaries[axis]
+        if _bc == 'periodic':
+            return np.exp(2j * np.pi * np.outer(offsets, np.arange(n)) / n)
+        elif _bc == 'dirichlet':
+            return np.cos(np.pi * np.outer(offsets, np.arange(1, n + 1)) / (n + 1))
+        else:
+            return np.cos(np.pi * np.outer(offsets, np.arange(n)) / n)
+
+    def _compute_symbol(self, offsets, values):
+        _factors = [self._eigenvalue_factors(_axis, n, offsets[:, _axis]) for _axis, n in enumerate(self._shape)]
+        _symbol = 0.0
+        for _entry, _value in enumerate(values):
+            _term = np.asarray(_value)
+            for _factor in _factors:
+                _term = np.multiply.outer(_term, _factor[_entry])
+            _symbol = _symbol + _term
+        if all(_bc != 'periodic' for _bc in self._boundaries) and np.isrealobj(values):
+            _symbol = np.real(_symbol)
+        return np.asarray(_symbol)
+
+
+__all__ = ['SpectralSpaceSolver']
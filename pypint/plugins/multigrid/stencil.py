@@ -8,6 +8,21 @@ from pypint.utilities import assert_is_callable, assert_is_instance, assert_cond
 from pypint.plugins.multigrid.i_multigrid_level import IMultigridLevel
 from pypint.utilities.logging import LOG
 from pypint.utilities import func_name
+from pypint.plugins.multigrid.stencil_engine import StencilEngine
+from pypint.plugins.multigrid.i_multigrid_preconditioner import IMultigridPreconditioner
+
+KRYLOV_SOLVERS = {
+    'bicg': spla.bicg,
+    'bicgstab': spla.bicgstab,
+    'cg': spla.cg,
+    'cgs': spla.cgs,
+    'gmres': spla.gmres,
+    'lgmres': spla.lgmres,
+    'minres': spla.minres,
+    'qmr': spla.qmr
+}
+"""Sparse Krylov solvers available for :py:meth:`.Stencil.iterative_solver_list`
+"""
 
 
 class Stencil(object):
@@ -32,7 +47,11 @@ class Stencil(object):
             assert_condition(arr.ndim == center.size, ValueError,
                              "center does not match with stencil array")
             self.center = np.array(center, dtype=np.int)
-        self.arr = arr
+        # sparse matrices by grid and format
+        self._sparse_matrices = {}
+        # stencil engines by input shape, convolve control and dtype
+        self._engines = {}
+        self._arr = arr
         self.dim = arr.ndim
         self.order = order
         # compute borders
@@ -80,8 +99,7 @@ class Stencil(object):
             self.solver_info = "Direct Fast Solver through factorization"
             self.solver_type = "factorized"
         elif isinstance(kwargs['solver'], str):
-            self.solver = ft.partial(self.iterative_solver_list,
-                                     self, kwargs["solver"])
+            self.solver = ft.partial(self.iterative_solver_list, kwargs["solver"])
             self.solver_info = "Iterative solver of type" + kwargs['solver']
             self.solver_type = "iterative"
         elif callable(kwargs['solver']):
@@ -99,6 +117,36 @@ class Stencil(object):
 
         self.reversed_arr = self.arr[self.reverse_slice]
 
+    @property
+    def arr(self):
+        """stencil array getter
+
+        """
+        return self._arr
+
+    @arr.setter
+    def arr(self, arr):
+        """stencil array setter
+
+        The new array must be of the same shape.
+        Cached sparse matrices are dropped and the sparse matrix for the grid, as well as a factorized solver, are
+        rebuilt.
+        """
+        assert_is_instance(arr, np.ndarray, "the array is not a numpy array")
+        assert_condition(arr.shape == self._arr.shape, ValueError, "the array has the wrong shape")
+        self._arr = arr
+        self.reversed_arr = self._arr[tuple(self.reverse_slice)]
+        self.invalidate_sparse_matrices()
+        self.grid = self._grid
+
+    def invalidate_sparse_matrices(self):
+        """Drops all cached sparse matrices and stencil engines
+
+        Must be called after modifying :py:attr:`.arr` in place.
+        """
+        self._sparse_matrices = {}
+        self._engines = {}
+
     @property
     def num_nodes(self):
         """Accessor for the number of desired integration nodes.
@@ -181,6 +229,26 @@ class Stencil(object):
         # LOG.debug("  ==> %s" % _out)
         return _out
 
+    def eval_into(self, array_in, array_out, convolve_control="valid"):
+        """Evaluate like :py:meth:`.eval_convolve`, but into the given array
+
+        A :py:class:`.StencilEngine` is set up on the first call for each shape, convolve control and dtype of
+        ``array_in``, which chooses the fastest strategy.
+
+        Parameters
+        ----------
+        array_in : ndarray
+            array to apply to
+        array_out : ndarray
+            array to storage the result
+        convolve_control : string
+            ``valid`` or ``same``
+        """
+        key = (array_in.shape, convolve_control, array_in.dtype.str)
+        if key not in self._engines:
+            self._engines[key] = StencilEngine(self, array_in.shape, convolve_control, dtype=array_in.dtype)
+        return self._engines[key](array_in, array_out)
+
     def eval_sparse(self, array_in, array_out, sp_matrix=None):
         """Evaluate via the sparse matrix
 
@@ -228,6 +296,9 @@ class Stencil(object):
     def to_sparse_matrix(self, grid, format=None):
         """constructs a scipy dia sparse matrix
 
+        The matrix is built once for each grid and format and cached until :py:meth:`.invalidate_sparse_matrices` is
+        called, thus it must not be modified in place.
+
         This algorithm is, besides the embedding in the first few lines,
         taken from `PyAMG`_
 
@@ -273,6 +344,12 @@ class Stencil(object):
 
         .. _PyAMG: https://github.com/pyamg/pyamg
         """
+        key = (tuple(int(n) for n in grid), format)
+        if key not in self._sparse_matrices:
+            self._sparse_matrices[key] = self._assemble_sparse_matrix(grid, format)
+        return self._sparse_matrices[key]
+
+    def _assemble_sparse_matrix(self, grid, format):
         S = self.centered_stencil()
         # print("grid :")
 
@@ -281,7 +358,7 @@ class Stencil(object):
         if not (np.asarray(S.shape) % 2 == 1).all():
             raise ValueError('all stencil dimensions must be odd')
 
-        assert_condition(len(grid) == np.rank(S), ValueError,
+        assert_condition(len(grid) == np.ndim(S), ValueError,
                          'stencil rank must equal number of grid dimensions')
         assert_condition(min(grid) >= 1, ValueError,
                          'grid dimensions must be positive')
@@ -336,13 +413,11 @@ class Stencil(object):
 
         return sprs.dia_matrix((data,diags), shape=(N_v, N_v)).asformat(format)
 
-    def iterative_solver_list(self, which, rhs, *args):
-        """Solves the linear problem Ab = x using the sparse matrix
+    def iterative_solver_list(self, which, rhs, *args, **kwargs):
+        """Solves the linear problem Ax = b using the sparse matrix
 
             Parameters
             ----------
-            rhs : ndarray
-                the right hand side
             which : string
                 choose which solver is used
                     bicg(A, b[, x0, tol, maxiter, xtype, M, ...])
@@ -368,23 +443,29 @@ class Stencil(object):
 
                     qmr(A, b[, x0, tol, maxiter, xtype, M1, M2, ...])
                         Use Quasi-Minimal Residual iteration to solve A x = b
+            rhs : ndarray
+                the right hand side
+            args, kwargs :
+                passed on to the solver, e.g. ``x0``, ``tol``, ``maxiter`` or the preconditioner ``M``, which may
+                also be an :py:class:`.IMultigridPreconditioner`
+            grid : tuple
+                (optional) grid to solve on instead of the one of this stencil
+
+            Returns
+            -------
+            (x, info) :
+                as returned by the solver
         """
-        if which == 'bicg':
-            return spla.bicg(self.sp_matrix, rhs, args)
-        elif which == "cg":
-            return spla.cg(self.sp_matrix, rhs, args)
-        elif which == "bicgstab":
-            return spla.bicgstab(self.sp_matrix, rhs, args)
-        elif which == "cgs":
-            return spla.cgs(self.sp_matrix, rhs, args)
-        elif which == "gmres":
-            return spla.gmres(self.sp_matrix, rhs, args)
-        elif which == "lgmres":
-            return spla.lgmres(self.sp_matrix, rhs, args)
-        elif which == "qmr":
-            return spla.qmr(self.sp_matrix, rhs, args)
-        else:
+        if which not in KRYLOV_SOLVERS:
             raise NotImplementedError("this solver is unknown")
+        if kwargs.get('grid') is None:
+            sp_matrix = self.sp_matrix
+        else:
+            sp_matrix = self.to_sparse_matrix(kwargs['grid'], "csr")
+        kwargs.pop('grid', None)
+        if isinstance(kwargs.get('M'), IMultigridPreconditioner):
+            kwargs['M'] = kwargs['M'].as_linear_operator()
+        return KRYLOV_SOLVERS[which](sp_matrix, rhs, *args, **kwargs)
 
     def modify_rhs(self, level):
         """ Modifies rhs
@@ -418,7 +499,10 @@ class Stencil(object):
                 level.rhs[:] = level.rhs[:] - sig.convolve(temp_arr, self.reversed_arr, 'valid')
 
             elif self.dim == 3:
-                raise NotImplementedError("Sure I will do it , like, really soon")
+                # only the ghost cells contribute, the borders are given in reversed order of the axes
+                temp_arr = np.copy(level.evaluable_view(self))
+                temp_arr[tuple(slice(b[0], n - b[1]) for b, n in zip(self.b[::-1], temp_arr.shape))] = 0.0
+                level.rhs[:] -= self.eval_convolve(temp_arr, "valid")
             else:
                 raise NotImplementedError("No one needs more than 3 dimensions")
 
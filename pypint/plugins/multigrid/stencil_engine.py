@@ -0,0 +1,205 @@
+# coding=utf-8
+"""Matrix-free application of stencils into preallocated buffers
+
+.. moduleauthor:: Torbjörn Klatt <t.klatt@fz-juelich.de>
+"""
+import threading
+import time
+
+import numpy as np
+import scipy.ndimage as ndimage
+
+# strategy chosen by benchmark for each (stencil shape, nonzero entries, input shape, mode, dtype)
+_BENCHMARKED_STRATEGIES = {}
+
+
+class StencilEngine(object):
+    """Applies a stencil to arrays of a fixed shape, writing the result into a given output buffer
+
+    The result is the same as of :py:meth:`.Stencil.eval_convolve`, i.e. a correlation with the stencil array.
+    For ``valid`` the input is the padded array and the output is smaller by the stencil's extent; for ``same`` input
+    and output are of the same shape and values outside the input are zero.
+
+    Three strategies are available:
+
+        ``slices``
+            adds up the input shifted by each nonzero stencil entry times the entry; no temporaries are allocated,
+            which pays off for stencils with few entries on large grids
+
+        ``ndimage``
+            :py:func:`scipy.ndimage.correlate`; not available for complex values
+
+        ``sparse``
+            product with the sparse matrix of the stencil (see :py:meth:`.Stencil.to_sparse_matrix`)
+
+    Unless a strategy is given, all of them are benchmarked once on construction and the fastest one is used.
+    The choice is remembered for further engines of the same stencil size, input shape, mode and data type.
+
+    The scratch buffers are allocated once for each thread applying the engine, thus an engine may be applied by
+    several threads at once, e.g. by the node-parallel sweeps of :py:class:`.ParallelSdc`.
+    """
+
+    strategies = ('slices', 'ndimage', 'sparse')
+
+    def __init__(self, stencil, shape, convolve_control="valid", dtype=float, strategy=None, repeats=10):
+        """
+        Parameters
+        ----------
+        stencil : :py:class:`.Stencil`
+        shape : :py:class:`tuple`
+            shape of the input arrays
+        convolve_control : :py:class:`str`
+            *(optional)*
+            ``valid`` (default) or ``same``
+        dtype : :py:class:`numpy.dtype`
+            *(optional)*
+            data type of the input and output arrays
+        strategy : :py:class:`str`
+            *(optional)*
+            one of :py:attr:`.strategies`; benchmarked if not given
+        repeats : :py:class:`int`
+            *(optional)*
+            number of timed applications per strategy for the benchmark
+
+        Raises
+        ------
+        ValueError
+            if ``convolve_control`` or ``strategy`` is unknown
+        """
+        if convolve_control not in ("valid", "same"):
+            raise ValueError("Unknown convolve control: '%s'" % convolve_control)
+        self.stencil = stencil
+        self.shape = tuple(int(n) for n in shape)
+        self.convolve_control = convolve_control
+        self.dtype = np.dtype(dtype)
+        self.arr = np.asarray(stencil.arr, dtype=np.result_type(stencil.arr, self.dtype))
+        if convolve_control == "valid":
+            self.out_shape = tuple(n - m + 1 for n, m in zip(self.shape, self.arr.shape))
+        else:
+            self.out_shape = self.shape
+        self.out_dtype = np.result_type(self.arr, self.dtype)
+        self._entries = [(self.arr[index],) + self._shifted(index) for index in zip(*np.nonzero(self.arr))]
+        self._interior = tuple(slice(m // 2, m // 2 + n) for m, n in zip(self.arr.shape, self.out_shape))
+        # scratch and padded output buffer of each thread
+        self._buffers = threading.local()
+
+        if strategy is None:
+            key = (self.arr.shape, len(self._entries), self.shape, convolve_control, self.dtype.str)
+            if key not in _BENCHMARKED_STRATEGIES:
+                _BENCHMARKED_STRATEGIES[key] = self._benchmark(repeats)
+            strategy = _BENCHMARKED_STRATEGIES[key]
+        if strategy not in self.strategies:
+            raise ValueError("Unknown strategy: '%s'" % strategy)
+        self.strategy = strategy
+        self.apply = getattr(self, '_apply_' + strategy)
+
+    def _candidates(self):
+        _candidates = ['slices']
+        if self.dtype.kind != 'c' and np.result_type(self.arr).kind != 'c':
+            _candidates.append('ndimage')
+        _candidates.append('sparse')
+        return _candidates
+
+    def _benchmark(self, repeats):
+        # own generator, so the benchmark leaves the global random state alone
+        _in = np.random.RandomState(0).rand(*self.shape).astype(self.dtype)
+        _reference = np.empty(self.out_shape, dtype=self.out_dtype)
+        self._apply_slices(_in, _reference)
+        _out = np.empty_like(_reference)
+
+        _timings = {}
+        for _strategy in self._candidates():
+            _apply = getattr(self, '_apply_' + _strategy)
+            # warm up, also sets up the strategy
+            _apply(_in, _out)
+            if not np.allclose(_out, _reference):
+                continue
+            _start = time.perf_counter()
+            for _ in range(repeats):
+                _apply(_in, _out)
+            _timings[_strategy] = time.perf_counter() - _start
+        return min(_timings, key=_timings.get)
+
+    def _shifted(self, index):
+        """Slices of input and output for the stencil entry at ``index``
+        """
+        if self.convolve_control == "valid":
+            return tuple(slice(i, i + n) for i, n in zip(index, self.out_shape)), \
+                tuple(slice(None) for n in self.out_shape)
+        _in = []
+        _out = []
+        for i, m, n in zip(index, self.arr.shape, self.shape):
+            d = int(i) - m // 2
+            _in.append(slice(max(0, d), n + min(0, d)))
+            _out.append(slice(max(0, -d), n - max(0, d)))
+        return tuple(_in), tuple(_out)
+
+    def _scratch(self):
+        """Views of the calling thread's scratch buffer for the output region of each stencil entry
+        """
+        _scratch = getattr(self._buffers, 'scratch', None)
+        if _scratch is None:
+            _buffer = np.empty(self.out_shape, dtype=self.out_dtype)
+            _scratch = [_buffer[_out] for value, _in, _out in self._entries]
+            self._buffers.scratch = _scratch
+        return _scratch
+
+    def _padded_out(self, dtype):
+        """The calling thread's output buffer of the input's shape
+        """
+        _padded_out = getattr(self._buffers, 'padded_out', None)
+        if _padded_out is None or _padded_out.dtype != dtype:
+            _padded_out = np.empty(self.shape, dtype=dtype)
+            self._buffers.padded_out = _padded_out
+        return _padded_out
+
+    def _apply_slices(self, array_in, out):
+        _scratch = self._scratch()
+        if self.convolve_control == "same":
+            out[:] = 0.0
+            _first = 0
+        else:
+            value, _in, _out = self._entries[0]
+            np.multiply(array_in[_in], value, out=out)
+            _first = 1
+        for (value, _in, _out), _scratch_out in zip(self._entries[_first:], _scratch[_first:]):
+            np.multiply(array_in[_in], value, out=_scratch_out)
+            out[_out] += _scratch_out
+        return out
+
+    def _apply_ndimage(self, array_in, out):
+        if self.convolve_control == "same":
+            ndimage.correlate(array_in, self.arr, output=out, mode='constant', cval=0.0)
+        else:
+            _padded_out = self._padded_out(out.dtype)
+            ndimage.correlate(array_in, self.arr, output=_padded_out, mode='constant', cval=0.0)
+            out[:] = _padded_out[self._interior]
+        return out
+
+    def _apply_sparse(self, array_in, out):
+        if not hasattr(self, '_sp_matrix'):
+            self._sp_matrix = self.stencil.to_sparse_matrix(self.shape, "csr")
+        if self.convolve_control == "same":
+            out[:] = self._sp_matrix.dot(array_in.reshape(-1)).reshape(self.shape)
+        else:
+            out[:] = self._sp_matrix.dot(array_in.reshape(-1)).reshape(self.shape)[self._interior]
+        return out
+
+    def __call__(self, array_in, out):
+        """Applies the stencil to ``array_in`` and writes the result into ``out``
+
+        Parameters
+        ----------
+        array_in : :py:class:`numpy.ndarray`
+            of :py:attr:`.shape`
+        out : :py:class:`numpy.ndarray`
+            of :py:attr:`.out_shape`
+
+        Returns
+        -------
+        out : :py:class:`numpy.ndarray`
+        """
+        return self.apply(array_in, out)
+
+
+__all__ = ['StencilEngine']
@@ -71,7 +71,7 @@ def stencil_grid(S, grid, dtype=None, format=None):
     if not (np.asarray(S.shape) % 2 == 1).all():
         raise ValueError('all stencil dimensions must be odd')
     
-    if len(grid) != np.rank(S):
+    if len(grid) != np.ndim(S):
         raise ValueError('stencil rank must equal number of grid dimensions')
     
     if min(grid) < 1:
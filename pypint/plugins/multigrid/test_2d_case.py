@@ -3,8 +3,6 @@
 # using the MultiGridLevel2D class we
 
 import numpy as np
-import sys
-print(sys.path)
 from pypint.plugins.multigrid.multigrid_problem import MultigridProblem
 from pypint.plugins.multigrid.multigrid_level_provider import MultiGridLevelProvider
 from pypint.plugins.multigrid.multigrid_solution import MultiGridSolution
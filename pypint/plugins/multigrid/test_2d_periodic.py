@@ -1,7 +1,5 @@
 # coding=utf-8
 import numpy as np
-import sys
-print(sys.path)
 from pypint.plugins.multigrid.multigrid_problem import MultiGridProblem
 from pypint.plugins.multigrid.multigrid_level_provider import MultiGridLevelProvider
 from pypint.plugins.multigrid.multigrid_solution import MultiGridSolution
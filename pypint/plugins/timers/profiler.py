@@ -0,0 +1,268 @@
+# coding=utf-8
+"""
+
+.. moduleauthor:: Torbjörn Klatt <t.klatt@fz-juelich.de>
+"""
+import json as json
+import time as time
+from functools import wraps
+from threading import get_ident
+
+try:
+    _clock_ns = time.perf_counter_ns
+except AttributeError:
+    # requires Python 3.7 or later
+    def _clock_ns():
+        return int(time.perf_counter() * 1e9)
+
+
+class _ProfilerScope(object):
+    """Node of the profiler's tree accumulating the calls and time of one named scope
+
+    Entering the node makes it the current scope of its profiler, thus scopes entered meanwhile become its children.
+    """
+    __slots__ = ('name', 'parent', 'children', 'calls', 'total', '_profiler', '_start')
+
+    def __init__(self, profiler, name, parent):
+        self.name = name
+        self.parent = parent
+        self.children = {}
+        self.calls = 0
+        self.total = 0
+        self._profiler = profiler
+        self._start = 0
+
+    def child(self, name):
+        _child = self.children.get(name)
+        if _child is None:
+            _child = _ProfilerScope(self._profiler, name, self)
+            self.children[name] = _child
+        return _child
+
+    def __enter__(self):
+        self._profiler._current = self
+        self._start = self._profiler._clock()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.total += self._profiler._clock() - self._start
+        self.calls += 1
+        self._profiler._current = self.parent
+        return False
+
+
+class _NullScope(object):
+    """Scope of a disabled profiler doing nothing
+    """
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
+_NULL_SCOPE = _NullScope()
+
+
+class Profiler(object):
+    """Hierarchical profiler of named scopes
+
+    Scopes are entered as context managers and nest, i.e. a scope entered while another one is active is accounted
+    as its child.
+    The same name within the same parent scope accumulates the number of calls and the time spent, measured with
+    :py:func:`time.perf_counter_ns`.
+    A disabled profiler hands out a shared scope doing nothing, thus instrumented code costs a method call per scope.
+
+    Only the thread which created or last reset the profiler records scopes; other threads, e.g. the workers of
+    node-parallel sweeps, get scopes doing nothing, so that their time is accounted to the scope they were
+    dispatched from.
+
+    Examples
+    --------
+    >>> profiler = Profiler()
+    >>> for _ in range(3):
+    ...     with profiler.scope("iteration"):
+    ...         with profiler.scope("rhs evaluation"):
+    ...             pass
+    >>> [(path, calls) for path, calls, total in profiler.items()]
+    [(('iteration',), 3), (('iteration', 'rhs evaluation'), 3)]
+    >>> Profiler(enabled=False).scope("iteration") is Profiler(enabled=False).scope("residual")
+    True
+    """
+    def __init__(self, enabled=True, clock=None):
+        """
+        Parameters
+        ----------
+        enabled : :py:class:`bool`
+            *(optional)*
+            defaults to ``True``
+        clock : :py:class:`callable`
+            *(optional)*
+            returning the current time in nanoseconds as :py:class:`int`;
+            defaults to :py:func:`time.perf_counter_ns`
+        """
+        self._enabled = bool(enabled)
+        self._clock = clock if clock is not None else _clock_ns
+        self._root = _ProfilerScope(self, None, None)
+        self._current = self._root
+        self._thread = get_ident()
+
+    def scope(self, name):
+        """Named scope within the current one
+
+        Parameters
+        ----------
+        name : :py:class:`str`
+
+        Returns
+        -------
+        scope : context manager
+            doing nothing if the profiler is disabled or called from another thread than its own
+        """
+        if not self._enabled or get_ident() != self._thread:
+            return _NULL_SCOPE
+        return self._current.child(name)
+
+    @property
+    def enabled(self):
+        """Whether scopes are timed
+
+        Parameters
+        ----------
+        enabled : :py:class:`bool`
+        """
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, enabled):
+        self._enabled = bool(enabled)
+
+    def reset(self):
+        """Drops all recorded scopes
+
+        Must not be called from within a scope.
+        The calling thread becomes the one recording the scopes.
+        """
+        self._root = _ProfilerScope(self, None, None)
+        self._current = self._root
+        self._thread = get_ident()
+
+    def items(self):
+        """Recorded scopes in depth-first order
+
+        Children are ordered by their first entry.
+
+        Returns
+        -------
+        items : generator of :py:class:`tuple`
+            of the path of names to the scope, the number of calls and the total time in nanoseconds
+        """
+        _stack = [((), _child) for _child in reversed(list(self._root.children.values()))]
+        while _stack:
+            _path, _scope = _stack.pop()
+            _path = _path + (_scope.name,)
+            yield _path, _scope.calls, _scope.total
+            _stack.extend((_path, _child) for _child in reversed(list(_scope.children.values())))
+
+    def to_dict(self):
+        """Recorded scopes as nested dictionaries
+
+        Returns
+        -------
+        scopes : :py:class:`list` of :py:class:`dict`
+            with ``name``, ``calls``, ``total_ns`` and ``children`` for each scope of the top level
+        """
+        def _as_dict(scope):
+            return {'name': scope.name, 'calls': scope.calls, 'total_ns': scope.total,
+                    'children': [_as_dict(_child) for _child in scope.children.values()]}
+        return [_as_dict(_child) for _child in self._root.children.values()]
+
+    def to_json(self, **kwargs):
+        """Recorded scopes as JSON (see :py:meth:`.to_dict`)
+
+        Parameters
+        ----------
+        kwargs : :py:class:`dict`
+            passed on to :py:func:`json.dumps`
+
+        Returns
+        -------
+        json : :py:class:`str`
+        """
+        return json.dumps(self.to_dict(), **kwargs)
+
+    def summary(self):
+        """Table of the recorded scopes
+
+        Nested scopes are indented below their parent with the share of the parent's time they take.
+
+        Returns
+        -------
+        summary : :py:class:`str`
+        """
+        _lines = ["{:<40s} {:>9s} {:>12s} {:>12s} {:>8s}".format("scope", "calls", "total [s]", "mean [ms]",
+                                                                 "% parent")]
+        _totals = {}
+        for _path, _calls, _total in self.items():
+            _totals[_path] = _total
+            _parent = _totals.get(_path[:-1])
+            _share = "{:8.1f}".format(100.0 * _total / _parent) if _parent else "{:>8s}".format("")
+            _lines.append("{:<40s} {:9d} {:12.6f} {:12.6f} {:s}"
+                          .format("  " * (len(_path) - 1) + str(_path[-1]), _calls, _total * 1e-9,
+                                  _total * 1e-6 / _calls if _calls > 0 else 0.0, _share))
+        return "\n".join(_lines)
+
+
+DISABLED_PROFILER = Profiler(enabled=False)
+"""Shared disabled profiler used by default
+"""
+
+
+class HasProfilerMixin(object):
+    """Provides the :py:class:`.Profiler` instrumented code reports to
+
+    Solvers hand their profiler on to their cores and problems, thus the scopes of all of them nest.
+    """
+    def __init__(self, *args, **kwargs):
+        self._profiler = DISABLED_PROFILER
+
+    @property
+    def profiler(self):
+        """Accessor for the profiler
+
+        Parameters
+        ----------
+        profiler : :py:class:`.Profiler`
+
+        Returns
+        -------
+        profiler : :py:class:`.Profiler`
+            :py:data:`.DISABLED_PROFILER` by default
+        """
+        return getattr(self, '_profiler', DISABLED_PROFILER)
+
+    @profiler.setter
+    def profiler(self, profiler):
+        self._profiler = profiler
+
+
+def profiled(name):
+    """Decorator timing a method of a :py:class:`.HasProfilerMixin` as scope of its profiler
+
+    Parameters
+    ----------
+    name : :py:class:`str`
+        of the scope
+    """
+    def _decorator(method):
+        @wraps(method)
+        def _wrapper(self, *args, **kwargs):
+            with self.profiler.scope(name):
+                return method(self, *args, **kwargs)
+        return _wrapper
+    return _decorator
+
+
+__all__ = ['Profiler', 'HasProfilerMixin', 'profiled', 'DISABLED_PROFILER']
@@ -0,0 +1,82 @@
+# coding=utf-8
+"""
+
+.. moduleauthor:: Torbjörn Klatt <t.klatt@fz-juelich.de>
+"""
+from pypint.problems.i_problem import IProblem
+from pypint.utilities import assert_is_instance
+
+
+class HasLinearPartMixin(object):
+    """Provides the linear part :math:`L` of the right hand side :math:`F(t, u) = L u + N(t, u)`
+
+    Exponential integrators treat :math:`L` exactly through functions of it.
+    It is given either by its eigenvalues (:py:meth:`.linear_symbol`) together with the transforms into and out of its
+    eigenbasis, e.g. a discrete Fourier transform, or as a matrix (:py:meth:`.linear_operator`).
+    """
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def linear_symbol(self):
+        """Eigenvalues of the linear part in the basis of :py:meth:`.to_linear_eigenbasis`
+
+        Functions of the linear part may be cached as long as the same array is returned.
+
+        Returns
+        -------
+        symbol : :py:class:`numpy.ndarray` or :py:class:`None`
+            :py:class:`None` (default) if the linear part is only given as a matrix
+        """
+        return None
+
+    def to_linear_eigenbasis(self, values):
+        """Transforms values into the eigenbasis of the linear part; the identity by default
+        """
+        return values
+
+    def from_linear_eigenbasis(self, coefficients):
+        """Transforms coefficients in the eigenbasis of the linear part back; the identity by default
+        """
+        return coefficients
+
+    def linear_operator(self):
+        """Matrix of the linear part acting on the flattened values
+
+        It is assumed to be constant over the lifetime of the problem.
+
+        Raises
+        ------
+        NotImplementedError :
+            If the problem using this Mixin provides neither this matrix nor :py:meth:`.linear_symbol`.
+        """
+        raise NotImplementedError("If this mixin is used, the problem must implement this function.")
+
+
+def problem_has_linear_part(problem, checking_obj=None):
+    """Convenience checker for existence of a linear part of a problem's right hand side.
+
+    Parameters
+    ----------
+    problem : :py:class:`.IProblem`
+        The problem to check for a linear part.
+    checking_obj : :py:class:`object`
+        *(optional)*
+        The object calling this function for a meaningful error message.
+        For debugging purposes only.
+
+    Returns
+    -------
+    has_linear_part : :py:class:`bool`
+        :py:class:`True` if the linear part is provided, :py:class:`False` otherwise
+
+    Raises
+    ------
+    ValueError :
+        If the given problem is not an instance of :py:class:`.IProblem`.
+    """
+    assert_is_instance(problem, IProblem,
+                       message="It needs to be a problem to have a linear part.", checking_obj=checking_obj)
+    return isinstance(problem, HasLinearPartMixin)
+
+
+__all__ = ['problem_has_linear_part', 'HasLinearPartMixin']
@@ -4,20 +4,32 @@
 """
 import warnings
 from collections import OrderedDict
+from threading import Lock
 
 import numpy as np
 
 from pypint.plugins.implicit_solvers.find_root import find_root
+from pypint.plugins.metrics.metrics_registry import HasMetricsMixin
 from pypint.utilities import assert_is_callable, assert_is_instance, assert_is_in, class_name, assert_condition
 from pypint.utilities.logging import LOG
 
 
-class IProblem(object):
+class IProblem(HasMetricsMixin):
     """Basic interface for all problems of type :math:`u'(t,\\phi(t))=F(t,\\phi(t))`
+
+    The evaluations of the right hand side and the iterations of the implicit solver are counted by the problem's
+    :py:attr:`.metrics`.
     """
 
     valid_numeric_types = ['i', 'u', 'f', 'c']
 
+    thread_safe = False
+    """Flag for :py:meth:`.evaluate_wrt_time` and :py:meth:`.implicit_solve` to be callable from several threads at once
+
+    Solvers refuse to dispatch the work on a problem to threads unless it is set, e.g. the node-parallel sweeps of
+    :py:class:`.ParallelSdc`.
+    """
+
     def __init__(self, *args, **kwargs):
         """
         Parameters
@@ -59,6 +71,7 @@ class IProblem(object):
         >>> prob.dofs_per_point
         1
         """
+        HasMetricsMixin.__init__(self, *args, **kwargs)
         self._rhs_function_wrt_time = None
         if 'rhs_function_wrt_time' in kwargs:
             self.rhs_function_wrt_time = kwargs['rhs_function_wrt_time']
@@ -84,6 +97,7 @@ class IProblem(object):
                 self._strings['rhs_wrt_time'] = kwargs['strings']['rhs_wrt_time']
 
         self._count_rhs_eval = 0
+        self._count_lock = Lock()
 
     def evaluate_wrt_time(self, time, phi_of_time, **kwargs):
         """Evaluates given right hand side at given time and with given time-dependent value.
@@ -114,7 +128,7 @@ class IProblem(object):
         assert_is_instance(phi_of_time, np.ndarray, descriptor="Data Vector", checking_obj=self)
         if kwargs.get('partial') is not None:
             assert_is_instance(kwargs['partial'], str, descriptor="Partial Descriptor", checking_obj=self)
-        self._count_rhs_eval += 1
+        self._count_rhs_evaluation(kwargs.get('partial'))
         return np.zeros(self.dim, dtype=self.numeric_type)
 
     def implicit_solve(self, next_x, func, method="hybr", **kwargs):
@@ -155,6 +169,8 @@ class IProblem(object):
         assert_is_instance(next_x, np.ndarray, descriptor="Initial Guess", checking_obj=self)
         assert_is_callable(func, descriptor="Function of RHS for Implicit Solver", checking_obj=self)
         sol = find_root(fun=func, x0=next_x.reshape(-1), method=method)
+        # not all methods report their iterations
+        self.metrics.increment('newton_iterations', getattr(sol, 'nit', getattr(sol, 'nfev', 0)))
         if not sol.success:
             warnings.warn("Implicit solver did not converged.")
             LOG.debug("sol.x: %s" % sol.x)
@@ -188,6 +204,13 @@ class IProblem(object):
     def rhs_evaluations(self):
         return self._count_rhs_eval
 
+    def _count_rhs_evaluation(self, partial=None):
+        """Counts an evaluation of the right hand side or the given part of it
+        """
+        with self._count_lock:
+            self._count_rhs_eval += 1
+        self.metrics.increment('rhs_evaluations', partial=partial if partial is not None else 'full')
+
     @rhs_evaluations.deleter
     def rhs_evaluations(self):
         self._count_rhs_eval = 0
@@ -0,0 +1,10 @@
+# coding=utf-8
+"""Accelerators for the fixed-point iteration of iterative time solvers
+
+.. moduleauthor:: Torbjörn Klatt <t.klatt@fz-juelich.de>
+"""
+from pypint.solvers.accelerators.i_accelerator import IAccelerator
+from pypint.solvers.accelerators.anderson_accelerator import AndersonAccelerator
+from pypint.solvers.accelerators.krylov_accelerator import KrylovAccelerator
+
+__all__ = ['IAccelerator', 'AndersonAccelerator', 'KrylovAccelerator']
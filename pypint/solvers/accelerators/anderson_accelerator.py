@@ -0,0 +1,120 @@
+# coding=utf-8
+"""
+
+.. moduleauthor:: Torbjörn Klatt <t.klatt@fz-juelich.de>
+"""
+import numpy as np
+
+from pypint.solvers.accelerators.i_accelerator import IAccelerator
+from pypint.utilities import assert_is_instance, assert_condition
+
+
+class AndersonAccelerator(IAccelerator):
+    """Anderson mixing over the last iterates
+
+    With :math:`x_k` the node values the :math:`k`-th sweep :math:`G` started from, :math:`g_k = G(x_k)` and the
+    residuals :math:`f_k = g_k - x_k`, the next iterate is
+
+    .. math::
+
+        x_{k+1} = g_k - \\Delta G_k \\gamma_k - (1 - \\beta) \\left( f_k - \\Delta F_k \\gamma_k \\right)
+
+    where :math:`\\gamma_k` minimizes :math:`\\| f_k - \\Delta F_k \\gamma \\|_2` and the columns of
+    :math:`\\Delta F_k` and :math:`\\Delta G_k` are the differences of the last ``depth + 1`` residuals and sweep
+    results.
+    """
+
+    def __init__(self, **kwargs):
+        """
+        Parameters
+        ----------
+        depth : :py:class:`int`
+            *(optional)*
+            number of previous iterates mixed in
+            *(defaults to 5)*
+        damping : :py:class:`float`
+            *(optional)*
+            damping factor :math:`\\beta \\in (0, 1]`
+            *(defaults to 1.0)*
+
+        Raises
+        ------
+        ValueError
+
+            * if ``depth`` is not a non-negative integer
+            * if ``damping`` is not within :math:`(0, 1]`
+        """
+        super(AndersonAccelerator, self).__init__(**kwargs)
+        self._depth = kwargs.get('depth', 5)
+        self._damping = kwargs.get('damping', 1.0)
+        assert_is_instance(self._depth, int, descriptor="Depth", checking_obj=self)
+        assert_condition(self._depth >= 0,
+                         ValueError, message="Depth must be non-negative: NOT {:d}".format(self._depth),
+                         checking_obj=self)
+        assert_is_instance(self._damping, float, descriptor="Damping", checking_obj=self)
+        assert_condition(0.0 < self._damping <= 1.0,
+                         ValueError, message="Damping must be within (0, 1]: NOT {:f}".format(self._damping),
+                         checking_obj=self)
+
+    def accelerate(self, previous, current, key=0):
+        """Anderson mixing of the given iterates with the history of ``key``
+
+        See Also
+        --------
+        :py:meth:`.IAccelerator.accelerate` : overridden method
+        """
+        super(AndersonAccelerator, self).accelerate(previous, current, key)
+
+        _g = current.reshape(-1)
+        _f = _g - previous.reshape(-1)
+
+        if key not in self._history:
+            self._history[key] = {'f': [], 'g': []}
+        _history = self._history[key]
+        _history['f'].append(_f.copy())
+        _history['g'].append(_g.copy())
+        self._truncate(_history)
+
+        if len(_history['f']) < 2:
+            return current
+
+        _delta_f = np.diff(np.array(_history['f']), axis=0).T
+        _delta_g = np.diff(np.array(_history['g']), axis=0).T
+        _gamma = np.linalg.lstsq(_delta_f, _f, rcond=None)[0]
+
+        _accelerated = _g - _delta_g.dot(_gamma)
+        if self._damping != 1.0:
+            _accelerated -= (1.0 - self._damping) * (_f - _delta_f.dot(_gamma))
+        return _accelerated.reshape(current.shape)
+
+    @property
+    def depth(self):
+        """Read-only accessor for the number of previous iterates mixed in
+
+        Returns
+        -------
+        depth : :py:class:`int`
+        """
+        return self._depth
+
+    @property
+    def damping(self):
+        """Read-only accessor for the damping factor
+
+        Returns
+        -------
+        damping : :py:class:`float`
+        """
+        return self._damping
+
+    def _truncate(self, history):
+        # sliding window over the last iterates
+        while len(history['f']) > self._depth + 1:
+            del history['f'][0]
+            del history['g'][0]
+
+    def __str__(self):
+        return "{}(depth={:d}, damping={:f})".format(self.__class__.__name__, self._depth, self._damping)
+
+
+__all__ = ['AndersonAccelerator']
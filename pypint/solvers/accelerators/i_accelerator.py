@@ -0,0 +1,67 @@
+# coding=utf-8
+"""
+
+.. moduleauthor:: Torbjörn Klatt <t.klatt@fz-juelich.de>
+"""
+import numpy as np
+
+from pypint.utilities import assert_is_instance, assert_condition
+
+
+class IAccelerator(object):
+    """Interface for accelerators of the fixed-point iteration of iterative time solvers
+
+    An accelerator is applied after each sweep.
+    It gets the node values the sweep started from and the ones it computed and returns the node values the next
+    sweep should start from.
+
+    The history of each independent block of nodes (e.g. each time step of an interval) is kept separately and is
+    identified by a key.
+    """
+
+    def __init__(self, **kwargs):
+        self._history = {}
+
+    def accelerate(self, previous, current, key=0):
+        """Computes the accelerated iterate
+
+        Parameters
+        ----------
+        previous : :py:class:`numpy.ndarray`
+            node values the sweep started from
+        current : :py:class:`numpy.ndarray`
+            node values computed by the sweep
+        key : :py:class:`object`
+            *(optional)*
+            identifier of the block of nodes
+
+        Returns
+        -------
+        accelerated : :py:class:`numpy.ndarray`
+            node values of the same shape as ``current``
+
+        Raises
+        ------
+        ValueError
+            if ``previous`` and ``current`` are not of the same shape
+        """
+        assert_is_instance(previous, np.ndarray, descriptor="Previous Iterate", checking_obj=self)
+        assert_is_instance(current, np.ndarray, descriptor="Current Iterate", checking_obj=self)
+        assert_condition(previous.shape == current.shape,
+                         ValueError, message="Iterates must be of same shape: {} != {}"
+                                             .format(previous.shape, current.shape),
+                         checking_obj=self)
+        return current
+
+    def reset(self):
+        """Forgets the history of all blocks
+
+        Usually, this is called on each new interval.
+        """
+        self._history = {}
+
+    def __str__(self):
+        return "{}()".format(self.__class__.__name__)
+
+
+__all__ = ['IAccelerator']
@@ -0,0 +1,67 @@
+# coding=utf-8
+"""
+
+.. moduleauthor:: Torbjörn Klatt <t.klatt@fz-juelich.de>
+"""
+from pypint.solvers.accelerators.anderson_accelerator import AndersonAccelerator
+from pypint.utilities import assert_is_instance, assert_condition
+
+
+class KrylovAccelerator(AndersonAccelerator):
+    """GMRES-accelerated deferred corrections
+
+    For *Krylov deferred corrections*, the collocation problem is solved with GMRES, using the SDC sweep as the
+    preconditioner.
+    Anderson mixing over the full history of iterates is essentially equivalent to GMRES applied to the
+    preconditioned system for linear problems (see [WalkerNi2011]_), without requiring the sweep to be applied to
+    arbitrary vectors.
+    Thus, the full history is kept and, as for GMRES(m), discarded once ``restart`` iterates have been collected.
+
+    .. [WalkerNi2011] H. F. Walker and P. Ni, *Anderson acceleration for fixed-point iterations*,
+       SIAM J. Numer. Anal., 49(4), 2011.
+    """
+
+    def __init__(self, **kwargs):
+        """
+        Parameters
+        ----------
+        restart : :py:class:`int`
+            *(optional)*
+            maximum dimension of the Krylov space before restarting
+            *(defaults to 20)*
+
+        Raises
+        ------
+        ValueError
+            if ``restart`` is not a positive integer
+        """
+        _restart = kwargs.get('restart', 20)
+        assert_is_instance(_restart, int, descriptor="Restart", checking_obj=self)
+        assert_condition(_restart > 0,
+                         ValueError, message="Restart must be positive: NOT {:d}".format(_restart),
+                         checking_obj=self)
+        kwargs['depth'] = _restart
+        kwargs['damping'] = 1.0
+        super(KrylovAccelerator, self).__init__(**kwargs)
+
+    @property
+    def restart(self):
+        """Read-only accessor for the maximum dimension of the Krylov space
+
+        Returns
+        -------
+        restart : :py:class:`int`
+        """
+        return self._depth
+
+    def _truncate(self, history):
+        # restart with the latest iterate only
+        if len(history['f']) > self._depth + 1:
+            del history['f'][:-1]
+            del history['g'][:-1]
+
+    def __str__(self):
+        return "{}(restart={:d})".format(self.__class__.__name__, self._depth)
+
+
+__all__ = ['KrylovAccelerator']
@@ -6,12 +6,14 @@
 from pypint.solvers.cores.explicit_sdc_core import ExplicitSdcCore
 from pypint.solvers.cores.implicit_sdc_core import ImplicitSdcCore
 from pypint.solvers.cores.semi_implicit_sdc_core import SemiImplicitSdcCore
+from pypint.solvers.cores.diagonal_implicit_sdc_core import DiagonalImplicitSdcCore
+from pypint.solvers.cores.exponential_sdc_core import ExponentialSdcCore
 
 from pypint.solvers.cores.explicit_mlsdc_core import ExplicitMlSdcCore
 from pypint.solvers.cores.implicit_mlsdc_core import ImplicitMlSdcCore
 from pypint.solvers.cores.semi_implicit_mlsdc_core import SemiImplicitMlSdcCore
 
 __all__ = [
-    'ExplicitSdcCore', 'ImplicitSdcCore', 'SemiImplicitSdcCore',
+    'ExplicitSdcCore', 'ImplicitSdcCore', 'SemiImplicitSdcCore', 'DiagonalImplicitSdcCore', 'ExponentialSdcCore',
     'ExplicitMlSdcCore', 'ImplicitMlSdcCore', 'SemiImplicitMlSdcCore'
 ]
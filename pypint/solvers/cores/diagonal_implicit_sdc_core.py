@@ -0,0 +1,180 @@
+# coding=utf-8
+"""
+
+.. moduleauthor:: Torbjörn Klatt <t.klatt@fz-juelich.de>
+"""
+from concurrent.futures import Executor
+
+import numpy as np
+
+from pypint.solvers.cores.sdc_solver_core import SdcSolverCore
+from pypint.solvers.states.sdc_solver_state import SdcSolverState
+from pypint.problems import IProblem
+from pypint.utilities import assert_is_instance, assert_named_argument, assert_condition
+
+
+def _diagonal_implicit_node_update(problem, time_point, initial_guess, previous_rhs, expl_term, q_delta):
+    """Solves the implicit system of a single node of a node-parallel sweep
+
+    Parameters
+    ----------
+    problem : :py:class:`.IProblem`
+    time_point : :py:class:`float`
+        time point of the node
+    initial_guess : :py:class:`numpy.ndarray`
+        value of the node from the previous iteration
+    previous_rhs : :py:class:`numpy.ndarray`
+        right hand side evaluated at the node's value of the previous iteration
+    expl_term : :py:class:`numpy.ndarray`
+        initial value of the time step plus the integral from the time step's start up to the node
+    q_delta : :py:class:`float`
+        diagonal entry of :math:`Q_\\Delta` for the node
+
+    Returns
+    -------
+    value : :py:class:`numpy.ndarray`
+        new value of the node
+    """
+    _expl_term = (expl_term - q_delta * previous_rhs).reshape(-1)
+    _func = lambda x_next: \
+        _expl_term \
+        + q_delta * problem.evaluate_wrt_time(time_point, x_next.reshape(problem.dim_for_time_solver)).reshape(-1) \
+        - x_next
+    _sol = problem.implicit_solve(initial_guess.reshape(-1), _func,
+                                  expl_term=_expl_term, time_level=0, delta_time=float(q_delta))
+    if type(initial_guess) == type(_sol):
+        return _sol.reshape(initial_guess.shape)
+    else:
+        return _sol[0]
+
+
+class DiagonalImplicitSdcCore(SdcSolverCore):
+    """Node-Parallel Implicit SDC Core
+
+    Implicit sweep with a diagonal :math:`Q_\\Delta` (see :py:meth:`.SdcIntegrator.diagonal_q_delta`).
+    The update of a node only depends on values of the previous iteration, thus all nodes of a time step can be
+    computed concurrently.
+
+    Notes
+    -----
+    As the sweep is not a node-to-node sweep, solvers must use :py:meth:`.sweep` instead of :py:meth:`.run`
+    for all nodes of a time step at once (see :py:attr:`.node_parallel`).
+    """
+
+    name = "Diagonal Implicit SDC"
+
+    node_parallel = True
+    """Flag for solvers to use :py:meth:`.sweep` on a whole time step
+    """
+
+    def __init__(self):
+        super(DiagonalImplicitSdcCore, self).__init__()
+
+    def run(self, state, **kwargs):
+        """Implicit step with diagonal :math:`Q_\\Delta` for the current node only.
+
+        .. math::
+
+            u_m^{k+1} - \\Delta_\\tau^{(m)} F(t_m, u_m^{k+1}) =
+                u_0 - \\Delta_\\tau^{(m)} F(t_m, u_m^k) + \\Delta_t I_0^m \\left( F(\\vec{u}^k) \\right)
+
+        with :math:`\\Delta_\\tau^{(m)}` being the :math:`m`-th diagonal entry of :math:`Q_\\Delta`.
+
+        Parameters
+        ----------
+        state : :py:class:`.SdcSolverState`
+        problem : :py:class:`.IProblem`
+        q_delta : :py:class:`numpy.ndarray`
+            diagonal of :math:`Q_\\Delta` for all nodes of the time step
+        """
+        super(DiagonalImplicitSdcCore, self).run(state, **kwargs)
+
+        assert_is_instance(state, SdcSolverState, descriptor="State", checking_obj=self)
+        assert_named_argument('problem', kwargs, types=IProblem, descriptor="Problem", checking_obj=self)
+        assert_named_argument('q_delta', kwargs, types=np.ndarray, descriptor="Diagonal Q_Delta", checking_obj=self)
+
+        _index = state.current_step_index
+        _integral = 0.0
+        for _step_index in range(0, _index + 1):
+            _integral = _integral + state.current_time_step[_step_index].integral
+
+        self.metrics.increment('implicit_solves')
+        state.current_step.value = \
+            _diagonal_implicit_node_update(*self._node_update_args(state, _index, _integral,
+                                                                   kwargs['problem'], kwargs['q_delta']))
+
+    def sweep(self, state, **kwargs):
+        """Node-parallel sweep over all nodes of the current time step.
+
+        Parameters
+        ----------
+        state : :py:class:`.SdcSolverState`
+        problem : :py:class:`.IProblem`
+        q_delta : :py:class:`numpy.ndarray`
+            diagonal of :math:`Q_\\Delta` for all nodes of the time step
+        executor : :py:class:`concurrent.futures.Executor`
+            *(optional)*
+            thread pool the node updates are dispatched to;
+            if not given or :py:class:`None`, the nodes are computed one after another
+
+        Raises
+        ------
+        ValueError
+            * if the number of diagonal entries does not match the number of nodes
+            * if an executor is given for a problem, which is not thread-safe (see :py:attr:`.IProblem.thread_safe`)
+        """
+        assert_is_instance(state, SdcSolverState, descriptor="State", checking_obj=self)
+        assert_named_argument('problem', kwargs, types=IProblem, descriptor="Problem", checking_obj=self)
+        assert_named_argument('q_delta', kwargs, types=np.ndarray, descriptor="Diagonal Q_Delta", checking_obj=self)
+        _problem = kwargs['problem']
+        _q_delta = kwargs['q_delta']
+        _executor = kwargs['executor'] if 'executor' in kwargs else None
+        if _executor is not None:
+            assert_is_instance(_executor, Executor, descriptor="Node Executor", checking_obj=self)
+            assert_condition(_problem.thread_safe, ValueError,
+                             message="Problem is not thread-safe: %s" % _problem.__class__.__name__,
+                             checking_obj=self)
+
+        _time_step = state.current_time_step
+        assert_condition(_q_delta.size == len(_time_step),
+                         ValueError, message="Number of diagonal entries not correct: {:d} != {:d}"
+                                             .format(_q_delta.size, len(_time_step)),
+                         checking_obj=self)
+
+        _args = []
+        _integral = 0.0
+        for _step_index in range(0, len(_time_step)):
+            _integral = _integral + _time_step[_step_index].integral
+            _args.append(self._node_update_args(state, _step_index, _integral, _problem, _q_delta))
+
+        self.metrics.increment('implicit_solves', len(_args))
+        if _executor is None:
+            _solutions = [_diagonal_implicit_node_update(*_arg) for _arg in _args]
+        else:
+            _solutions = list(_executor.map(_diagonal_implicit_node_update, *zip(*_args)))
+
+        for _step_index in range(0, len(_time_step)):
+            _time_step[_step_index].value = _solutions[_step_index]
+
+    def _node_update_args(self, state, step_index, integral, problem, q_delta):
+        _time_point = state.current_time_step[step_index].time_point
+        if state.previous_iteration_index is not None:
+            _previous = state.previous_iteration[state.current_time_step_index][step_index]
+            if not _previous.rhs_evaluated:
+                _previous.rhs = problem.evaluate_wrt_time(_previous.time_point, _previous.value)
+            _previous_value = _previous.value
+            _previous_rhs = _previous.rhs
+        else:
+            # the initial value is spread to all nodes
+            _previous_value = state.initial.value
+            _previous_rhs = problem.evaluate_wrt_time(_time_point, _previous_value)
+
+        return (problem,
+                _time_point,
+                _previous_value,
+                _previous_rhs,
+                state.current_time_step.initial.value + integral,
+                q_delta[step_index])
+
+
+__all__ = ['DiagonalImplicitSdcCore']
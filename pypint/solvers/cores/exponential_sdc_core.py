@@ -0,0 +1,144 @@
+# coding=utf-8
+"""
+
+.. moduleauthor:: Torbjörn Klatt <t.klatt@fz-juelich.de>
+"""
+import numpy as np
+import scipy.sparse as sp
+import scipy.sparse.linalg as spla
+
+from pypint.solvers.cores.sdc_solver_core import SdcSolverCore
+from pypint.solvers.states.sdc_solver_state import SdcSolverState
+from pypint.problems import IProblem
+from pypint.problems.has_linear_part_mixin import problem_has_linear_part
+from pypint.utilities import assert_condition, assert_is_instance, assert_named_argument
+from pypint.utilities.math import phi_functions
+
+
+class ExponentialSdcCore(SdcSolverCore):
+    """Exponential SDC Core
+
+    For problems with a stiff linear part :math:`F(t, u) = L u + N(t, u)` (see :py:class:`.HasLinearPartMixin`) the
+    linear part is propagated exactly from node to node, while the nonlinear part is corrected with the explicit
+    Euler as in the semi-implicit SDC.
+    The functions :math:`\\varphi_0(\\Delta_\\tau L)` and :math:`\\varphi_1(\\Delta_\\tau L)` are computed once for each
+    node distance :math:`\\Delta_\\tau`:
+
+        * in the eigenbasis of :math:`L` if the problem provides its eigenvalues (:py:meth:`.linear_symbol`), e.g. in
+          Fourier space for spectral problems
+        * otherwise :math:`\\varphi_0(\\Delta_\\tau L) a + \\varphi_1(\\Delta_\\tau L) b` is the action of the
+          exponential of the matrix :math:`\\Delta_\\tau L` augmented by :math:`b`, computed by
+          :py:func:`scipy.sparse.linalg.expm_multiply` on the sparse :py:meth:`.linear_operator`
+
+    The fixed point of the sweeps is the collocation solution, as for the other SDC cores.
+    For a linear problem and a constant initial guess the first sweep already gives the exact solution.
+    """
+
+    name = "Exponential SDC"
+
+    def __init__(self):
+        super(ExponentialSdcCore, self).__init__()
+        self._problem = None
+        self._linear = None
+        # phi_0 and phi_1 of the linear part for each node distance
+        self._phis = {}
+
+    def run(self, state, **kwargs):
+        """Exponential Euler step method.
+
+        .. math::
+
+            u_{m+1}^{k+1} = u_{m+1}^k &+ \\varphi_0(\\Delta_\\tau L) \\left( u_m^{k+1} - u_m^k \\right) \\\\
+                &+ \\varphi_1(\\Delta_\\tau L) \\left( \\Delta_\\tau \\left( N(t_m, u_m^{k+1}) - N(t_m, u_m^k) \\right)
+                   + u_m^k + \\Delta_t I_m^{m+1} \\left( F(\\vec{u}^k) \\right) - u_{m+1}^k \\right)
+
+        with :math:`N(t, u) = F(t, u) - L u`.
+
+        Parameters
+        ----------
+        state : :py:class:`.SdcSolverState`
+
+        Notes
+        -----
+        This step method requires the given problem to provide its linear part (see :py:class:`.HasLinearPartMixin`).
+        A given ``q_delta`` is ignored, as the linear part is treated exactly.
+        """
+        super(ExponentialSdcCore, self).run(state, **kwargs)
+
+        assert_is_instance(state, SdcSolverState, descriptor="State", checking_obj=self)
+        assert_named_argument('problem', kwargs, types=IProblem, descriptor="Problem", checking_obj=self)
+        _problem = kwargs['problem']
+        assert_condition(problem_has_linear_part(_problem, self), ValueError,
+                         message="Exponential SDC requires the linear part of the problem", checking_obj=self)
+
+        if state.previous_iteration_index is not None:
+            _previous_iteration_current = self._previous_iteration_current_step(state).value
+            _previous_iteration_previous = self._previous_iteration_previous_step(state).value
+        else:
+            # the integral of the first sweep is the one of the time step's initial value at all nodes
+            _previous_iteration_current = state.current_time_step.initial.value
+            _previous_iteration_previous = state.current_time_step.initial.value
+        _delta_tau = state.current_step.delta_tau
+
+        with self.profiler.scope("rhs evaluation"):
+            _nonlinear_update = \
+                self._nonlinear(_problem, state.previous_step.time_point, state.previous_step.value) \
+                - self._nonlinear(_problem, state.previous_step.time_point, _previous_iteration_previous)
+        _residual = _previous_iteration_previous + state.current_step.integral - _previous_iteration_current
+
+        with self.profiler.scope("exponential propagation"):
+            _sol = _previous_iteration_current \
+                + self._apply_phis(_problem, _delta_tau, state.previous_step.value - _previous_iteration_previous,
+                                   _delta_tau * _nonlinear_update + _residual)
+
+        if type(state.current_step.value) == type(_sol):
+            state.current_step.value = _sol
+        else:
+            state.current_step.value = _sol[0]
+
+    def _linear_part(self, problem):
+        """Symbol or sparse matrix of the linear part, refreshed if the problem or its symbol changed
+        """
+        _symbol = problem.linear_symbol()
+        if problem is not self._problem or (_symbol is not None and _symbol is not self._linear):
+            self._problem = problem
+            self._linear = _symbol if _symbol is not None else sp.csr_matrix(problem.linear_operator())
+            self._phis.clear()
+        return self._linear
+
+    def _apply_linear(self, problem, values):
+        _linear = self._linear_part(problem)
+        if sp.issparse(_linear):
+            return _linear.dot(values.reshape(-1)).reshape(values.shape)
+        return problem.from_linear_eigenbasis(_linear * problem.to_linear_eigenbasis(values)).reshape(values.shape)
+
+    def _nonlinear(self, problem, time, values):
+        return problem.evaluate_wrt_time(time, values) - self._apply_linear(problem, values)
+
+    def _apply_phis(self, problem, delta_tau, a, b):
+        """:math:`\\varphi_0(\\Delta_\\tau L) a + \\varphi_1(\\Delta_\\tau L) b`
+        """
+        _linear = self._linear_part(problem)
+        if delta_tau not in self._phis:
+            self.metrics.increment('cache_misses', cache='phi functions')
+            if sp.issparse(_linear):
+                self._phis[delta_tau] = (delta_tau * _linear).tocsr()
+            else:
+                self._phis[delta_tau] = phi_functions(delta_tau * _linear, 1)
+        else:
+            self.metrics.increment('cache_hits', cache='phi functions')
+
+        if sp.issparse(_linear):
+            # exponential of the augmented matrix [[dt L, b], [0, 0]] applied to [a, 1]
+            _n = a.size
+            _augmented = sp.bmat([[self._phis[delta_tau], sp.csr_matrix(b.reshape(-1, 1))],
+                                  [sp.csr_matrix((1, _n)), sp.csr_matrix((1, 1))]], format='csr')
+            _start = np.append(a.reshape(-1), 1.0)
+            return spla.expm_multiply(_augmented, _start)[:_n].reshape(a.shape)
+
+        _phi_0, _phi_1 = self._phis[delta_tau]
+        return problem.from_linear_eigenbasis(_phi_0 * problem.to_linear_eigenbasis(a)
+                                              + _phi_1 * problem.to_linear_eigenbasis(b)).reshape(a.shape)
+
+
+__all__ = ['ExponentialSdcCore']
@@ -5,10 +5,15 @@
 """
 from pypint.utilities import assert_is_instance
 from pypint.solvers.states.i_solver_state import ISolverState
+from pypint.plugins.timers.profiler import HasProfilerMixin
+from pypint.plugins.metrics.metrics_registry import HasMetricsMixin
 
 
-class ISolverCore(object):
+class ISolverCore(HasProfilerMixin, HasMetricsMixin):
     """Interface for the Solver's Cores
+
+    The solver hands its :py:class:`.Profiler` and :py:class:`.MetricsRegistry` on to its core (see
+    :py:attr:`.IIterativeTimeSolver.profiler`).
     """
 
     name = 'Solver Core Interface'
@@ -16,7 +21,8 @@ class ISolverCore(object):
     """
 
     def __init__(self):
-        pass
+        HasProfilerMixin.__init__(self)
+        HasMetricsMixin.__init__(self)
 
     def run(self, state, **kwargs):
         """Apply the solver core to the current state
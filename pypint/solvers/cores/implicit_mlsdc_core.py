@@ -75,13 +75,15 @@ class ImplicitMlSdcCore(MlSdcSolverCore):
             else:
                 _previous_iteration_previous_step = self._previous_iteration_previous_step(state)
 
-            _sol = _problem.direct_implicit(phis_of_time=[_previous_iteration_previous_step.value,
-                                                          _previous_iteration_current_step.value,
-                                                          state.previous_step.value],
-                                            delta_node=state.current_step.delta_tau,
-                                            integral=state.current_step.integral,
-                                            fas=_fas,
-                                            core=self)
+            with self.profiler.scope("implicit solve"):
+                self.metrics.increment('implicit_solves')
+                _sol = _problem.direct_implicit(phis_of_time=[_previous_iteration_previous_step.value,
+                                                              _previous_iteration_current_step.value,
+                                                              state.previous_step.value],
+                                                delta_node=state.current_step.delta_tau,
+                                                integral=state.current_step.integral,
+                                                fas=_fas,
+                                                core=self)
         else:
             # using step-wise formula
             #   u_{m+1}^{k+1} - \Delta_\tau F(u_{m+1}^{k+1})
@@ -95,7 +97,9 @@ class ImplicitMlSdcCore(MlSdcSolverCore):
                 _expl_term \
                 + state.current_step.delta_tau * _problem.evaluate_wrt_time(state.current_step.time_point, x_next) \
                 - x_next
-            _sol = _problem.implicit_solve(state.current_step.value, _func)
+            with self.profiler.scope("implicit solve"):
+                self.metrics.increment('implicit_solves')
+                _sol = _problem.implicit_solve(state.current_step.value, _func)
 
         if type(state.current_step.value) == type(_sol):
             state.current_step.value = _sol
@@ -27,9 +27,21 @@ class ImplicitSdcCore(SdcSolverCore):
             u_{m+1}^{k+1} - \\Delta_\\tau F(t_{m+1}, u_{m+1}^{k+1}) =
                 u_m^{k+1} + \\Delta_\\tau F(t_{m+1}, u_{m+1}^k) + \\Delta_t I_m^{m+1} \\left( F(\\vec{u}^k) \\right)
 
+        With a general lower-triangular preconditioner :math:`Q_\\Delta` the sweep reads
+
+        .. math::
+
+            u_m^{k+1} - q_{m,m} F(t_m, u_m^{k+1}) =
+                u_0 + \\sum_{j=1}^{m-1} q_{m,j} \\left( F(t_j, u_j^{k+1}) - F(t_j, u_j^k) \\right)
+                - q_{m,m} F(t_m, u_m^k) + \\Delta_t I_0^m \\left( F(\\vec{u}^k) \\right)
+
         Parameters
         ----------
         solver_state : :py:class:`.SdcSolverState`
+        q_delta : :py:class:`numpy.ndarray` or :py:class:`None`
+            *(optional)*
+            preconditioner :math:`Q_\\Delta` (see :py:meth:`.SdcIntegrator.q_delta`);
+            if not given, the implicit Euler is used
         """
         super(ImplicitSdcCore, self).run(state, **kwargs)
 
@@ -39,15 +51,19 @@ class ImplicitSdcCore(SdcSolverCore):
 
         _previous_iteration_current_step = self._previous_iteration_current_step(state)
 
-        if problem_has_direct_implicit(_problem, self):
+        if kwargs.get('q_delta') is not None:
+            _sol = self._q_delta_step(state, _problem, kwargs['q_delta'], _previous_iteration_current_step)
+        elif problem_has_direct_implicit(_problem, self):
             _previous_iteration_previous_step = self._previous_iteration_previous_step(state)
 
-            _sol = _problem.direct_implicit(phis_of_time=[_previous_iteration_previous_step.value,
-                                                          _previous_iteration_current_step.value,
-                                                          state.current_time_step.previous_step.value],
-                                            delta_node=state.current_step.delta_tau,
-                                            integral=state.current_step.integral,
-                                            core=self)
+            with self.profiler.scope("implicit solve"):
+                self.metrics.increment('implicit_solves')
+                _sol = _problem.direct_implicit(phis_of_time=[_previous_iteration_previous_step.value,
+                                                              _previous_iteration_current_step.value,
+                                                              state.current_time_step.previous_step.value],
+                                                delta_node=state.current_step.delta_tau,
+                                                integral=state.current_step.integral,
+                                                core=self)
         else:
             # using step-wise formula
             #   u_{m+1}^{k+1} - \Delta_\tau F(u_{m+1}^{k+1})
@@ -65,12 +81,45 @@ class ImplicitSdcCore(SdcSolverCore):
                   * _problem.evaluate_wrt_time(state.current_step.time_point,
                                                x_next.reshape(_problem.dim_for_time_solver)).reshape(-1) \
                 - x_next
-            _sol = _problem.implicit_solve(state.current_step.value.reshape(-1), _func)
+            with self.profiler.scope("implicit solve"):
+                self.metrics.increment('implicit_solves')
+                _sol = _problem.implicit_solve(state.current_step.value.reshape(-1), _func)
 
         if type(state.current_step.value) == type(_sol):
             state.current_step.value = _sol
         else:
             state.current_step.value = _sol[0]
 
+    def _q_delta_step(self, state, problem, q_delta, previous_iteration_current_step):
+        _node = state.current_step_index + 1
+        _q_mm = q_delta[_node, _node]
+        _expl_term = \
+            state.current_time_step.initial.value \
+            + self._q_delta_correction(state, problem, q_delta[_node, 1:_node]) \
+            + self._integral_from_start(state)
+        if problem_has_direct_implicit(problem, self):
+            with self.profiler.scope("implicit solve"):
+                self.metrics.increment('implicit_solves')
+                # the terms without u_m are given as the value of the previous node
+                return problem.direct_implicit(phis_of_time=[_expl_term,
+                                                             previous_iteration_current_step.value,
+                                                             _expl_term],
+                                               delta_node=_q_mm,
+                                               integral=0.0,
+                                               core=self)
+        _expl_term = \
+            (_expl_term - _q_mm * self._previous_rhs(state, problem, state.current_step_index)).reshape(-1)
+        _func = lambda x_next: \
+            _expl_term \
+            + _q_mm * problem.evaluate_wrt_time(state.current_step.time_point,
+                                                x_next.reshape(problem.dim_for_time_solver)).reshape(-1) \
+            - x_next
+        with self.profiler.scope("implicit solve"):
+            self.metrics.increment('implicit_solves')
+            return problem.implicit_solve(state.current_step.value.reshape(-1), _func,
+                                          expl_term=_expl_term,
+                                          time_level=0,
+                                          delta_time=float(_q_mm)).reshape(state.current_step.value.shape)
+
 
 __all__ = ['ImplicitSdcCore']
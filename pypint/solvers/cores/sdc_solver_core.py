@@ -2,6 +2,8 @@
 """
 .. moduleauthor:: Torbjörn Klatt <t.klatt@fz-juelich.de>
 """
+import numpy as np
+
 from pypint.solvers.cores.i_solver_core import ISolverCore
 from pypint.problems.has_exact_solution_mixin import problem_has_exact_solution
 from pypint.problems import IProblem
@@ -30,6 +32,9 @@ class SdcSolverCore(ISolverCore):
 
     def __init__(self):
         super(SdcSolverCore, self).__init__()
+        # right hand sides evaluated during the current sweep over a time step, see _sweep_storage
+        self._sweep = None
+        self._sweep_rhs = {}
 
     def run(self, state, **kwargs):
         super(SdcSolverCore, self).run(state, **kwargs)
@@ -68,6 +73,101 @@ class SdcSolverCore(ISolverCore):
             #  (unless we find an error approximation method)
             pass
 
+    def _q_delta_correction(self, state, problem, coefficients, partial=None):
+        """Applies the strictly lower-triangular part of a :math:`Q_\\Delta` to the updates of the previous nodes
+
+        .. math::
+
+            \\sum_{j=1}^{m-1} q_j \\left( F(t_j, u_j^{k+1}) - F(t_j, u_j^k) \\right)
+
+        The updates of the right hand side are evaluated once per node and sweep (see :py:meth:`._rhs_update`), thus
+        the evaluations of a sweep grow linearly with the number of nodes.
+
+        Parameters
+        ----------
+        state : :py:class:`.SdcSolverState`
+        problem : :py:class:`.IProblem`
+        coefficients : :py:class:`numpy.ndarray`
+            coefficients :math:`q_j` for the nodes :math:`1, \\dots, m-1` of the current time step
+        partial : :py:class:`str` or :py:class:`None`
+            *(optional)*
+            part of the right hand side to evaluate (see :py:meth:`.IProblem.evaluate_wrt_time`)
+        """
+        _correction = np.zeros(state.current_step.value.shape, dtype=problem.numeric_type)
+        for _index in range(0, state.current_step_index):
+            if coefficients[_index] == 0.0:
+                continue
+            _correction += coefficients[_index] * self._rhs_update(state, problem, _index, partial)
+        return _correction
+
+    def _rhs_update(self, state, problem, index, partial=None):
+        """Change of the right hand side at a node of the current time step by the current sweep
+
+        .. math::
+
+            F(t_j, u_j^{k+1}) - F(t_j, u_j^k)
+
+        The full right hand side at the new value is stored in the node's state, as the integrals of the next iteration
+        require it as well.
+        """
+        _updates = self._sweep_storage(state).setdefault(('update', partial), {})
+        if index not in _updates:
+            _current = state.current_time_step[index]
+            if partial is None:
+                if not _current.rhs_evaluated:
+                    _current.rhs = problem.evaluate_wrt_time(_current.time_point, _current.value)
+                _current_rhs = _current.rhs
+            else:
+                _current_rhs = problem.evaluate_wrt_time(_current.time_point, _current.value, partial=partial)
+            _updates[index] = _current_rhs - self._previous_rhs(state, problem, index, partial)
+        return _updates[index]
+
+    def _previous_rhs(self, state, problem, index, partial=None):
+        """Right hand side at the previous iteration's value of a node of the current time step
+
+        .. math::
+
+            F(t_j, u_j^k)
+
+        In the first iteration, the initial value is taken for all nodes.
+        The full right hand side is stored in the previous iteration's state.
+        """
+        _previous = self._sweep_storage(state).setdefault(('previous', partial), {})
+        if index not in _previous:
+            _time_point = state.current_time_step[index].time_point
+            if state.previous_iteration_index is None:
+                _previous[index] = problem.evaluate_wrt_time(_time_point, state.initial.value, partial=partial)
+            elif partial is None:
+                _step = state.previous_iteration[state.current_time_step_index][index]
+                if not _step.rhs_evaluated:
+                    _step.rhs = problem.evaluate_wrt_time(_time_point, _step.value)
+                _previous[index] = _step.rhs
+            else:
+                _previous[index] = \
+                    problem.evaluate_wrt_time(_time_point,
+                                              state.previous_iteration[state.current_time_step_index][index].value,
+                                              partial=partial)
+        return _previous[index]
+
+    def _sweep_storage(self, state):
+        """Right hand sides evaluated during the current sweep over the current time step
+
+        Dropped once the core is run for another state, iteration or time step.
+        """
+        _sweep = (state.current_iteration_index, state.current_time_step_index)
+        if self._sweep is None or self._sweep[0] is not state or self._sweep[1] != _sweep:
+            self._sweep = (state, _sweep)
+            self._sweep_rhs = {}
+        return self._sweep_rhs
+
+    def _integral_from_start(self, state):
+        """Integral from the start of the current time step up to the current node
+        """
+        _integral = 0.0
+        for _index in range(0, state.current_step_index + 1):
+            _integral = _integral + state.current_time_step[_index].integral
+        return _integral
+
     def _previous_iteration_previous_step(self, state):
         if state.previous_iteration_index is not None:
             if state.previous_step_index is not None:
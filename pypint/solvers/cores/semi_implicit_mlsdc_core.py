@@ -76,14 +76,16 @@ class SemiImplicitMlSdcCore(MlSdcSolverCore):
             _fas = _previous_iteration_current_step.fas_correction
 
         if problem_has_direct_implicit(_problem, self):
-            _sol = _problem.direct_implicit(phis_of_time=[_previous_iteration_previous_step.value,
-                                                          _previous_iteration_current_step.value,
-                                                          state.previous_step.value],
-                                            delta_node=state.current_step.delta_tau,
-                                            delta_step=state.delta_interval,
-                                            integral=state.current_step.integral,
-                                            fas=_fas,
-                                            core=self)
+            with self.profiler.scope("implicit solve"):
+                self.metrics.increment('implicit_solves')
+                _sol = _problem.direct_implicit(phis_of_time=[_previous_iteration_previous_step.value,
+                                                              _previous_iteration_current_step.value,
+                                                              state.previous_step.value],
+                                                delta_node=state.current_step.delta_tau,
+                                                delta_step=state.delta_interval,
+                                                integral=state.current_step.integral,
+                                                fas=_fas,
+                                                core=self)
 
         else:
             # Note: \Delta_t is always 1.0 as it's part of the integral
@@ -113,14 +115,17 @@ class SemiImplicitMlSdcCore(MlSdcSolverCore):
             # LOG.debug("shape of value: %s" % (state.current_step.value.shape,))
             # LOG.debug("shape expl term: %s" % (_expl_term.shape,))
             # LOG.debug("shape impl func: %s" % (_func(state.current_step.value.reshape(-1)).shape,))
-            _sol = \
-                _problem.implicit_solve(
-                    state.current_step.value.reshape(-1),
-                    _func,
-                    expl_term=_expl_term,
-                    time_level=state.current_iteration.current_level_index,
-                    delta_time=state.current_iteration.current_level.current_step.delta_tau
-                ).reshape(state.current_step.value.shape)
+            with self.profiler.scope("implicit solve"):
+                self.metrics.increment('implicit_solves')
+                _sol = \
+                    _problem.implicit_solve(
+                        state.current_step.value.reshape(-1),
+                        _func,
+                        expl_term=_expl_term,
+                        time_level=state.current_iteration.current_level_index,
+                        delta_time=state.current_iteration.current_level.current_step.delta_tau,
+                        partial="impl"
+                    ).reshape(state.current_step.value.shape)
 
         if type(state.current_step.value) == type(_sol):
             state.current_step.value = _sol
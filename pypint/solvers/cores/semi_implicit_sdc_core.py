@@ -29,9 +29,23 @@ class SemiImplicitSdcCore(SdcSolverCore):
                                                   - F_E(t_m, u_m^{k+1}) + F_E(t_m, u_m^k) \\right) \\\\
                           &+ \\Delta_t I_m^{m+1} \\left( F(\\vec{u}^k) \\right)
 
+        With a general lower-triangular preconditioner :math:`Q_\\Delta` for the implicit part the sweep reads
+
+        .. math::
+
+            u_m^{k+1} - q_{m,m} F_I(t_m, u_m^{k+1}) =
+                u_0 &+ \\sum_{j=1}^{m-1} q_{m,j} \\left( F_I(t_j, u_j^{k+1}) - F_I(t_j, u_j^k) \\right)
+                     - q_{m,m} F_I(t_m, u_m^k) \\\\
+                    &+ \\sum_{j=1}^{m-1} \\Delta_{\\tau_{j+1}} \\left( F_E(t_j, u_j^{k+1}) - F_E(t_j, u_j^k) \\right)
+                     + \\Delta_t I_0^m \\left( F(\\vec{u}^k) \\right)
+
         Parameters
         ----------
         state : :py:class:`.SdcSolverState`
+        q_delta : :py:class:`numpy.ndarray` or :py:class:`None`
+            *(optional)*
+            preconditioner :math:`Q_\\Delta` of the implicit part (see :py:meth:`.SdcIntegrator.q_delta`);
+            if not given, the implicit Euler is used
 
         Notes
         -----
@@ -46,13 +60,17 @@ class SemiImplicitSdcCore(SdcSolverCore):
         _previous_iteration_current_step = self._previous_iteration_current_step(state)
         _previous_iteration_previous_step = self._previous_iteration_previous_step(state)
 
-        if problem_has_direct_implicit(_problem, self):
-            _sol = _problem.direct_implicit(phis_of_time=[_previous_iteration_previous_step.value,
-                                                          _previous_iteration_current_step.value,
-                                                          state.previous_step.value],
-                                            delta_node=state.current_step.delta_tau,
-                                            delta_step=state.current_time_step.delta_time_step,
-                                            integral=state.current_step.integral)
+        if kwargs.get('q_delta') is not None:
+            _sol = self._q_delta_step(state, _problem, kwargs['q_delta'], _previous_iteration_current_step)
+        elif problem_has_direct_implicit(_problem, self):
+            with self.profiler.scope("implicit solve"):
+                self.metrics.increment('implicit_solves')
+                _sol = _problem.direct_implicit(phis_of_time=[_previous_iteration_previous_step.value,
+                                                              _previous_iteration_current_step.value,
+                                                              state.previous_step.value],
+                                                delta_node=state.current_step.delta_tau,
+                                                delta_step=state.current_time_step.delta_time_step,
+                                                integral=state.current_step.integral)
 
         else:
             # Note: \Delta_t is always 1.0 as it's part of the integral
@@ -76,15 +94,56 @@ class SemiImplicitSdcCore(SdcSolverCore):
                                                x_next.reshape(_problem.dim_for_time_solver),
                                                partial="impl").reshape(-1) \
                 - x_next
-            _sol = _problem.implicit_solve(state.current_step.value.reshape(-1), _func,
-                                           expl_term=_expl_term,
-                                           time_level=0,
-                                           delta_time=state.current_step.delta_tau).reshape(state.current_step.value.shape)
+            with self.profiler.scope("implicit solve"):
+                self.metrics.increment('implicit_solves')
+                _sol = _problem.implicit_solve(state.current_step.value.reshape(-1), _func,
+                                               expl_term=_expl_term,
+                                               time_level=0,
+                                               delta_time=state.current_step.delta_tau,
+                                               partial="impl").reshape(state.current_step.value.shape)
 
         if type(state.current_step.value) == type(_sol):
             state.current_step.value = _sol
         else:
             state.current_step.value = _sol[0]
 
+    def _q_delta_step(self, state, problem, q_delta, previous_iteration_current_step):
+        _node = state.current_step_index + 1
+        _q_mm = q_delta[_node, _node]
+        # the explicit part is always treated with the node-to-node explicit Euler
+        _expl_coefficients = [state.current_time_step[_index].delta_tau for _index in range(1, _node)]
+        _expl_term = \
+            state.current_time_step.initial.value \
+            + self._q_delta_correction(state, problem, q_delta[_node, 1:_node], partial="impl") \
+            + self._q_delta_correction(state, problem, _expl_coefficients, partial="expl") \
+            + self._integral_from_start(state)
+        if problem_has_direct_implicit(problem, self):
+            with self.profiler.scope("implicit solve"):
+                self.metrics.increment('implicit_solves')
+                # the terms without u_m are given as the value of the previous node of both iterations, thus the
+                # explicit part of the formula cancels out
+                return problem.direct_implicit(phis_of_time=[_expl_term,
+                                                             previous_iteration_current_step.value,
+                                                             _expl_term],
+                                               delta_node=_q_mm,
+                                               delta_step=state.current_time_step.delta_time_step,
+                                               integral=0.0)
+        _expl_term = \
+            (_expl_term
+             - _q_mm * self._previous_rhs(state, problem, state.current_step_index, partial="impl")).reshape(-1)
+        _func = lambda x_next: \
+            _expl_term \
+            + _q_mm * problem.evaluate_wrt_time(state.current_step.time_point,
+                                                x_next.reshape(problem.dim_for_time_solver),
+                                                partial="impl").reshape(-1) \
+            - x_next
+        with self.profiler.scope("implicit solve"):
+            self.metrics.increment('implicit_solves')
+            return problem.implicit_solve(state.current_step.value.reshape(-1), _func,
+                                          expl_term=_expl_term,
+                                          time_level=0,
+                                          delta_time=float(_q_mm),
+                                          partial="impl").reshape(state.current_step.value.shape)
+
 
 __all__ = ['SemiImplicitSdcCore']
@@ -5,21 +5,27 @@
 """
 from pypint.solvers.states.i_solver_state import ISolverState
 from pypint.solvers.cores.i_solver_core import ISolverCore
+from pypint.plugins.timers.profiler import HasProfilerMixin, Profiler
+from pypint.plugins.metrics.metrics_registry import HasMetricsMixin, MetricsRegistry
 from pypint.utilities.threshold_check import ThresholdCheck
-from pypint.utilities import assert_condition, assert_is_callable, class_name
+from pypint.utilities.logging import is_logging
+from pypint.utilities import assert_condition, assert_is_callable, assert_is_instance, class_name
 
 
-class IIterativeTimeSolver(object):
+class IIterativeTimeSolver(HasProfilerMixin, HasMetricsMixin):
     """Basic interface for iterative time solvers.
     """
 
     def __init__(self, *args, **kwargs):
+        HasProfilerMixin.__init__(self, *args, **kwargs)
+        HasMetricsMixin.__init__(self, *args, **kwargs)
         self._problem = None
         self._integrator = None
         self._core = ISolverCore()
         self._timer = None
         self._threshold_check = ThresholdCheck()
         self._state = ISolverState()
+        self._logs_progress = True
 
     def init(self, problem, **kwargs):
         """Initializes the solver with a given problem and options.
@@ -35,6 +41,14 @@ class IIterativeTimeSolver(object):
         threshold : :py:class:`.ThresholdCheck`
             *(optional)*
             see :py:attr:`.threshold`
+
+        profiler : :py:class:`.Profiler`
+            *(optional)*
+            see :py:attr:`.profiler`
+
+        metrics : :py:class:`.MetricsRegistry`
+            *(optional)*
+            see :py:attr:`.metrics`
         """
         self._problem = problem
         if 'integrator' in kwargs:
@@ -42,6 +56,12 @@ class IIterativeTimeSolver(object):
             self._integrator = kwargs['integrator']()
         if "threshold" in kwargs and isinstance(kwargs["threshold"], ThresholdCheck):
             self.threshold = kwargs["threshold"]
+        if 'profiler' in kwargs:
+            assert_is_instance(kwargs['profiler'], Profiler, descriptor="Profiler", checking_obj=self)
+            self.profiler = kwargs['profiler']
+        if 'metrics' in kwargs:
+            assert_is_instance(kwargs['metrics'], MetricsRegistry, descriptor="Metrics Registry", checking_obj=self)
+            self.metrics = kwargs['metrics']
 
     def run(self, core, **kwargs):
         """Applies this solver.
@@ -63,6 +83,9 @@ class IIterativeTimeSolver(object):
                                              .format(class_name(core)),
                          checking_obj=self)
         self._core = core()
+        self._share_instrumentation()
+        # the progress messages are only formatted if they are emitted at all
+        self._logs_progress = is_logging()
 
     @property
     def problem(self):
@@ -103,6 +126,81 @@ class IIterativeTimeSolver(object):
     def timer(self, timer):
         self._timer = timer
 
+    @property
+    def profiler(self):
+        """Accessor for the profiler of the solver's phases
+
+        It is handed on to the solver's core and problem, if the latter is a :py:class:`.HasProfilerMixin`, on each
+        call of :py:meth:`.run`.
+        Thus, e.g. the scope ``implicit solve`` of the core and ``mg solve`` of a multigrid problem nest within the
+        solver's scopes.
+
+        Parameters
+        ----------
+        profiler : :py:class:`.Profiler`
+
+        Returns
+        -------
+        profiler : :py:class:`.Profiler`
+            a disabled profiler by default
+
+        Examples
+        --------
+        .. code-block:: python
+
+            solver.init(problem, profiler=Profiler(), **options)
+            solver.run(core, dt=1.0)
+            print(solver.profiler.summary())
+        """
+        return self._profiler
+
+    @profiler.setter
+    def profiler(self, profiler):
+        self._profiler = profiler
+
+    @property
+    def metrics(self):
+        """Accessor for the counters of the solver's work units
+
+        It is handed on as the :py:attr:`.profiler` is.
+        The solver counts its iterations per interval, while e.g. the right hand side evaluations and implicit solves
+        are counted by the problem and core (see :py:class:`.MetricsRegistry`).
+
+        Parameters
+        ----------
+        metrics : :py:class:`.MetricsRegistry`
+
+        Returns
+        -------
+        metrics : :py:class:`.MetricsRegistry`
+            a disabled registry by default
+
+        Examples
+        --------
+        .. code-block:: python
+
+            solver.init(problem, metrics=MetricsRegistry(), **options)
+            solver.run(core, dt=1.0)
+            print(solver.metrics.to_prometheus())
+        """
+        return self._metrics
+
+    @metrics.setter
+    def metrics(self, metrics):
+        self._metrics = metrics
+
+    def _instrumented(self):
+        """Objects the profiler and metrics registry are handed on to
+        """
+        return [self._core, self._problem]
+
+    def _share_instrumentation(self):
+        for _instrumented in self._instrumented():
+            if isinstance(_instrumented, HasProfilerMixin):
+                _instrumented.profiler = self._profiler
+            if isinstance(_instrumented, HasMetricsMixin):
+                _instrumented.metrics = self._metrics
+
     @property
     def threshold(self):
         """Accessor for threshold check of this solver.
@@ -18,6 +18,7 @@ from pypint.integrators.node_providers.gauss_lobatto_nodes import GaussLobattoNo
 from pypint.integrators.weight_function_providers.polynomial_weight_function import PolynomialWeightFunction
 from pypint.problems import IInitialValueProblem, problem_has_exact_solution
 from pypint.solvers.states.mlsdc_solver_state import MlSdcSolverState
+from pypint.solvers.accelerators.i_accelerator import IAccelerator
 from pypint.solvers.diagnosis import IDiagnosisValue
 from pypint.solvers.diagnosis.norms import supremum_norm
 from pypint.plugins.timers.timer_base import TimerBase
@@ -46,6 +47,7 @@ class MlSdc(IIterativeTimeSolver, IParallelSolver):
 
         self._dt = 0.0
         self._ml_provider = None
+        self._accelerator = None
 
         self.__nodes_type = GaussLobattoNodes
         self.__weights_type = PolynomialWeightFunction
@@ -70,6 +72,10 @@ class MlSdc(IIterativeTimeSolver, IParallelSolver):
         weights_type : :py:class:`.IWeightFunction`
             *(optional)*
             Integration weights function to be used (class name, **NOT instance**).
+        accelerator : :py:class:`.IAccelerator`
+            *(optional)*
+            Accelerator applied to the node values of the finest level after each V-cycle, e.g.
+            :py:class:`.AndersonAccelerator` or :py:class:`.KrylovAccelerator`.
 
         Raises
         ------
@@ -93,6 +99,10 @@ class MlSdc(IIterativeTimeSolver, IParallelSolver):
                               descriptor='Multi Time Level Provider', checking_obj=self)
         self._ml_provider = kwargs['ml_provider']
 
+        if 'accelerator' in kwargs:
+            assert_is_instance(kwargs['accelerator'], IAccelerator, descriptor="Accelerator", checking_obj=self)
+            self._accelerator = kwargs['accelerator']
+
         super(MlSdc, self).init(problem, **kwargs)
 
         # TODO: need to store the exact solution somewhere else
@@ -137,7 +147,8 @@ class MlSdc(IIterativeTimeSolver, IParallelSolver):
             _current_flag = Message.SolverFlag.none
 
             # receive dedicated message
-            _msg = self._communicator.receive(tag=(self.ml_provider.num_levels - 1))
+            with self.profiler.scope("communication wait"):
+                _msg = self._communicator.receive(tag=(self.ml_provider.num_levels - 1))
 
             if _msg.flag == Message.SolverFlag.failed:
                 # previous solver failed
@@ -160,7 +171,8 @@ class MlSdc(IIterativeTimeSolver, IParallelSolver):
                              Message.SolverFlag.time_adjusted]:
                         # we just started or finished our previous interval
                         # --> start a new interval
-                        _has_work = self._init_new_interval(_msg.time_point)
+                        with self.profiler.scope("interval setup"):
+                            _has_work = self._init_new_interval(_msg.time_point)
 
                         if _has_work:
                             # set initial values
@@ -246,9 +258,10 @@ class MlSdc(IIterativeTimeSolver, IParallelSolver):
                         # LOG.warn("Solver failed.")
                         _current_flag = Message.SolverFlag.failed
 
-            self._communicator.send(value=self.state.current_iteration.finest_level.final_step.value,
-                                    time_point=self.state.current_iteration.finest_level.final_step.time_point,
-                                    flag=_current_flag)
+            with self.profiler.scope("communication wait"):
+                self._communicator.send(value=self.state.current_iteration.finest_level.final_step.value,
+                                        time_point=self.state.current_iteration.finest_level.final_step.time_point,
+                                        flag=_current_flag)
             __work_loop_count += 1
 
         # end while:has_work is None
@@ -256,6 +269,9 @@ class MlSdc(IIterativeTimeSolver, IParallelSolver):
 
         return [_s.solution for _s in self._states]
 
+    def _instrumented(self):
+        return super(MlSdc, self)._instrumented() + [self._communicator]
+
     @property
     def state(self):
         """Read-only accessor for the sovler's state
@@ -283,25 +299,30 @@ class MlSdc(IIterativeTimeSolver, IParallelSolver):
         # initialize iteration timer of same type as global timer
         _iter_timer = self.timer.__class__()
 
-        # initialize solver states for this iteration
-        self._init_new_iteration()
-
         self._print_iteration(self.state.current_iteration_index + 1)
+        self.metrics.increment('iterations', interval=len(self._states) - 1)
 
         # iterate on time steps
         _iter_timer.start()
-        self._level()
+        with self.profiler.scope("iteration"):
+            # initialize solver states for this iteration
+            with self.profiler.scope("iteration setup"):
+                self._init_new_iteration()
+
+            with self.profiler.scope("level %d" % self.state.current_level_index), \
+                    self.metrics.labels(level=self.state.current_level_index):
+                self._level()
         _iter_timer.stop()
 
         # check termination criteria
         self.threshold.check(self.state)
 
         # log this iteration's summary
-        if self.state.is_first_iteration:
-            # on first iteration we do not have comparison values
-            self._print_iteration_end(None, None, None, _iter_timer.past())
-        else:
-            if problem_has_exact_solution(self.problem, self) and not self.state.is_first_iteration:
+        if self._logs_progress:
+            if self.state.is_first_iteration:
+                # on first iteration we do not have comparison values
+                self._print_iteration_end(None, None, None, _iter_timer.past())
+            elif problem_has_exact_solution(self.problem, self):
                 # we could compute the correct error of our current solution
                 self._print_iteration_end(self.state.solution.solution_reduction(self.state.current_iteration_index),
                                           self.state.solution.error_reduction(self.state.current_iteration_index),
@@ -314,7 +335,8 @@ class MlSdc(IIterativeTimeSolver, IParallelSolver):
                                           _iter_timer.past())
 
         # finalize this iteration (i.e. TrajectorySolutionData.finalize())
-        self.state.current_iteration.finalize()
+        with self.profiler.scope("state finalize"):
+            self.state.current_iteration.finalize()
 
         _reason = self.threshold.has_reached()
         if _reason is None:
@@ -325,14 +347,16 @@ class MlSdc(IIterativeTimeSolver, IParallelSolver):
             _dim = list(self.problem.spacial_dim)
             _dim.insert(0, self.ml_provider.integrator(self.state.last.current_level_index).num_nodes)
             LOG.debug("-->\n%s" % (self.state.last.current_level.values.reshape(tuple(_dim)).tolist()))
-            self.state.finalize()
+            with self.profiler.scope("state finalize"):
+                self.state.finalize()
             return Message.SolverFlag.finished
         else:
             # LOG.debug("solver main loop done: other")
             _dim = list(self.problem.spacial_dim)
             _dim.insert(0, self.ml_provider.integrator(self.state.last.current_level_index).num_nodes)
             LOG.debug("-->\n%s" % (self.state.last.current_level.values.reshape(tuple(_dim)).tolist()))
-            self.state.finalize()
+            with self.profiler.scope("state finalize"):
+                self.state.finalize()
             return Message.SolverFlag.converged
 
     def _init_new_state(self):
@@ -375,6 +399,9 @@ class MlSdc(IIterativeTimeSolver, IParallelSolver):
 
         self._init_new_state()
 
+        if self._accelerator is not None:
+            self._accelerator.reset()
+
         # set width of current interval
         self.state.initial.solution.time_point = start
         self.state.initial.value = self.problem.initial_value.copy()
@@ -387,7 +414,8 @@ class MlSdc(IIterativeTimeSolver, IParallelSolver):
         for _level in range(0, self.ml_provider.num_levels):
             _integrator = self.ml_provider.integrator(_level)
 
-            _integrator.transform_interval(self.state.interval)
+            with self.profiler.scope("integrator init"):
+                _integrator.transform_interval(self.state.interval)
 
             # print("nodes: %s" % _integrator.nodes)
 
@@ -458,17 +486,19 @@ class MlSdc(IIterativeTimeSolver, IParallelSolver):
 
     def _recompute_rhs_for_level(self, level):
         if level.rhs is None:
-            if not level.initial.rhs_evaluated:
-                level.initial.rhs = self.problem.evaluate_wrt_time(level.initial.time_point, level.initial.value)
-            for step in level:
-                if not step.rhs_evaluated:
-                    step.rhs = self.problem.evaluate_wrt_time(step.time_point, step.value)
+            with self.profiler.scope("rhs evaluation"):
+                if not level.initial.rhs_evaluated:
+                    level.initial.rhs = self.problem.evaluate_wrt_time(level.initial.time_point, level.initial.value)
+                for step in level:
+                    if not step.rhs_evaluated:
+                        step.rhs = self.problem.evaluate_wrt_time(step.time_point, step.value)
 
     def _compute_residual(self, finalize=False):
         LOG.debug("Computing Residual")
-        self._print_step(1, None, self.state.current_level.initial.time_point,
-                         supremum_norm(self.state.current_level.initial.value),
-                         None, None)
+        if self._logs_progress:
+            self._print_step(1, None, self.state.current_level.initial.time_point,
+                             supremum_norm(self.state.current_level.initial.value),
+                             None, None)
 
         _full_integral = 0.0
 
@@ -478,59 +508,64 @@ class MlSdc(IIterativeTimeSolver, IParallelSolver):
             _step = self.state.current_level[_step_index]
 
             if not _step.integral_available:
-                _step.integral = \
-                    self.ml_provider \
-                        .integrator(self.state.current_level_index) \
-                        .evaluate(self.state.current_level.rhs, from_node=_step_index, target_node=_step_index + 1)
+                with self.profiler.scope("integral"):
+                    _step.integral = \
+                        self.ml_provider \
+                            .integrator(self.state.current_level_index) \
+                            .evaluate(self.state.current_level.rhs, from_node=_step_index, target_node=_step_index + 1)
             _full_integral += _step.integral
 
-            self._core.compute_residual(self.state, step=_step, integral=_full_integral)
+            with self.profiler.scope("residual"):
+                self._core.compute_residual(self.state, step=_step, integral=_full_integral)
 
             if finalize:
                 # finalize this step (i.e. StepSolutionData.finalize())
                 _step.done()
 
-        for _step_index in range(0, len(self.state.current_level)):
-            _step = self.state.current_level[_step_index]
-            if _step_index > 0:
-                _previous_time = self.state.current_level[_step_index - 1].time_point
-            else:
-                _previous_time = self.state.current_level.initial.time_point
-
-            _fas = _step.fas_correction if not self.state.current_iteration.on_finest_level else None
-            _cc = _step.coarse_correction if not self.state.current_iteration.on_finest_level else None
-
-            if problem_has_exact_solution(self.problem, self):
-                self._print_step(_step_index + 2,
-                                 _previous_time,
-                                 _step.time_point,
-                                 supremum_norm(_step.value),
-                                 _step.solution.residual,
-                                 _step.solution.error,
-                                 _fas,
-                                 _cc)
-            else:
-                self._print_step(_step_index + 2,
-                                 _previous_time,
-                                 _step.time_point,
-                                 supremum_norm(_step.value),
-                                 _step.solution.residual,
-                                 None,
-                                 _fas,
-                                 _cc)
+        if self._logs_progress:
+            for _step_index in range(0, len(self.state.current_level)):
+                _step = self.state.current_level[_step_index]
+                if _step_index > 0:
+                    _previous_time = self.state.current_level[_step_index - 1].time_point
+                else:
+                    _previous_time = self.state.current_level.initial.time_point
+
+                _fas = _step.fas_correction if not self.state.current_iteration.on_finest_level else None
+                _cc = _step.coarse_correction if not self.state.current_iteration.on_finest_level else None
+
+                if problem_has_exact_solution(self.problem, self):
+                    self._print_step(_step_index + 2,
+                                     _previous_time,
+                                     _step.time_point,
+                                     supremum_norm(_step.value),
+                                     _step.solution.residual,
+                                     _step.solution.error,
+                                     _fas,
+                                     _cc)
+                else:
+                    self._print_step(_step_index + 2,
+                                     _previous_time,
+                                     _step.time_point,
+                                     supremum_norm(_step.value),
+                                     _step.solution.residual,
+                                     None,
+                                     _fas,
+                                     _cc)
 
         self._print_sweep_end()
 
         if finalize:
             LOG.debug("Finalizing Level %d" % self.state.current_iteration.current_level_index)
-            self.state.current_iteration.current_level.finalize()
+            with self.profiler.scope("state finalize"):
+                self.state.current_iteration.current_level.finalize()
 
     def _level(self):
         _current_level = self.state.current_iteration.current_level
         _finer_level = self.state.current_iteration.finer_level
         _coarser_level = self.state.current_iteration.coarser_level
 
-        _msg = self.comm.receive(tag=self.state.current_level_index)
+        with self.profiler.scope("communication wait"):
+            _msg = self.comm.receive(tag=self.state.current_level_index)
         if _msg and _msg.time_point == self.state.initial.time_point:
             _current_level.initial.definalize()
             _current_level.initial.value = _msg.value
@@ -548,31 +583,32 @@ class MlSdc(IIterativeTimeSolver, IParallelSolver):
 
         if not self.state.current_iteration.on_finest_level:
             # compute FAS Correction
-            _q_rhs_coarse = \
-                np.concatenate(
-                    (np.array([np.zeros(self.problem.dim_for_time_solver, dtype=self.problem.numeric_type)]),
-                     np.array([
-                        self.ml_provider
-                            .integrator(self.state.current_iteration.current_level_index)
-                            .evaluate(_current_level.rhs, target_node=_step_i+1)
-                        for _step_i in range(0, len(_current_level))
-                     ], dtype=self.problem.numeric_type)),
-                    axis=0)
-            self._recompute_rhs_for_level(_finer_level)
-
-            _q_rhs_fine = \
-                np.concatenate(
-                    (np.array([np.zeros(self.problem.dim_for_time_solver, dtype=self.problem.numeric_type)]),
-                     np.array([
-                         self.ml_provider
-                             .integrator(self.state.current_iteration.finer_level_index)
-                             .evaluate(_finer_level.rhs, target_node=_step_i+1)
-                         for _step_i in range(0, len(_finer_level))
-                     ], dtype=self.problem.numeric_type)),
-                    axis=0)
-
-            self._compute_fas_correction(_q_rhs_fine, _finer_level.fas_correction, _q_rhs_coarse,
-                                         fine_lvl=self.state.current_iteration.finer_level_index)
+            with self.profiler.scope("fas correction"):
+                _q_rhs_coarse = \
+                    np.concatenate(
+                        (np.array([np.zeros(self.problem.dim_for_time_solver, dtype=self.problem.numeric_type)]),
+                         np.array([
+                            self.ml_provider
+                                .integrator(self.state.current_iteration.current_level_index)
+                                .evaluate(_current_level.rhs, target_node=_step_i+1)
+                            for _step_i in range(0, len(_current_level))
+                         ], dtype=self.problem.numeric_type)),
+                        axis=0)
+                self._recompute_rhs_for_level(_finer_level)
+
+                _q_rhs_fine = \
+                    np.concatenate(
+                        (np.array([np.zeros(self.problem.dim_for_time_solver, dtype=self.problem.numeric_type)]),
+                         np.array([
+                             self.ml_provider
+                                 .integrator(self.state.current_iteration.finer_level_index)
+                                 .evaluate(_finer_level.rhs, target_node=_step_i+1)
+                             for _step_i in range(0, len(_finer_level))
+                         ], dtype=self.problem.numeric_type)),
+                        axis=0)
+
+                self._compute_fas_correction(_q_rhs_fine, _finer_level.fas_correction, _q_rhs_coarse,
+                                             fine_lvl=self.state.current_iteration.finer_level_index)
 
         if (not self.state.current_iteration.on_base_level and not self.state.current_iteration.on_finest_level) or \
                 (self.state.current_iteration.on_finest_level and self.state.is_first_iteration):
@@ -582,22 +618,26 @@ class MlSdc(IIterativeTimeSolver, IParallelSolver):
 
         if not self.state.current_iteration.on_base_level:
             # restrict
-            _coarser_level.values = \
-                self.ml_provider.restringate(_current_level.values,
-                                             fine_level=self.state.current_iteration.current_level_index,
-                                             coarse_level=self.state.current_iteration.coarser_level_index)
+            with self.profiler.scope("level transfer"):
+                _coarser_level.values = \
+                    self.ml_provider.restringate(_current_level.values,
+                                                 fine_level=self.state.current_iteration.current_level_index,
+                                                 coarse_level=self.state.current_iteration.coarser_level_index)
             # call next coarser level
             self.state.current_iteration.step_down()
             #  RECURSION HERE!
-            self._level()
+            with self.profiler.scope("level %d" % self.state.current_level_index), \
+                    self.metrics.labels(level=self.state.current_level_index):
+                self._level()
             # -> coarser level is done; coming up again
 
             # coarse correction
             # TODO: correct RHS evaluations; not values
-            _prolongated_coarse_correction = \
-                self.ml_provider.prolongate(_coarser_level.coarse_corrections,
-                                            fine_level=self.state.current_iteration.current_level_index,
-                                            coarse_level=self.state.current_iteration.coarser_level_index)
+            with self.profiler.scope("level transfer"):
+                _prolongated_coarse_correction = \
+                    self.ml_provider.prolongate(_coarser_level.coarse_corrections,
+                                                fine_level=self.state.current_iteration.current_level_index,
+                                                coarse_level=self.state.current_iteration.coarser_level_index)
             # LOG.debug("Apply Coarse Correction\n  ==> %s\n    = %s + %s"
             #           % ((_current_level.values + _prolongated_coarse_correction),
             #              _current_level.values.flatten(), _prolongated_coarse_correction))
@@ -620,22 +660,28 @@ class MlSdc(IIterativeTimeSolver, IParallelSolver):
         if not self.state.current_iteration.on_finest_level:
             # compute coarse correction
             # LOG.debug("Computing Coarse Correction")
-            _restringated_values = \
-                self.ml_provider\
-                    .restringate(_finer_level.values,
-                                 self.state.current_iteration.finer_level_index,
-                                 self.state.current_iteration.current_level_index)
+            with self.profiler.scope("level transfer"):
+                _restringated_values = \
+                    self.ml_provider\
+                        .restringate(_finer_level.values,
+                                     self.state.current_iteration.finer_level_index,
+                                     self.state.current_iteration.current_level_index)
             for _step_index in range(0, len(_current_level)):
                 _step = _current_level[_step_index]
                 _step.coarse_correction = _step.value - _restringated_values[_step_index + 1]
                 # LOG.debug("    %d: %s = %s - %s"
                 #           % (_step_index, _step.coarse_correction, _step.value, _restringated_values[_step_index + 1]))
 
+        if self._accelerator is not None and self.state.current_iteration.on_finest_level:
+            with self.profiler.scope("acceleration"):
+                self._accelerate()
+
         self._compute_residual(finalize=True)
 
-        self.comm.send(tag=self.state.current_level_index,
-                       value=_current_level.final_step.value,
-                       time_point=_current_level.final_step.time_point)
+        with self.profiler.scope("communication wait"):
+            self.comm.send(tag=self.state.current_level_index,
+                           value=_current_level.final_step.value,
+                           time_point=_current_level.final_step.time_point)
 
         self._print_level_end()
 
@@ -646,6 +692,22 @@ class MlSdc(IIterativeTimeSolver, IParallelSolver):
             # pass on to next finer level
             self.state.current_iteration.step_up()
 
+    def _accelerate(self):
+        _level = self.state.current_iteration.current_level
+        if self.state.is_first_iteration:
+            _previous = np.array([self.state.initial.value for _step in _level], dtype=self.problem.numeric_type)
+        else:
+            _previous = np.array([_step.value for _step in self.state.previous_iteration[self.state.current_level_index]],
+                                 dtype=self.problem.numeric_type)
+        _current = np.array([_step.value for _step in _level], dtype=self.problem.numeric_type)
+
+        _accelerated = self._accelerator.accelerate(_previous, _current)
+
+        # replace the V-cycle's result and recalculate errors
+        for _step_index in range(0, len(_level)):
+            _level[_step_index].value = _accelerated[_step_index]
+            self._core.compute_error(self.state, step_index=_step_index, problem=self.problem)
+
     def _sdc_sweep(self, use_intermediate=False, copy=True, with_residual=False):
         """
         Parameters
@@ -664,57 +726,49 @@ class MlSdc(IIterativeTimeSolver, IParallelSolver):
         # compute integral
         self.state.current_iteration.current_level.integral = 0.0
 
-        if not self.state.current_iteration.current_level.initial.rhs_evaluated:
-            self.state.current_iteration.current_level.initial.rhs = \
-                self.problem.evaluate_wrt_time(self.state.current_iteration.current_level.initial.time_point,
-                                               self.state.current_iteration.current_level.initial.value)
-
-        _integrate_values = np.array([self.state.current_iteration.current_level.initial.rhs],
-                                     dtype=self.problem.numeric_type)
-
-        for _step_index in range(0, len(self.state.current_iteration.current_level)):
-            # TODO: clean up this conditional
-            if self.state.current_iteration.on_finest_level and self.state.is_first_iteration and not use_intermediate:
-                # LOG.debug("On First Iteration on Finest Level. Taking breadcasted initial value.")
-                _integrate_values = \
-                    np.append(_integrate_values,
-                              np.array([self.state.current_iteration.current_level.initial.rhs],
-                                       dtype=self.problem.numeric_type),
-                              axis=0)
-
-            elif not self.state.current_iteration.on_finest_level:
-                # LOG.debug("Not on Finest Level. Taking current intermediate value.")
-                _step = self.state.current_iteration.current_level[_step_index]
-                if use_intermediate:
-                    if not _step.intermediate.rhs_evaluated:
-                        _step.intermediate.rhs = self.problem.evaluate_wrt_time(_step.time_point,
-                                                                                _step.intermediate.value)
+        # gather the right hand sides to integrate
+        with self.profiler.scope("rhs evaluation"):
+            if not self.state.current_iteration.current_level.initial.rhs_evaluated:
+                self.state.current_iteration.current_level.initial.rhs = \
+                    self.problem.evaluate_wrt_time(self.state.current_iteration.current_level.initial.time_point,
+                                                   self.state.current_iteration.current_level.initial.value)
+
+            _integrate_values = np.array([self.state.current_iteration.current_level.initial.rhs],
+                                         dtype=self.problem.numeric_type)
+
+            for _step_index in range(0, len(self.state.current_iteration.current_level)):
+                # TODO: clean up this conditional
+                if self.state.current_iteration.on_finest_level and self.state.is_first_iteration \
+                        and not use_intermediate:
+                    # LOG.debug("On First Iteration on Finest Level. Taking breadcasted initial value.")
                     _integrate_values = \
                         np.append(_integrate_values,
-                                  np.array([_step.intermediate.rhs], dtype=self.problem.numeric_type),
+                                  np.array([self.state.current_iteration.current_level.initial.rhs],
+                                           dtype=self.problem.numeric_type),
                                   axis=0)
-                else:
-                    if not _step.rhs_evaluated:
-                        _step.rhs = self.problem.evaluate_wrt_time(_step.time_point, _step.value)
-                    _integrate_values = \
-                        np.append(_integrate_values,
-                                  np.array([_step.rhs], dtype=self.problem.numeric_type),
-                                  axis=0)
-
-            elif use_intermediate:
-                # LOG.debug("On Finest Level. Using intermediate value.")
-                _step = self.state.current_iteration.current_level[_step_index]
-                if not _step.intermediate.rhs_evaluated:
-                    _step.intermediate.rhs = self.problem.evaluate_wrt_time(_step.time_point, _step.intermediate.value)
-                _integrate_values = \
-                    np.append(_integrate_values,
-                              np.array([_step.intermediate.rhs], dtype=self.problem.numeric_type),
-                              axis=0)
 
-            else:
-                # LOG.debug("On Finest Level. Taking previous iteration's value.")
-                _step = self.state.previous_iteration[self.state.current_iteration.current_level_index][_step_index]
-                if use_intermediate:
+                elif not self.state.current_iteration.on_finest_level:
+                    # LOG.debug("Not on Finest Level. Taking current intermediate value.")
+                    _step = self.state.current_iteration.current_level[_step_index]
+                    if use_intermediate:
+                        if not _step.intermediate.rhs_evaluated:
+                            _step.intermediate.rhs = self.problem.evaluate_wrt_time(_step.time_point,
+                                                                                    _step.intermediate.value)
+                        _integrate_values = \
+                            np.append(_integrate_values,
+                                      np.array([_step.intermediate.rhs], dtype=self.problem.numeric_type),
+                                      axis=0)
+                    else:
+                        if not _step.rhs_evaluated:
+                            _step.rhs = self.problem.evaluate_wrt_time(_step.time_point, _step.value)
+                        _integrate_values = \
+                            np.append(_integrate_values,
+                                      np.array([_step.rhs], dtype=self.problem.numeric_type),
+                                      axis=0)
+
+                elif use_intermediate:
+                    # LOG.debug("On Finest Level. Using intermediate value.")
+                    _step = self.state.current_iteration.current_level[_step_index]
                     if not _step.intermediate.rhs_evaluated:
                         _step.intermediate.rhs = self.problem.evaluate_wrt_time(_step.time_point,
                                                                                 _step.intermediate.value)
@@ -722,13 +776,25 @@ class MlSdc(IIterativeTimeSolver, IParallelSolver):
                         np.append(_integrate_values,
                                   np.array([_step.intermediate.rhs], dtype=self.problem.numeric_type),
                                   axis=0)
+
                 else:
-                    if not _step.rhs_evaluated:
-                        _step.rhs = self.problem.evaluate_wrt_time(_step.time_point, _step.value)
-                    _integrate_values = \
-                        np.append(_integrate_values,
-                                  np.array([_step.rhs], dtype=self.problem.numeric_type),
-                                  axis=0)
+                    # LOG.debug("On Finest Level. Taking previous iteration's value.")
+                    _step = self.state.previous_iteration[self.state.current_iteration.current_level_index][_step_index]
+                    if use_intermediate:
+                        if not _step.intermediate.rhs_evaluated:
+                            _step.intermediate.rhs = self.problem.evaluate_wrt_time(_step.time_point,
+                                                                                    _step.intermediate.value)
+                        _integrate_values = \
+                            np.append(_integrate_values,
+                                      np.array([_step.intermediate.rhs], dtype=self.problem.numeric_type),
+                                      axis=0)
+                    else:
+                        if not _step.rhs_evaluated:
+                            _step.rhs = self.problem.evaluate_wrt_time(_step.time_point, _step.value)
+                        _integrate_values = \
+                            np.append(_integrate_values,
+                                      np.array([_step.rhs], dtype=self.problem.numeric_type),
+                                      axis=0)
 
         assert_condition(_integrate_values.shape[0] == _num_nodes,
                          ValueError, message="Number of integration values not correct: %d != %d"
@@ -748,8 +814,9 @@ class MlSdc(IIterativeTimeSolver, IParallelSolver):
             _current_step = self.state.current_iteration.current_level[_step_index]
             # if not _current_step.integral_available:
             # TODO: fix unneccessary recomputation of integrals
-            _current_step.integral = _integrator.evaluate(_integrate_values,
-                                                          from_node=_step_index, target_node=_step_index + 1)
+            with self.profiler.scope("integral"):
+                _current_step.integral = _integrator.evaluate(_integrate_values,
+                                                              from_node=_step_index, target_node=_step_index + 1)
 
             # we successively compute the full integral
             # LOG.debug("  Full Integral up to %d: %s = %s + %s"
@@ -758,7 +825,8 @@ class MlSdc(IIterativeTimeSolver, IParallelSolver):
             self.state.current_iteration.current_level.integral += _current_step.integral
 
             # do the SDC step of this sweep
-            self._sdc_step(use_intermediate=use_intermediate, copy=copy)
+            with self.profiler.scope("sweep"):
+                self._sdc_step(use_intermediate=use_intermediate, copy=copy)
 
             if self.state.current_level.current_step != self.state.current_level.final_step:
                 self.state.current_level.proceed()
@@ -811,6 +879,8 @@ class MlSdc(IIterativeTimeSolver, IParallelSolver):
         return _lines
 
     def _print_interval_header(self):
+        if not self._logs_progress:
+            return
         LOG.info("%s%s" % (VERBOSITY_LVL1, SEPARATOR_LVL3))
         LOG.info("{}  Interval: [{:.3f}, {:.3f}]"
                  .format(VERBOSITY_LVL1, self.state.initial.time_point, self.state.initial.time_point + self._dt))
@@ -826,11 +896,15 @@ class MlSdc(IIterativeTimeSolver, IParallelSolver):
         LOG.info("%s        \\_   sol r.red    err r.red      resid       time" % VERBOSITY_LVL1)
 
     def _print_iteration(self, _iter):
+        if not self._logs_progress:
+            return
         _iter = self._output_format(_iter, 'int', width=4)
         LOG.info("%s   %s" % (VERBOSITY_LVL1, _iter))
         LOG.info("%s       \\" % VERBOSITY_LVL2)
 
     def _print_level_header(self):
+        if not self._logs_progress:
+            return
         _lvl = self._output_format(self.state.current_level_index, 'int', width=2)
         _nodes = self._output_format(self.ml_provider.integrator(self.state.current_level_index).num_nodes,
                                      'int', width=2)
@@ -839,9 +913,13 @@ class MlSdc(IIterativeTimeSolver, IParallelSolver):
         LOG.info("%s        %s|     \\" % (VERBOSITY_LVL3, ('|      ' * (self.ml_provider.num_levels - self.state.current_level_index - 1))))
 
     def _print_level_end(self):
+        if not self._logs_progress:
+            return
         LOG.info("%s        %s|      \\_" % (VERBOSITY_LVL2, ('|      ' * (self.ml_provider.num_levels - self.state.current_level_index - 1))))
 
     def _print_iteration_end(self, solred, errred, resid, time):
+        if not self._logs_progress:
+            return
         _solred = self._output_format(solred, 'exp')
         _errred = self._output_format(errred, 'exp')
         _resid = self._output_format(resid, 'exp')
@@ -849,6 +927,8 @@ class MlSdc(IIterativeTimeSolver, IParallelSolver):
         LOG.info("%s        \\_   %s    %s    %s    %s" % (VERBOSITY_LVL1, _solred, _errred, _resid, _time))
 
     def _print_step(self, step, t0, t1, phi, resid, err, fas=None, cc=None):
+        if not self._logs_progress:
+            return
         _step = self._output_format(step, 'int', width=2)
         _t0 = self._output_format(t0, 'float', width=6.3)
         _t1 = self._output_format(t1, 'float', width=6.3)
@@ -862,6 +942,8 @@ class MlSdc(IIterativeTimeSolver, IParallelSolver):
                     _step, _t0, _t1, _phi, _resid, _err, _fas, _cc))
 
     def _print_sweep_end(self):
+        if not self._logs_progress:
+            return
         LOG.info("%s        %s|    \\_"
                  % (VERBOSITY_LVL3, ('|      ' * (self.ml_provider.num_levels - self.state.current_level_index))))
 
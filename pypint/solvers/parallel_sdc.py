@@ -6,6 +6,7 @@
 from copy import deepcopy
 import warnings as warnings
 from collections import OrderedDict
+from concurrent.futures import Executor
 
 import numpy as np
 
@@ -17,6 +18,8 @@ from pypint.integrators.node_providers.gauss_lobatto_nodes import GaussLobattoNo
 from pypint.integrators.weight_function_providers.polynomial_weight_function import PolynomialWeightFunction
 from pypint.problems import IInitialValueProblem, problem_has_exact_solution
 from pypint.solvers.states.sdc_solver_state import SdcSolverState
+from pypint.solvers.accelerators.i_accelerator import IAccelerator
+from pypint.solvers.predictors.i_predictor import IPredictor
 from pypint.solvers.diagnosis import IDiagnosisValue
 from pypint.solvers.diagnosis.norms import supremum_norm
 from pypint.plugins.timers.timer_base import TimerBase
@@ -95,6 +98,11 @@ class ParallelSdc(IIterativeTimeSolver, IParallelSolver):
             'n': np.zeros(0)
         }
         self._classic = True
+        self._q_delta = None
+        self._node_executor = None
+        self._accelerator = None
+        self._predictor = None
+        self._freeze_time_steps = False
 
         self.__nodes_type = GaussLobattoNodes
         self.__weights_type = PolynomialWeightFunction
@@ -126,13 +134,38 @@ class ParallelSdc(IIterativeTimeSolver, IParallelSolver):
             Flag for specifying the type of the SDC sweep.
             :py:class:`True`: *(default)* For the classic SDC as known from the literature;
             :py:class:`False`: For the modified SDC as developed by Torbjörn Klatt.
-
+        q_delta : :py:class:`str` or :py:class:`numpy.ndarray`
+            *(optional)*
+            Preconditioner :math:`Q_\\Delta` of the sweeps (see :py:meth:`.SdcIntegrator.q_delta`).
+            If not given, the implicit cores use the classic implicit Euler and node-parallel cores such as
+            :py:class:`.DiagonalImplicitSdcCore` the diagonal of :math:`Q`.
+        node_executor : :py:class:`concurrent.futures.Executor` or :py:class:`None`
+            *(optional)*
+            Thread pool the node updates of node-parallel cores are dispatched to; only for thread-safe problems
+            (see :py:attr:`.IProblem.thread_safe`).
+            If not given or :py:class:`None`, the nodes are computed one after another.
+        accelerator : :py:class:`.IAccelerator`
+            *(optional)*
+            Accelerator applied to the node values of each time step after each sweep, e.g.
+            :py:class:`.AndersonAccelerator` or :py:class:`.KrylovAccelerator`.
+        predictor : :py:class:`.IPredictor`
+            *(optional)*
+            Predictor for the node values of each time step, e.g. :py:class:`.ImplicitEulerPredictor`.
+            If given, the first iteration computes the prediction instead of a sweep and the first sweep starts from
+            the predicted values; otherwise the first sweep starts from the initial value spread to all nodes.
+        freeze_time_steps : :py:class:`bool`
+            *(optional)*
+            If :py:class:`True`, leading time steps of the interval, which have reached the residual or solution
+            reduction threshold on their own, are not swept over anymore
+            (see :py:meth:`.SdcSolverState.freeze_time_steps`).
+            *(defaults to* :py:class:`False` *)*
 
         Raises
         ------
         ValueError :
 
             * if given problem is not an :py:class:`.IInitialValueProblem`
+            * if a node executor is given for a problem, which is not thread-safe
             * if number of nodes per time step is not given; neither through ``num_nodes``, ``nodes_type`` nor
               ``integrator``
 
@@ -173,6 +206,31 @@ class ParallelSdc(IIterativeTimeSolver, IParallelSolver):
             assert_is_instance(kwargs['classic'], bool, descriptor="Classic Flag", checking_obj=self)
             self._classic = kwargs['classic']
 
+        if 'q_delta' in kwargs:
+            assert_is_instance(kwargs['q_delta'], (str, np.ndarray), descriptor="Q_Delta", checking_obj=self)
+            self._q_delta = kwargs['q_delta']
+
+        if 'node_executor' in kwargs:
+            if kwargs['node_executor'] is not None:
+                assert_is_instance(kwargs['node_executor'], Executor, descriptor="Node Executor", checking_obj=self)
+                assert_condition(problem.thread_safe, ValueError,
+                                 message="Problem is not thread-safe: %s" % problem.__class__.__name__,
+                                 checking_obj=self)
+            self._node_executor = kwargs['node_executor']
+
+        if 'accelerator' in kwargs:
+            assert_is_instance(kwargs['accelerator'], IAccelerator, descriptor="Accelerator", checking_obj=self)
+            self._accelerator = kwargs['accelerator']
+
+        if 'predictor' in kwargs:
+            assert_is_instance(kwargs['predictor'], IPredictor, descriptor="Predictor", checking_obj=self)
+            self._predictor = kwargs['predictor']
+
+        if 'freeze_time_steps' in kwargs:
+            assert_is_instance(kwargs['freeze_time_steps'], bool, descriptor="Freeze Time Steps Flag",
+                               checking_obj=self)
+            self._freeze_time_steps = kwargs['freeze_time_steps']
+
         # TODO: need to store the exact solution somewhere else
         self.__exact = np.zeros(self.num_time_steps * (self.__num_nodes - 1) + 1, dtype=np.object)
 
@@ -215,7 +273,8 @@ class ParallelSdc(IIterativeTimeSolver, IParallelSolver):
             _current_flag = Message.SolverFlag.none
 
             # receive dedicated message
-            _msg = self._communicator.receive()
+            with self.profiler.scope("communication wait"):
+                _msg = self._communicator.receive()
 
             if _msg.flag == Message.SolverFlag.failed:
                 # previous solver failed
@@ -238,7 +297,8 @@ class ParallelSdc(IIterativeTimeSolver, IParallelSolver):
                              Message.SolverFlag.time_adjusted]:
                         # we just started or finished our previous interval
                         # --> start a new interval
-                        _has_work = self._init_new_interval(_msg.time_point)
+                        with self.profiler.scope("interval setup"):
+                            _has_work = self._init_new_interval(_msg.time_point)
 
                         if _has_work:
                             # set initial values
@@ -322,9 +382,10 @@ class ParallelSdc(IIterativeTimeSolver, IParallelSolver):
                         LOG.warn("Solver failed.")
                         _current_flag = Message.SolverFlag.failed
 
-            self._communicator.send(value=self.state.current_iteration.final_step.solution.value,
-                                    time_point=self.state.current_iteration.final_step.time_point,
-                                    flag=_current_flag)
+            with self.profiler.scope("communication wait"):
+                self._communicator.send(value=self.state.current_iteration.final_step.solution.value,
+                                        time_point=self.state.current_iteration.final_step.time_point,
+                                        flag=_current_flag)
             __work_loop_count += 1
 
         # end while:has_work is None
@@ -332,6 +393,9 @@ class ParallelSdc(IIterativeTimeSolver, IParallelSolver):
 
         return [_s.solution for _s in self._states]
 
+    def _instrumented(self):
+        return super(ParallelSdc, self)._instrumented() + [self._communicator]
+
     @property
     def state(self):
         """Read-only accessor for the sovler's state
@@ -417,6 +481,9 @@ class ParallelSdc(IIterativeTimeSolver, IParallelSolver):
 
         self._init_new_state()
 
+        if self._accelerator is not None:
+            self._accelerator.reset()
+
         # set width of current interval
         self.state.delta_interval = self._dt
 
@@ -427,9 +494,10 @@ class ParallelSdc(IIterativeTimeSolver, IParallelSolver):
         self.__time_points['steps'] = np.linspace(start, start + self._dt, self.num_time_steps + 1)
 
         # initialize and transform integrator for time step width
-        self._integrator.init(self.__nodes_type, self.__num_nodes, self.__weights_type,
-                              interval=np.array([self.__time_points['steps'][0], self.__time_points['steps'][1]],
-                                                dtype=np.float))
+        with self.profiler.scope("integrator init"):
+            self._integrator.init(self.__nodes_type, self.__num_nodes, self.__weights_type,
+                                  interval=np.array([self.__time_points['steps'][0], self.__time_points['steps'][1]],
+                                                    dtype=np.float))
 
         self.__time_points['nodes'] = np.zeros((self.num_time_steps, self.num_nodes), dtype=np.float)
         _deltas_n = np.zeros(self.num_time_steps * (self.num_nodes - 1) + 1)
@@ -458,25 +526,40 @@ class ParallelSdc(IIterativeTimeSolver, IParallelSolver):
         _iter_timer = self.timer.__class__()
 
         self._print_iteration(self.state.current_iteration_index + 1)
+        self.metrics.increment('iterations', interval=len(self._states) - 1)
 
         # iterate on time steps
         _iter_timer.start()
-        for _current_time_step in self.state.current_iteration:
-            # run this time step
-            self._time_step()
-            if self.state.current_time_step_index < len(self.state.current_iteration) - 1:
-                self.state.current_iteration.proceed()
+        with self.profiler.scope("iteration"):
+            for _current_time_step in self.state.current_iteration:
+                # run this time step
+                with self.profiler.scope("time step"):
+                    if self.state.is_time_step_frozen(self.state.current_time_step_index):
+                        self._frozen_time_step()
+                    elif self.state.is_first_iteration and self._predictor is not None:
+                        self._predict_time_step()
+                    else:
+                        self._time_step()
+                if self.state.current_time_step_index < len(self.state.current_iteration) - 1:
+                    self.state.current_iteration.proceed()
         _iter_timer.stop()
 
         # check termination criteria
         self.threshold.check(self.state)
 
+        if self._freeze_time_steps:
+            # track convergence of the time steps swept over
+            for _time_step_index in range(self.state.num_frozen_time_steps, self.num_time_steps):
+                self.state.record_time_step_convergence(_time_step_index)
+            self.state.freeze_time_steps(min_residual=self.threshold.min_residual,
+                                         min_solution_reduction=self.threshold.min_solution_reduction)
+
         # log this iteration's summary
-        if self.state.is_first_iteration:
-            # on first iteration we do not have comparison values
-            self._print_iteration_end(None, None, None, _iter_timer.past())
-        else:
-            if problem_has_exact_solution(self.problem, self) and not self.state.is_first_iteration:
+        if self._logs_progress:
+            if self.state.is_first_iteration:
+                # on first iteration we do not have comparison values
+                self._print_iteration_end(None, None, None, _iter_timer.past())
+            elif problem_has_exact_solution(self.problem, self):
                 # we could compute the correct error of our current solution
                 self._print_iteration_end(self.state.solution.solution_reduction(self.state.current_iteration_index),
                                           self.state.solution.error_reduction(self.state.current_iteration_index),
@@ -489,7 +572,8 @@ class ParallelSdc(IIterativeTimeSolver, IParallelSolver):
                                           _iter_timer.past())
 
         # finalize this iteration (i.e. TrajectorySolutionData.finalize())
-        self.state.current_iteration.finalize()
+        with self.profiler.scope("state finalize"):
+            self.state.current_iteration.finalize()
 
         _reason = self.threshold.has_reached()
         if _reason is None:
@@ -497,14 +581,16 @@ class ParallelSdc(IIterativeTimeSolver, IParallelSolver):
             return Message.SolverFlag.iterating
         elif _reason == ['iterations']:
             # LOG.debug("solver main loop done: iterations")
-            self.state.finalize()
+            with self.profiler.scope("state finalize"):
+                self.state.finalize()
             return Message.SolverFlag.finished
         else:
             # LOG.debug("solver main loop done: other")
-            self.state.finalize()
+            with self.profiler.scope("state finalize"):
+                self.state.finalize()
             return Message.SolverFlag.converged
 
-    def _time_step(self):
+    def _init_time_step(self):
         self.state.current_time_step.delta_time_step = self._deltas['t']
         for _step in range(0, len(self.state.current_time_step)):
             _node_index = self.state.current_time_step_index * (self.num_nodes - 1) + _step
@@ -517,14 +603,18 @@ class ParallelSdc(IIterativeTimeSolver, IParallelSolver):
                               self.state.current_time_step.last.time_point,
                               self.state.current_time_step.delta_time_step)
 
+    def _time_step(self):
+        self._init_time_step()
+
         # for classic SDC compute integral
         _integral = 0.0
         _integrate_values = None
         if self.classic:
             if not self.state.current_time_step.initial.rhs_evaluated:
-                self.state.current_time_step.initial.rhs = \
-                    self.problem.evaluate_wrt_time(self.state.current_time_step.initial.time_point,
-                                                   self.state.current_time_step.initial.value)
+                with self.profiler.scope("rhs evaluation"):
+                    self.state.current_time_step.initial.rhs = \
+                        self.problem.evaluate_wrt_time(self.state.current_time_step.initial.time_point,
+                                                       self.state.current_time_step.initial.value)
 
             _integrate_values = np.array([self.state.current_time_step.initial.rhs], dtype=self.problem.numeric_type)
             for _step_index in range(0, len(self.state.current_time_step)):
@@ -536,7 +626,8 @@ class ParallelSdc(IIterativeTimeSolver, IParallelSolver):
                 else:
                     _step = self.state.previous_iteration[self.state.current_time_step_index][_step_index]
                     if not _step.rhs_evaluated:
-                        _step.rhs = self.problem.evaluate_wrt_time(_step.time_point, _step.value)
+                        with self.profiler.scope("rhs evaluation"):
+                            _step.rhs = self.problem.evaluate_wrt_time(_step.time_point, _step.value)
                     _integrate_values = \
                         np.append(_integrate_values,
                                   np.array([_step.rhs], dtype=self.problem.numeric_type),
@@ -549,31 +640,124 @@ class ParallelSdc(IIterativeTimeSolver, IParallelSolver):
 
         _full_integral = 0.0
 
-        # do the actual SDC steps of this SDC sweep
-        for _step_index in range(0, len(self.state.current_time_step)):
-            _current_step = self.state.current_time_step[_step_index]
-            if self.classic:
+        if getattr(self._core, 'node_parallel', False):
+            assert_condition(self.classic,
+                             ValueError, message="Node-parallel sweeps require the classic SDC.",
+                             checking_obj=self)
+            with self.profiler.scope("integral"):
+                for _step_index in range(0, len(self.state.current_time_step)):
+                    _integral = self._integrator.evaluate(_integrate_values,
+                                                          from_node=_step_index, target_node=_step_index + 1)
+                    _full_integral += _integral
+                    self.state.current_time_step[_step_index].integral = _integral.copy()
+            # all nodes of this sweep are independent of each other
+            with self.profiler.scope("sweep"):
+                self._node_parallel_sweep()
+        else:
+            # do the actual SDC steps of this SDC sweep
+            for _step_index in range(0, len(self.state.current_time_step)):
+                _current_step = self.state.current_time_step[_step_index]
+                if self.classic:
+                    with self.profiler.scope("integral"):
+                        _integral = self._integrator.evaluate(_integrate_values,
+                                                              from_node=_step_index, target_node=_step_index + 1)
+                    # we successively compute the full integral, which is used for the residual at the end
+                    _full_integral += _integral
+                _current_step.integral = _integral.copy()
+                # do the SDC step of this sweep
+                with self.profiler.scope("sweep"):
+                    self._sdc_step()
+                if self.state.current_step_index < len(self.state.current_time_step) - 1:
+                    self.state.current_time_step.proceed()
+
+        if self._accelerator is not None:
+            with self.profiler.scope("acceleration"):
+                self._accelerate()
+
+        del _integrate_values
+
+        self._finalize_time_step(_full_integral)
+
+    def _predict_time_step(self):
+        self._init_time_step()
+
+        _time_step = self.state.current_time_step
+        _previous_time_points, _previous_values = self._previous_solution()
+        _predicted = self._predictor.predict(self.problem, _time_step.initial.value, _time_step.initial.time_point,
+                                             self.__time_points['nodes'][self.state.current_time_step_index][1:],
+                                             previous_time_points=_previous_time_points,
+                                             previous_values=_previous_values)
+        for _step_index in range(0, len(_time_step)):
+            _time_step[_step_index].value = _predicted[_step_index]
+        self._compute_errors()
+
+        # integral of the prediction's right hand side for the residual
+        _full_integral = 0.0
+        if self.classic:
+            if not _time_step.initial.rhs_evaluated:
+                _time_step.initial.rhs = self.problem.evaluate_wrt_time(_time_step.initial.time_point,
+                                                                        _time_step.initial.value)
+            for _step in _time_step:
+                _step.rhs = self.problem.evaluate_wrt_time(_step.time_point, _step.value)
+            _integrate_values = np.array([_time_step.initial.rhs] + [_step.rhs for _step in _time_step],
+                                         dtype=self.problem.numeric_type)
+            for _step_index in range(0, len(_time_step)):
                 _integral = self._integrator.evaluate(_integrate_values,
                                                       from_node=_step_index, target_node=_step_index + 1)
-                # we successively compute the full integral, which is used for the residual at the end
                 _full_integral += _integral
-            _current_step.integral = _integral.copy()
-            # do the SDC step of this sweep
-            self._sdc_step()
-            if self.state.current_step_index < len(self.state.current_time_step) - 1:
-                self.state.current_time_step.proceed()
+                _time_step[_step_index].integral = _integral.copy()
+            del _integrate_values
+
+        self._finalize_time_step(_full_integral)
+
+    def _frozen_time_step(self):
+        self._init_time_step()
+
+        # take over the converged values of the previous iteration without sweeping
+        _previous_time_step = self.state.previous_iteration[self.state.current_time_step_index]
+        _time_step = self.state.current_time_step
+        for _step_index in range(0, len(_time_step)):
+            _step = _time_step[_step_index]
+            _previous_step = _previous_time_step[_step_index]
+            _step.value = _previous_step.value.copy()
+            if _previous_step.rhs_evaluated:
+                _step.rhs = _previous_step.rhs
+            _step.solution.residual = _previous_step.solution.residual
+            if _previous_step.solution.error is not None:
+                _step.solution.error = _previous_step.solution.error
+            _step.done()
 
-        del _integrate_values
+        self._print_time_step_end()
 
+        # finalizing the current time step (i.e. TrajectorySolutionData.finalize)
+        self.state.current_time_step.finalize()
+
+    def _previous_solution(self):
+        # node values of the time step preceding the current one; either of this iteration or the previous interval
+        if self.state.current_time_step_index > 0:
+            _time_step = self.state.current_iteration[self.state.current_time_step_index - 1]
+        elif len(self._states) > 1 and self._states[-2].last_iteration is not None:
+            _time_step = self._states[-2].last_iteration.last_time_step
+        else:
+            return None, None
+        return (np.array([_time_step.initial.time_point] + [_step.time_point for _step in _time_step], dtype=np.float),
+                np.array([_time_step.initial.value] + [_step.value for _step in _time_step],
+                         dtype=self.problem.numeric_type))
+
+    def _finalize_time_step(self, full_integral):
         # compute residual and print step details
         for _step_index in range(0, len(self.state.current_time_step)):
             _step = self.state.current_time_step[_step_index]
 
-            self._core.compute_residual(self.state, step=_step, integral=_full_integral)
+            with self.profiler.scope("residual"):
+                self._core.compute_residual(self.state, step=_step, integral=full_integral)
 
             # finalize this step (i.e. StepSolutionData.finalize())
             _step.done()
 
+            if not self._logs_progress:
+                continue
+
             if _step_index > 0:
                 _previous_time = self.state.current_time_step[_step_index - 1].time_point
             else:
@@ -597,7 +781,8 @@ class ParallelSdc(IIterativeTimeSolver, IParallelSolver):
         self._print_time_step_end()
 
         # finalizing the current time step (i.e. TrajectorySolutionData.finalize)
-        self.state.current_time_step.finalize()
+        with self.profiler.scope("state finalize"):
+            self.state.current_time_step.finalize()
 
     def _sdc_step(self):
         # helper variables
@@ -660,13 +845,49 @@ class ParallelSdc(IIterativeTimeSolver, IParallelSolver):
         # # END if not self.classic
 
         # compute step
-        self._core.run(self.state, problem=self.problem)
+        self._core.run(self.state, problem=self.problem,
+                       q_delta=self._integrator.q_delta(self._q_delta) if self._q_delta is not None else None)
 
         # calculate error
         self._core.compute_error(self.state, problem=self.problem)
 
         # step gets finalized after computation of residual
 
+    def _node_parallel_sweep(self):
+        # compute all nodes of the current time step at once
+        self._core.sweep(self.state, problem=self.problem,
+                         q_delta=self._integrator.diagonal_q_delta(self._q_delta
+                                                                   if self._q_delta is not None else 'diag'),
+                         executor=self._node_executor)
+
+        self._compute_errors()
+
+    def _accelerate(self):
+        _time_step = self.state.current_time_step
+        if self.state.is_first_iteration:
+            _previous = np.array([self.state.initial.value for _step in _time_step], dtype=self.problem.numeric_type)
+        else:
+            _previous = np.array([_step.value
+                                  for _step in self.state.previous_iteration[self.state.current_time_step_index]],
+                                 dtype=self.problem.numeric_type)
+        _current = np.array([_step.value for _step in _time_step], dtype=self.problem.numeric_type)
+
+        _accelerated = self._accelerator.accelerate(_previous, _current, key=self.state.current_time_step_index)
+
+        # replace the sweep's result and recalculate errors
+        for _step_index in range(0, len(_time_step)):
+            _time_step[_step_index].value = _accelerated[_step_index]
+        self._compute_errors()
+
+    def _compute_errors(self):
+        # calculate errors of all steps of the current time step
+        _time_step = self.state.current_time_step
+        _time_step.reset_to_start()
+        for _step_index in range(0, len(_time_step)):
+            self._core.compute_error(self.state, problem=self.problem)
+            if self.state.current_step_index < len(_time_step) - 1:
+                _time_step.proceed()
+
     def print_lines_for_log(self):
         _lines = super(ParallelSdc, self).print_lines_for_log()
         if 'Number Nodes per Time Step' not in _lines['Integrator']:
@@ -676,6 +897,8 @@ class ParallelSdc(IIterativeTimeSolver, IParallelSolver):
         return _lines
 
     def _print_interval_header(self):
+        if not self._logs_progress:
+            return
         LOG.info("%s%s" % (VERBOSITY_LVL1, SEPARATOR_LVL3))
         LOG.info("{}  Interval: [{:.3f}, {:.3f}]"
                  .format(VERBOSITY_LVL1, self.state.initial.time_point, self.state.initial.time_point + self._dt))
@@ -691,11 +914,15 @@ class ParallelSdc(IIterativeTimeSolver, IParallelSolver):
         LOG.info("%s         \\_   sol r.red    err r.red      resid       time" % VERBOSITY_LVL1)
 
     def _print_iteration(self, _iter):
+        if not self._logs_progress:
+            return
         _iter = self._output_format(_iter, 'int', width=5)
         LOG.info("%s   %s" % (VERBOSITY_LVL1, _iter))
         LOG.info("%s        \\" % VERBOSITY_LVL2)
 
     def _print_iteration_end(self, solred, errred, resid, time):
+        if not self._logs_progress:
+            return
         _solred = self._output_format(solred, 'exp')
         _errred = self._output_format(errred, 'exp')
         _resid = self._output_format(resid, 'exp')
@@ -703,6 +930,8 @@ class ParallelSdc(IIterativeTimeSolver, IParallelSolver):
         LOG.info("%s         \\_   %s    %s    %s    %s" % (VERBOSITY_LVL1, _solred, _errred, _resid, _time))
 
     def _print_time_step(self, time_step, start, end, delta):
+        if not self._logs_progress:
+            return
         _time_step = self._output_format(time_step, 'int', width=3)
         _start = self._output_format(start, 'float', width=6.3)
         _end = self._output_format(end, 'float', width=6.3)
@@ -714,9 +943,13 @@ class ParallelSdc(IIterativeTimeSolver, IParallelSolver):
                          None, None)
 
     def _print_time_step_end(self):
+        if not self._logs_progress:
+            return
         LOG.info("%s         |      \\_" % VERBOSITY_LVL2)
 
     def _print_step(self, step, t0, t1, phi, resid, err):
+        if not self._logs_progress:
+            return
         _step = self._output_format(step, 'int', width=2)
         _t0 = self._output_format(t0, 'float', width=6.3)
         _t1 = self._output_format(t1, 'float', width=6.3)
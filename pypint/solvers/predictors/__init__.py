@@ -0,0 +1,13 @@
+# coding=utf-8
+"""Predictors for the initial node values of iterative time solvers
+
+.. moduleauthor:: Torbjörn Klatt <t.klatt@fz-juelich.de>
+"""
+from pypint.solvers.predictors.i_predictor import IPredictor
+from pypint.solvers.predictors.spread_predictor import SpreadPredictor
+from pypint.solvers.predictors.euler_predictors import ExplicitEulerPredictor, ImplicitEulerPredictor
+from pypint.solvers.predictors.coarse_predictor import CoarsePredictor
+from pypint.solvers.predictors.extrapolation_predictor import ExtrapolationPredictor
+
+__all__ = ['IPredictor', 'SpreadPredictor', 'ExplicitEulerPredictor', 'ImplicitEulerPredictor', 'CoarsePredictor',
+           'ExtrapolationPredictor']
@@ -0,0 +1,84 @@
+# coding=utf-8
+"""
+
+.. moduleauthor:: Torbjörn Klatt <t.klatt@fz-juelich.de>
+"""
+import numpy as np
+
+from pypint.solvers.predictors.i_predictor import IPredictor
+from pypint.solvers.predictors.euler_predictors import ImplicitEulerPredictor
+from pypint.integrators.node_providers.gauss_lobatto_nodes import GaussLobattoNodes
+from pypint.utilities import assert_is_instance, assert_condition
+
+
+class CoarsePredictor(IPredictor):
+    """Prediction on a coarser set of nodes
+
+    The time step is predicted on ``num_nodes`` Gauss-Lobatto nodes with another predictor and the result is
+    interpolated to the nodes of the time step.
+    """
+
+    def __init__(self, **kwargs):
+        """
+        Parameters
+        ----------
+        num_nodes : :py:class:`int`
+            *(optional)*
+            number of coarse Gauss-Lobatto nodes including the start of the time step
+            *(defaults to 2)*
+        predictor : :py:class:`.IPredictor`
+            *(optional)*
+            predictor used on the coarse nodes
+            *(defaults to* :py:class:`.ImplicitEulerPredictor` *)*
+
+        Raises
+        ------
+        ValueError
+            if ``num_nodes`` is less than 2
+        """
+        super(CoarsePredictor, self).__init__(**kwargs)
+        self._num_nodes = kwargs.get('num_nodes', 2)
+        self._predictor = kwargs.get('predictor', ImplicitEulerPredictor())
+        assert_is_instance(self._num_nodes, int, descriptor="Number of Coarse Nodes", checking_obj=self)
+        assert_condition(self._num_nodes >= 2,
+                         ValueError, message="At least two coarse nodes required: NOT {:d}".format(self._num_nodes),
+                         checking_obj=self)
+        assert_is_instance(self._predictor, IPredictor, descriptor="Coarse Predictor", checking_obj=self)
+
+    def predict(self, problem, initial_value, initial_time, time_points, **kwargs):
+        """
+        See Also
+        --------
+        :py:meth:`.IPredictor.predict` : overridden method
+        """
+        super(CoarsePredictor, self).predict(problem, initial_value, initial_time, time_points, **kwargs)
+        _nodes = GaussLobattoNodes()
+        _nodes.init(self._num_nodes, interval=np.array([initial_time, time_points[-1]]))
+        _coarse_values = self._predictor.predict(problem, initial_value, initial_time, _nodes.nodes[1:], **kwargs)
+        return self._interpolate(_nodes.nodes, np.concatenate(([initial_value], _coarse_values)), time_points)
+
+    @property
+    def num_nodes(self):
+        """Read-only accessor for the number of coarse nodes
+
+        Returns
+        -------
+        num_nodes : :py:class:`int`
+        """
+        return self._num_nodes
+
+    @property
+    def predictor(self):
+        """Read-only accessor for the predictor used on the coarse nodes
+
+        Returns
+        -------
+        predictor : :py:class:`.IPredictor`
+        """
+        return self._predictor
+
+    def __str__(self):
+        return "{}(num_nodes={:d}, predictor={})".format(self.__class__.__name__, self._num_nodes, self._predictor)
+
+
+__all__ = ['CoarsePredictor']
@@ -0,0 +1,78 @@
+# coding=utf-8
+"""
+
+.. moduleauthor:: Torbjörn Klatt <t.klatt@fz-juelich.de>
+"""
+from pypint.solvers.predictors.i_predictor import IPredictor
+
+
+class ExplicitEulerPredictor(IPredictor):
+    """Explicit Euler from node to node
+
+    .. math::
+
+        u_{m+1} = u_m + \\Delta_\\tau F(t_m, u_m)
+    """
+
+    def __init__(self, **kwargs):
+        super(ExplicitEulerPredictor, self).__init__(**kwargs)
+
+    def predict(self, problem, initial_value, initial_time, time_points, **kwargs):
+        """
+        See Also
+        --------
+        :py:meth:`.IPredictor.predict` : overridden method
+        """
+        _values = super(ExplicitEulerPredictor, self).predict(problem, initial_value, initial_time, time_points,
+                                                              **kwargs)
+        _previous_time = initial_time
+        _previous_value = initial_value
+        for _index in range(0, time_points.size):
+            _values[_index] = \
+                _previous_value \
+                + (time_points[_index] - _previous_time) * problem.evaluate_wrt_time(_previous_time, _previous_value)
+            _previous_time = float(time_points[_index])
+            _previous_value = _values[_index]
+        return _values
+
+
+class ImplicitEulerPredictor(IPredictor):
+    """Implicit Euler from node to node
+
+    .. math::
+
+        u_{m+1} - \\Delta_\\tau F(t_{m+1}, u_{m+1}) = u_m
+    """
+
+    def __init__(self, **kwargs):
+        super(ImplicitEulerPredictor, self).__init__(**kwargs)
+
+    def predict(self, problem, initial_value, initial_time, time_points, **kwargs):
+        """
+        See Also
+        --------
+        :py:meth:`.IPredictor.predict` : overridden method
+        """
+        _values = super(ImplicitEulerPredictor, self).predict(problem, initial_value, initial_time, time_points,
+                                                              **kwargs)
+        _previous_time = initial_time
+        _previous_value = initial_value
+        for _index in range(0, time_points.size):
+            _time_point = float(time_points[_index])
+            _delta_tau = _time_point - _previous_time
+            _expl_term = _previous_value.reshape(-1)
+            _func = lambda x_next: \
+                _expl_term \
+                + _delta_tau * problem.evaluate_wrt_time(_time_point,
+                                                         x_next.reshape(problem.dim_for_time_solver)).reshape(-1) \
+                - x_next
+            _values[_index] = problem.implicit_solve(_previous_value.reshape(-1), _func,
+                                                     expl_term=_expl_term,
+                                                     time_level=0,
+                                                     delta_time=_delta_tau).reshape(_previous_value.shape)
+            _previous_time = _time_point
+            _previous_value = _values[_index]
+        return _values
+
+
+__all__ = ['ExplicitEulerPredictor', 'ImplicitEulerPredictor']
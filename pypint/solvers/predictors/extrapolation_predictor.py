@@ -0,0 +1,66 @@
+# coding=utf-8
+"""
+
+.. moduleauthor:: Torbjörn Klatt <t.klatt@fz-juelich.de>
+"""
+import numpy as np
+
+from pypint.solvers.predictors.i_predictor import IPredictor
+from pypint.solvers.predictors.spread_predictor import SpreadPredictor
+from pypint.utilities import assert_is_instance
+
+
+class ExtrapolationPredictor(IPredictor):
+    """Extrapolation of the previous interval's solution
+
+    The collocation polynomial of the last time step of the previous interval is evaluated at the new nodes and
+    shifted to match the new initial value.
+    Without a previous solution (i.e. on the first interval), the fallback predictor is used.
+    """
+
+    def __init__(self, **kwargs):
+        """
+        Parameters
+        ----------
+        fallback : :py:class:`.IPredictor`
+            *(optional)*
+            predictor used if there is no previous solution
+            *(defaults to* :py:class:`.SpreadPredictor` *)*
+        """
+        super(ExtrapolationPredictor, self).__init__(**kwargs)
+        self._fallback = kwargs.get('fallback', SpreadPredictor())
+        assert_is_instance(self._fallback, IPredictor, descriptor="Fallback Predictor", checking_obj=self)
+
+    def predict(self, problem, initial_value, initial_time, time_points, **kwargs):
+        """
+        See Also
+        --------
+        :py:meth:`.IPredictor.predict` : overridden method
+        """
+        super(ExtrapolationPredictor, self).predict(problem, initial_value, initial_time, time_points, **kwargs)
+        _previous_time_points = kwargs.get('previous_time_points')
+        _previous_values = kwargs.get('previous_values')
+        if _previous_time_points is None or _previous_values is None:
+            return self._fallback.predict(problem, initial_value, initial_time, time_points, **kwargs)
+
+        assert_is_instance(_previous_time_points, np.ndarray, descriptor="Previous Time Points", checking_obj=self)
+        assert_is_instance(_previous_values, np.ndarray, descriptor="Previous Values", checking_obj=self)
+        _base_points = np.concatenate(([initial_time], time_points))
+        _extrapolated = self._interpolate(_previous_time_points, _previous_values, _base_points)
+        return _extrapolated[1:] + (initial_value - _extrapolated[0])
+
+    @property
+    def fallback(self):
+        """Read-only accessor for the predictor used if there is no previous solution
+
+        Returns
+        -------
+        fallback : :py:class:`.IPredictor`
+        """
+        return self._fallback
+
+    def __str__(self):
+        return "{}(fallback={})".format(self.__class__.__name__, self._fallback)
+
+
+__all__ = ['ExtrapolationPredictor']
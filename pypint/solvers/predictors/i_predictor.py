@@ -0,0 +1,67 @@
+# coding=utf-8
+"""
+
+.. moduleauthor:: Torbjörn Klatt <t.klatt@fz-juelich.de>
+"""
+import numpy as np
+
+from pypint.problems import IProblem
+from pypint.utilities import assert_is_instance
+from pypint.utilities.math import lagrange_polynome
+
+
+class IPredictor(object):
+    """Interface for predictors of the initial node values of an iterative time solver
+
+    A predictor computes the node values of a time step before the first sweep.
+    The first sweep then starts from these values instead of the initial value spread to all nodes.
+    """
+
+    def __init__(self, **kwargs):
+        pass
+
+    def predict(self, problem, initial_value, initial_time, time_points, **kwargs):
+        """Predicts the values at the given nodes of a time step
+
+        Parameters
+        ----------
+        problem : :py:class:`.IProblem`
+            problem to predict the values for
+        initial_value : :py:class:`numpy.ndarray`
+            value at the start of the time step
+        initial_time : :py:class:`float`
+            start of the time step
+        time_points : :py:class:`numpy.ndarray`
+            time points of the nodes to predict the values for (i.e. without the start of the time step)
+        previous_time_points : :py:class:`numpy.ndarray` or :py:class:`None`
+            *(optional)*
+            time points of the nodes of the previous interval's last time step (including its start)
+        previous_values : :py:class:`numpy.ndarray` or :py:class:`None`
+            *(optional)*
+            final values at ``previous_time_points``
+
+        Returns
+        -------
+        values : :py:class:`numpy.ndarray`
+            predicted values; one for each of the given ``time_points``
+        """
+        assert_is_instance(problem, IProblem, descriptor="Problem", checking_obj=self)
+        assert_is_instance(initial_value, np.ndarray, descriptor="Initial Value", checking_obj=self)
+        assert_is_instance(time_points, np.ndarray, descriptor="Time Points", checking_obj=self)
+        return np.array([initial_value for _t in time_points], dtype=problem.numeric_type)
+
+    @staticmethod
+    def _interpolate(base_points, base_values, points):
+        # Lagrange interpolation of the values on base points to the given points
+        _values = np.zeros((points.size,) + base_values.shape[1:], dtype=base_values.dtype)
+        for _index in range(0, points.size):
+            for _base_index in range(0, base_points.size):
+                _values[_index] += \
+                    lagrange_polynome(_base_index, base_points, points[_index]) * base_values[_base_index]
+        return _values
+
+    def __str__(self):
+        return "{}()".format(self.__class__.__name__)
+
+
+__all__ = ['IPredictor']
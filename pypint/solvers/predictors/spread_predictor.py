@@ -0,0 +1,27 @@
+# coding=utf-8
+"""
+
+.. moduleauthor:: Torbjörn Klatt <t.klatt@fz-juelich.de>
+"""
+from pypint.solvers.predictors.i_predictor import IPredictor
+
+
+class SpreadPredictor(IPredictor):
+    """Spreads the initial value to all nodes
+
+    This is the classic initial guess of SDC.
+    """
+
+    def __init__(self, **kwargs):
+        super(SpreadPredictor, self).__init__(**kwargs)
+
+    def predict(self, problem, initial_value, initial_time, time_points, **kwargs):
+        """
+        See Also
+        --------
+        :py:meth:`.IPredictor.predict` : overridden method
+        """
+        return super(SpreadPredictor, self).predict(problem, initial_value, initial_time, time_points, **kwargs)
+
+
+__all__ = ['SpreadPredictor']
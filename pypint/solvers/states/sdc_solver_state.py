@@ -6,6 +6,8 @@
 from pypint.solvers.states.i_solver_state import IStepState, ITimeStepState, IIterationState, ISolverState
 from pypint.solutions.iterative_solution import IterativeSolution
 from pypint.solutions.data_storage import TrajectorySolutionData
+from pypint.solvers.diagnosis.norms import supremum_norm
+from pypint.utilities import assert_condition
 
 
 class SdcStepState(IStepState):
@@ -71,6 +73,12 @@ class SdcIterationState(IIterationState):
 
 class SdcSolverState(ISolverState):
     """Solver States for SDC Solver
+
+    Besides the iterations, the convergence of each time step of the interval is tracked separately.
+    Leading time steps, which have converged, can be frozen, i.e. solvers do not need to sweep over them anymore.
+    As the initial value of a time step is the last value of its predecessor, only a time step following a frozen one
+    can be frozen (sliding window).
+    The last time step is never frozen as it determines the convergence of the whole interval.
     """
     def __init__(self, **kwargs):
         """
@@ -86,6 +94,114 @@ class SdcSolverState(ISolverState):
         kwargs['element_type'] = SdcIterationState
         super(SdcSolverState, self).__init__(**kwargs)
         self._initial_state = SdcStepState()
+        self._time_step_residuals = [[] for _t in range(0, self.num_time_steps)]
+        self._time_step_reductions = [[] for _t in range(0, self.num_time_steps)]
+        self._num_frozen_time_steps = 0
+
+    def record_time_step_convergence(self, time_step_index):
+        """Records residual and solution reduction of a time step of the current iteration
+
+        Both are taken from the last step of the time step.
+        The solution reduction is computed the same way as :py:meth:`.ThresholdCheck.compute_reduction` does for the
+        whole interval and is :py:class:`None` for the first iteration.
+
+        Parameters
+        ----------
+        time_step_index : :py:class:`int`
+        """
+        _last_step = self.current_iteration[time_step_index].last_step
+        self._time_step_residuals[time_step_index].append(supremum_norm(_last_step.solution.residual))
+        if self.previous_iteration is not None:
+            _previous = supremum_norm(self.previous_iteration[time_step_index].last_step.value)
+            _current = supremum_norm(_last_step.value)
+            self._time_step_reductions[time_step_index].append(abs((_previous - _current) / _previous * 100))
+        else:
+            self._time_step_reductions[time_step_index].append(None)
+
+    def time_step_residuals(self, time_step_index):
+        """Residuals of a time step recorded so far
+
+        Parameters
+        ----------
+        time_step_index : :py:class:`int`
+
+        Returns
+        -------
+        residuals : :py:class:`list` of :py:class:`float`
+            one for each iteration the time step was not frozen in
+        """
+        return self._time_step_residuals[time_step_index]
+
+    def time_step_reductions(self, time_step_index):
+        """Solution reductions of a time step recorded so far
+
+        Parameters
+        ----------
+        time_step_index : :py:class:`int`
+
+        Returns
+        -------
+        reductions : :py:class:`list` of :py:class:`float`
+            one for each iteration the time step was not frozen in; :py:class:`None` for the first iteration
+        """
+        return self._time_step_reductions[time_step_index]
+
+    def freeze_time_steps(self, min_residual=None, min_solution_reduction=None):
+        """Freezes the leading time steps, which have converged
+
+        A time step has converged if its last recorded residual or solution reduction is below the given threshold.
+
+        Parameters
+        ----------
+        min_residual : :py:class:`float` or :py:class:`None`
+            *(optional)*
+            residual threshold; not checked if not given
+        min_solution_reduction : :py:class:`float` or :py:class:`None`
+            *(optional)*
+            solution reduction threshold; not checked if not given
+
+        Returns
+        -------
+        num_frozen_time_steps : :py:class:`int`
+            number of frozen time steps after the update
+        """
+        while self._num_frozen_time_steps < self.num_time_steps - 1:
+            _index = self._num_frozen_time_steps
+            assert_condition(len(self._time_step_residuals[_index]) > 0,
+                             RuntimeError, message="Convergence of time step {:d} not recorded yet.".format(_index),
+                             checking_obj=self)
+            _residual = self._time_step_residuals[_index][-1]
+            _reduction = self._time_step_reductions[_index][-1]
+            if (min_residual is not None and _residual <= min_residual) \
+                    or (min_solution_reduction is not None and _reduction is not None
+                        and _reduction <= min_solution_reduction):
+                self._num_frozen_time_steps += 1
+            else:
+                break
+        return self._num_frozen_time_steps
+
+    def is_time_step_frozen(self, time_step_index):
+        """Checks whether a time step is frozen
+
+        Parameters
+        ----------
+        time_step_index : :py:class:`int`
+
+        Returns
+        -------
+        is_frozen : :py:class:`bool`
+        """
+        return time_step_index < self._num_frozen_time_steps
+
+    @property
+    def num_frozen_time_steps(self):
+        """Read-only accessor for the number of leading time steps, which are frozen
+
+        Returns
+        -------
+        num_frozen_time_steps : :py:class:`int`
+        """
+        return self._num_frozen_time_steps
 
 
 __all__ = ['SdcStepState', 'SdcTimeStepState', 'SdcIterationState', 'SdcSolverState']
@@ -3,11 +3,12 @@
 
 .. moduleauthor:: Torbjörn Klatt <t.klatt@fz-juelich.de>
 """
-from logbook import Logger, StreamHandler, FileHandler
+from logbook import Logger, Handler, StreamHandler, FileHandler, INFO
 from logbook.more import ColorizedStderrHandler
 from sys import stdout
 from datetime import datetime
 from collections import OrderedDict
+from itertools import chain
 import inspect
 import numpy
 
@@ -55,6 +56,44 @@ SEPARATOR_LVL2 = '-' * 80
 SEPARATOR_LVL3 = '.' * 80
 
 
+def is_logging(level=INFO):
+    """Whether messages of the given level reach any handler of :py:data:`.LOG`
+
+    Code emitting many messages, e.g. the progress of the solvers' sweeps, checks this up front and skips the
+    formatting of the messages and the computation of their values if they would be discarded anyway.
+
+    Parameters
+    ----------
+    level : :py:class:`int`
+        *(optional)*
+        one of logbook's levels; defaults to ``INFO``
+
+    Returns
+    -------
+    is_logging : :py:class:`bool`
+        :py:class:`False` if :py:data:`.LOG` is silenced (see :py:func:`.silence`), its level is above the given one
+        or the first handler interested in the level is a black hole (e.g. a :py:class:`logbook.NullHandler`)
+    """
+    if LOG.disabled or level < LOG.level:
+        return False
+    for _handler in chain(LOG.handlers, Handler.stack_manager.iter_context_objects()):
+        if level >= _handler.level:
+            return not _handler.blackhole
+    return False
+
+
+def silence(silent=True):
+    """Switches all messages of :py:data:`.LOG` off (or on again)
+
+    Parameters
+    ----------
+    silent : :py:class:`bool`
+        *(optional)*
+        defaults to :py:class:`True`
+    """
+    LOG.disabled = silent
+
+
 def print_logging_message_tree(messages):
     for _key1, _value1 in messages.items():
         if isinstance(_value1, (dict, OrderedDict)):
@@ -102,5 +141,5 @@ __all__ = [
     'LOG',
     'VERBOSITY_LVL1', 'VERBOSITY_LVL2', 'VERBOSITY_LVL3',
     'SEPARATOR_LVL1', 'SEPARATOR_LVL2', 'SEPARATOR_LVL3',
-    'this_got_called', 'print_logging_message_tree'
+    'this_got_called', 'print_logging_message_tree', 'is_logging', 'silence'
 ]
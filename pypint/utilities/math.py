@@ -3,6 +3,7 @@
 
 .. moduleauthor:: Torbjörn Klatt <t.klatt@fz-juelich.de>
 """
+import numpy as np
 
 
 def lagrange_polynome(j, base_points, x):
@@ -36,3 +37,49 @@ def lagrange_polynome(j, base_points, x):
         if m != j:
             _val *= (x - base_points[m]) / (base_points[j] - base_points[m])
     return _val
+
+
+def phi_functions(z, order):
+    """Evaluates the :math:`\\varphi`-functions of exponential integrators up to the given order
+
+    .. math::
+
+        \\varphi_0(z) = e^z, \\quad \\varphi_{k+1}(z) = \\frac{\\varphi_k(z) - \\frac{1}{k!}}{z}
+            = \\sum_{j=0}^\\infty \\frac{z^j}{(j+k+1)!}
+
+    The recurrence cancels catastrophically for small :math:`|z|`, thus there the Taylor series is summed instead.
+
+    Parameters
+    ----------
+    z : :py:class:`float`, :py:class:`complex` or :py:class:`numpy.ndarray`
+        arguments, e.g. the eigenvalues of a linear operator times the step width
+    order : :py:class:`int`
+        highest :math:`k`
+
+    Returns
+    -------
+    phis : :py:class:`list` of :py:class:`numpy.ndarray`
+        :math:`\\varphi_0(z), \\dots, \\varphi_{order}(z)` each of the shape of ``z``
+
+    Examples
+    --------
+    >>> [float(phi) for phi in phi_functions(0.0, 2)]
+    [1.0, 1.0, 0.5]
+    """
+    _z = np.asarray(z)
+    _small = np.abs(_z) < 1.0
+    _z_large = np.where(_small, 1.0, _z)
+    _z_small = np.where(_small, _z, 0.0)
+    _phis = [np.exp(_z)]
+    _factorial = 1.0
+    for _k in range(order):
+        # Taylor series of phi_{k+1}, the terms fall below the round-off after 20 summands as |z| < 1
+        _series = np.zeros(_z.shape, dtype=np.result_type(_z, float))
+        _term_factorial = _factorial * (_k + 1)
+        for _j in range(20):
+            _series = _series + _z_small ** _j / _term_factorial
+            _term_factorial *= _j + _k + 2
+        _recurrence = (_phis[-1] - 1.0 / _factorial) / _z_large
+        _phis.append(np.where(_small, _series, _recurrence))
+        _factorial *= _k + 1
+    return _phis
@@ -34,6 +34,32 @@ class SdcIntegratorTest(NumpyAwareTestCase):
         )
         self.assertNumpyArrayAlmostEqual(computed_qmat, expected_qmat, delta=1e-8)
 
+    def test_diagonal_q_delta_default_interval(self):
+        self._test_obj.init(num_nodes=3)
+        self.assertNumpyArrayAlmostEqual(self._test_obj.diagonal_q_delta(),
+                                         numpy.array([0.666666666666667, float(1.0/3.0)]), delta=1e-8)
+        self.assertNumpyArrayAlmostEqual(self._test_obj.diagonal_q_delta('min-sr'),
+                                         numpy.array([0.5, 1.0]), delta=1e-8)
+        self.assertRaises(ValueError, self._test_obj.diagonal_q_delta, 'unknown')
+
+    def test_q_delta_preconditioners_default_interval(self):
+        self._test_obj.init(num_nodes=3)
+        self.assertNumpyArrayAlmostEqual(self._test_obj.q_delta(),
+                                         numpy.array([[0.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 1.0, 1.0]]), delta=1e-8)
+        self.assertNumpyArrayAlmostEqual(self._test_obj.q_delta('trapezoidal'),
+                                         numpy.array([[0.0, 0.0, 0.0], [0.5, 0.5, 0.0], [0.5, 1.0, 0.5]]), delta=1e-8)
+        _lu = self._test_obj.q_delta('lu')
+        self.assertNumpyArrayAlmostEqual(numpy.triu(_lu, 1), numpy.zeros((3, 3)), delta=1e-8)
+        self.assertAlmostEqual(_lu[1, 1], self._test_obj._qmat[1, 1], delta=1e-8)
+
+    def test_q_delta_validates_user_matrix(self):
+        self._test_obj.init(num_nodes=3)
+        _user = numpy.tril(numpy.ones((3, 3)))
+        self.assertIs(self._test_obj.q_delta(_user), _user)
+        self.assertRaises(ValueError, self._test_obj.q_delta, numpy.ones((3, 3)))
+        self.assertRaises(ValueError, self._test_obj.q_delta, numpy.eye(2))
+        self.assertRaises(ValueError, self._test_obj.diagonal_q_delta, 'lu')
+
     def test_s_matrix_computation_0_to_1_interval(self):
         self._test_obj.init(num_nodes=3, interval=numpy.array([0.0, 1.0]))
         computed_smat = self._test_obj._smat
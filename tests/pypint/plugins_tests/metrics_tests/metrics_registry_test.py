@@ -0,0 +1,85 @@
+# coding=utf-8
+import json
+import unittest
+
+from pypint.plugins.metrics.metrics_registry import MetricsRegistry, HasMetricsMixin, DISABLED_METRICS
+
+
+class _Cache(HasMetricsMixin):
+    def get(self, key):
+        self.metrics.increment('cache_hits', cache='matrices')
+        return key
+
+
+class _Metered(HasMetricsMixin):
+    def __init__(self):
+        super(_Metered, self).__init__()
+        self.cache = _Cache()
+        self._add_metered(self.cache)
+
+
+class MetricsRegistryTest(unittest.TestCase):
+    def setUp(self):
+        self._test_obj = MetricsRegistry()
+
+    def test_counts_by_labels(self):
+        self._test_obj.increment('rhs_evaluations', partial='expl')
+        self._test_obj.increment('rhs_evaluations', partial='impl')
+        self._test_obj.increment('rhs_evaluations', 2, partial='expl')
+        self._test_obj.increment('implicit_solves')
+        self.assertEqual(self._test_obj.value('rhs_evaluations', partial='expl'), 3)
+        self.assertEqual(self._test_obj.value('rhs_evaluations'), 0)
+        self.assertEqual(self._test_obj.total('rhs_evaluations'), 4)
+        self.assertEqual(self._test_obj.total('implicit_solves'), 1)
+        self.assertEqual([_name for _name, _labels, _value in self._test_obj.items()],
+                         ['rhs_evaluations', 'rhs_evaluations', 'implicit_solves'])
+
+    def test_labels_context(self):
+        with self._test_obj.labels(level=0):
+            self._test_obj.increment('implicit_solves')
+            with self._test_obj.labels(level=1, interval=2):
+                self._test_obj.increment('implicit_solves')
+                self._test_obj.increment('implicit_solves', level=3)
+            self._test_obj.increment('implicit_solves')
+        self._test_obj.increment('implicit_solves')
+        self.assertEqual(self._test_obj.value('implicit_solves', level=0), 2)
+        self.assertEqual(self._test_obj.value('implicit_solves', level=1, interval=2), 1)
+        self.assertEqual(self._test_obj.value('implicit_solves', level=3, interval=2), 1)
+        self.assertEqual(self._test_obj.value('implicit_solves'), 1)
+        self.assertEqual(self._test_obj.total('implicit_solves', interval=2), 2)
+
+    def test_disabled_registry_counts_nothing(self):
+        self._test_obj.enabled = False
+        with self._test_obj.labels(level=0):
+            self._test_obj.increment('mg_cycles')
+        self.assertEqual(self._test_obj.items(), [])
+        self.assertFalse(DISABLED_METRICS.enabled)
+
+    def test_exports_json_and_prometheus(self):
+        self._test_obj.increment('cache_hits', cache='spectral "solvers"')
+        self._test_obj.increment('communicated_bytes', 800)
+        self.assertEqual(json.loads(self._test_obj.to_json()),
+                         {'cache_hits': [{'labels': {'cache': 'spectral "solvers"'}, 'value': 1}],
+                          'communicated_bytes': [{'labels': {}, 'value': 800}]})
+        self.assertEqual(self._test_obj.to_prometheus().split("\n"),
+                         ['# TYPE pypint_cache_hits_total counter',
+                          'pypint_cache_hits_total{cache="spectral \\"solvers\\""} 1',
+                          '# TYPE pypint_communicated_bytes_total counter',
+                          'pypint_communicated_bytes_total 800'])
+
+        self._test_obj.reset()
+        self.assertEqual(self._test_obj.to_prometheus(), "")
+
+    def test_hands_registry_on_to_metered_objects(self):
+        _obj = _Metered()
+        self.assertIs(_obj.metrics, DISABLED_METRICS)
+        self.assertIs(_obj.cache.metrics, DISABLED_METRICS)
+        _obj.metrics = self._test_obj
+        self.assertIs(_obj.cache.metrics, self._test_obj)
+
+        _obj.cache.get('matrix')
+        self.assertEqual(self._test_obj.value('cache_hits', cache='matrices'), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,159 @@
+# coding=utf-8
+import unittest
+
+import numpy
+
+from tests import NumpyAwareTestCase
+from pypint.plugins.multigrid.boundary_condition import BoundaryCondition, as_boundary_condition, \
+    DirichletGhostCells
+from pypint.plugins.multigrid.multigrid_problem import MultigridProblem
+from pypint.plugins.multigrid.level import MultigridLevel1D
+from pypint.plugins.multigrid.level2d import MultigridLevel2D
+from pypint.plugins.multigrid.multigrid_core import MultiGridCore, ResidualErrorControl
+from pypint.plugins.multigrid import MG_INTERPOLATION_PRESETS, MG_RESTRICTION_PRESETS, MG_SMOOTHER_PRESETS, \
+    MG_LEVEL_PRESETS
+
+
+def _counting(function, calls):
+    def _function(*args):
+        calls.append(args[1:])
+        return function(*args)
+    return _function
+
+
+class BoundaryConditionTest(unittest.TestCase):
+    def test_static(self):
+        _test_obj = BoundaryCondition(lambda x: 2.0 * x)
+        self.assertTrue(_test_obj.static)
+        self.assertFalse(_test_obj.time_dependent)
+        self.assertEqual(_test_obj(3.0), 6.0)
+        self.assertEqual(_test_obj(3.0, time=1.0), 6.0)
+
+    def test_time_dependent(self):
+        _test_obj = BoundaryCondition(lambda x, t: x * t, time_dependent=True)
+        self.assertTrue(_test_obj.time_dependent)
+        self.assertEqual(_test_obj(2.0, time=3.0), 6.0)
+        self.assertRaises(ValueError, _test_obj, 2.0)
+
+    def test_defaults_to_zero(self):
+        _test_obj = BoundaryCondition()
+        self.assertEqual(_test_obj(numpy.ones(3)), 0.0)
+        self.assertTrue(BoundaryCondition(None, time_dependent=True).static)
+
+    def test_rejects_non_callable(self):
+        self.assertRaises(ValueError, BoundaryCondition, 1.0)
+
+    def test_as_boundary_condition(self):
+        _bc = BoundaryCondition(lambda x, t: t, time_dependent=True)
+        self.assertIs(as_boundary_condition(_bc), _bc)
+        _wrapped = as_boundary_condition(lambda x: 1.0)
+        self.assertIsInstance(_wrapped, BoundaryCondition)
+        self.assertTrue(_wrapped.static)
+        self.assertEqual(as_boundary_condition(None)(5.0), 0.0)
+
+
+class DirichletGhostCellsTest(NumpyAwareTestCase):
+    def setUp(self):
+        self._arr = numpy.zeros(6)
+        self._coordinates = numpy.linspace(0.0, 1.0, 6)
+
+    def test_evaluates_static_conditions_once(self):
+        _calls = []
+        _test_obj = DirichletGhostCells([(slice(None, 2), [_counting(lambda x: 1.0 + x, _calls)],
+                                          self._coordinates[:2])], self._arr)
+        self.assertFalse(_test_obj.time_dependent)
+        for _time in (None, 1.0, 2.0):
+            self._arr[:] = -1.0
+            _test_obj.pad(self._arr, _time)
+            self.assertNumpyArrayAlmostEqual(self._arr, numpy.array([1.0, 1.2, -1.0, -1.0, -1.0, -1.0]), places=14)
+        self.assertEqual(len(_calls), 1)
+
+    def test_regions_of_several_conditions_take_mean(self):
+        _test_obj = DirichletGhostCells([(slice(4, None), [lambda x: 1.0, lambda x: x, lambda x: 0.0],
+                                          self._coordinates[4:])], self._arr)
+        _test_obj.pad(self._arr)
+        self.assertNumpyArrayAlmostEqual(self._arr[4:], (1.0 + self._coordinates[4:]) / 3.0, places=14)
+
+    def test_reevaluates_time_dependent_conditions_on_new_time(self):
+        _calls = []
+        _dynamic = BoundaryCondition(_counting(lambda x, t: x * t, _calls), time_dependent=True)
+        _test_obj = DirichletGhostCells([(slice(None, 2), [_dynamic, lambda x: 1.0], self._coordinates[:2]),
+                                         (slice(4, None), [lambda x: 2.0], self._coordinates[4:])], self._arr)
+        self.assertTrue(_test_obj.time_dependent)
+        self.assertRaises(ValueError, _test_obj.pad, self._arr)
+        for _time in (1.0, 1.0, 3.0):
+            _test_obj.pad(self._arr, _time)
+            self.assertNumpyArrayAlmostEqual(self._arr[:2], 0.5 * (1.0 + _time * self._coordinates[:2]), places=14)
+            self.assertNumpyArrayAlmostEqual(self._arr[4:], numpy.full(2, 2.0), places=14)
+        self.assertListEqual(_calls, [(1.0,), (3.0,)])
+        # without a time, the values of the last one are kept
+        self._arr[:] = 0.0
+        _test_obj.pad(self._arr)
+        self.assertNumpyArrayAlmostEqual(self._arr[:2], 0.5 * (1.0 + 3.0 * self._coordinates[:2]), places=14)
+        self.assertEqual(len(_calls), 2)
+
+
+def _problem(dim, boundary_functions):
+    return MultigridProblem(dim=dim + (1,), rhs_function_wrt_space=lambda dof, tensor: 0.0,
+                            boundaries='dirichlet', boundary_functions=boundary_functions,
+                            geometry=numpy.asarray([[0, 1]] * len(dim)))
+
+
+class LevelGhostCellsTest(NumpyAwareTestCase):
+    def test_level_1d_evaluates_static_boundaries_once(self):
+        _calls = []
+        _problem_1d = _problem((7,), [[_counting(lambda x: 1.0 + 0.0 * x, _calls), lambda x: 2.0]])
+        _test_obj = MultigridLevel1D(7, mg_problem=_problem_1d, max_borders=numpy.array([2, 2]), role="FL")
+        for _i in range(0, 3):
+            _test_obj.arr[:] = 0.0
+            _test_obj.pad()
+            self.assertNumpyArrayEqual(_test_obj.arr[:2], numpy.ones(2))
+            self.assertNumpyArrayEqual(_test_obj.arr[-2:], numpy.full(2, 2.0))
+        self.assertEqual(len(_calls), 1)
+
+    def test_coarser_levels_have_homogeneous_boundaries(self):
+        _problem_1d = _problem((7,), [[lambda x: 1.0, lambda x: 2.0]])
+        _test_obj = MultigridLevel1D(7, mg_problem=_problem_1d, max_borders=numpy.array([1, 1]), role="ML")
+        _test_obj.arr[:] = 5.0
+        _test_obj.pad()
+        self.assertListEqual([_test_obj.arr[0], _test_obj.arr[-1]], [0.0, 0.0])
+
+    def test_level_2d_pads_time_dependent_boundaries(self):
+        _west = BoundaryCondition(lambda x, t: t * x[1], time_dependent=True)
+        _zero = lambda x: 0.0
+        _test_obj = MultigridLevel2D((4, 4), mg_problem=_problem((4, 4), [[_west, _zero], [_zero, _zero]]),
+                                     max_borders=numpy.ones((2, 2), dtype=int), role="FL")
+        for _time in (1.0, 2.0):
+            _test_obj.pad(_time)
+            self.assertNumpyArrayAlmostEqual(_test_obj.arr[1:-1, 0], _time * _test_obj.west_tensor[1].reshape(-1),
+                                             places=14)
+            # the corners are the mean of both sides
+            self.assertAlmostEqual(_test_obj.arr[0, 0], 0.5 * _time * float(_test_obj.nw_tensor[1]), places=14)
+
+
+class MultiGridCoreBoundaryTest(NumpyAwareTestCase):
+    def test_solves_with_time_dependent_boundaries(self):
+        # -u'' = 0 with u(0) = 0 and u(1) = t gives u = t x
+        _right = BoundaryCondition(lambda x, t: t + 0.0 * x, time_dependent=True)
+        _options = {}
+        _options.update(MG_SMOOTHER_PRESETS["Jacobi"])
+        _options["smooth_opts"] = {"omega": 2.0 / 3.0}
+        for _presets in (MG_LEVEL_PRESETS, MG_RESTRICTION_PRESETS, MG_INTERPOLATION_PRESETS):
+            _options.update(_presets["Standard-1D"])
+        _options.update(shape_coarse=7, num_levels=3, n_pre=1, n_post=1)
+        _test_obj = MultiGridCore(_problem((31,), [[lambda x: 0.0, _right]]),
+                                  lambda level: (numpy.array([-1.0, 2.0, -1.0]) / level.h ** 2, numpy.array([1])),
+                                  **_options)
+        _x = numpy.linspace(0.0, 1.0, 33)[1:-1]
+        for _time in (1.0, 2.5):
+            _test_obj.levels[-1].mid[:] = 0.0
+            _test_obj.levels[-1].rhs = 0.0
+            _test_obj.reset_coarse_levels()
+            _test_obj.pad(-1, _time)
+            _test_obj.modify_rhs(-1)
+            _test_obj.solve(ResidualErrorControl({-1: 1e-12}, {-1: 40}), cycle_type="v")
+            self.assertNumpyArrayAlmostEqual(_test_obj.levels[-1].mid, _time * _x, places=9)
+
+
+if __name__ == '__main__':
+    unittest.main()
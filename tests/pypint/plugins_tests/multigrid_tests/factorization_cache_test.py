@@ -0,0 +1,115 @@
+# coding=utf-8
+import time
+import unittest
+from threading import Thread
+
+import numpy
+import scipy.sparse as sprs
+import scipy.sparse.linalg as spla
+
+from pypint.plugins.multigrid.factorization_cache import FactorizationCache, estimate_nbytes
+from pypint.plugins.metrics.metrics_registry import MetricsRegistry
+
+
+class FactorizationCacheTest(unittest.TestCase):
+    def setUp(self):
+        self._test_obj = FactorizationCache(max_entries=2)
+
+    def test_creates_value_once(self):
+        _calls = []
+        _factory = lambda: _calls.append(None) or len(_calls)
+        self.assertEqual(self._test_obj.get('level', 0.1, _factory), 1)
+        self.assertEqual(self._test_obj.get('level', 0.1, _factory), 1)
+        self.assertEqual(len(_calls), 1)
+        self.assertEqual((self._test_obj.hits, self._test_obj.misses), (1, 1))
+        self.assertEqual(self._test_obj.hit_rate, 0.5)
+
+    def test_matches_delta_times_within_tolerance(self):
+        self._test_obj.get('level', 0.1, lambda: 'LU(0.1)')
+        self.assertEqual(self._test_obj.get('level', 0.1 * (1.0 + 1e-12), lambda: 'other'), 'LU(0.1)')
+        self.assertEqual(self._test_obj.get('level', 0.1 * (1.0 + 1e-8), lambda: 'other'), 'other')
+        self.assertEqual(self._test_obj.get('other level', 0.1, lambda: 'other level'), 'other level')
+
+    def test_none_only_matches_none(self):
+        self._test_obj.get('level', None, lambda: 'static')
+        self.assertEqual(self._test_obj.get('level', 0.0, lambda: 'zero'), 'zero')
+        self.assertEqual(self._test_obj.get('level', None, lambda: 'other'), 'static')
+
+    def test_evicts_least_recently_used_entries(self):
+        self._test_obj.get('level', 0.1, lambda: 'LU(0.1)')
+        self._test_obj.get('level', 0.2, lambda: 'LU(0.2)')
+        self._test_obj.get('level', 0.1, lambda: 'other')
+        self._test_obj.get('level', 0.3, lambda: 'LU(0.3)')
+        self.assertEqual(len(self._test_obj), 2)
+        self.assertEqual(self._test_obj.evictions, 1)
+        self.assertEqual(self._test_obj.get('level', 0.1, lambda: 'other'), 'LU(0.1)')
+        self.assertEqual(self._test_obj.get('level', 0.2, lambda: 'new LU(0.2)'), 'new LU(0.2)')
+
+    def test_evicts_by_memory(self):
+        self._test_obj = FactorizationCache(max_bytes=2000)
+        self._test_obj.get('a', None, lambda: numpy.zeros(100))
+        self._test_obj.get('b', None, lambda: numpy.zeros(100))
+        self.assertEqual(self._test_obj.nbytes, 1600)
+        self._test_obj.get('c', None, lambda: numpy.zeros(100))
+        self.assertEqual(len(self._test_obj), 2)
+        self.assertEqual(self._test_obj.nbytes, 1600)
+        # the latest entry is kept even if it exceeds the limit on its own
+        self._test_obj.get('d', None, lambda: numpy.zeros(1000))
+        self.assertEqual(len(self._test_obj), 1)
+        self.assertEqual(self._test_obj.nbytes, 8000)
+
+    def test_clear(self):
+        self._test_obj.get('level', 0.1, lambda: numpy.zeros(10))
+        self._test_obj.clear()
+        self.assertEqual(len(self._test_obj), 0)
+        self.assertEqual((self._test_obj.nbytes, self._test_obj.hits, self._test_obj.misses), (0, 0, 0))
+        self.assertEqual(self._test_obj.hit_rate, 0.0)
+
+    def test_counts_metrics(self):
+        self._test_obj = FactorizationCache(name='lu')
+        self._test_obj.metrics = MetricsRegistry()
+        self._test_obj.get('level', 0.1, lambda: 'LU')
+        self._test_obj.get('level', 0.1, lambda: 'LU')
+        self.assertEqual(self._test_obj.metrics.value('cache_hits', cache='lu'), 1)
+        self.assertEqual(self._test_obj.metrics.value('cache_misses', cache='lu'), 1)
+
+    def test_concurrent_misses_create_value_once(self):
+        _calls = []
+
+        def _factory():
+            _calls.append(None)
+            time.sleep(0.01)
+            return 'LU'
+
+        _threads = [Thread(target=self._test_obj.get, args=('level', 0.1, _factory)) for _i in range(0, 4)]
+        for _thread in _threads:
+            _thread.start()
+        for _thread in _threads:
+            _thread.join()
+        self.assertEqual(len(_calls), 1)
+        self.assertEqual(self._test_obj.hits, 3)
+
+    def test_validates_parameters(self):
+        self.assertRaises(ValueError, FactorizationCache, max_entries=0)
+        self.assertRaises(ValueError, FactorizationCache, max_bytes=-1)
+        self.assertRaises(ValueError, FactorizationCache, rtol=-1e-10)
+        self.assertRaises(ValueError, FactorizationCache, atol=-1e-10)
+
+
+class EstimateNbytesTest(unittest.TestCase):
+    def test_arrays_and_containers(self):
+        self.assertEqual(estimate_nbytes(numpy.zeros(10)), 80)
+        self.assertEqual(estimate_nbytes({'a': numpy.zeros(10), 'b': [numpy.zeros(5), (numpy.zeros(5), 'x')]}), 160)
+        self.assertEqual(estimate_nbytes('anything else'), 0)
+
+    def test_sparse_matrices_and_factorizations(self):
+        _matrix = sprs.diags([-1.0, 2.0, -1.0], [-1, 0, 1], shape=(10, 10), format='csc')
+        self.assertEqual(estimate_nbytes(_matrix),
+                         _matrix.data.nbytes + _matrix.indices.nbytes + _matrix.indptr.nbytes)
+        _lu = spla.splu(_matrix)
+        self.assertGreaterEqual(estimate_nbytes(_lu), estimate_nbytes(_lu.L) + estimate_nbytes(_lu.U))
+        self.assertGreater(estimate_nbytes(_lu.L), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+# coding=utf-8
+import unittest
+
+import numpy
+import scipy.sparse as sprs
+
+from tests import NumpyAwareTestCase
+from pypint.plugins.multigrid.galerkin import linear_interpolation_matrix, full_weighting_matrix, \
+    galerkin_product, stencil_from_matrix
+from pypint.plugins.multigrid.stencil import Stencil
+
+
+_LAPLACE_2D = numpy.array([[0.0, -1.0, 0.0], [-1.0, 4.0, -1.0], [0.0, -1.0, 0.0]])
+
+
+class GalerkinTest(NumpyAwareTestCase):
+    def test_linear_interpolation_matrix(self):
+        self.assertNumpyArrayEqual(linear_interpolation_matrix((3,)).toarray(),
+                                   numpy.array([[0.5, 0.0, 0.0],
+                                                [1.0, 0.0, 0.0],
+                                                [0.5, 0.5, 0.0],
+                                                [0.0, 1.0, 0.0],
+                                                [0.0, 0.5, 0.5],
+                                                [0.0, 0.0, 1.0],
+                                                [0.0, 0.0, 0.5]]))
+        _bilinear = linear_interpolation_matrix((3, 2))
+        self.assertEqual(_bilinear.shape, (7 * 5, 3 * 2))
+        self.assertNumpyArrayEqual(_bilinear.toarray(),
+                                   sprs.kron(linear_interpolation_matrix((3,)),
+                                             linear_interpolation_matrix((2,))).toarray())
+
+    def test_full_weighting_is_scaled_transposed_interpolation(self):
+        for _shape in ((3,), (3, 2)):
+            self.assertNumpyArrayEqual(full_weighting_matrix(_shape).toarray(),
+                                       linear_interpolation_matrix(_shape).T.toarray() * 0.5 ** len(_shape))
+        self.assertNumpyArrayEqual(full_weighting_matrix((1,)).toarray(), numpy.array([[0.25, 0.5, 0.25]]))
+
+    def test_galerkin_product_of_laplacian(self):
+        _matrix = Stencil(numpy.array([-1.0, 2.0, -1.0])).to_sparse_matrix((7,), "csr")
+        _coarse = galerkin_product(full_weighting_matrix((3,)), _matrix, linear_interpolation_matrix((3,)))
+        # the Laplacian rediscretized with twice the mesh width
+        self.assertNumpyArrayAlmostEqual(_coarse.toarray(),
+                                         Stencil(numpy.array([-1.0, 2.0, -1.0]) / 4.0).to_sparse_matrix((3,))
+                                         .toarray(), places=14)
+
+    def test_galerkin_stencil_of_five_point_laplacian(self):
+        _matrix = Stencil(_LAPLACE_2D).to_sparse_matrix((7, 7), "csr")
+        _coarse = galerkin_product(full_weighting_matrix((3, 3)), _matrix, linear_interpolation_matrix((3, 3)))
+        self.assertNumpyArrayAlmostEqual(stencil_from_matrix(_coarse, (3, 3)).arr,
+                                         numpy.array([[-0.25, -0.5, -0.25],
+                                                      [-0.5, 3.0, -0.5],
+                                                      [-0.25, -0.5, -0.25]]) / 4.0, places=14)
+
+    def test_stencil_from_matrix_inverts_assembly(self):
+        for _arr in (numpy.array([1.0, -3.0, 2.0]), _LAPLACE_2D, numpy.array([[1.0, 2.0, 3.0]])):
+            _shape = (9,) if _arr.ndim == 1 else (5, 7)
+            _matrix = Stencil(_arr).to_sparse_matrix(_shape, "csr")
+            self.assertNumpyArrayEqual(stencil_from_matrix(_matrix, _shape).arr, _arr)
+
+    def test_stencil_from_matrix_rejects_other_grid(self):
+        _matrix = Stencil(numpy.array([-1.0, 2.0, -1.0])).to_sparse_matrix((7,), "csr")
+        self.assertRaises(ValueError, stencil_from_matrix, _matrix, (8,))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,189 @@
+# coding=utf-8
+import unittest
+
+import numpy
+import scipy.sparse.linalg as spla
+
+from tests import NumpyAwareTestCase
+from pypint.plugins.multigrid.multigrid_problem import MultigridProblem
+from pypint.plugins.multigrid.level3d import MultigridLevel3D
+from pypint.plugins.multigrid.boundary_condition import BoundaryCondition
+from pypint.plugins.multigrid.stencil import Stencil
+from pypint.plugins.multigrid.multigrid_core import MultiGridCore, ResidualErrorControl
+from pypint.plugins.multigrid import MG_INTERPOLATION_PRESETS, MG_RESTRICTION_PRESETS, MG_SMOOTHER_PRESETS, \
+    MG_LEVEL_PRESETS
+from examples.problems.heat_equation import HeatEquation
+
+
+_ZERO = lambda x: 0.0
+
+
+def _problem(dim, boundaries='dirichlet', boundary_functions=None, geometry=None):
+    """Problem on the unit cube or the given geometry with homogeneous Dirichlet boundaries by default
+    """
+    return MultigridProblem(dim=dim + (1,), rhs_function_wrt_space=lambda dof, tensor: 0.0, boundaries=boundaries,
+                            boundary_functions=boundary_functions or [[_ZERO, _ZERO]] * len(dim),
+                            geometry=numpy.asarray(geometry or [[0, 1]] * len(dim)))
+
+
+def _laplace_3d(h):
+    """Seven point stencil of :math:`-\\Delta_h`
+    """
+    _arr = numpy.zeros((3, 3, 3))
+    _arr[1, 1, 1] = 6.0
+    for _axis in range(0, 3):
+        for _neighbour in (0, 2):
+            _index = [1, 1, 1]
+            _index[_axis] = _neighbour
+            _arr[tuple(_index)] = -1.0
+    return _arr / h ** 2
+
+
+class MultigridLevel3DTest(NumpyAwareTestCase):
+    def setUp(self):
+        # the boundary functions and the geometry are given in (x, y, z) order, the arrays are indexed (z, y, x)
+        self._functions = [[lambda x: 1.0 + 0.0 * x[0], lambda x: 2.0 + 0.0 * x[0]],
+                           [lambda x: x[0], lambda x: x[1]],
+                           [lambda x: 0.0 * x[0], lambda x: x[2]]]
+        self._problem = _problem((5, 4, 3), boundary_functions=self._functions, geometry=[[0, 1], [0, 2], [0, 3]])
+        self._test_obj = MultigridLevel3D((3, 4, 5), mg_problem=self._problem,
+                                          max_borders=numpy.ones((3, 2), dtype=int), role="FL")
+
+    def test_shapes_and_grid_widths(self):
+        self.assertTupleEqual(self._test_obj.arr.shape, (5, 6, 7))
+        self.assertTupleEqual(self._test_obj.mid.shape, (3, 4, 5))
+        self.assertTupleEqual(self._test_obj.rhs.shape, (3, 4, 5))
+        self.assertListEqual(MultigridLevel3D.buffer_shapes((3, 4, 5), numpy.ones((3, 2), dtype=int)),
+                             [(5, 6, 7), (5, 6, 7), (3, 4, 5)])
+        self.assertNumpyArrayAlmostEqual(self._test_obj.h, numpy.array([1.0 / 6.0, 2.0 / 5.0, 3.0 / 4.0]), places=14)
+        # six faces, twelve edges and eight corners
+        self.assertEqual(len(self._test_obj.ghost_regions), 26)
+        _x, _y, _z = self._test_obj.mid_tensor
+        self.assertNumpyArrayAlmostEqual(_x[0, 0, :], numpy.arange(1, 6) / 6.0, places=14)
+        self.assertNumpyArrayAlmostEqual(_y[0, :, 0], 2.0 * numpy.arange(1, 5) / 5.0, places=14)
+        self.assertNumpyArrayAlmostEqual(_z[:, 0, 0], 3.0 * numpy.arange(1, 4) / 4.0, places=14)
+        self.assertTupleEqual(self._test_obj.space_tensor.shape, (3, 5, 6, 7))
+
+    def test_pads_dirichlet_faces_edges_and_corners(self):
+        self._test_obj.mid[:] = 7.0
+        self._test_obj.pad()
+        _arr = self._test_obj.arr
+        _x, _y, _z = self._test_obj.space_tensor
+        self.assertTrue(numpy.all(_arr[1:-1, 1:-1, 0] == 1.0))
+        self.assertTrue(numpy.all(_arr[1:-1, 1:-1, -1] == 2.0))
+        self.assertNumpyArrayAlmostEqual(_arr[1:-1, 0, 1:-1], _x[1:-1, 0, 1:-1], places=14)
+        self.assertNumpyArrayAlmostEqual(_arr[1:-1, -1, 1:-1], _y[1:-1, -1, 1:-1], places=14)
+        self.assertNumpyArrayAlmostEqual(_arr[-1, 1:-1, 1:-1], _z[-1, 1:-1, 1:-1], places=14)
+        # edges and corners take the mean of the adjacent faces
+        self.assertNumpyArrayAlmostEqual(_arr[1:-1, 0, 0], numpy.full(3, 0.5), places=14)
+        self.assertAlmostEqual(_arr[0, 0, 0], 1.0 / 3.0, places=14)
+        self.assertAlmostEqual(_arr[-1, -1, -1], (2.0 + _y[-1, -1, -1] + _z[-1, -1, -1]) / 3.0, places=14)
+        self.assertTrue(numpy.all(self._test_obj.mid == 7.0))
+
+    def test_pads_time_dependent_dirichlet_boundaries(self):
+        _functions = [[BoundaryCondition(lambda x, t: t + 0.0 * x[0], time_dependent=True), _ZERO],
+                      [_ZERO, _ZERO], [_ZERO, _ZERO]]
+        _test_obj = MultigridLevel3D((3, 3, 3), mg_problem=_problem((3, 3, 3), boundary_functions=_functions),
+                                     max_borders=numpy.ones((3, 2), dtype=int), role="FL")
+        for _time in (0.5, 2.0):
+            _test_obj.pad(_time)
+            self.assertTrue(numpy.all(_test_obj.arr[1:-1, 1:-1, 0] == _time))
+            self.assertAlmostEqual(_test_obj.arr[1, 0, 0], 0.5 * _time, places=14)
+        self.assertRaises(ValueError, MultigridLevel3D((3, 3, 3), mg_problem=_problem((3, 3, 3),
+                                                                                      boundary_functions=_functions),
+                                                       max_borders=numpy.ones((3, 2), dtype=int), role="FL").pad)
+
+    def test_pads_periodic_axes(self):
+        _test_obj = MultigridLevel3D((3, 4, 5), mg_problem=_problem((5, 4, 3), boundaries='periodic'),
+                                     max_borders=numpy.ones((3, 2), dtype=int) * 2, role="FL")
+        _test_obj.mid[:] = numpy.random.RandomState(0).rand(3, 4, 5)
+        _test_obj.pad()
+        self.assertNumpyArrayEqual(_test_obj.arr, numpy.pad(_test_obj.mid, 2, mode='wrap'))
+
+    def test_pads_mixed_boundaries(self):
+        _test_obj = MultigridLevel3D((3, 4, 5), mg_problem=_problem((5, 4, 3),
+                                                                    boundaries=['dirichlet'] * 2 + ['periodic'] * 2
+                                                                    + ['dirichlet'] * 2),
+                                     max_borders=numpy.ones((3, 2), dtype=int), role="FL")
+        _test_obj.mid[:] = numpy.random.RandomState(0).rand(3, 4, 5)
+        _test_obj.pad()
+        _expected = numpy.pad(numpy.pad(_test_obj.mid, [(0, 0), (1, 1), (0, 0)], mode='wrap'),
+                              [(1, 1), (0, 0), (1, 1)], mode='constant')
+        self.assertNumpyArrayEqual(_test_obj.arr, _expected)
+
+    def test_residual_and_modified_rhs_match_sparse_matrix(self):
+        _stencil = Stencil(_laplace_3d(0.25))
+        self._test_obj.mid[:] = numpy.random.RandomState(0).rand(3, 4, 5)
+        self._test_obj.pad()
+        _matrix = _stencil.to_sparse_matrix(self._test_obj.mid.shape, "csr")
+        # the stencil applied including the boundary values
+        _full = _stencil.eval_convolve(self._test_obj.evaluable_view(_stencil), "valid")
+        self._test_obj.rhs = _full
+        self._test_obj.compute_residual(_stencil)
+        self.assertNumpyArrayAlmostEqual(self._test_obj.res_mid, numpy.zeros((3, 4, 5)), places=12)
+        _stencil.modify_rhs(self._test_obj)
+        self.assertNumpyArrayAlmostEqual(self._test_obj.rhs.reshape(-1),
+                                         _matrix.dot(self._test_obj.mid.reshape(-1)), places=12)
+
+    def test_validates_parameters(self):
+        _borders = numpy.ones((3, 2), dtype=int)
+        self.assertRaises(ValueError, MultigridLevel3D, (3, 4), mg_problem=self._problem, max_borders=_borders)
+        self.assertRaises(ValueError, MultigridLevel3D, (3, 4, 5), mg_problem=self._problem,
+                          max_borders=numpy.ones((2, 2), dtype=int))
+        self.assertRaises(ValueError, MultigridLevel3D, (3, 4, 5), mg_problem=self._problem, max_borders=_borders,
+                          role="XL")
+        self.assertRaises(ValueError, MultigridLevel3D, (3, 4, 5), mg_problem=_problem((5, 4)),
+                          max_borders=_borders)
+
+
+def _poisson_core_3d(**kwargs):
+    _options = {}
+    _options.update(MG_SMOOTHER_PRESETS["Jacobi"])
+    _options["smooth_opts"] = {"omega": 6.0 / 7.0}
+    _options.update(MG_LEVEL_PRESETS["Standard-3D"])
+    _options.update(MG_RESTRICTION_PRESETS["Standard-3D"])
+    _options.update(MG_INTERPOLATION_PRESETS["Standard-3D"])
+    _options.update(shape_coarse=(3, 3, 3), num_levels=3, n_pre=2, n_post=2)
+    _options.update(kwargs)
+    return MultiGridCore(_problem((15, 15, 15)), lambda level: (_laplace_3d(level.h[0]), numpy.ones(3, dtype=int)),
+                         **_options)
+
+
+class MultiGridCore3DTest(NumpyAwareTestCase):
+    def test_builds_hierarchy(self):
+        _test_obj = _poisson_core_3d()
+        self.assertListEqual([_level.mid.shape for _level in _test_obj.levels], [(3, 3, 3), (7, 7, 7), (15, 15, 15)])
+        self.assertListEqual([_level.role for _level in _test_obj.levels], ["CL", "ML", "FL"])
+
+    def test_cycles_solve_discrete_problem(self):
+        for _coarse_operator in ("rediscretize", "galerkin"):
+            _test_obj = _poisson_core_3d(coarse_operator=_coarse_operator)
+            _test_obj.levels[-1].rhs = numpy.random.RandomState(0).rand(15, 15, 15)
+            _test_obj.pad(-1)
+            _test_obj.modify_rhs(-1)
+            self.assertLess(_test_obj.solve(ResidualErrorControl({-1: 1e-10}, {-1: 30}), cycle_type="v"), 30)
+            _matrix = _test_obj.stencils[-1].to_sparse_matrix((15, 15, 15), "csc")
+            _expected = spla.spsolve(_matrix, _test_obj.levels[-1].rhs.reshape(-1)).reshape((15, 15, 15))
+            self.assertNumpyArrayAlmostEqual(_test_obj.levels[-1].mid, _expected, places=10)
+
+    def test_rejects_other_dimensions(self):
+        self.assertRaises(ValueError, _poisson_core_3d, dim=4)
+
+    def test_heat_equation_solves_implicit_system(self):
+        _problem_3d = HeatEquation(dim=(7, 7, 7, 1), time_end=0.1, thermal_diffusivity=0.5,
+                                   initial_value=numpy.ones((343, 1)),
+                                   rhs_function_wrt_space=lambda dof, tensor: 0.0,
+                                   boundary_functions=[[_ZERO, _ZERO]] * 3, boundaries=['dirichlet'] * 6,
+                                   geometry=numpy.asarray([[0, 1]] * 3), implicit_solve_method='mg')
+        _problem_3d._mg_level = MultigridLevel3D((7, 7, 7), mg_problem=_problem_3d,
+                                                 max_borders=numpy.ones((3, 2), dtype=int), role='FL')
+        _problem_3d._mg_stencil = Stencil(-0.5 * _laplace_3d(_problem_3d._mg_level.h[0]))
+        _rhs = numpy.random.RandomState(0).rand(7, 7, 7)
+        _solution = _problem_3d.implicit_solve(numpy.zeros(_rhs.shape), None, expl_term=_rhs, delta_time=0.01)
+        _set = _problem_3d.initialize_direct_space_solver(0, 0.01)
+        _matrix = _set['stencil'].to_sparse_matrix((7, 7, 7), "csc")
+        self.assertNumpyArrayAlmostEqual(_solution.reshape(-1), spla.spsolve(_matrix, _rhs.reshape(-1)), places=5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+# coding=utf-8
+import unittest
+
+import numpy
+
+from tests import NumpyAwareTestCase
+from pypint.plugins.multigrid.memory_arena import MemoryArena, zeros
+from pypint.plugins.multigrid.multigrid_core import ResidualErrorControl
+from tests.pypint.plugins_tests.multigrid_tests.multigrid_core_test import _poisson_core, _discrete_solution
+from tests.pypint.plugins_tests.multigrid_tests.multigrid_problem_mixin_test import _heat_equation, \
+    _exact_implicit_solve
+
+
+class MemoryArenaTest(NumpyAwareTestCase):
+    def test_required_size_is_aligned_to_cache_lines(self):
+        self.assertEqual(MemoryArena.required_size([(3,)]), 8)
+        self.assertEqual(MemoryArena.required_size([(9,), (2, 4)]), 16 + 8)
+        self.assertEqual(MemoryArena.required_size([(5,)], dtype=complex), 8)
+        self.assertEqual(MemoryArena.required_size([]), 0)
+
+    def test_allocates_aligned_zeroed_arrays(self):
+        _test_obj = MemoryArena(MemoryArena.required_size([(3, 5), (7,), 2]))
+        _arrays = [_test_obj.allocate((3, 5)), _test_obj.allocate((7,)), _test_obj.allocate(2)]
+        self.assertListEqual([_array.shape for _array in _arrays], [(3, 5), (7,), (2,)])
+        for _array in _arrays:
+            self.assertEqual(_array.ctypes.data % MemoryArena.alignment, 0)
+            self.assertTrue(_array.flags['C_CONTIGUOUS'])
+            self.assertTrue(numpy.all(_array == 0.0))
+        self.assertEqual(_test_obj.used, _test_obj.size)
+        self.assertEqual(_test_obj.nbytes, _test_obj.size * 8)
+        # the arrays do not overlap
+        _arrays[0][:] = 1.0
+        self.assertTrue(numpy.all(_arrays[1] == 0.0))
+
+    def test_raises_if_too_small(self):
+        _test_obj = MemoryArena(16)
+        _test_obj.allocate(9)
+        self.assertRaises(MemoryError, _test_obj.allocate, 1)
+
+    def test_reset_hands_out_same_memory_zeroed(self):
+        _test_obj = MemoryArena(16)
+        _first = _test_obj.allocate((4, 4))
+        _first[:] = 1.0
+        _test_obj.reset()
+        self.assertEqual(_test_obj.used, 0)
+        _second = _test_obj.allocate((4, 4))
+        self.assertTrue(numpy.shares_memory(_first, _second))
+        self.assertTrue(numpy.all(_second == 0.0))
+
+    def test_zeros(self):
+        self.assertNumpyArrayEqual(zeros((2, 3)), numpy.zeros((2, 3)))
+        _arena = MemoryArena(8, dtype=complex)
+        _array = zeros(3, complex, _arena)
+        self.assertEqual(_array.dtype, numpy.dtype(complex))
+        self.assertEqual(_arena.used, 4)
+        self.assertRaises(ValueError, zeros, 3, float, _arena)
+
+
+class MultiGridCoreArenaTest(NumpyAwareTestCase):
+    def test_levels_are_carved_out_of_one_arena(self):
+        _core = _poisson_core()
+        self.assertEqual(_core.arena.used, _core.arena.size)
+        for _level in _core.levels:
+            for _array in (_level.arr, _level.res, _level.rhs):
+                self.assertTrue(numpy.shares_memory(_array, _core.arena._buffer))
+
+    def test_hierarchies_share_arena(self):
+        _first = _poisson_core()
+        _second = _poisson_core(arena=_first.arena)
+        self.assertIs(_second.arena, _first.arena)
+        self.assertTrue(numpy.shares_memory(_second.levels[-1].arr, _first.levels[-1].arr))
+        _second.solve(ResidualErrorControl({-1: 1e-10}, {-1: 30}), cycle_type="v")
+        self.assertNumpyArrayAlmostEqual(_second.levels[-1].mid, _discrete_solution(_second), places=10)
+
+    def test_rejects_too_small_arena(self):
+        self.assertRaises(ValueError, _poisson_core, arena=MemoryArena(64))
+
+    def test_problem_keeps_arena_with_each_hierarchy(self):
+        _problem = _heat_equation('mg')
+        _rhs = _problem.initial_value.copy()
+        _solve = lambda delta_time: _problem.implicit_solve(numpy.zeros(_rhs.shape), None, expl_term=_rhs,
+                                                            delta_time=delta_time, time_level=0)
+        _solve(0.01)
+        _arena = _problem.mg_core.arena
+        _solve(0.02)
+        self.assertIsNot(_problem.mg_core.arena, _arena)
+        self.assertEqual(_problem._mg_cores.nbytes, _arena.nbytes + _problem.mg_core.arena.nbytes)
+        for _delta_time in (0.01, 0.02, 0.01):
+            self.assertNumpyArrayAlmostEqual(_solve(_delta_time), _exact_implicit_solve(_problem, _rhs, _delta_time),
+                                             places=6)
+
+
+if __name__ == '__main__':
+    unittest.main()
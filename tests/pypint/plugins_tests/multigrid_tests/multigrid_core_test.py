@@ -0,0 +1,140 @@
+# coding=utf-8
+import unittest
+
+import numpy
+import scipy.sparse.linalg as spla
+
+from tests import NumpyAwareTestCase
+from pypint.plugins.multigrid.multigrid_problem import MultigridProblem
+from pypint.plugins.multigrid.multigrid_core import MultiGridCore, ResidualErrorControl
+from pypint.plugins.multigrid import MG_INTERPOLATION_PRESETS, MG_RESTRICTION_PRESETS, MG_SMOOTHER_PRESETS, \
+    MG_LEVEL_PRESETS
+
+
+def _poisson_problem():
+    _zero = lambda x: 0.0
+    return MultigridProblem(dim=(63, 1), rhs_function_wrt_space=lambda dof, tensor: 0.0,
+                            boundaries=['dirichlet'] * 2, boundary_functions=[[_zero, _zero]],
+                            geometry=numpy.asarray([[0, 1]]))
+
+
+def _poisson_core(**kwargs):
+    """Four levels down to 7 points of :math:`-u'' = \\pi^2 \\sin(\\pi x)` on 63 points
+    """
+    _options = {}
+    _options.update(MG_SMOOTHER_PRESETS["Jacobi"])
+    _options["smooth_opts"] = {"omega": 2.0 / 3.0}
+    _options.update(MG_LEVEL_PRESETS["Standard-1D"])
+    _options.update(MG_RESTRICTION_PRESETS["Standard-1D"])
+    _options.update(MG_INTERPOLATION_PRESETS["Standard-1D"])
+    _options.update(shape_coarse=7, num_levels=4, n_pre=1, n_post=1)
+    _options.update(kwargs)
+    _core = MultiGridCore(_poisson_problem(),
+                          lambda level: (numpy.array([-1.0, 2.0, -1.0]) / level.h ** 2, numpy.array([1])),
+                          **_options)
+    _x = numpy.linspace(0.0, 1.0, _core.levels[-1].mid.size + 2)[1:-1]
+    _core.levels[-1].rhs = numpy.pi ** 2 * numpy.sin(numpy.pi * _x)
+    _core.pad(-1)
+    _core.modify_rhs(-1)
+    return _core
+
+
+def _discrete_solution(core):
+    _matrix = core.stencils[-1].to_sparse_matrix(core.levels[-1].mid.shape, "csc")
+    return spla.spsolve(_matrix, core.levels[-1].rhs.reshape(-1)).reshape(core.levels[-1].mid.shape)
+
+
+class ResidualErrorControlTest(unittest.TestCase):
+    def test_reached_by_reduction_of_initial_residual(self):
+        _test_obj = ResidualErrorControl({-1: 1e-2}, {-1: 10})
+        self.assertFalse(_test_obj.reached(-1, 4.0, 0))
+        self.assertFalse(_test_obj.reached(-1, 0.05, 1))
+        self.assertTrue(_test_obj.reached(-1, 0.01, 2))
+        self.assertListEqual(_test_obj.residuals[-1], [4.0, 0.05, 0.01])
+
+    def test_reached_by_maximum_cycles(self):
+        _test_obj = ResidualErrorControl({-1: 1e-2}, {-1: 2})
+        self.assertFalse(_test_obj.reached(-1, 4.0, 0))
+        self.assertTrue(_test_obj.reached(-1, 3.0, 2))
+
+    def test_levels_without_thresholds_are_never_reached(self):
+        _test_obj = ResidualErrorControl({-1: 1e-2}, {-1: 2})
+        self.assertFalse(_test_obj.reached(0, 0.0, 100))
+
+    def test_reset_forgets_initial_residual(self):
+        _test_obj = ResidualErrorControl({-1: 1e-2}, {-1: 10})
+        _test_obj.reached(-1, 4.0, 0)
+        _test_obj.reset()
+        self.assertFalse(_test_obj.reached(-1, 0.04, 0))
+        self.assertTrue(_test_obj.reached(-1, 0.0001, 1))
+
+
+class MultiGridCoreTest(NumpyAwareTestCase):
+    def setUp(self):
+        self._test_obj = _poisson_core()
+        self._expected = _discrete_solution(self._test_obj)
+
+    def _solve(self, cycle_type):
+        self._test_obj.levels[-1].mid[:] = 0.0
+        self._test_obj.reset_coarse_levels()
+        return self._test_obj.solve(ResidualErrorControl({-1: 1e-10}, {-1: 30}), cycle_type=cycle_type)
+
+    def test_cycles_solve_discrete_problem(self):
+        for _cycle_type in ("v", "w", "f", "fmg"):
+            _cycles = self._solve(_cycle_type)
+            self.assertLess(_cycles, 30, "%s-cycles did not converge" % _cycle_type)
+            self.assertNumpyArrayAlmostEqual(self._test_obj.levels[-1].mid, self._expected, places=10)
+
+    def test_w_and_f_cycles_converge_faster_than_v_cycles(self):
+        _v_cycles = self._solve("v")
+        self.assertLess(self._solve("w"), _v_cycles)
+        self.assertLess(self._solve("f"), _v_cycles)
+
+    def test_fmg_cycle_reaches_discretization_error(self):
+        self._test_obj.levels[-1].mid[:] = 1.0
+        self._test_obj.fmg_cycle()
+        _x = numpy.linspace(0.0, 1.0, self._expected.size + 2)[1:-1]
+        _discretization_error = numpy.max(numpy.abs(self._expected - numpy.sin(numpy.pi * _x)))
+        self.assertLess(numpy.max(numpy.abs(self._test_obj.levels[-1].mid - self._expected)),
+                        2.0 * _discretization_error)
+
+    def test_cycles_of_limited_depth_reduce_residual(self):
+        _initial = self._test_obj.residual_norm(-1)
+        self._test_obj.v_cycle(max_depth=1)
+        self.assertLess(self._test_obj.residual_norm(-1), _initial)
+
+    def test_solve_stops_at_maximum_cycles(self):
+        self.assertEqual(self._test_obj.solve(ResidualErrorControl({-1: 0.0}, {-1: 3}), cycle_type="v"), 3)
+
+    def test_solve_rejects_unknown_cycle_type(self):
+        self.assertRaises(ValueError, self._test_obj.solve, ResidualErrorControl({-1: 1e-6}, {-1: 3}), "x")
+
+    def test_vectorized_smoothers_solve_discrete_problem(self):
+        for _smoother in ("RedBlackGaussSeidel", "Chebyshev"):
+            self._test_obj = _poisson_core(**MG_SMOOTHER_PRESETS[_smoother])
+            self.assertLess(self._solve("v"), 30, "V-cycles with %s did not converge" % _smoother)
+            self.assertNumpyArrayAlmostEqual(self._test_obj.levels[-1].mid, self._expected, places=10)
+
+    def test_smoothers_in_row_blocks_solve_discrete_problem(self):
+        _options = dict(MG_SMOOTHER_PRESETS["DampedJacobi"])
+        _options["smooth_opts"] = dict(_options["smooth_opts"], n_workers=2, min_block_size=4)
+        self._test_obj = _poisson_core(**_options)
+        self.assertLess(self._solve("v"), 30)
+        self.assertNumpyArrayAlmostEqual(self._test_obj.levels[-1].mid, self._expected, places=10)
+        self.assertGreater(len(self._test_obj.smoothers[-1]._row_blocks(self._expected.shape)), 1)
+
+    def test_galerkin_coarse_operators_solve_discrete_problem(self):
+        _rediscretized = [_stencil.arr.copy() for _stencil in self._test_obj.stencils]
+        self._test_obj = _poisson_core(coarse_operator="galerkin")
+        # in 1D, the Galerkin product of the Laplacian equals its rediscretization
+        for _stencil, _expected in zip(self._test_obj.stencils, _rediscretized):
+            self.assertNumpyArrayAlmostEqual(_stencil.arr, _expected, places=8)
+        self.assertLess(self._solve("v"), 30)
+        self.assertNumpyArrayAlmostEqual(self._test_obj.levels[-1].mid, self._expected, places=10)
+
+    def test_rejects_unknown_coarse_operator(self):
+        self.assertRaises(ValueError, _poisson_core, coarse_operator="aggregation")
+
+
+if __name__ == '__main__':
+    unittest.main()
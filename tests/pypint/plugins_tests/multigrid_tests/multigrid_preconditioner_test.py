@@ -0,0 +1,55 @@
+# coding=utf-8
+import unittest
+
+import numpy
+import scipy.sparse.linalg as spla
+
+from tests import NumpyAwareTestCase
+from pypint.plugins.multigrid.multigrid_preconditioner import MultiGridPreconditioner
+from tests.pypint.plugins_tests.multigrid_tests.multigrid_core_test import _poisson_core
+
+
+class MultiGridPreconditionerTest(NumpyAwareTestCase):
+    def setUp(self):
+        self._core = _poisson_core()
+        self._matrix = self._core.stencils[-1].to_sparse_matrix(self._core.levels[-1].mid.shape, "csr")
+        self._rhs = numpy.random.RandomState(0).rand(self._matrix.shape[0])
+
+    def test_is_linear_operator_on_flattened_grid(self):
+        _test_obj = MultiGridPreconditioner(self._core)
+        self.assertTupleEqual(_test_obj.shape, self._matrix.shape)
+        _first = _test_obj.apply(self._rhs)
+        # nothing is carried over from the previous application
+        self.assertNumpyArrayAlmostEqual(_test_obj.apply(self._rhs), _first, places=14)
+        self.assertNumpyArrayAlmostEqual(_test_obj.apply(2.0 * self._rhs + _first), 2.0 * _first
+                                         + _test_obj.apply(_first), places=12)
+
+    def test_approximates_inverse(self):
+        _expected = spla.spsolve(self._matrix.tocsc(), self._rhs)
+        _error = lambda n_cycles: numpy.max(numpy.abs(MultiGridPreconditioner(self._core, n_cycles=n_cycles)
+                                                      .apply(self._rhs) - _expected))
+        self.assertLess(_error(1), 0.2 * numpy.max(numpy.abs(_expected)))
+        self.assertLess(_error(10), 1e-6 * numpy.max(numpy.abs(_expected)))
+
+    def test_symmetric_for_conjugate_gradients(self):
+        _test_obj = MultiGridPreconditioner(self._core)
+        _other = numpy.random.RandomState(1).rand(self._rhs.size)
+        self.assertAlmostEqual(_other.dot(_test_obj.apply(self._rhs)), self._rhs.dot(_test_obj.apply(_other)),
+                               places=10)
+
+    def test_preconditions_krylov_solvers(self):
+        for _cycle_type in ("v", "w", "f"):
+            _iterations = []
+            _solution, _info = spla.cg(self._matrix, self._rhs, tol=1e-10, callback=lambda xk: _iterations.append(0),
+                                       M=MultiGridPreconditioner(self._core, _cycle_type).as_linear_operator())
+            self.assertEqual(_info, 0)
+            self.assertLess(len(_iterations), 10)
+            self.assertNumpyArrayAlmostEqual(self._matrix.dot(_solution), self._rhs, places=6)
+
+    def test_validates_parameters(self):
+        self.assertRaises(ValueError, MultiGridPreconditioner, self._core, cycle_type="fmg")
+        self.assertRaises(ValueError, MultiGridPreconditioner, self._core, n_cycles=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,285 @@
+# coding=utf-8
+import unittest
+from threading import Thread
+
+import numpy
+import scipy.sparse.linalg as spla
+
+from tests import NumpyAwareTestCase
+from pypint.plugins.multigrid.level import MultigridLevel1D
+from pypint.plugins.multigrid.stencil import Stencil
+from pypint.plugins.multigrid.multigrid_preconditioner import MultiGridPreconditioner
+from pypint.plugins.multigrid.spectral_solver import fft
+from pypint.plugins.multigrid.factorization_cache import FactorizationCache
+from examples.problems.heat_equation import HeatEquation
+
+
+def _heat_equation(implicit_solve_method, num_points=31, boundary_values=(0.0, 0.0), **kwargs):
+    _left, _right = boundary_values
+    _x = numpy.linspace(0.0, 1.0, num_points + 2)[1:-1].reshape((num_points, 1))
+    problem = HeatEquation(dim=(num_points, 1), time_end=0.1, thermal_diffusivity=0.5,
+                           initial_value=numpy.exp(-100.0 * (_x - 0.5) ** 2),
+                           rhs_function_wrt_space=lambda dof, tensor: 0.0,
+                           boundary_functions=[[lambda x: _left, lambda x: _right]],
+                           boundaries=['dirichlet'] * 2, geometry=numpy.asarray([[0, 1]]),
+                           implicit_solve_method=implicit_solve_method, **kwargs)
+    problem._mg_level = MultigridLevel1D(num_points, mg_problem=problem, max_borders=numpy.array([2, 2]), role='FL')
+    problem._mg_stencil = Stencil(numpy.array([0.5, -1.0, 0.5]) / problem._mg_level.h ** 2)
+    return problem
+
+
+def _exact_implicit_solve(problem, rhs, delta_time):
+    _set = problem.initialize_direct_space_solver(0, delta_time)
+    _matrix = _set['stencil'].to_sparse_matrix(_set['mg_level'].mid.shape, "csc")
+    return spla.spsolve(_matrix, rhs.reshape(-1)).reshape(rhs.shape)
+
+
+def _mg_solve(problem, method, rhs, delta_time=0.01, **kwargs):
+    _set = problem.initialize_direct_space_solver(0, delta_time)
+    return problem.mg_solve(numpy.zeros(rhs.shape), method=method, rhs=rhs, stencil=_set['stencil'],
+                            stencil_fnc=_set['stencil_fnc'], time_level=0, delta_time=delta_time, **kwargs)
+
+
+def _mg_entry(problem, shape, delta_time=0.01):
+    _stencil_fnc = problem.initialize_direct_space_solver(0, delta_time)['stencil_fnc']
+    return problem._mg_cores.get(('0', shape, 'rediscretize', id(_stencil_fnc), 0), delta_time, lambda: None)
+
+
+class MultigridProblemMixinTest(NumpyAwareTestCase):
+    def setUp(self):
+        self._test_obj = _heat_equation('mg', num_points=19)
+        self._rhs = self._test_obj.initial_value.reshape(-1).copy()
+
+    def _solve(self, rhs, delta_time=0.01, problem=None):
+        if problem is None:
+            problem = self._test_obj
+        return problem.implicit_solve(numpy.zeros(rhs.shape), None, expl_term=rhs, delta_time=delta_time,
+                                      time_level=0)
+
+    def test_mg_reused_hierarchy_solves_as_new_one(self):
+        self._solve(2.0 * self._rhs)
+        self.assertNumpyArrayAlmostEqual(self._solve(self._rhs),
+                                         self._solve(self._rhs, problem=_heat_equation('mg', num_points=19)),
+                                         places=12)
+
+    def test_mg_reuses_hierarchy(self):
+        _first = self._solve(self._rhs)
+        _core = self._test_obj.mg_core
+        _second = self._solve(2.0 * self._rhs)
+        self.assertIs(self._test_obj.mg_core, _core)
+        self.assertEqual(self._test_obj._mg_cores.misses, 1)
+        self.assertEqual(self._test_obj._mg_cores.hits, 1)
+        # the hierarchy does not carry over any values of the previous solve
+        self.assertNumpyArrayAlmostEqual(_second, 2.0 * _first, places=12)
+
+    def test_mg_returns_copy_of_solution(self):
+        _first = self._solve(self._rhs)
+        _expected = _first.copy()
+        self._solve(2.0 * self._rhs)
+        self.assertNumpyArrayEqual(_first, _expected)
+
+    def test_mg_assembles_hierarchy_per_delta_time(self):
+        self._solve(self._rhs, delta_time=0.01)
+        _core = self._test_obj.mg_core
+        _solution = self._solve(self._rhs, delta_time=0.02)
+        self.assertIsNot(self._test_obj.mg_core, _core)
+        self.assertEqual(len(self._test_obj._mg_cores), 2)
+        self.assertNumpyArrayAlmostEqual(_solution, self._solve(self._rhs, delta_time=0.02,
+                                                                problem=_heat_equation('mg', num_points=19)),
+                                         places=12)
+
+    def test_mg_assembles_hierarchy_per_stencil_function(self):
+        self._solve(self._rhs)
+        _core = self._test_obj.mg_core
+        # another operator for the same time level and delta time
+        _stencil_fnc = lambda level: self._test_obj.mg_stencil(0.02, level.h)
+        _solution = self._test_obj.mg_solve(numpy.zeros(self._rhs.shape), method='mg', rhs=self._rhs,
+                                            stencil_fnc=_stencil_fnc, time_level=0, delta_time=0.01)
+        self.assertIsNot(self._test_obj.mg_core, _core)
+        self.assertEqual(self._test_obj._mg_cores.misses, 2)
+        self.assertNumpyArrayAlmostEqual(_solution, _exact_implicit_solve(self._test_obj, self._rhs, 0.02), places=6)
+
+    def test_mg_hierarchies_are_bounded(self):
+        for _step in range(0, 40):
+            self._solve(self._rhs, delta_time=0.001 * (_step + 1))
+        self.assertEqual(len(self._test_obj._mg_cores), 32)
+        self.assertEqual(self._test_obj._mg_cores.evictions, 8)
+
+    def test_mg_threads_solving_one_after_another_share_hierarchy(self):
+        self._solve(self._rhs)
+        _cores = [self._test_obj.mg_core]
+
+        def _solve_in_thread():
+            self._solve(self._rhs)
+            _cores.append(self._test_obj.mg_core)
+
+        for _ in range(0, 3):
+            _thread = Thread(target=_solve_in_thread)
+            _thread.start()
+            _thread.join()
+        self.assertTrue(all(_core is _cores[0] for _core in _cores))
+        self.assertEqual(self._test_obj._mg_cores.misses, 1)
+
+    def test_mg_assembles_hierarchy_per_thread_solving_at_once(self):
+        self._solve(self._rhs)
+        _cores = [self._test_obj.mg_core]
+
+        def _solve_in_thread():
+            self._solve(self._rhs)
+            _cores.append(self._test_obj.mg_core)
+
+        # the slot of the first hierarchy is taken while the other thread solves
+        with self._test_obj._mg_slot():
+            _thread = Thread(target=_solve_in_thread)
+            _thread.start()
+            _thread.join()
+        self.assertIsNot(_cores[1], _cores[0])
+        self.assertEqual(self._test_obj._mg_cores.misses, 2)
+
+    def test_mg_hierarchy_keeps_memory_of_levels(self):
+        self._solve(self._rhs)
+        _entry = _mg_entry(self._test_obj, self._rhs.shape)
+        self.assertIs(_entry['arena'], _entry['core'].arena)
+        self.assertEqual(self._test_obj._mg_cores.nbytes, _entry['arena'].nbytes)
+
+    def test_mg_threads_are_bounded(self):
+        _problem = HeatEquation(dim=(19, 1), rhs_function_wrt_space=lambda dof, tensor: 0.0, mg_max_threads=2)
+        self.assertEqual(_problem._mg_slots.maxsize, 2)
+        self.assertRaises(ValueError, HeatEquation, dim=(19, 1), rhs_function_wrt_space=lambda dof, tensor: 0.0,
+                          mg_max_threads=0)
+
+
+class MultigridProblemMixinKrylovTest(NumpyAwareTestCase):
+    def _solve(self, method, num_points=31, **kwargs):
+        self._test_obj = _heat_equation(method, num_points)
+        self._rhs = self._test_obj.initial_value.reshape(-1).copy()
+        return _mg_solve(self._test_obj, method, self._rhs, **kwargs)
+
+    def test_preconditioned_krylov_methods_solve_implicit_system(self):
+        for _method in ('cg', 'gmres', 'bicgstab'):
+            for _preconditioner in ('mg', 'amg'):
+                _solution = self._solve(_method, mg_preconditioner=_preconditioner, mg_tolerance=1e-10)
+                self.assertNumpyArrayAlmostEqual(_solution, _exact_implicit_solve(self._test_obj, self._rhs, 0.01),
+                                                 places=10)
+
+    def test_iterations_do_not_grow_with_grid(self):
+        for _num_points in (31, 127):
+            _solution = self._solve('cg', num_points=_num_points, mg_tolerance=1e-10, mg_max_cycles=10)
+            self.assertNumpyArrayAlmostEqual(_solution, _exact_implicit_solve(self._test_obj, self._rhs, 0.01),
+                                             places=8)
+
+    def test_reuses_multigrid_preconditioner(self):
+        _preconditioner = lambda: _mg_entry(self._test_obj, self._rhs.shape)['preconditioner']
+        self._solve('cg')
+        _first = _preconditioner()
+        self.assertIsInstance(_first, MultiGridPreconditioner)
+        _mg_solve(self._test_obj, 'cg', self._rhs)
+        self.assertEqual(self._test_obj._mg_cores.misses, 1)
+        self.assertIs(_preconditioner(), _first)
+
+    def test_rejects_unknown_preconditioner(self):
+        self.assertRaises(ValueError, self._solve, 'cg', mg_preconditioner='ilu')
+
+
+@unittest.skipIf(fft is None, "requires scipy.fft")
+class MultigridProblemMixinSpectralTest(NumpyAwareTestCase):
+    def setUp(self):
+        self._test_obj = _heat_equation('fft')
+        self._rhs = self._test_obj.initial_value.copy()
+
+    def test_fft_solves_implicit_system(self):
+        for _delta_time in (0.01, 0.02):
+            self.assertNumpyArrayAlmostEqual(_mg_solve(self._test_obj, 'fft', self._rhs, delta_time=_delta_time),
+                                             _exact_implicit_solve(self._test_obj, self._rhs, _delta_time),
+                                             places=12)
+
+    def test_fft_solves_implicit_system_via_implicit_solve(self):
+        _rhs = self._rhs.reshape(-1)
+        self.assertNumpyArrayAlmostEqual(self._test_obj.implicit_solve(numpy.zeros(_rhs.shape), None, expl_term=_rhs,
+                                                                       delta_time=0.01),
+                                         _exact_implicit_solve(self._test_obj, _rhs, 0.01), places=12)
+
+    def test_fft_reuses_solver(self):
+        _mg_solve(self._test_obj, 'fft', self._rhs)
+        _mg_solve(self._test_obj, 'fft', 2.0 * self._rhs)
+        self.assertEqual((self._test_obj._spectral_solvers.misses, self._test_obj._spectral_solvers.hits), (1, 1))
+        _mg_solve(self._test_obj, 'fft', self._rhs, delta_time=0.02)
+        self.assertEqual(self._test_obj._spectral_solvers.misses, 2)
+
+
+class HeatEquationDirectSolverCacheTest(NumpyAwareTestCase):
+    def setUp(self):
+        self._cache = FactorizationCache()
+
+    def _solve(self, problem, rhs):
+        return problem.implicit_solve(numpy.zeros(rhs.shape), None, expl_term=rhs, delta_time=0.01, time_level=0)
+
+    def test_problems_with_same_operator_share_solver(self):
+        _first = _heat_equation('direct', direct_solver_cache=self._cache)
+        _second = _heat_equation('direct', direct_solver_cache=self._cache)
+        self.assertIs(_second.initialize_direct_space_solver(0, 0.01), _first.initialize_direct_space_solver(0, 0.01))
+        self.assertEqual(self._cache.misses, 1)
+
+    def test_problems_with_other_operator_do_not_share_solver(self):
+        _first = _heat_equation('direct', direct_solver_cache=self._cache)
+        _second = _heat_equation('direct', direct_solver_cache=self._cache)
+        _second.thermal_diffusivity = 1.0
+        _expected = _heat_equation('direct')
+        _expected.thermal_diffusivity = 1.0
+        _rhs = _first.initial_value.reshape(-1).copy()
+        self._solve(_first, _rhs)
+        self.assertNumpyArrayAlmostEqual(self._solve(_second, _rhs), _exact_implicit_solve(_expected, _rhs, 0.01),
+                                         places=12)
+        self.assertEqual(self._cache.misses, 2)
+
+    def test_problems_on_other_grid_width_do_not_share_solver(self):
+        _first = _heat_equation('direct', direct_solver_cache=self._cache)
+        _second = _heat_equation('direct', direct_solver_cache=self._cache)
+        _second._mg_level.h = 2.0 * _first._mg_level.h
+        self.assertIsNot(_second.initialize_direct_space_solver(0, 0.01),
+                         _first.initialize_direct_space_solver(0, 0.01))
+        self.assertEqual(self._cache.misses, 2)
+
+
+class HeatEquationBoundaryTermsTest(NumpyAwareTestCase):
+    def setUp(self):
+        self._test_obj = _heat_equation('direct', boundary_values=(1.0, 2.0))
+        self._test_obj._mg_level.pad()
+        self._rhs = self._test_obj.initial_value.reshape(-1).copy()
+
+    def _solve(self, problem, delta_time=0.01):
+        return problem.implicit_solve(numpy.zeros(self._rhs.shape), None, expl_term=self._rhs, delta_time=delta_time,
+                                      time_level=0)
+
+    def test_computes_boundary_terms_once_per_stencil(self):
+        _first = self._solve(self._test_obj)
+        self.assertNumpyArrayAlmostEqual(self._solve(self._test_obj), _first, places=14)
+        self.assertEqual((self._test_obj._boundary_terms_cache.misses, self._test_obj._boundary_terms_cache.hits),
+                         (1, 1))
+        self._solve(self._test_obj, delta_time=0.02)
+        self.assertEqual(self._test_obj._boundary_terms_cache.misses, 2)
+
+    def test_solve_moves_boundary_values_into_right_hand_side(self):
+        _solution = self._solve(self._test_obj)
+        _operator = self._test_obj.initialize_direct_space_solver(0, 0.01)['stencil']
+        # the boundary values enter the outermost inner points through the off-diagonal couplings
+        _expected_rhs = self._rhs.copy()
+        _expected_rhs[0] -= _operator.arr[0] * 1.0
+        _expected_rhs[-1] -= _operator.arr[-1] * 2.0
+        self.assertNumpyArrayAlmostEqual(_operator.to_sparse_matrix((self._rhs.size,), "csr").dot(_solution),
+                                         _expected_rhs, places=10)
+
+    def test_evaluation_reuses_padded_buffer(self):
+        _phi = self._test_obj.initial_value
+        _first = self._test_obj.evaluate_wrt_time(0.0, _phi)
+        _buffer = self._test_obj._padded_buffers.arr
+        _zero = self._test_obj.evaluate_wrt_time(0.0, numpy.zeros(_phi.shape))
+        self.assertIs(self._test_obj._padded_buffers.arr, _buffer)
+        self.assertNumpyArrayAlmostEqual(_first - _zero,
+                                         self._test_obj.linear_operator().dot(_phi.reshape(-1)).reshape(_phi.shape),
+                                         places=8)
+        self.assertNumpyArrayAlmostEqual(self._test_obj.evaluate_wrt_time(0.0, _phi), _first, places=14)
+
+
+if __name__ == '__main__':
+    unittest.main()
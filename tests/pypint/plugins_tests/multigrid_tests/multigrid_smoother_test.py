@@ -0,0 +1,170 @@
+# coding=utf-8
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy
+
+from tests import NumpyAwareTestCase
+from pypint.plugins.multigrid.multigrid_problem import MultigridProblem
+from pypint.plugins.multigrid.level import MultigridLevel1D
+from pypint.plugins.multigrid.level2d import MultigridLevel2D
+from pypint.plugins.multigrid.level3d import MultigridLevel3D
+from pypint.plugins.multigrid.stencil import Stencil
+from pypint.plugins.multigrid.multigrid_smoother import RedBlackGaussSeidelSmoother, ChebyshevJacobiSmoother, \
+    DampedJacobiSmoother
+
+
+def _laplace_level(shape, boundaries='dirichlet'):
+    """Level with homogeneous Dirichlet boundaries, or the given ones, and the stencil of :math:`-\\Delta_h` on it
+    """
+    _zero = lambda x: 0.0
+    if isinstance(shape, int):
+        _problem = MultigridProblem(dim=(shape, 1), rhs_function_wrt_space=lambda dof, tensor: 0.0,
+                                    boundaries=boundaries, boundary_functions=[[_zero, _zero]],
+                                    geometry=numpy.asarray([[0, 1]]))
+        _level = MultigridLevel1D(shape, mg_problem=_problem, max_borders=numpy.array([1, 1]), role="FL")
+        _stencil = Stencil(numpy.array([-1.0, 2.0, -1.0]) / _level.h ** 2)
+    else:
+        _dim = len(shape)
+        _problem = MultigridProblem(dim=shape + (1,), rhs_function_wrt_space=lambda dof, tensor: 0.0,
+                                    boundaries=boundaries, boundary_functions=[[_zero, _zero]] * _dim,
+                                    geometry=numpy.asarray([[0, 1]] * _dim))
+        _level_class = MultigridLevel2D if _dim == 2 else MultigridLevel3D
+        _level = _level_class(shape, mg_problem=_problem, max_borders=numpy.ones((_dim, 2), dtype=int), role="FL")
+        _arr = numpy.zeros((3,) * _dim)
+        _arr[(1,) * _dim] = 2.0 * _dim
+        for _axis in range(0, _dim):
+            for _neighbour in (0, 2):
+                _arr[(1,) * _axis + (_neighbour,) + (1,) * (_dim - _axis - 1)] = -1.0
+        _stencil = Stencil(_arr / _level.h[0] ** 2)
+    _level.pad()
+    return _level, _stencil
+
+
+def _red_black_gauss_seidel(matrix, values, rhs):
+    """Gauss-Seidel sweep over the red points followed by the black ones, point by point
+    """
+    _values = values.reshape(-1).copy()
+    _colors = numpy.indices(values.shape).reshape(values.ndim, -1).sum(axis=0) % 2
+    for _color in (0, 1):
+        for _i in numpy.nonzero(_colors == _color)[0]:
+            _values[_i] += (rhs.reshape(-1)[_i] - matrix[_i].dot(_values)) / matrix[_i, _i]
+    return _values.reshape(values.shape)
+
+
+class RedBlackGaussSeidelSmootherTest(NumpyAwareTestCase):
+    def test_sweeps_equal_point_wise_gauss_seidel(self):
+        _random = numpy.random.RandomState(0)
+        for _shape in (15, (7, 9)):
+            _level, _stencil = _laplace_level(_shape)
+            _matrix = _stencil.to_sparse_matrix(_level.mid.shape).toarray()
+            _values = _random.rand(*_level.mid.shape)
+            _rhs = _random.rand(*_level.mid.shape)
+            _level.mid[:] = _values
+            _level.rhs = _rhs
+            RedBlackGaussSeidelSmoother(_stencil, _level).relax(2)
+            _expected = _red_black_gauss_seidel(_matrix, _red_black_gauss_seidel(_matrix, _values, _rhs), _rhs)
+            self.assertNumpyArrayAlmostEqual(_level.mid, _expected, places=12)
+
+    def test_rejects_stencil_coupling_points_of_same_color(self):
+        _level, _stencil = _laplace_level((7, 9))
+        _nine_point = Stencil(numpy.array([[-1.0, -1.0, -1.0], [-1.0, 8.0, -1.0], [-1.0, -1.0, -1.0]]))
+        self.assertRaises(ValueError, RedBlackGaussSeidelSmoother, _nine_point, _level)
+
+
+class ChebyshevJacobiSmootherTest(NumpyAwareTestCase):
+    def test_applies_chebyshev_polynomial_to_eigenvectors(self):
+        _level, _stencil = _laplace_level(31)
+        _test_obj = ChebyshevJacobiSmoother(_stencil, _level, degree=3)
+        _theta = 0.5 * (_test_obj.max_eigenvalue + _test_obj.min_eigenvalue)
+        _delta = 0.5 * (_test_obj.max_eigenvalue - _test_obj.min_eigenvalue)
+        _chebyshev = numpy.polynomial.chebyshev.Chebyshev([0.0, 0.0, 0.0, 1.0])
+        _points = numpy.arange(1, 32)
+        for _frequency in (3, 20, 30):
+            # eigenvalues of D^{-1} A are 1 - cos(k pi h)
+            _eigenvector = numpy.sin(numpy.pi * _frequency * _points / 32.0)
+            _eigenvalue = 1.0 - numpy.cos(numpy.pi * _frequency / 32.0)
+            _level.mid[:] = _eigenvector
+            _level.rhs = 0.0
+            _test_obj.relax()
+            _factor = _chebyshev((_theta - _eigenvalue) / _delta) / _chebyshev(_theta / _delta)
+            self.assertNumpyArrayAlmostEqual(_level.mid, _factor * _eigenvector, places=12)
+
+    def test_damps_high_frequencies(self):
+        _level, _stencil = _laplace_level(31)
+        _level.mid[:] = numpy.sin(numpy.pi * 24 * numpy.arange(1, 32) / 32.0)
+        _level.rhs = 0.0
+        ChebyshevJacobiSmoother(_stencil, _level).relax()
+        self.assertLess(numpy.max(numpy.abs(_level.mid)), 0.1)
+
+    def test_validates_parameters(self):
+        _level, _stencil = _laplace_level(31)
+        self.assertRaises(ValueError, ChebyshevJacobiSmoother, _stencil, _level, degree=0)
+        self.assertRaises(ValueError, ChebyshevJacobiSmoother, _stencil, _level, lower_fraction=1.0)
+
+
+class DampedJacobiSmootherTest(NumpyAwareTestCase):
+    def test_sweeps_equal_matrix_formulation(self):
+        _random = numpy.random.RandomState(0)
+        for _shape in (15, (7, 9), (5, 5, 5)):
+            _level, _stencil = _laplace_level(_shape)
+            _matrix = _stencil.to_sparse_matrix(_level.mid.shape).toarray()
+            _values = _random.rand(*_level.mid.shape).reshape(-1)
+            _rhs = _random.rand(*_level.mid.shape)
+            _level.mid[:] = _values.reshape(_level.mid.shape)
+            _level.rhs = _rhs
+            DampedJacobiSmoother(_stencil, _level, omega=0.8).relax(2)
+            _diagonal = numpy.diag(_matrix)
+            for _i in range(0, 2):
+                _values = _values + 0.8 * (_rhs.reshape(-1) - _matrix.dot(_values)) / _diagonal
+            self.assertNumpyArrayAlmostEqual(_level.mid.reshape(-1), _values, places=12)
+
+
+class BlockSmoothingTest(NumpyAwareTestCase):
+    _smoothers = [DampedJacobiSmoother, RedBlackGaussSeidelSmoother, ChebyshevJacobiSmoother]
+
+    def _relax(self, smoother, shape, boundaries='dirichlet', **kwargs):
+        _level, _stencil = _laplace_level(shape, boundaries)
+        _random = numpy.random.RandomState(0)
+        _level.mid[:] = _random.rand(*_level.mid.shape)
+        _level.rhs = _random.rand(*_level.mid.shape)
+        _level.pad()
+        _test_obj = smoother(_stencil, _level, **kwargs)
+        _test_obj.relax(3)
+        return _test_obj, _level.mid.copy()
+
+    def test_results_do_not_depend_on_number_of_workers(self):
+        for _smoother in self._smoothers:
+            for _shape in (31, (15, 17), (7, 9, 11)):
+                for _boundaries in ('dirichlet', 'periodic'):
+                    _serial = self._relax(_smoother, _shape, _boundaries)[1]
+                    _test_obj, _blocked = self._relax(_smoother, _shape, _boundaries, n_workers=3, min_block_size=1)
+                    self.assertEqual(len(_test_obj._row_blocks(numpy.atleast_1d(_blocked).shape)), 3)
+                    self.assertNumpyArrayEqual(_blocked, _serial)
+
+    def test_given_executor(self):
+        _executor = ThreadPoolExecutor(max_workers=2)
+        try:
+            for _smoother in self._smoothers:
+                self.assertNumpyArrayEqual(self._relax(_smoother, (15, 17), n_workers=4, executor=_executor,
+                                                       min_block_size=1)[1],
+                                           self._relax(_smoother, (15, 17))[1])
+        finally:
+            _executor.shutdown()
+
+    def test_row_blocks(self):
+        _test_obj = self._relax(DampedJacobiSmoother, (15, 17), n_workers=4, min_block_size=100)[0]
+        # at most one block per 100 points
+        self.assertListEqual(_test_obj._row_blocks((15, 17)), [(0, 7), (7, 15)])
+        self.assertListEqual(_test_obj._row_blocks((3, 2)), [(0, 3)])
+        self.assertListEqual(self._relax(DampedJacobiSmoother, (15, 17), n_workers=4)[0]._row_blocks((15, 17)),
+                             [(0, 15)])
+
+    def test_validates_parameters(self):
+        _level, _stencil = _laplace_level((7, 9))
+        self.assertRaises(ValueError, DampedJacobiSmoother, _stencil, _level, n_workers=0)
+        self.assertRaises(ValueError, DampedJacobiSmoother, _stencil, _level, n_workers=2, executor=object())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+# coding=utf-8
+import unittest
+
+import numpy
+import scipy.sparse as sprs
+import scipy.sparse.linalg as spla
+
+from tests import NumpyAwareTestCase
+from pypint.plugins.multigrid.smoothed_aggregation import SmoothedAggregationSolver
+
+
+def _laplace_matrix(n, anisotropy=1.0):
+    """Five point stencil of :math:`-u_{xx} - \\epsilon u_{yy}` on :math:`n \\times n` points
+    """
+    _tridiagonal = sprs.diags([-1.0, 2.0, -1.0], [-1, 0, 1], shape=(n, n))
+    _identity = sprs.identity(n)
+    return (sprs.kron(_tridiagonal, _identity) + anisotropy * sprs.kron(_identity, _tridiagonal)).tocsr()
+
+
+class SmoothedAggregationSolverTest(NumpyAwareTestCase):
+    def setUp(self):
+        self._matrix = _laplace_matrix(31)
+        self._rhs = numpy.random.RandomState(0).rand(self._matrix.shape[0])
+
+    def test_builds_hierarchy(self):
+        _test_obj = SmoothedAggregationSolver(self._matrix)
+        self.assertGreater(_test_obj.num_levels, 2)
+        self.assertLessEqual(_test_obj.levels[-1]['A'].shape[0], 50)
+        self.assertLess(_test_obj.operator_complexity, 2.0)
+        self.assertEqual(SmoothedAggregationSolver(self._matrix, max_levels=2).num_levels, 2)
+
+    def test_solves_poisson_problem(self):
+        _test_obj = SmoothedAggregationSolver(self._matrix)
+        _solution = _test_obj.solve(self._rhs.reshape(31, 31), tolerance=1e-10)
+        self.assertTupleEqual(_solution.shape, (31, 31))
+        self.assertNumpyArrayAlmostEqual(_solution.reshape(-1), spla.spsolve(self._matrix.tocsc(), self._rhs),
+                                         places=8)
+        self.assertLess(_test_obj.cycles, 50)
+
+    def test_solves_anisotropic_problem(self):
+        _matrix = _laplace_matrix(31, anisotropy=1e-3)
+        _test_obj = SmoothedAggregationSolver(_matrix)
+        _solution = _test_obj.solve(self._rhs, tolerance=1e-10)
+        self.assertLess(_test_obj.cycles, 50)
+        self.assertNumpyArrayAlmostEqual(_solution, spla.spsolve(_matrix.tocsc(), self._rhs), places=8)
+
+    def test_stops_at_maximum_cycles(self):
+        _test_obj = SmoothedAggregationSolver(self._matrix)
+        _test_obj.solve(self._rhs, tolerance=0.0, max_cycles=3)
+        self.assertEqual(_test_obj.cycles, 3)
+
+    def test_preconditions_conjugate_gradients(self):
+        _iterations = []
+        _count = lambda xk: _iterations.append(None)
+        spla.cg(self._matrix, self._rhs, tol=1e-10, callback=_count)
+        _plain = len(_iterations)
+        del _iterations[:]
+        _solution, _info = spla.cg(self._matrix, self._rhs, tol=1e-10, callback=_count,
+                                   M=SmoothedAggregationSolver(self._matrix).as_linear_operator())
+        self.assertEqual(_info, 0)
+        self.assertLess(2 * len(_iterations), _plain)
+
+    def test_rejects_non_square_matrix(self):
+        self.assertRaises(ValueError, SmoothedAggregationSolver, sprs.csr_matrix(numpy.ones((3, 4))))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+# coding=utf-8
+import itertools
+import unittest
+
+import numpy
+
+from tests import NumpyAwareTestCase
+from pypint.plugins.multigrid.stencil import Stencil
+from pypint.plugins.multigrid.spectral_solver import SpectralSpaceSolver, fft
+
+
+def _dense_matrix(stencil, shape, boundaries):
+    """Matrix of the stencil with the values outside the grid given by the boundary conditions
+    """
+    _modes = {'periodic': 'wrap', 'dirichlet': 'constant', 'neumann': 'symmetric'}
+    _center = numpy.asarray(stencil.center).reshape(-1)
+    _radius = [(c, n - c - 1) for c, n in zip(_center, stencil.arr.shape)]
+    _matrix = numpy.zeros((numpy.prod(shape), numpy.prod(shape)), dtype=numpy.result_type(stencil.arr, float))
+    for _column in range(_matrix.shape[1]):
+        _unit = numpy.zeros(numpy.prod(shape))
+        _unit[_column] = 1.0
+        _padded = _unit.reshape(shape)
+        for _axis, _bc in enumerate(boundaries):
+            _padding = [(0, 0)] * len(shape)
+            _padding[_axis] = _radius[_axis]
+            _padded = numpy.pad(_padded, _padding, mode=_modes[_bc])
+        _values = numpy.zeros(shape, dtype=_matrix.dtype)
+        # (S u)_i = sum over the offsets o of S[c + o] u[i + o]
+        for _index in itertools.product(*[range(n) for n in stencil.arr.shape]):
+            _values += stencil.arr[_index] * _padded[tuple(slice(i, i + n) for i, n in zip(_index, shape))]
+        _matrix[:, _column] = _values.reshape(-1)
+    return _matrix
+
+
+@unittest.skipIf(fft is None, "requires scipy.fft")
+class SpectralSpaceSolverTest(NumpyAwareTestCase):
+    def setUp(self):
+        self._random = numpy.random.RandomState(0)
+
+    def _assert_solves(self, stencil, shape, boundaries, complex_rhs=False):
+        _test_obj = SpectralSpaceSolver(stencil, shape, boundaries)
+        _rhs = self._random.rand(*shape)
+        if complex_rhs:
+            _rhs = _rhs + 1j * self._random.rand(*shape)
+        _solution = _test_obj.solve(_rhs)
+        self.assertTupleEqual(_solution.shape, _rhs.shape)
+        self.assertEqual(numpy.iscomplexobj(_solution), complex_rhs or numpy.iscomplexobj(stencil.arr))
+        _bcs = [boundaries] * len(shape) if isinstance(boundaries, str) else boundaries
+        self.assertNumpyArrayAlmostEqual(_dense_matrix(stencil, shape, _bcs).dot(_solution.reshape(-1)),
+                                         _rhs.reshape(-1), places=10)
+
+    def test_dirichlet_equals_sparse_matrix(self):
+        _stencil = Stencil(numpy.array([-1.0, 3.0, -1.0]))
+        _rhs = self._random.rand(20)
+        self.assertNumpyArrayAlmostEqual(_stencil.to_sparse_matrix((20,)).dot(
+            SpectralSpaceSolver(_stencil, (20,), 'dirichlet').solve(_rhs)), _rhs, places=12)
+
+    def test_solves_one_dimensional_problems(self):
+        for _boundaries in SpectralSpaceSolver.valid_boundaries:
+            self._assert_solves(Stencil(numpy.array([-1.0, 2.5, -1.0])), (17,), _boundaries)
+            self._assert_solves(Stencil(numpy.array([-1.0, 2.5, -1.0])), (16,), _boundaries, complex_rhs=True)
+
+    def test_solves_two_dimensional_problems(self):
+        _stencil = Stencil(numpy.array([[0.0, -1.0, 0.0], [-2.0, 6.5, -2.0], [0.0, -1.0, 0.0]]))
+        for _boundaries in itertools.product(SpectralSpaceSolver.valid_boundaries, repeat=2):
+            self._assert_solves(_stencil, (9, 12), list(_boundaries))
+
+    def test_periodic_solves_non_symmetric_and_complex_stencils(self):
+        self._assert_solves(Stencil(numpy.array([-1.0, 3.0, -0.5, 0.25, 0.1])), (15,), 'periodic')
+        self._assert_solves(Stencil(numpy.array([[0.0, 1.0, 0.0], [-1.0, 5.0, 0.5], [0.0, -1.0j, 0.0]])), (8, 7),
+                            'periodic')
+
+    def test_matches_direct_solve_of_implicit_heat_equation(self):
+        # (I - dt * nu * Laplace) u = b on 63 interior points
+        _h = 1.0 / 64.0
+        _stencil = Stencil(numpy.array([-1.0, 2.0 + _h ** 2 / 0.005, -1.0]) * 0.005 / _h ** 2)
+        _rhs = numpy.sin(numpy.pi * numpy.arange(1, 64) * _h)
+        _solution = SpectralSpaceSolver(_stencil, (63,), 'dirichlet').solve(_rhs)
+        self.assertNumpyArrayAlmostEqual(_solution, _rhs / (1.0 + 0.005 * 4.0 / _h ** 2 *
+                                                            numpy.sin(numpy.pi * _h / 2.0) ** 2), places=12)
+
+    def test_symbol_holds_eigenvalues(self):
+        _test_obj = SpectralSpaceSolver(Stencil(numpy.array([-1.0, 2.0, -1.0])), (7,), 'dirichlet')
+        self.assertNumpyArrayAlmostEqual(_test_obj.symbol, 2.0 - 2.0 * numpy.cos(numpy.pi * numpy.arange(1, 8) / 8.0),
+                                         places=14)
+        self.assertListEqual(_test_obj.boundaries, ['dirichlet'])
+        self.assertTupleEqual(_test_obj.shape, (7,))
+
+    def test_validates_stencil_and_boundaries(self):
+        _laplace = Stencil(numpy.array([-1.0, 2.0, -1.0]))
+        self.assertRaises(ValueError, SpectralSpaceSolver, _laplace, (8, 8))
+        self.assertRaises(ValueError, SpectralSpaceSolver, _laplace, (8,), 'robin')
+        self.assertRaises(ValueError, SpectralSpaceSolver, _laplace, (8,), ['periodic', 'periodic'])
+        # the constants are in the kernel
+        self.assertRaises(ValueError, SpectralSpaceSolver, _laplace, (8,), 'periodic')
+        self.assertRaises(ValueError, SpectralSpaceSolver, Stencil(numpy.array([-1.0, 3.0, -2.0])), (8,),
+                          'dirichlet')
+        self.assertRaises(ValueError, SpectralSpaceSolver, Stencil(numpy.array([1.0, -1.0, 3.0, -1.0, 1.0])), (8,),
+                          'neumann')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,117 @@
+# coding=utf-8
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
+
+import numpy
+
+from tests import NumpyAwareTestCase
+from pypint.plugins.multigrid.stencil import Stencil
+from pypint.plugins.multigrid.stencil_engine import StencilEngine
+
+
+_STENCILS = [
+    Stencil(numpy.array([1.0, -2.0, 1.0])),
+    Stencil(numpy.array([[0.0, 1.0, 0.0], [1.0, -4.0, 1.0], [0.0, 2.0, 0.0]]))
+]
+
+
+def _input(stencil, convolve_control, dtype=float):
+    _shape = (17,) if stencil.dim == 1 else (9, 11)
+    if convolve_control == "valid":
+        _shape = tuple(n + m - 1 for n, m in zip(_shape, stencil.arr.shape))
+    _values = numpy.random.RandomState(1).rand(*_shape)
+    return _values + 1j * _values[::-1] if numpy.dtype(dtype).kind == 'c' else _values
+
+
+class StencilEngineTest(NumpyAwareTestCase):
+    def test_strategies_equal_convolution(self):
+        for _stencil in _STENCILS:
+            for _convolve_control in ("valid", "same"):
+                _in = _input(_stencil, _convolve_control)
+                _expected = _stencil.eval_convolve(_in, _convolve_control)
+                for _strategy in StencilEngine.strategies:
+                    _test_obj = StencilEngine(_stencil, _in.shape, _convolve_control, strategy=_strategy)
+                    _out = numpy.empty(_test_obj.out_shape)
+                    self.assertIs(_test_obj(_in, _out), _out)
+                    self.assertNumpyArrayAlmostEqual(_out, _expected, places=12)
+
+    def test_complex_values(self):
+        _stencil = _STENCILS[1]
+        _in = _input(_stencil, "valid", complex)
+        _test_obj = StencilEngine(_stencil, _in.shape, dtype=complex)
+        self.assertNotEqual(_test_obj.strategy, 'ndimage')
+        _out = numpy.empty(_test_obj.out_shape, dtype=complex)
+        self.assertNumpyArrayAlmostEqual(_test_obj(_in, _out), _stencil.eval_convolve(_in), places=12)
+
+    def test_benchmark_keeps_global_random_state(self):
+        numpy.random.seed(42)
+        _expected = numpy.random.rand()
+        numpy.random.seed(42)
+        StencilEngine(_STENCILS[0], (23,), repeats=1)
+        self.assertEqual(numpy.random.rand(), _expected)
+
+    def test_remembers_benchmarked_strategy(self):
+        _test_obj = StencilEngine(_STENCILS[1], (13, 13), repeats=1)
+        self.assertIn(_test_obj.strategy, StencilEngine.strategies)
+        for _i in range(0, 3):
+            self.assertEqual(StencilEngine(_STENCILS[1], (13, 13), repeats=1).strategy, _test_obj.strategy)
+
+    def test_is_applied_by_several_threads_at_once(self):
+        # large enough for the applications of the threads to overlap
+        _stencil = _STENCILS[1]
+        _inputs = [numpy.random.RandomState(_i).rand(514, 514) for _i in range(0, 4)]
+        _expected = [_stencil.eval_convolve(_in) for _in in _inputs]
+        for _strategy in StencilEngine.strategies:
+            _test_obj = StencilEngine(_stencil, _inputs[0].shape, strategy=_strategy)
+            _barrier = Barrier(len(_inputs))
+
+            def _apply(index):
+                _out = numpy.empty(_test_obj.out_shape)
+                _barrier.wait()
+                _errors = []
+                for _ in range(0, 20):
+                    _errors.append(numpy.abs(_test_obj(_inputs[index], _out) - _expected[index]).max())
+                return max(_errors)
+
+            with ThreadPoolExecutor(max_workers=len(_inputs)) as _executor:
+                _errors = list(_executor.map(_apply, range(0, len(_inputs))))
+            self.assertLess(max(_errors), 1e-12, "strategy %s" % _strategy)
+
+    def test_validates_parameters(self):
+        self.assertRaises(ValueError, StencilEngine, _STENCILS[0], (10,), "full")
+        self.assertRaises(ValueError, StencilEngine, _STENCILS[0], (10,), strategy="fft")
+
+
+class StencilEvalIntoTest(NumpyAwareTestCase):
+    def test_eval_into_equals_eval_convolve(self):
+        for _stencil in _STENCILS:
+            for _convolve_control in ("valid", "same"):
+                _in = _input(_stencil, _convolve_control)
+                _expected = _stencil.eval_convolve(_in, _convolve_control)
+                _out = numpy.empty(_expected.shape)
+                _stencil.eval_into(_in, _out, _convolve_control)
+                self.assertNumpyArrayAlmostEqual(_out, _expected, places=12)
+
+    def test_eval_into_reuses_engine(self):
+        _stencil = Stencil(numpy.array([1.0, -2.0, 1.0]))
+        _in = _input(_stencil, "valid")
+        _out = numpy.empty(_in.size - 2)
+        _stencil.eval_into(_in, _out)
+        _engines = dict(_stencil._engines)
+        _stencil.eval_into(2.0 * _in, _out)
+        self.assertDictEqual(_stencil._engines, _engines)
+        self.assertNumpyArrayAlmostEqual(_out, 2.0 * _stencil.eval_convolve(_in), places=12)
+
+    def test_assigning_array_drops_engines(self):
+        _stencil = Stencil(numpy.array([1.0, -2.0, 1.0]))
+        _in = _input(_stencil, "valid")
+        _out = numpy.empty(_in.size - 2)
+        _stencil.eval_into(_in, _out)
+        _stencil.arr = numpy.array([-1.0, 2.0, -1.0])
+        _stencil.eval_into(_in, _out)
+        self.assertNumpyArrayAlmostEqual(_out, _stencil.eval_convolve(_in), places=12)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+# coding=utf-8
+import unittest
+
+import numpy
+
+from tests import NumpyAwareTestCase
+from pypint.plugins.multigrid.stencil import Stencil
+from pypint.plugins.multigrid.smoothed_aggregation import SmoothedAggregationSolver
+
+
+class StencilTest(NumpyAwareTestCase):
+    def setUp(self):
+        self._test_obj = Stencil(numpy.array([1.0, -2.0, 1.0]))
+
+    def test_sparse_matrix_of_stencil(self):
+        self.assertNumpyArrayEqual(self._test_obj.to_sparse_matrix((4,)).toarray(),
+                                   numpy.array([[-2.0, 1.0, 0.0, 0.0],
+                                                [1.0, -2.0, 1.0, 0.0],
+                                                [0.0, 1.0, -2.0, 1.0],
+                                                [0.0, 0.0, 1.0, -2.0]]))
+
+    def test_caches_sparse_matrix_per_grid_and_format(self):
+        _matrix = self._test_obj.to_sparse_matrix((5,), "csr")
+        self.assertIs(self._test_obj.to_sparse_matrix((5,), "csr"), _matrix)
+        self.assertIs(self._test_obj.to_sparse_matrix(numpy.array([5]), "csr"), _matrix)
+        self.assertIsNot(self._test_obj.to_sparse_matrix((5,), "csc"), _matrix)
+        self.assertIsNot(self._test_obj.to_sparse_matrix((6,), "csr"), _matrix)
+
+    def test_assigning_array_rebuilds_sparse_matrices(self):
+        _matrix = self._test_obj.to_sparse_matrix((4,), "csr")
+        self._test_obj.arr = numpy.array([-1.0, 2.0, -1.0])
+        self.assertIsNot(self._test_obj.to_sparse_matrix((4,), "csr"), _matrix)
+        self.assertNumpyArrayEqual(self._test_obj.to_sparse_matrix((4,), "csr").toarray(), -_matrix.toarray())
+        self.assertNumpyArrayEqual(self._test_obj.sp_matrix.toarray(),
+                                   -Stencil(numpy.array([1.0, -2.0, 1.0])).sp_matrix.toarray())
+
+    def test_assigning_array_of_other_shape_fails(self):
+        self.assertRaises(ValueError, setattr, self._test_obj, 'arr', numpy.array([1.0, -4.0, 6.0, -4.0, 1.0]))
+
+    def test_invalidating_after_modifying_array_in_place(self):
+        _matrix = self._test_obj.to_sparse_matrix((4,), "csr")
+        self._test_obj.arr[:] *= 2.0
+        self.assertIs(self._test_obj.to_sparse_matrix((4,), "csr"), _matrix)
+        self._test_obj.invalidate_sparse_matrices()
+        self.assertNumpyArrayEqual(self._test_obj.to_sparse_matrix((4,), "csr").toarray(), 2.0 * _matrix.toarray())
+
+    def test_iterative_solvers_on_given_grid(self):
+        _rhs = numpy.random.RandomState(0).rand(15)
+        _matrix = self._test_obj.to_sparse_matrix((15,), "csr")
+        for _solver in ('cg', 'gmres', 'bicgstab', 'minres'):
+            _solution, _info = self._test_obj.iterative_solver_list(_solver, _rhs, grid=(15,), tol=1e-12, maxiter=200)
+            self.assertEqual(_info, 0, "%s did not converge" % _solver)
+            self.assertNumpyArrayAlmostEqual(_matrix.dot(_solution), _rhs, places=8)
+
+    def test_iterative_solvers_accept_multigrid_preconditioner(self):
+        _iterations = []
+        _count = lambda xk: _iterations.append(0)
+        self._test_obj.iterative_solver_list('cg', numpy.ones(255), grid=(255,), tol=1e-10, callback=_count)
+        _plain = len(_iterations)
+        del _iterations[:]
+        _preconditioner = SmoothedAggregationSolver(self._test_obj.to_sparse_matrix((255,), "csr"))
+        _solution, _info = self._test_obj.iterative_solver_list('cg', numpy.ones(255), grid=(255,), tol=1e-10,
+                                                                M=_preconditioner, callback=_count)
+        self.assertEqual(_info, 0)
+        self.assertLess(4 * len(_iterations), _plain)
+
+    def test_iterative_solvers_reject_unknown_solver(self):
+        self.assertRaises(NotImplementedError, self._test_obj.iterative_solver_list, 'jacobi', numpy.ones(3))
+
+
+if __name__ == '__main__':
+    unittest.main()
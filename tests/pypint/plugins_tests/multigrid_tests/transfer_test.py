@@ -0,0 +1,117 @@
+# coding=utf-8
+import unittest
+from operator import iadd
+
+import numpy
+import scipy.signal as sig
+
+from tests import NumpyAwareTestCase
+from pypint.plugins.multigrid.multigrid_problem import MultigridProblem
+from pypint.plugins.multigrid.level import MultigridLevel1D
+from pypint.plugins.multigrid.level2d import MultigridLevel2D
+from pypint.plugins.multigrid.level3d import MultigridLevel3D
+from pypint.plugins.multigrid.stencil import Stencil
+from pypint.plugins.multigrid.restriction import RestrictionByStencilForLevelsClassical
+from pypint.plugins.multigrid.interpolation import InterpolationByStencilForLevelsClassical
+from pypint.plugins.multigrid.galerkin import linear_interpolation_matrix, full_weighting_matrix
+from pypint.plugins.multigrid import MG_INTERPOLATION_PRESETS, MG_RESTRICTION_PRESETS
+
+
+_ZERO = lambda x: 0.0
+
+
+def _levels(coarse_shape):
+    """Coarse level of the given shape and the next finer one with :math:`2n+1` points along each axis
+    """
+    _dim = len(coarse_shape)
+    _problem = MultigridProblem(dim=(7,) * _dim + (1,), rhs_function_wrt_space=lambda dof, tensor: 0.0,
+                                boundaries='dirichlet', boundary_functions=[[_ZERO, _ZERO]] * _dim,
+                                geometry=numpy.asarray([[0, 1]] * _dim))
+    _fine_shape = tuple(2 * n + 1 for n in coarse_shape)
+    if _dim == 1:
+        return [MultigridLevel1D(_shape[0], mg_problem=_problem, max_borders=numpy.array([1, 1]), role=_role)
+                for _shape, _role in ((coarse_shape, "CL"), (_fine_shape, "FL"))]
+    _level_class = MultigridLevel2D if _dim == 2 else MultigridLevel3D
+    return [_level_class(_shape, mg_problem=_problem, max_borders=numpy.ones((_dim, 2), dtype=int), role=_role)
+            for _shape, _role in ((coarse_shape, "CL"), (_fine_shape, "FL"))]
+
+
+class RestrictionByStencilForLevelsClassicalTest(NumpyAwareTestCase):
+    def setUp(self):
+        self._random = numpy.random.RandomState(0)
+
+    def test_standard_presets_equal_full_weighting(self):
+        for _coarse_shape in ((7,), (3, 5), (3, 2, 4)):
+            _coarse, _fine = _levels(_coarse_shape)
+            _fine.res_mid[:] = self._random.rand(*_fine.res_mid.shape)
+            _preset = MG_RESTRICTION_PRESETS["Standard-%dD" % len(_coarse_shape)]
+            _preset["rst_class"](_fine, _coarse, *_preset["rst_opts"]).restrict()
+            self.assertNumpyArrayAlmostEqual(_coarse.rhs.reshape(-1),
+                                             full_weighting_matrix(_coarse_shape).dot(_fine.res_mid.reshape(-1)),
+                                             places=14)
+
+    def test_equals_strided_convolution(self):
+        for _arr in (numpy.array([0.1, 0.5, 0.3]), self._random.rand(3, 3), self._random.rand(3, 3, 3)):
+            _coarse, _fine = _levels((3, 4, 2)[:_arr.ndim])
+            _fine.res_mid[:] = self._random.rand(*_fine.res_mid.shape)
+            RestrictionByStencilForLevelsClassical(_fine, _coarse, Stencil(_arr)).restrict()
+            _expected = sig.convolve(_fine.res_mid, Stencil(_arr).reversed_arr, "valid")[(slice(None, None, 2),)
+                                                                                          * _arr.ndim]
+            self.assertNumpyArrayAlmostEqual(_coarse.rhs, _expected, places=14)
+
+    def test_pre_assign(self):
+        _coarse, _fine = _levels((7,))
+        _fine.res_mid[:] = self._random.rand(15)
+        _coarse.rhs = 1.0
+        RestrictionByStencilForLevelsClassical(_fine, _coarse, Stencil(numpy.array([0.25, 0.5, 0.25])),
+                                               pre_assign=lambda old, new: old - new).restrict()
+        self.assertNumpyArrayAlmostEqual(_coarse.rhs, 1.0 - full_weighting_matrix((7,)).dot(_fine.res_mid),
+                                         places=14)
+
+
+class InterpolationByStencilForLevelsClassicalTest(NumpyAwareTestCase):
+    def setUp(self):
+        self._random = numpy.random.RandomState(0)
+
+    def _interpolate(self, coarse_shape, pre_assign=None, initial=0.0):
+        _coarse, _fine = _levels(coarse_shape)
+        _coarse.mid[:] = self._random.rand(*coarse_shape)
+        _fine.mid[:] = initial
+        _preset = MG_INTERPOLATION_PRESETS["Standard-%dD" % len(coarse_shape)]
+        _preset["ipl_class"](_coarse, _fine, *_preset["ipl_opts"], pre_assign=pre_assign).eval()
+        return _coarse, _fine
+
+    def test_standard_presets_equal_linear_interpolation(self):
+        for _coarse_shape in ((7,), (3, 5), (3, 2, 4)):
+            _coarse, _fine = self._interpolate(_coarse_shape)
+            self.assertNumpyArrayAlmostEqual(_fine.mid.reshape(-1),
+                                             linear_interpolation_matrix(_coarse_shape).dot(_coarse.mid.reshape(-1)),
+                                             places=14)
+
+    def test_adds_correction(self):
+        _coarse, _fine = self._interpolate((3, 2, 4), pre_assign=iadd, initial=1.0)
+        self.assertNumpyArrayAlmostEqual(_fine.mid.reshape(-1),
+                                         1.0 + linear_interpolation_matrix((3, 2, 4)).dot(_coarse.mid.reshape(-1)),
+                                         places=14)
+
+    def test_custom_pre_assign(self):
+        _coarse, _fine = self._interpolate((7,), pre_assign=lambda old, new: 0.5 * old + new, initial=2.0)
+        self.assertNumpyArrayAlmostEqual(_fine.mid, 1.0 + linear_interpolation_matrix((7,)).dot(_coarse.mid),
+                                         places=14)
+
+    def test_equals_full_convolution_at_stencil_positions(self):
+        _coarse, _fine = _levels((7,))
+        _coarse.mid[:] = self._random.rand(7)
+        _stencil_list = [(Stencil(numpy.array([0.2])), (1,)), (Stencil(numpy.array([0.7, 0.1])), (0,))]
+        InterpolationByStencilForLevelsClassical(_coarse, _fine, _stencil_list).eval()
+        for _stencil, _position in _stencil_list:
+            self.assertNumpyArrayAlmostEqual(_fine.mid[_position[0]::2],
+                                             sig.convolve(_coarse.mid, _stencil.reversed_arr, "full"), places=14)
+
+    def test_rejects_levels_not_matching(self):
+        _preset = MG_INTERPOLATION_PRESETS["Standard-1D"]
+        self.assertRaises(ValueError, _preset["ipl_class"], _levels((6,))[0], _levels((7,))[1], *_preset["ipl_opts"])
+
+
+if __name__ == '__main__':
+    unittest.main()
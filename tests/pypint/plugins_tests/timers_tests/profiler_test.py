@@ -0,0 +1,93 @@
+# coding=utf-8
+import json
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from pypint.plugins.timers.profiler import Profiler, HasProfilerMixin, profiled, DISABLED_PROFILER
+
+
+class _Clock(object):
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        self.now += 10
+        return self.now
+
+
+class _Profiled(HasProfilerMixin):
+    @profiled("method")
+    def method(self, value):
+        return 2 * value
+
+
+class ProfilerTest(unittest.TestCase):
+    def setUp(self):
+        self._test_obj = Profiler(clock=_Clock())
+
+    def test_nests_scopes(self):
+        for _ in range(2):
+            with self._test_obj.scope("iteration"):
+                with self._test_obj.scope("rhs evaluation"):
+                    pass
+                with self._test_obj.scope("implicit solve"):
+                    with self._test_obj.scope("mg solve"):
+                        pass
+        _items = list(self._test_obj.items())
+        self.assertEqual([_path for _path, _calls, _total in _items],
+                         [('iteration',), ('iteration', 'rhs evaluation'), ('iteration', 'implicit solve'),
+                          ('iteration', 'implicit solve', 'mg solve')])
+        self.assertEqual([_calls for _path, _calls, _total in _items], [2, 2, 2, 2])
+        # each clock reading advances by 10 ns
+        self.assertEqual([_total for _path, _calls, _total in _items], [140, 20, 60, 20])
+
+    def test_records_scope_left_by_exception(self):
+        with self.assertRaises(ValueError):
+            with self._test_obj.scope("failing"):
+                raise ValueError()
+        with self._test_obj.scope("next"):
+            pass
+        self.assertEqual([_path for _path, _calls, _total in self._test_obj.items()], [('failing',), ('next',)])
+
+    def test_disabled_profiler_records_nothing(self):
+        self._test_obj.enabled = False
+        with self._test_obj.scope("iteration"):
+            pass
+        self.assertEqual(list(self._test_obj.items()), [])
+        self.assertFalse(DISABLED_PROFILER.enabled)
+
+    def test_exports_summary_and_json(self):
+        with self._test_obj.scope("iteration"):
+            with self._test_obj.scope("residual"):
+                pass
+        _summary = self._test_obj.summary().split("\n")
+        self.assertEqual(len(_summary), 3)
+        self.assertTrue(_summary[1].startswith("iteration "))
+        self.assertTrue(_summary[2].startswith("  residual "))
+        self.assertEqual(json.loads(self._test_obj.to_json()),
+                         [{'name': 'iteration', 'calls': 1, 'total_ns': 30,
+                           'children': [{'name': 'residual', 'calls': 1, 'total_ns': 10, 'children': []}]}])
+
+        self._test_obj.reset()
+        self.assertEqual(self._test_obj.to_dict(), [])
+
+    def test_profiled_method(self):
+        _obj = _Profiled()
+        self.assertIs(_obj.profiler, DISABLED_PROFILER)
+        _obj.profiler = self._test_obj
+        self.assertEqual(_obj.method(2), 4)
+        self.assertEqual([(_path, _calls) for _path, _calls, _total in self._test_obj.items()], [(('method',), 1)])
+
+    def test_scopes_of_other_threads_are_not_recorded(self):
+        _obj = _Profiled()
+        _obj.profiler = self._test_obj
+        with self._test_obj.scope("sweep"):
+            with ThreadPoolExecutor(max_workers=2) as _executor:
+                self.assertEqual(list(_executor.map(_obj.method, range(4))), [0, 2, 4, 6])
+            self.assertEqual(_obj.method(1), 2)
+        self.assertEqual([(_path, _calls) for _path, _calls, _total in self._test_obj.items()],
+                         [(('sweep',), 1), (('sweep', 'method'), 1)])
+
+
+if __name__ == "__main__":
+    unittest.main()
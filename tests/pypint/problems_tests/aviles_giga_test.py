@@ -0,0 +1,113 @@
+# coding=utf-8
+import unittest
+
+import numpy
+import scipy.optimize as scop
+
+from tests import NumpyAwareTestCase
+from examples.problems.spectral_toolkit import fft
+from pypint.plugins.metrics.metrics_registry import MetricsRegistry
+if fft is not None:
+    from examples.problems.aviles_giga import AvilesGiga
+
+
+def _reference_rhs(u, epsilon):
+    """Implicit and explicit part of the right hand side with the full complex transforms of :py:mod:`numpy.fft`
+    """
+    _k = numpy.meshgrid(*[numpy.fft.fftfreq(n, 1.0 / n) for n in u.shape], indexing='ij')
+    _derivative = lambda v, axis: numpy.fft.ifftn(1j * _k[axis] * numpy.fft.fftn(v))
+    _u_x, _u_y = _derivative(u, 0), _derivative(u, 1)
+    _b = _u_x ** 2 + _u_y ** 2 - 1.0
+    _implicit = -epsilon * numpy.fft.ifftn((_k[0] ** 2 + _k[1] ** 2) ** 2 * numpy.fft.fftn(u))
+    return _implicit, (_derivative(_b * _u_x, 0) + _derivative(_b * _u_y, 1)) / epsilon
+
+
+@unittest.skipIf(fft is None, "requires scipy.fft")
+class AvilesGigaTest(NumpyAwareTestCase):
+    def setUp(self):
+        self._test_obj = AvilesGiga(n=4, epsilon=0.5)
+        self._values = numpy.random.RandomState(0).rand(81, 1)
+
+    def test_grid_and_initial_value(self):
+        self.assertEqual(self._test_obj.dim, (9, 9, 1))
+        self.assertEqual(self._test_obj.dim_for_time_solver, (81, 1))
+        self.assertEqual((self._test_obj.time_start, self._test_obj.time_end), (0.0, 1.0))
+        _x = numpy.linspace(0.0, numpy.pi, 9)
+        self.assertNumpyArrayAlmostEqual(self._test_obj.initial_value.reshape(9, 9),
+                                         numpy.outer(numpy.sin(_x), numpy.sin(_x)), places=14)
+
+    def test_real_transforms_and_symbol(self):
+        self.assertTrue(self._test_obj.spectral.real)
+        self.assertEqual(self._test_obj.implicit_symbol.shape, (9, 5))
+        _k_x, _k_y = self._test_obj.spectral.wavenumbers
+        self.assertNumpyArrayAlmostEqual(self._test_obj.implicit_symbol, -0.5 * (_k_x ** 2 + _k_y ** 2) ** 2,
+                                         places=12)
+
+    def test_evaluates_parts_of_right_hand_side(self):
+        _implicit, _explicit = _reference_rhs(self._values.reshape(9, 9), 0.5)
+        _evaluate = lambda **kwargs: self._test_obj.evaluate_wrt_time(0.0, self._values, **kwargs)
+        self.assertEqual(_evaluate().shape, (81, 1))
+        self.assertNumpyArrayAlmostEqual(_evaluate(partial='impl').reshape(9, 9), _implicit.real, places=10)
+        self.assertNumpyArrayAlmostEqual(_evaluate(partial='expl').reshape(9, 9), _explicit.real, places=10)
+        self.assertNumpyArrayAlmostEqual(_evaluate(), _evaluate(partial='impl') + _evaluate(partial='expl'),
+                                         places=10)
+
+    def test_complex_epsilon_uses_complex_transforms(self):
+        self._test_obj = AvilesGiga(n=4, epsilon=0.5 + 0.1j)
+        self.assertFalse(self._test_obj.spectral.real)
+        self.assertEqual(self._test_obj.implicit_symbol.shape, (9, 9))
+        _values = self._values + 1j * self._values[::-1]
+        _implicit, _explicit = _reference_rhs(_values.reshape(9, 9), 0.5 + 0.1j)
+        self.assertNumpyArrayAlmostEqual(self._test_obj.evaluate_wrt_time(0.0, _values).reshape(9, 9),
+                                         _implicit + _explicit, places=10)
+
+    def test_spectral_solve_inverts_implicit_part(self):
+        for _delta_time in (1e-3, 0.1, 10.0):
+            _solution = self._test_obj.spectral_solve(self._values, _delta_time)
+            self.assertNumpyArrayAlmostEqual(
+                _solution - _delta_time * self._test_obj.evaluate_wrt_time(0.0, _solution, partial='impl'),
+                self._values, places=10)
+
+    def test_implicit_solve_equals_newton_krylov(self):
+        self._test_obj.metrics = MetricsRegistry()
+        _func = lambda x: x.reshape(81, 1) - 0.01 * self._test_obj.evaluate_wrt_time(0.0, x.reshape(81, 1),
+                                                                                     partial='impl') - self._values
+        _solution = self._test_obj.implicit_solve(numpy.zeros(81), _func, expl_term=self._values, delta_time=0.01,
+                                                  partial='impl')
+        self.assertEqual(self._test_obj.metrics.value('newton_iterations'), 0)
+        _newton = scop.newton_krylov(lambda x: _func(x).reshape(-1), numpy.zeros(81), f_tol=1e-12)
+        self.assertNumpyArrayAlmostEqual(_solution.reshape(-1), _newton, places=8)
+
+    def test_warms_up_denominators_for_time_levels(self):
+        self._test_obj = AvilesGiga(n=4, delta_times_for_time_levels=[[0.1, 0.2], [0.2, 0.4]])
+        self.assertEqual((len(self._test_obj.denominators), self._test_obj.denominators.hits), (3, 1))
+        self._test_obj.spectral_solve(self._values, 0.4)
+        self.assertEqual(self._test_obj.denominators.misses, 3)
+        self.assertRaises(ValueError, AvilesGiga, n=4, delta_times_for_time_levels=0.1)
+
+    def test_assigning_epsilon_updates_symbol(self):
+        self._test_obj.spectral_solve(self._values, 0.1)
+        self._test_obj.epsilon = 0.25
+        self.assertEqual(len(self._test_obj.denominators), 0)
+        _implicit = _reference_rhs(self._values.reshape(9, 9), 0.25)[0]
+        self.assertNumpyArrayAlmostEqual(
+            self._test_obj.evaluate_wrt_time(0.0, self._values, partial='impl').reshape(9, 9), _implicit.real,
+            places=10)
+        _solution = self._test_obj.spectral_solve(self._values, 0.1)
+        self.assertNumpyArrayAlmostEqual(
+            _solution - 0.1 * self._test_obj.evaluate_wrt_time(0.0, _solution, partial='impl'), self._values,
+            places=10)
+
+    def test_reuses_work_buffers(self):
+        self._test_obj.evaluate_wrt_time(0.0, self._values)
+        _nbytes = self._test_obj.spectral.nbytes
+        _buffers = dict(self._test_obj.spectral._buffers)
+        self._test_obj.evaluate_wrt_time(0.0, 2.0 * self._values)
+        self._test_obj.angle(self._values)
+        self.assertEqual(self._test_obj.spectral.nbytes, _nbytes)
+        for _key, _buffer in self._test_obj.spectral._buffers.items():
+            self.assertIs(_buffer, _buffers[_key])
+
+
+if __name__ == '__main__':
+    unittest.main()
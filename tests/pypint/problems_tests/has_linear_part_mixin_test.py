@@ -0,0 +1,34 @@
+# coding=utf-8
+
+import numpy as np
+
+from pypint.problems.i_problem import IProblem
+from pypint.problems.has_linear_part_mixin import HasLinearPartMixin, problem_has_linear_part
+import unittest
+
+
+class HasLinearPartMixinTest(unittest.TestCase):
+    class TestProblem(IProblem, HasLinearPartMixin):
+        def __init__(self, *args, **kwargs):
+            super(HasLinearPartMixinTest.TestProblem, self).__init__(*args, **kwargs)
+            HasLinearPartMixin.__init__(self, *args, **kwargs)
+
+    def setUp(self):
+        self._default = HasLinearPartMixinTest.TestProblem()
+
+    def test_provides_linear_operator_method(self):
+        self.assertRaises(NotImplementedError, self._default.linear_operator)
+
+    def test_default_has_no_symbol_and_identity_eigenbasis(self):
+        self.assertIsNone(self._default.linear_symbol())
+        _values = np.arange(3.0)
+        self.assertIs(self._default.to_linear_eigenbasis(_values), _values)
+        self.assertIs(self._default.from_linear_eigenbasis(_values), _values)
+
+    def test_problem_has_linear_part_introspection(self):
+        self.assertTrue(problem_has_linear_part(self._default))
+        self.assertFalse(problem_has_linear_part(IProblem()))
+
+
+if __name__ == '__main__':
+    unittest.main()
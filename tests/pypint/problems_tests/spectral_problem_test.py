@@ -0,0 +1,134 @@
+# coding=utf-8
+import unittest
+
+import numpy
+
+from tests import NumpyAwareTestCase
+from examples.problems.spectral_toolkit import fft
+from pypint.plugins.metrics.metrics_registry import MetricsRegistry
+if fft is not None:
+    from examples.problems.spectral_problem import SpectralProblem
+
+
+def _dense_operator(shape, symbol):
+    """Matrix of :math:`u \\mapsto \\mathcal{F}^{-1}(\\sigma \\mathcal{F}(u))` with the full complex transforms
+
+    ``symbol`` is evaluated on the wave numbers of all axes.
+    """
+    _wavenumbers = numpy.meshgrid(*[numpy.fft.fftfreq(n, 1.0 / n) for n in shape], indexing='ij')
+    _symbol = symbol(*_wavenumbers)
+    _size = int(numpy.prod(shape))
+    _matrix = numpy.zeros((_size, _size), dtype=complex)
+    for _i in range(0, _size):
+        _unit = numpy.zeros(_size)
+        _unit[_i] = 1.0
+        _matrix[:, _i] = numpy.fft.ifftn(_symbol * numpy.fft.fftn(_unit.reshape(shape))).reshape(-1)
+    return _matrix
+
+
+def _laplacian_symbol(*wavenumbers):
+    return -sum(_k ** 2 for _k in wavenumbers)
+
+
+def _diffusion_problem(shape, **kwargs):
+    _problem = SpectralProblem(dim=shape + (1,), **kwargs)
+    _problem.implicit_symbol = -_problem.spectral.squared_wavenumbers
+    return _problem
+
+
+@unittest.skipIf(fft is None, "requires scipy.fft")
+class SpectralProblemTest(NumpyAwareTestCase):
+    def setUp(self):
+        self._random = numpy.random.RandomState(0)
+
+    def test_spectral_solve_equals_dense_solve(self):
+        for _shape in ((16,), (15,), (6, 9)):
+            _test_obj = _diffusion_problem(_shape)
+            _rhs = self._random.rand(*_test_obj.dim_for_time_solver)
+            _matrix = numpy.eye(_rhs.size) - 0.1 * _dense_operator(_shape, _laplacian_symbol)
+            _solution = _test_obj.spectral_solve(_rhs, 0.1)
+            self.assertEqual(_solution.shape, _test_obj.dim_for_time_solver)
+            self.assertFalse(numpy.iscomplexobj(_solution))
+            self.assertNumpyArrayAlmostEqual(_matrix.dot(_solution.reshape(-1)), _rhs.reshape(-1), places=12)
+
+    def test_solves_complex_right_hand_sides_of_real_fields(self):
+        _test_obj = _diffusion_problem((6, 9))
+        _rhs = self._random.rand(54, 1) + 1j * self._random.rand(54, 1)
+        _solution = _test_obj.spectral_solve(_rhs, 0.1)
+        self.assertTrue(numpy.iscomplexobj(_solution))
+        self.assertNumpyArrayAlmostEqual(_solution.real, _test_obj.spectral_solve(_rhs.real, 0.1), places=14)
+        self.assertNumpyArrayAlmostEqual(_solution.imag, _test_obj.spectral_solve(_rhs.imag, 0.1), places=14)
+
+    def test_complex_fields(self):
+        _test_obj = SpectralProblem(dim=(12, 1), real_field=False)
+        self.assertEqual(_test_obj.spectral.spectral_shape, (12,))
+        # dispersive symbol, not symmetric in the wave numbers
+        _symbol = lambda k: -k ** 2 + 1j * k ** 3
+        _test_obj.implicit_symbol = _symbol(numpy.fft.fftfreq(12, 1.0 / 12))
+        _rhs = self._random.rand(12, 1) + 1j * self._random.rand(12, 1)
+        _matrix = numpy.eye(12) - 0.05 * _dense_operator((12,), _symbol)
+        self.assertNumpyArrayAlmostEqual(_matrix.dot(_test_obj.spectral_solve(_rhs, 0.05).reshape(-1)),
+                                         _rhs.reshape(-1), places=12)
+        # real right hand sides of real symbols keep real solutions
+        _test_obj.implicit_symbol = -numpy.fft.fftfreq(12, 1.0 / 12) ** 2
+        self.assertFalse(numpy.iscomplexobj(_test_obj.spectral_solve(_rhs.real, 0.05)))
+
+    def test_caches_denominators_per_delta_time(self):
+        _test_obj = _diffusion_problem((16,))
+        _test_obj.metrics = MetricsRegistry()
+        _rhs = self._random.rand(16, 1)
+        for _delta_time in (0.1, 0.2, 0.1, 0.2, 0.1):
+            _test_obj.spectral_solve(_rhs, _delta_time)
+        self.assertEqual((_test_obj.denominators.misses, _test_obj.denominators.hits), (2, 3))
+        self.assertEqual(_test_obj.metrics.value('cache_hits', cache='denominators'), 3)
+
+    def test_assigning_symbol_drops_denominators(self):
+        _test_obj = _diffusion_problem((16,))
+        _rhs = self._random.rand(16, 1)
+        _test_obj.spectral_solve(_rhs, 0.1)
+        _test_obj.implicit_symbol = -_test_obj.spectral.squared_wavenumbers ** 2
+        self.assertEqual(len(_test_obj.denominators), 0)
+        _matrix = numpy.eye(16) - 0.1 * _dense_operator((16,), lambda k: -k ** 4)
+        self.assertNumpyArrayAlmostEqual(_matrix.dot(_test_obj.spectral_solve(_rhs, 0.1).reshape(-1)),
+                                         _rhs.reshape(-1), places=12)
+
+    def test_rejects_symbol_of_other_shape(self):
+        _test_obj = SpectralProblem(dim=(16, 1))
+        self.assertEqual(_test_obj.spectral.spectral_shape, (9,))
+        self.assertRaises(ValueError, setattr, _test_obj, 'implicit_symbol', numpy.zeros(16))
+
+    def test_implicit_solve_of_implicit_part_is_spectral(self):
+        _test_obj = _diffusion_problem((16,))
+        _test_obj.metrics = MetricsRegistry()
+        _rhs = self._random.rand(16, 1)
+        _func = lambda x: x - _rhs.reshape(-1)
+        _solution = _test_obj.implicit_solve(numpy.zeros(16), _func, expl_term=_rhs, delta_time=0.1, partial='impl')
+        self.assertNumpyArrayAlmostEqual(_solution, _test_obj.spectral_solve(_rhs, 0.1), places=14)
+        self.assertEqual(_test_obj.metrics.value('newton_iterations'), 0)
+
+    def test_implicit_solve_falls_back_to_newton_krylov(self):
+        _test_obj = _diffusion_problem((16,))
+        _test_obj.metrics = MetricsRegistry()
+        _rhs = self._random.rand(16, 1)
+        _func = lambda x: x - _rhs.reshape(-1)
+        for _kwargs in ({}, {'expl_term': _rhs, 'delta_time': 0.1},
+                        {'expl_term': _rhs, 'delta_time': 0.1, 'partial': 'impl', 'method': 'newton'}):
+            _solution = _test_obj.implicit_solve(numpy.zeros(16), _func, **_kwargs)
+            self.assertEqual(_solution.shape, (16, 1))
+            # the residual given is the one of the identity
+            self.assertNumpyArrayAlmostEqual(_solution, _rhs, places=5)
+        self.assertGreater(_test_obj.metrics.value('newton_iterations'), 0)
+
+    def test_linear_part_is_diagonal_in_fourier_space(self):
+        _test_obj = _diffusion_problem((6, 9))
+        _values = self._random.rand(54, 1)
+        self.assertIs(_test_obj.linear_symbol(), _test_obj.implicit_symbol)
+        _coefficients = _test_obj.to_linear_eigenbasis(_values)
+        self.assertEqual(_coefficients.shape, (6, 5))
+        self.assertNumpyArrayAlmostEqual(
+            _test_obj.from_linear_eigenbasis(_test_obj.linear_symbol() * _coefficients).reshape(-1),
+            _dense_operator((6, 9), _laplacian_symbol).dot(_values.reshape(-1)), places=12)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+# coding=utf-8
+import unittest
+
+import numpy
+
+from tests import NumpyAwareTestCase
+from examples.problems.spectral_toolkit import SpectralToolkit, fft
+
+
+@unittest.skipIf(fft is None, "requires scipy.fft")
+class SpectralToolkitTest(NumpyAwareTestCase):
+    def setUp(self):
+        self._random = numpy.random.RandomState(0)
+
+    def test_spectral_shapes(self):
+        self.assertEqual(SpectralToolkit((4, 6)).spectral_shape, (4, 4))
+        self.assertEqual(SpectralToolkit((4, 7)).spectral_shape, (4, 4))
+        self.assertEqual(SpectralToolkit((4, 7), real=False).spectral_shape, (4, 7))
+        self.assertEqual(SpectralToolkit((4, 7)).field_dtype, numpy.dtype(float))
+        self.assertEqual(SpectralToolkit((4, 7), real=False).field_dtype, numpy.dtype(complex))
+
+    def test_transforms_equal_numpy_transforms(self):
+        for _shape in ((16,), (6, 9), (4, 5, 6)):
+            _u = self._random.rand(*_shape)
+            _test_obj = SpectralToolkit(_shape)
+            _u_hat = _test_obj.forward(_u.reshape(-1, 1))
+            self.assertNumpyArrayAlmostEqual(_u_hat, numpy.fft.rfftn(_u), places=12)
+            self.assertNumpyArrayAlmostEqual(_test_obj.backward(_u_hat), _u, places=14)
+            _u = _u + 1j * self._random.rand(*_shape)
+            _test_obj = SpectralToolkit(_shape, real=False, workers=2)
+            _u_hat = _test_obj.forward(_u)
+            self.assertNumpyArrayAlmostEqual(_u_hat, numpy.fft.fftn(_u), places=12)
+            self.assertNumpyArrayAlmostEqual(_test_obj.backward(_u_hat), _u, places=14)
+
+    def test_forward_keeps_field(self):
+        _u = self._random.rand(6, 9)
+        _expected = _u.copy()
+        SpectralToolkit((6, 9)).forward(_u)
+        self.assertNumpyArrayEqual(_u, _expected)
+
+    def test_backward_into_given_array(self):
+        _test_obj = SpectralToolkit((6, 9))
+        _u = self._random.rand(54, 1)
+        _out = numpy.empty((54, 1))
+        _u_hat = _test_obj.forward(_u)
+        _expected = _u_hat.copy()
+        self.assertIs(_test_obj.backward(_u_hat, out=_out, overwrite=False), _out)
+        self.assertNumpyArrayAlmostEqual(_out, _u, places=14)
+        self.assertNumpyArrayEqual(_u_hat, _expected)
+
+    def test_wavenumbers(self):
+        _test_obj = SpectralToolkit((4, 6))
+        _k_x, _k_y = _test_obj.wavenumbers
+        self.assertEqual((_k_x.shape, _k_y.shape), ((4, 1), (1, 4)))
+        self.assertNumpyArrayEqual(_k_x.reshape(-1), numpy.array([0.0, 1.0, -2.0, -1.0]))
+        self.assertNumpyArrayEqual(_k_y.reshape(-1), numpy.array([0.0, 1.0, 2.0, 3.0]))
+        self.assertNumpyArrayEqual(_test_obj.squared_wavenumbers, _k_x ** 2 + _k_y ** 2)
+        self.assertIs(_test_obj.squared_wavenumbers, _test_obj.squared_wavenumbers)
+        self.assertNumpyArrayEqual(SpectralToolkit((4, 6), real=False).wavenumbers[1].reshape(-1),
+                                   numpy.array([0.0, 1.0, 2.0, -3.0, -2.0, -1.0]))
+
+    def test_derivatives_of_trigonometric_polynomials(self):
+        for _shape in ((8, 10), (9, 11)):
+            _x = 2.0 * numpy.pi * numpy.arange(_shape[0]).reshape(-1, 1) / _shape[0]
+            _y = 2.0 * numpy.pi * numpy.arange(_shape[1]).reshape(1, -1) / _shape[1]
+            _u = numpy.sin(2.0 * _x) * numpy.cos(3.0 * _y)
+            _test_obj = SpectralToolkit(_shape)
+            _u_hat = _test_obj.forward(_u)
+            _expected = _u_hat.copy()
+            self.assertNumpyArrayAlmostEqual(_test_obj.derivative(_u_hat, 0),
+                                             2.0 * numpy.cos(2.0 * _x) * numpy.cos(3.0 * _y), places=12)
+            self.assertNumpyArrayAlmostEqual(_test_obj.derivative(_u_hat, 1),
+                                             -3.0 * numpy.sin(2.0 * _x) * numpy.sin(3.0 * _y), places=12)
+            self.assertNumpyArrayEqual(_u_hat, _expected)
+
+    def test_derivatives_drop_nyquist_modes(self):
+        # the highest mode of an even grid has no derivative as real field
+        _u = numpy.cos(numpy.pi * numpy.arange(8))
+        for _real in (True, False):
+            _test_obj = SpectralToolkit((8,), real=_real)
+            _derivative = _test_obj.derivative(_test_obj.forward(_u), 0)
+            self.assertNumpyArrayAlmostEqual(_derivative, numpy.zeros(8), places=14)
+
+    def test_derivatives_into_given_array(self):
+        _test_obj = SpectralToolkit((6, 9))
+        _u_hat = _test_obj.forward(self._random.rand(6, 9))
+        _out = _test_obj.buffer('u_x')
+        self.assertIs(_test_obj.derivative(_u_hat, 0, out=_out), _out)
+        self.assertNumpyArrayAlmostEqual(_out, _test_obj.derivative(_u_hat, 0), places=14)
+
+    def test_buffers_are_allocated_once(self):
+        _test_obj = SpectralToolkit((6, 9))
+        _field = _test_obj.buffer('u')
+        _spectrum = _test_obj.buffer('u', spectral=True)
+        self.assertEqual((_field.shape, _field.dtype), ((6, 9), numpy.dtype(float)))
+        self.assertEqual((_spectrum.shape, _spectrum.dtype), ((6, 5), numpy.dtype(complex)))
+        self.assertIs(_test_obj.buffer('u'), _field)
+        self.assertIs(_test_obj.buffer('u', spectral=True), _spectrum)
+        self.assertEqual(_test_obj.nbytes, _field.nbytes + _spectrum.nbytes)
+        self.assertEqual(SpectralToolkit((6, 9), real=False).buffer('u').dtype, numpy.dtype(complex))
+
+
+if __name__ == '__main__':
+    unittest.main()
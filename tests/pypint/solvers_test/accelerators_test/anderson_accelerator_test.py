@@ -0,0 +1,53 @@
+# coding=utf-8
+import numpy
+
+from tests import NumpyAwareTestCase
+from pypint.solvers.accelerators import AndersonAccelerator
+
+
+def _linear_fixed_point_iteration(accelerator, num_iterations):
+    _matrix = numpy.array([[0.9, 0.05, 0.0], [0.05, 0.8, 0.05], [0.0, 0.05, 0.7]])
+    _rhs = numpy.array([1.0, 2.0, 3.0])
+    _x = numpy.zeros(3)
+    for _i in range(0, num_iterations):
+        _x = accelerator.accelerate(_x, _matrix.dot(_x) + _rhs)
+    return _x, numpy.linalg.solve(numpy.eye(3) - _matrix, _rhs)
+
+
+class AndersonAcceleratorTest(NumpyAwareTestCase):
+    def test_default_values(self):
+        _test_obj = AndersonAccelerator()
+        self.assertEqual(_test_obj.depth, 5)
+        self.assertEqual(_test_obj.damping, 1.0)
+
+    def test_validates_parameters(self):
+        self.assertRaises(ValueError, AndersonAccelerator, depth=-1)
+        self.assertRaises(ValueError, AndersonAccelerator, depth=1.0)
+        self.assertRaises(ValueError, AndersonAccelerator, damping=0.0)
+        self.assertRaises(ValueError, AndersonAccelerator, damping=1.5)
+
+    def test_validates_iterates(self):
+        self.assertRaises(ValueError, AndersonAccelerator().accelerate, numpy.zeros(2), numpy.zeros(3))
+
+    def test_returns_sweep_result_without_history(self):
+        _test_obj = AndersonAccelerator(depth=0)
+        _current = numpy.array([1.0, 2.0])
+        self.assertNumpyArrayAlmostEqual(_test_obj.accelerate(numpy.zeros(2), _current), _current)
+        self.assertNumpyArrayAlmostEqual(_test_obj.accelerate(_current, 2.0 * _current), 2.0 * _current)
+
+    def test_accelerates_linear_fixed_point_iteration(self):
+        _solution, _expected = _linear_fixed_point_iteration(AndersonAccelerator(depth=3), 8)
+        self.assertNumpyArrayAlmostEqual(_solution, _expected, places=8)
+
+    def test_keeps_separate_histories(self):
+        _test_obj = AndersonAccelerator()
+        _test_obj.accelerate(numpy.zeros(2), numpy.ones(2), key=0)
+        _current = numpy.array([3.0, 4.0])
+        self.assertNumpyArrayAlmostEqual(_test_obj.accelerate(numpy.zeros(2), _current, key=1), _current)
+        _test_obj.reset()
+        self.assertNumpyArrayAlmostEqual(_test_obj.accelerate(numpy.zeros(2), _current, key=0), _current)
+
+
+if __name__ == '__main__':
+    import unittest
+    unittest.main()
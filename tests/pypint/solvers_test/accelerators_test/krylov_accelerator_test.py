@@ -0,0 +1,20 @@
+# coding=utf-8
+from tests import NumpyAwareTestCase
+from pypint.solvers.accelerators import KrylovAccelerator
+from tests.pypint.solvers_test.accelerators_test.anderson_accelerator_test import _linear_fixed_point_iteration
+
+
+class KrylovAcceleratorTest(NumpyAwareTestCase):
+    def test_validates_restart(self):
+        self.assertRaises(ValueError, KrylovAccelerator, restart=0)
+        self.assertEqual(KrylovAccelerator(restart=4).restart, 4)
+
+    def test_solves_linear_fixed_point_iteration_within_dimension(self):
+        # like GMRES, the exact solution is found after at most n + 1 sweeps for n unknowns
+        _solution, _expected = _linear_fixed_point_iteration(KrylovAccelerator(), 4)
+        self.assertNumpyArrayAlmostEqual(_solution, _expected, places=10)
+
+
+if __name__ == '__main__':
+    import unittest
+    unittest.main()
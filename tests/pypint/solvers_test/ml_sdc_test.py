@@ -0,0 +1,66 @@
+# coding=utf-8
+from nose.tools import *
+
+from tests import assert_numpy_array_almost_equal
+from pypint.integrators.sdc_integrator import SdcIntegrator
+from pypint.multi_level_providers.multi_time_level_provider import MultiTimeLevelProvider
+from pypint.multi_level_providers.level_transition_providers.time_transition_provider import TimeTransitionProvider
+from pypint.solvers.ml_sdc import MlSdc
+from pypint.communicators.forward_sending_messaging import ForwardSendingMessaging
+from pypint.utilities.threshold_check import ThresholdCheck
+from pypint.solvers.accelerators import AndersonAccelerator, KrylovAccelerator
+from pypint.solvers.cores import ImplicitMlSdcCore, SemiImplicitMlSdcCore
+from examples.problems.lambda_u import LambdaU
+
+
+def _run_mlsdc_with_problem(problem, core, max_iter, **kwargs):
+    _coarse = SdcIntegrator()
+    _coarse.init(num_nodes=3)
+    _fine = SdcIntegrator()
+    _fine.init(num_nodes=5)
+    _ml_provider = MultiTimeLevelProvider()
+    _ml_provider.add_coarse_level(_fine)
+    _ml_provider.add_coarse_level(_coarse)
+    _ml_provider.add_level_transition(TimeTransitionProvider(fine_nodes=_fine.nodes, coarse_nodes=_coarse.nodes), 0, 1)
+
+    thresh = ThresholdCheck(max_threshold=max_iter + 1, min_threshold=1e-7, conditions=('residual', 'iterations'))
+    _comm = ForwardSendingMessaging()
+    _mlsdc = MlSdc(communicator=_comm)
+    _comm.link_solvers(previous=_comm, next=_comm)
+    _comm.write_buffer(tag=(_ml_provider.num_levels - 1), value=problem.initial_value, time_point=problem.time_start)
+    _mlsdc.init(problem=problem, ml_provider=_ml_provider, threshold=thresh, **kwargs)
+    _mlsdc.run(core, dt=1.0)
+    assert_in('residual', thresh.has_reached(), "Termination criteria should be 'residual'.")
+    assert_not_in('iterations', thresh.has_reached(), "Maximum Number of iterations should not be reached.")
+    return _mlsdc.state.current_iteration.finest_level.values
+
+
+def _stiff_lambda_u_accelerated_function(accelerator, core, iterations):
+    _values = _run_mlsdc_with_problem(LambdaU(lmbda=complex(-100.0, 1.0)), core, iterations['iter'],
+                                      accelerator=accelerator)
+    # the accelerated V-cycles converge to the same collocation solution
+    _expected = _run_mlsdc_with_problem(LambdaU(lmbda=complex(-100.0, 1.0)), core, 100)
+    assert_numpy_array_almost_equal(_values, _expected, places=6)
+
+
+def test_stiff_lambda_u_with_accelerators():
+    # plain V-cycles take 34 iterations for either core
+    _expected_iterations = {
+        AndersonAccelerator: {
+            ImplicitMlSdcCore: {'iter': 7},
+            SemiImplicitMlSdcCore: {'iter': 7}
+        },
+        KrylovAccelerator: {
+            ImplicitMlSdcCore: {'iter': 10},
+            SemiImplicitMlSdcCore: {'iter': 10}
+        }
+    }
+    for _accelerator in _expected_iterations.keys():
+        for _core in _expected_iterations[_accelerator].keys():
+            yield _stiff_lambda_u_accelerated_function, _accelerator(), _core, \
+                _expected_iterations[_accelerator][_core]
+
+
+if __name__ == "__main__":
+    import unittest
+    unittest.main()
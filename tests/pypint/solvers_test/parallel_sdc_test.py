@@ -1,4 +1,8 @@
 # coding=utf-8
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
+
+import numpy as np
 from nose.tools import *
 
 from tests import NumpyAwareTestCase
@@ -6,23 +10,30 @@ from pypint.integrators.sdc_integrator import SdcIntegrator
 from pypint.solvers.parallel_sdc import ParallelSdc
 from pypint.communicators.forward_sending_messaging import ForwardSendingMessaging
 from pypint.utilities.threshold_check import ThresholdCheck
-from pypint.solvers.cores import ExplicitSdcCore, ImplicitSdcCore, SemiImplicitSdcCore
+from pypint.solvers.accelerators import AndersonAccelerator, KrylovAccelerator
+from pypint.solvers.predictors import ImplicitEulerPredictor, CoarsePredictor, ExtrapolationPredictor
+from pypint.solvers.cores import ExplicitSdcCore, ImplicitSdcCore, SemiImplicitSdcCore, DiagonalImplicitSdcCore, \
+    ExponentialSdcCore
+from pypint.plugins.multigrid.stencil import Stencil
+from pypint.plugins.multigrid.level import MultigridLevel1D
 from examples.problems.lambda_u import LambdaU
 from examples.problems.constant import Constant
+from examples.problems.heat_equation import HeatEquation
 
 
 MAX_ITER = 100
 PRECISION = 6
 
 
-def _run_sdc_with_problem(problem, core, num_time_steps, dt, num_nodes, max_iter, precision):
+def _run_sdc_with_problem(problem, core, num_time_steps, dt, num_nodes, max_iter, precision, **kwargs):
     thresh = ThresholdCheck(max_threshold=max_iter + 1, conditions=('error', 'residual', 'solution reduction', 'error reduction', 'iterations'),
                             min_threshold=1e-7)
     _comm = ForwardSendingMessaging()
     _sdc = ParallelSdc(communicator=_comm)
     _comm.link_solvers(previous=_comm, next=_comm)
     _comm.write_buffer(value=problem.initial_value, time_point=problem.time_start)
-    _sdc.init(integrator=SdcIntegrator, threshold=thresh, problem=problem, num_time_steps=num_time_steps, num_nodes=num_nodes)
+    _sdc.init(integrator=SdcIntegrator, threshold=thresh, problem=problem, num_time_steps=num_time_steps, num_nodes=num_nodes,
+              **kwargs)
     _solution = _sdc.run(core, dt=dt)
     # for _node_index in range(0, len(_solution.solution(-1))):
     #     print("Node {}: {} <-> {}".format(_node_index, _solution.solution(-1)[_node_index].value, problem.exact(_solution.solution(-1)[_node_index].time_point)))
@@ -44,10 +55,11 @@ def _constant_minus_one_function(sdc_core, num_time_steps, dt, num_nodes, iter_p
     _run_sdc_with_problem(problem, sdc_core, num_time_steps, dt, num_nodes, iter_precision['iter'], precision)
 
 
-def _lambda_u_function(sdc_core, num_time_steps, dt, num_nodes, iter_precision):
+def _lambda_u_function(sdc_core, num_time_steps, dt, num_nodes, iter_precision, **kwargs):
     problem = LambdaU(lmbda=complex(-1.0, 1.0))
     precision = iter_precision['prec'] if 'prec' in iter_precision else PRECISION
-    _run_sdc_with_problem(problem, sdc_core, num_time_steps, dt, num_nodes, iter_precision['iter'], precision)
+    _run_sdc_with_problem(problem, sdc_core, num_time_steps, dt, num_nodes, iter_precision['iter'], precision,
+                          **kwargs)
 
 
 def test_constant_minus_one_function_with_explicit_sdc():
@@ -284,6 +296,163 @@ def test_lambda_u_with_semi_implicit_sdc():
                     _num_time_steps, _dt, _num_nodes, _expected_iterations[_num_time_steps][_dt][_num_nodes]
 
 
+def _lambda_u_node_parallel_function(q_delta, num_time_steps, dt, num_nodes, iter_precision):
+    with ThreadPoolExecutor(max_workers=num_nodes - 1) as _executor:
+        _lambda_u_function(DiagonalImplicitSdcCore, num_time_steps, dt, num_nodes, iter_precision,
+                           q_delta=q_delta, node_executor=_executor)
+
+
+def test_lambda_u_with_node_parallel_diagonal_implicit_sdc():
+    _expected_iterations = {
+        1: {
+            0.5: {
+                3: {'iter': 12},
+                5: {'iter': 11},
+                7: {'iter': 10}
+            }
+        }
+    }
+    for _q_delta in ['diag', 'min-sr']:
+        for _num_time_steps in _expected_iterations.keys():
+            for _dt in _expected_iterations[_num_time_steps].keys():
+                for _num_nodes in _expected_iterations[_num_time_steps][_dt].keys():
+                    yield _lambda_u_node_parallel_function, _q_delta, \
+                        _num_time_steps, _dt, _num_nodes, _expected_iterations[_num_time_steps][_dt][_num_nodes]
+
+
+def _stiff_lambda_u_function(sdc_core, q_delta, num_nodes, iter_precision):
+    problem = LambdaU(lmbda=complex(-100.0, 1.0))
+    _run_sdc_with_problem(problem, sdc_core, 1, 0.5, num_nodes, iter_precision['iter'], PRECISION, q_delta=q_delta)
+
+
+def _stiff_lambda_u_exponential_function(num_time_steps, num_nodes, iter_precision):
+    problem = LambdaU(lmbda=complex(-100.0, 1.0))
+    _run_sdc_with_problem(problem, ExponentialSdcCore, num_time_steps, 0.5, num_nodes, iter_precision['iter'],
+                          PRECISION)
+
+
+def _stiff_lambda_u_accelerated_function(accelerator, num_time_steps, num_nodes, iter_precision):
+    problem = LambdaU(lmbda=complex(-100.0, 1.0))
+    _run_sdc_with_problem(problem, ImplicitSdcCore, num_time_steps, 0.5, num_nodes, iter_precision['iter'], PRECISION,
+                          accelerator=accelerator)
+
+
+def test_stiff_lambda_u_with_q_delta_preconditioners():
+    _expected_iterations = {
+        ImplicitSdcCore: {
+            'lu': {
+                3: {'iter': 12},
+                5: {'iter': 12}
+            },
+            'trapezoidal': {
+                5: {'iter': 30}
+            }
+        },
+        SemiImplicitSdcCore: {
+            'lu': {
+                3: {'iter': 12},
+                5: {'iter': 12}
+            }
+        }
+    }
+    for _core in _expected_iterations.keys():
+        for _q_delta in _expected_iterations[_core].keys():
+            for _num_nodes in _expected_iterations[_core][_q_delta].keys():
+                yield _stiff_lambda_u_function, _core, _q_delta, _num_nodes, \
+                    _expected_iterations[_core][_q_delta][_num_nodes]
+
+
+def test_stiff_lambda_u_with_exponential_sdc():
+    # the linear part is propagated exactly, thus the first sweep already converges
+    _expected_iterations = {
+        1: {
+            3: {'iter': 2},
+            5: {'iter': 2}
+        },
+        2: {
+            3: {'iter': 2}
+        }
+    }
+    for _num_time_steps in _expected_iterations.keys():
+        for _num_nodes in _expected_iterations[_num_time_steps].keys():
+            yield _stiff_lambda_u_exponential_function, _num_time_steps, _num_nodes, \
+                _expected_iterations[_num_time_steps][_num_nodes]
+
+
+def test_stiff_lambda_u_with_accelerators():
+    _expected_iterations = {
+        AndersonAccelerator: {
+            1: {
+                3: {'iter': 15},
+                5: {'iter': 25}
+            },
+            2: {
+                5: {'iter': 25}
+            }
+        },
+        KrylovAccelerator: {
+            1: {
+                3: {'iter': 15},
+                5: {'iter': 25}
+            }
+        }
+    }
+    for _accelerator in _expected_iterations.keys():
+        for _num_time_steps in _expected_iterations[_accelerator].keys():
+            for _num_nodes in _expected_iterations[_accelerator][_num_time_steps].keys():
+                yield _stiff_lambda_u_accelerated_function, _accelerator(), _num_time_steps, _num_nodes, \
+                    _expected_iterations[_accelerator][_num_time_steps][_num_nodes]
+
+
+def _lambda_u_predicted_function(predictor, num_time_steps, num_nodes, iter_precision):
+    _lambda_u_function(ImplicitSdcCore, num_time_steps, 0.5, num_nodes, iter_precision, predictor=predictor)
+
+
+def test_lambda_u_with_predictors():
+    _expected_iterations = {
+        1: {
+            3: {'iter': 12},
+            5: {'iter': 10}
+        },
+        2: {
+            5: {'iter': 8}
+        }
+    }
+    for _predictor in [ImplicitEulerPredictor(), CoarsePredictor(num_nodes=3),
+                       ExtrapolationPredictor(fallback=ImplicitEulerPredictor())]:
+        for _num_time_steps in _expected_iterations.keys():
+            for _num_nodes in _expected_iterations[_num_time_steps].keys():
+                yield _lambda_u_predicted_function, _predictor, _num_time_steps, _num_nodes, \
+                    _expected_iterations[_num_time_steps][_num_nodes]
+
+
+class _NotThreadSafeLambdaU(LambdaU):
+    thread_safe = False
+
+
+def _heat_equation(implicit_solve_method, num_points=31):
+    _zero = lambda x: 0.0
+    _x = np.linspace(0.0, 1.0, num_points + 2)[1:-1].reshape((num_points, 1))
+    problem = HeatEquation(dim=(num_points, 1), time_end=0.1, thermal_diffusivity=0.5,
+                           initial_value=np.exp(-100.0 * (_x - 0.5) ** 2),
+                           rhs_function_wrt_space=lambda dof, tensor: 0.0, boundary_functions=[[_zero, _zero]],
+                           boundaries=['dirichlet'] * 2, geometry=np.asarray([[0, 1]]),
+                           implicit_solve_method=implicit_solve_method)
+    problem._mg_level = MultigridLevel1D(num_points, mg_problem=problem, max_borders=np.array([2, 2]), role='FL')
+    problem._mg_stencil = Stencil(np.array([0.5, -1.0, 0.5]) / problem._mg_level.h ** 2)
+    return problem
+
+
+def _run_node_parallel_sdc(problem, num_time_steps, num_nodes, node_executor):
+    _comm = ForwardSendingMessaging()
+    _sdc = ParallelSdc(communicator=_comm)
+    _comm.link_solvers(previous=_comm, next=_comm)
+    _comm.write_buffer(value=problem.initial_value, time_point=problem.time_start)
+    _sdc.init(integrator=SdcIntegrator, problem=problem, num_time_steps=num_time_steps, num_nodes=num_nodes,
+              threshold=ThresholdCheck(max_threshold=4, conditions=('iterations',)), node_executor=node_executor)
+    return _sdc.run(DiagonalImplicitSdcCore, dt=problem.time_end - problem.time_start)[-1].solution(-1)[-1].value
+
+
 class SdcTest(NumpyAwareTestCase):
     def setUp(self):
         # self._test_obj = ParallelSdc()
@@ -293,6 +462,63 @@ class SdcTest(NumpyAwareTestCase):
         problem = Constant(constant=-1.0, shift=1.0, dim=(2, 3, 1))
         _run_sdc_with_problem(problem, SemiImplicitSdcCore, 1, 1.0, 3, 2, PRECISION)
 
+    def test_frozen_time_steps_do_not_change_solution(self):
+        _solutions = {}
+        for _freeze in [False, True]:
+            problem = LambdaU(lmbda=complex(-1.0, 1.0))
+            _comm = ForwardSendingMessaging()
+            _sdc = ParallelSdc(communicator=_comm)
+            _comm.link_solvers(previous=_comm, next=_comm)
+            _comm.write_buffer(value=problem.initial_value, time_point=problem.time_start)
+            _sdc.init(integrator=SdcIntegrator, problem=problem, num_time_steps=8, num_nodes=5,
+                      threshold=ThresholdCheck(max_threshold=MAX_ITER, conditions=('solution reduction', 'iterations')),
+                      freeze_time_steps=_freeze)
+            _solutions[_freeze] = _sdc.run(ImplicitSdcCore, dt=0.5)[-1].solution(-1)[-1].value
+            if _freeze:
+                self.assertGreater(_sdc.state.num_frozen_time_steps, 0)
+        self.assertNumpyArrayAlmostEqual(_solutions[True], _solutions[False])
+
+    def test_q_delta_sweeps_evaluate_each_node_once(self):
+        for _core in [ImplicitSdcCore, SemiImplicitSdcCore]:
+            problem = LambdaU(lmbda=complex(-100.0, 1.0))
+            _comm = ForwardSendingMessaging()
+            _sdc = ParallelSdc(communicator=_comm)
+            _comm.link_solvers(previous=_comm, next=_comm)
+            _comm.write_buffer(value=problem.initial_value, time_point=problem.time_start)
+            _sdc.init(integrator=SdcIntegrator, problem=problem, num_time_steps=2, num_nodes=7, q_delta='lu',
+                      threshold=ThresholdCheck(max_threshold=6, conditions=('iterations',)))
+            _sdc.run(_core, dt=0.5)
+            # the right hand side or both of its parts at the old and new value of each node plus the integrals,
+            # whereas reevaluating the previous nodes for each node takes more than 1700 evaluations
+            _per_node = 3 if _core is ImplicitSdcCore else 8
+            self.assertLessEqual(problem.rhs_evaluations, _per_node * 2 * 7 * 6)
+
+    def test_node_parallel_heat_equation_does_not_depend_on_threads(self):
+        for _method in ['direct', 'fft', 'mg', 'cg', 'amg']:
+            _serial = _run_node_parallel_sdc(_heat_equation(_method), 2, 5, None)
+            with ThreadPoolExecutor(max_workers=4) as _executor:
+                _threaded = _run_node_parallel_sdc(_heat_equation(_method), 2, 5, _executor)
+            self.assertNumpyArrayAlmostEqual(_threaded, _serial, places=12)
+
+    def test_heat_equation_evaluates_in_several_threads_at_once(self):
+        # large enough for the evaluations of the threads to overlap
+        problem = _heat_equation('direct', num_points=2 ** 18 - 1)
+        _values = [np.random.RandomState(_i).rand(*problem.dim_for_time_solver) for _i in range(0, 4)]
+        _serial = [problem.evaluate_wrt_time(0.0, _value) for _value in _values]
+        _barrier = Barrier(len(_values))
+
+        def _evaluate(index):
+            _barrier.wait()
+            return max(np.abs(problem.evaluate_wrt_time(0.0, _values[index]) - _serial[index]).max()
+                       for _ in range(0, 20))
+
+        with ThreadPoolExecutor(max_workers=len(_values)) as _executor:
+            self.assertEqual(max(_executor.map(_evaluate, range(0, len(_values)))), 0.0)
+
+    def test_node_executor_is_refused_for_problems_not_thread_safe(self):
+        with ThreadPoolExecutor(max_workers=2) as _executor:
+            self.assertRaises(ValueError, _run_node_parallel_sdc, _NotThreadSafeLambdaU(), 1, 3, _executor)
+
 
 if __name__ == "__main__":
     import unittest
@@ -0,0 +1,24 @@
+# coding=utf-8
+import numpy
+
+from tests import NumpyAwareTestCase
+from pypint.solvers.predictors import CoarsePredictor, ExplicitEulerPredictor
+from examples.problems.lambda_u import LambdaU
+
+
+class CoarsePredictorTest(NumpyAwareTestCase):
+    def test_validates_number_of_nodes(self):
+        self.assertRaises(ValueError, CoarsePredictor, num_nodes=1)
+        self.assertEqual(CoarsePredictor(num_nodes=3).num_nodes, 3)
+
+    def test_interpolates_coarse_prediction(self):
+        _problem = LambdaU(lmbda=complex(-1.0, 0.0))
+        _predictor = CoarsePredictor(num_nodes=2, predictor=ExplicitEulerPredictor())
+        _values = _predictor.predict(_problem, _problem.initial_value, 0.0, numpy.array([0.25, 0.5, 1.0]))
+        # a single explicit Euler step over the whole time step, interpolated linearly
+        self.assertNumpyArrayAlmostEqual(_values.reshape(-1), numpy.array([0.75, 0.5, 0.0]))
+
+
+if __name__ == '__main__':
+    import unittest
+    unittest.main()
@@ -0,0 +1,35 @@
+# coding=utf-8
+import numpy
+
+from tests import NumpyAwareTestCase
+from pypint.solvers.predictors import SpreadPredictor, ExplicitEulerPredictor, ImplicitEulerPredictor
+from examples.problems.lambda_u import LambdaU
+
+
+class EulerPredictorsTest(NumpyAwareTestCase):
+    def setUp(self):
+        self._problem = LambdaU(lmbda=complex(-2.0, 0.0))
+        self._time_points = numpy.array([0.25, 0.5, 1.0])
+
+    def test_spread_predictor(self):
+        _values = SpreadPredictor().predict(self._problem, self._problem.initial_value, 0.0, self._time_points)
+        self.assertEqual(_values.shape, (3,) + self._problem.initial_value.shape)
+        for _value in _values:
+            self.assertNumpyArrayAlmostEqual(_value, self._problem.initial_value)
+
+    def test_explicit_euler_predictor(self):
+        _values = ExplicitEulerPredictor().predict(self._problem, self._problem.initial_value, 0.0, self._time_points)
+        _expected = self._problem.initial_value[0] \
+            * numpy.cumprod([1.0 - 2.0 * 0.25, 1.0 - 2.0 * 0.25, 1.0 - 2.0 * 0.5])
+        self.assertNumpyArrayAlmostEqual(_values.reshape(-1), _expected)
+
+    def test_implicit_euler_predictor(self):
+        _values = ImplicitEulerPredictor().predict(self._problem, self._problem.initial_value, 0.0, self._time_points)
+        _expected = self._problem.initial_value[0] \
+            * numpy.cumprod([1.0 / (1.0 + 2.0 * 0.25), 1.0 / (1.0 + 2.0 * 0.25), 1.0 / (1.0 + 2.0 * 0.5)])
+        self.assertNumpyArrayAlmostEqual(_values.reshape(-1), _expected)
+
+
+if __name__ == '__main__':
+    import unittest
+    unittest.main()
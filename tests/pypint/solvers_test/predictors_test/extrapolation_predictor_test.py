@@ -0,0 +1,31 @@
+# coding=utf-8
+import numpy
+
+from tests import NumpyAwareTestCase
+from pypint.solvers.predictors import ExtrapolationPredictor, ExplicitEulerPredictor
+from examples.problems.lambda_u import LambdaU
+
+
+class ExtrapolationPredictorTest(NumpyAwareTestCase):
+    def setUp(self):
+        self._problem = LambdaU(lmbda=complex(-1.0, 0.0))
+        self._time_points = numpy.array([1.5, 2.0])
+
+    def test_uses_fallback_without_previous_solution(self):
+        _values = ExtrapolationPredictor(fallback=ExplicitEulerPredictor()) \
+            .predict(self._problem, self._problem.initial_value, 1.0, self._time_points)
+        self.assertNumpyArrayAlmostEqual(_values.reshape(-1), numpy.array([0.5, 0.25]))
+
+    def test_extrapolates_previous_solution(self):
+        # quadratic previous solution is reproduced exactly; shifted to the new initial value
+        _previous_time_points = numpy.array([0.0, 0.5, 1.0])
+        _previous_values = (_previous_time_points ** 2).reshape(-1, 1)
+        _values = ExtrapolationPredictor().predict(self._problem, numpy.array([2.0]), 1.0, self._time_points,
+                                                   previous_time_points=_previous_time_points,
+                                                   previous_values=_previous_values)
+        self.assertNumpyArrayAlmostEqual(_values.reshape(-1), self._time_points ** 2 + 1.0)
+
+
+if __name__ == '__main__':
+    import unittest
+    unittest.main()
@@ -0,0 +1,50 @@
+# coding=utf-8
+"""
+.. moduleauthor:: Torbjörn Klatt <t.klatt@fz-juelich.de>
+"""
+import numpy
+from unittest import TestCase
+
+from pypint.solvers.states.sdc_solver_state import SdcSolverState
+
+
+class SdcSolverStateTest(TestCase):
+    def setUp(self):
+        self._default = SdcSolverState(num_nodes=2, num_time_steps=3)
+
+    def _iteration(self, values, residuals):
+        self._default.proceed()
+        for _time_step_index in range(0, 3):
+            for _step in self._default.current_iteration[_time_step_index]:
+                _step.value = numpy.array([values[_time_step_index]])
+                _step.solution.residual = numpy.array([residuals[_time_step_index]])
+            self._default.record_time_step_convergence(_time_step_index)
+
+    def test_records_residuals_and_reductions_per_time_step(self):
+        self._iteration([1.0, 1.0, 1.0], [1.0, 2.0, 3.0])
+        self._iteration([1.0, 2.0, 1.0], [0.5, 1.0, 1.5])
+        self.assertListEqual(self._default.time_step_residuals(1), [2.0, 1.0])
+        self.assertListEqual(self._default.time_step_reductions(0), [None, 0.0])
+        self.assertListEqual(self._default.time_step_reductions(1), [None, 100.0])
+
+    def test_freezes_leading_converged_time_steps(self):
+        self._iteration([1.0, 1.0, 1.0], [1e-8, 1.0, 1e-8])
+        self.assertEqual(self._default.freeze_time_steps(min_residual=1e-7), 1)
+        self.assertTrue(self._default.is_time_step_frozen(0))
+        self.assertFalse(self._default.is_time_step_frozen(1))
+
+        self._iteration([1.0, 1.0, 1.0], [1e-8, 1e-8, 1e-8])
+        # the last time step is never frozen
+        self.assertEqual(self._default.freeze_time_steps(min_residual=1e-7), 2)
+        self.assertEqual(self._default.num_frozen_time_steps, 2)
+
+    def test_freezes_on_solution_reduction(self):
+        self._iteration([1.0, 1.0, 1.0], [1.0, 1.0, 1.0])
+        self.assertEqual(self._default.freeze_time_steps(min_solution_reduction=1e-7), 0)
+        self._iteration([1.0, 1.0, 1.0], [1.0, 1.0, 1.0])
+        self.assertEqual(self._default.freeze_time_steps(min_solution_reduction=1e-7), 2)
+
+
+if __name__ == '__main__':
+    import unittest
+    unittest.main()
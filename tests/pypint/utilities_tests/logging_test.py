@@ -0,0 +1,37 @@
+# coding=utf-8
+
+import unittest
+from logbook import NullHandler, TestHandler, DEBUG, INFO, WARNING
+from pypint.utilities.logging import LOG, is_logging, silence
+
+
+class LoggingTest(unittest.TestCase):
+    def setUp(self):
+        self._handlers = LOG.handlers
+        LOG.handlers = []
+
+    def tearDown(self):
+        LOG.handlers = self._handlers
+        silence(False)
+
+    def test_is_logging(self):
+        with TestHandler(level=INFO):
+            self.assertTrue(is_logging(INFO))
+            self.assertTrue(is_logging(WARNING))
+            self.assertFalse(is_logging(DEBUG))
+        with NullHandler():
+            self.assertFalse(is_logging(INFO))
+
+    def test_silence(self):
+        with TestHandler(level=DEBUG) as _handler:
+            silence()
+            self.assertFalse(is_logging(WARNING))
+            LOG.warning("not emitted")
+            silence(False)
+            self.assertTrue(is_logging(DEBUG))
+            LOG.debug("emitted")
+        self.assertEqual([_record.message for _record in _handler.records], ["emitted"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -35,6 +35,17 @@ class MathTest(unittest.TestCase):
     def setUp(self):
         pass
 
+    def test_phi_functions(self):
+        _z = numpy.array([0.0, 1e-8, -0.5, -1.0, -3.0, -700.0, complex(2.0, 1.0)])
+        _phis = phi_functions(_z, 2)
+        self.assertEqual(len(_phis), 3)
+        _nonzero = _z != 0.0
+        numpy.testing.assert_allclose(_phis[0], numpy.exp(_z), rtol=1e-14)
+        numpy.testing.assert_allclose(_phis[1][_nonzero], numpy.expm1(_z[_nonzero]) / _z[_nonzero], rtol=1e-14)
+        numpy.testing.assert_allclose(_phis[2][_nonzero],
+                                      (numpy.expm1(_z[_nonzero]) - _z[_nonzero]) / _z[_nonzero] ** 2, rtol=1e-7)
+        numpy.testing.assert_allclose([_phis[1][0], _phis[2][0]], [1.0, 0.5], rtol=1e-15)
+
 
 if __name__ == '__main__':
     unittest.main()